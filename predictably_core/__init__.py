@@ -7,7 +7,19 @@ These tools makes it easy to create your own `predictably`-style packages.
 
 from __future__ import annotations
 
+from predictably_core._lazy import _lazy_module_attributes
+
 __version__: str = "0.1.0"
 
 __author__: list[str] = ["RNKuhns"]
 __all__: list[str] = []
+
+# Subpackages are imported the first time they are used
+_LAZY_IMPORTS: dict[str, str] = {
+    "config": "predictably_core.config",
+    "core": "predictably_core.core",
+    "utils": "predictably_core.utils",
+    "validate": "predictably_core.validate",
+}
+
+__getattr__, __dir__ = _lazy_module_attributes(__name__, _LAZY_IMPORTS)
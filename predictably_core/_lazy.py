@@ -0,0 +1,79 @@
+#!/usr/bin/env python3 -u
+# copyright: predictably developers, BSD-3-Clause License (see LICENSE file)
+"""Lazy loading of the public interface of `predictably_core` packages.
+
+Packages define a module level ``__getattr__`` (PEP 562) that imports the
+submodule defining a public attribute the first time the attribute is used. This
+keeps ``import predictably_core`` (and its subpackages) cheap for programs that
+only use part of the package.
+"""
+
+from __future__ import annotations
+
+import sys
+
+# The typing module is only imported by type checkers, since importing it would
+# dominate the time needed to import predictably_core
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Callable
+
+__author__: list[str] = ["RNKuhns"]
+__all__: list[str] = ["_lazy_module_attributes"]
+
+
+def _lazy_module_attributes(
+    package_name: str, lazy_imports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Create the ``__getattr__`` and ``__dir__`` functions of a lazy package.
+
+    Parameters
+    ----------
+    package_name : str
+        The name of the package (its ``__name__``).
+    lazy_imports : dict[str, str]
+        Mapping of each lazily imported attribute to the name of the module
+        that defines it. If the attribute and module have the same name, then
+        the module itself is the attribute.
+
+    Returns
+    -------
+    __getattr__ : Callable[[str], Any]
+        Function that imports and returns a lazily imported attribute. The
+        attribute is also stored on the package, so it is only imported once.
+    __dir__ : Callable[[], list[str]]
+        Function that lists the package's attributes, including the lazily
+        imported attributes that haven't been imported yet.
+
+    Examples
+    --------
+    The ``__init__`` module of a package assigns the returned functions to
+    module level ``__getattr__`` and ``__dir__`` attributes.
+
+    >>> from predictably_core._lazy import _lazy_module_attributes
+    >>> __getattr__, __dir__ = _lazy_module_attributes(
+    ...     "predictably_core.utils",
+    ...     {"IndexedDict": "predictably_core.utils._indexed_dict"},
+    ... )
+    >>> __getattr__("IndexedDict")
+    <class 'predictably_core.utils._indexed_dict.IndexedDict'>
+    """
+
+    def _getattr(name: str) -> Any:
+        module_name = lazy_imports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        # __import__ is used rather than importlib, so that the import is
+        # reported by ``python -X importtime``
+        __import__(module_name)
+        module = sys.modules[module_name]
+        value = (
+            module if module_name.rpartition(".")[2] == name else getattr(module, name)
+        )
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def _dir() -> list[str]:
+        return sorted({*vars(sys.modules[package_name]), *lazy_imports})
+
+    return _getattr, _dir
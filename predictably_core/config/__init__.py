@@ -8,12 +8,17 @@ built using it.
 
 from __future__ import annotations
 
-from predictably_core.config._config import (
-    config_context,
-    get_config,
-    reset_config,
-    set_config,
-)
+from typing import TYPE_CHECKING
+
+from predictably_core._lazy import _lazy_module_attributes
+
+if TYPE_CHECKING:
+    from predictably_core.config._config import (
+        config_context,
+        get_config,
+        reset_config,
+        set_config,
+    )
 
 __author__: list[str] = ["RNKuhns"]
 __all__: list[str] = [
@@ -22,3 +27,12 @@ __all__: list[str] = [
     "reset_config",
     "set_config",
 ]
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "config_context": "predictably_core.config._config",
+    "get_config": "predictably_core.config._config",
+    "reset_config": "predictably_core.config._config",
+    "set_config": "predictably_core.config._config",
+}
+
+__getattr__, __dir__ = _lazy_module_attributes(__name__, _LAZY_IMPORTS)
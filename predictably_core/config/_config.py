@@ -12,7 +12,7 @@ Allows users to configure `predictably_core`.
 
 import threading
 from contextlib import contextmanager
-from typing import Any, Dict, Iterator, List, Literal, Optional
+from typing import Any, Dict, Iterator, List, Literal, NamedTuple, Optional
 
 from predictably_core.config._config_param_setting import GlobalConfigParamSetting
 
@@ -24,7 +24,19 @@ __all__: List[str] = [
     "set_config",
 ]
 
-GlobalConfigParam = Literal["print_changed_only", "display"]
+GlobalConfigParam = Literal[
+    "print_changed_only",
+    "display",
+    "display_max_items",
+    "display_max_depth",
+    "display_memory_usage",
+    "validation_strategy",
+    "validation_sample_size",
+    "validate_params",
+    "fit_cache",
+    "fit_cache_dir",
+    "fit_cache_max_bytes",
+]
 
 _CONFIG_REGISTRY: Dict[GlobalConfigParam, GlobalConfigParamSetting] = {
     "print_changed_only": GlobalConfigParamSetting(
@@ -39,6 +51,60 @@ _CONFIG_REGISTRY: Dict[GlobalConfigParam, GlobalConfigParamSetting] = {
         allowed_values=("text", "diagram"),
         default_value="text",
     ),
+    "display_max_items": GlobalConfigParamSetting(
+        name="display_max_items",
+        expected_type=int,
+        allowed_values=None,
+        default_value=30,
+    ),
+    "display_max_depth": GlobalConfigParamSetting(
+        name="display_max_depth",
+        expected_type=int,
+        allowed_values=None,
+        default_value=10,
+    ),
+    "display_memory_usage": GlobalConfigParamSetting(
+        name="display_memory_usage",
+        expected_type=bool,
+        allowed_values=(True, False),
+        default_value=False,
+    ),
+    "validation_strategy": GlobalConfigParamSetting(
+        name="validation_strategy",
+        expected_type=str,
+        allowed_values=("full", "sample", "off"),
+        default_value="full",
+    ),
+    "validation_sample_size": GlobalConfigParamSetting(
+        name="validation_sample_size",
+        expected_type=int,
+        allowed_values=None,
+        default_value=100,
+    ),
+    "validate_params": GlobalConfigParamSetting(
+        name="validate_params",
+        expected_type=bool,
+        allowed_values=(True, False),
+        default_value=True,
+    ),
+    "fit_cache": GlobalConfigParamSetting(
+        name="fit_cache",
+        expected_type=str,
+        allowed_values=("off", "memory", "disk"),
+        default_value="off",
+    ),
+    "fit_cache_dir": GlobalConfigParamSetting(
+        name="fit_cache_dir",
+        expected_type=str,
+        allowed_values=None,
+        default_value="",
+    ),
+    "fit_cache_max_bytes": GlobalConfigParamSetting(
+        name="fit_cache_max_bytes",
+        expected_type=int,
+        allowed_values=None,
+        default_value=1 << 30,
+    ),
 }
 
 _GLOBAL_CONFIG_DEFAULT: Dict[GlobalConfigParam, Any] = {
@@ -66,6 +132,77 @@ def _get_threadlocal_config() -> Dict[GlobalConfigParam, Any]:
     return _THREAD_LOCAL_DATA.global_config  # type: ignore
 
 
+def _get_config_value(param_name: GlobalConfigParam) -> Any:
+    """Retrieve the current value of a single configuration parameter.
+
+    Unlike :func:`get_config`, the configuration is not copied, which makes this
+    suitable for code that reads the configuration on every call.
+
+    Parameters
+    ----------
+    param_name : str
+        The name of the configuration parameter.
+
+    Returns
+    -------
+    Any
+        The current value of the configuration parameter.
+    """
+    return _get_threadlocal_config()[param_name]
+
+
+class _ValidationMode(NamedTuple):
+    """The validation strategy in the configuration, resolved for fast access.
+
+    Parameters
+    ----------
+    strategy : {"full", "sample", "off"}
+        The ``validation_strategy`` configuration.
+    sample_size : int
+        The ``validation_sample_size`` configuration if sampling, otherwise 0.
+    off : bool
+        Whether validation is turned off.
+    """
+
+    strategy: str
+    sample_size: int
+    off: bool
+
+
+def _make_validation_mode(config: Dict[GlobalConfigParam, Any]) -> _ValidationMode:
+    """Resolve the validation strategy of a configuration.
+
+    Parameters
+    ----------
+    config : dict[GlobalConfigParam, Any]
+        The configuration.
+
+    Returns
+    -------
+    _ValidationMode
+        The resolved validation strategy.
+    """
+    strategy = config["validation_strategy"]
+    sample_size = config["validation_sample_size"] if strategy == "sample" else 0
+    return _ValidationMode(strategy, sample_size, strategy == "off")
+
+
+class _ThreadLocalValidationMode(threading.local):
+    """The resolved validation strategy of each thread's configuration.
+
+    The validation checkers read the `mode` attribute on every call instead of
+    looking up the configuration. It is replaced (in a single assignment) by
+    :func:`set_config` whenever the configuration changes, so readers always
+    see a consistent strategy and sample size.
+    """
+
+    def __init__(self) -> None:
+        self.mode = _make_validation_mode(_get_threadlocal_config())
+
+
+_VALIDATION_MODE = _ThreadLocalValidationMode()
+
+
 def get_config(default: bool = False) -> Dict[GlobalConfigParam, Any]:
     """Retrieve current values for configuration set by :meth:`set_config`.
 
@@ -111,6 +248,15 @@ def set_config(
     *,
     print_changed_only: Optional[bool] = None,
     display: Optional[Literal["text", "diagram"]] = None,
+    display_max_items: Optional[int] = None,
+    display_max_depth: Optional[int] = None,
+    display_memory_usage: Optional[bool] = None,
+    validation_strategy: Optional[Literal["full", "sample", "off"]] = None,
+    validation_sample_size: Optional[int] = None,
+    validate_params: Optional[bool] = None,
+    fit_cache: Optional[Literal["off", "memory", "disk"]] = None,
+    fit_cache_dir: Optional[str] = None,
+    fit_cache_max_bytes: Optional[int] = None,
     local_threadsafe: bool = False,
 ) -> None:
     """Set global configuration.
@@ -130,6 +276,58 @@ def set_config(
         as a diagram in a Jupyter lab or notebook context. If 'text', instances
         inheriting from BaseObject will be displayed as text. If None, the
         existing value won't change.
+    display_max_items : int, default=None
+        The maximum number of components shown side-by-side at any level of the
+        diagram used to display a BaseObject. Any further components are summarized
+        in a single "... and N more" item that groups them by class. If None, the
+        existing value won't change.
+    display_max_depth : int, default=None
+        The maximum nesting depth of components shown in the diagram used to
+        display a BaseObject. Components nested more deeply are shown as a single
+        item instead of being expanded. If None, the existing value won't change.
+    display_memory_usage : bool, default=None
+        If True, the diagram used to display a BaseObject includes an item
+        showing the memory used by the object, with a breakdown by attribute
+        (see :meth:`BaseObject.memory_usage`). Estimating the memory usage walks
+        all of the object's attributes, so this is off by default. If None, the
+        existing value won't change.
+    validation_strategy : {"full", "sample", "off"}, default=None
+        How much validation is performed by the checkers in
+        :mod:`predictably_core.validate` when they are not passed a strategy.
+        If "full", every element of sequences and mappings is validated. If
+        "sample", only the first, last and `validation_sample_size` randomly
+        selected elements are validated. If "off", the checkers return their
+        input without validating it. If None, the existing value won't change.
+    validation_sample_size : int, default=None
+        The number of randomly selected elements validated (in addition to the
+        first and last elements) when `validation_strategy` is "sample". If None,
+        the existing value won't change.
+    validate_params : bool, default=None
+        If True, functions decorated with
+        :func:`~predictably_core.validate.validate_params` validate their
+        arguments. If False, the decorator returns functions unchanged, so that
+        they have no validation overhead. The value in effect when a function is
+        decorated (usually when its module is imported) is used. If None, the
+        existing value won't change.
+    fit_cache : {"off", "memory", "disk"}, default=None
+        Where the `fit` method of BaseEstimators caches the fitted state, so that
+        fitting an estimator with the same class, parameters and data again
+        restores the cached state instead. If "memory", the state is cached in
+        memory of the current process. If "disk", the state is cached in files
+        in `fit_cache_dir`, so it can be reused by other processes. If "off",
+        estimators are always fit. If None, the existing value won't change.
+        Only use the cache for estimators whose fitted state depends only on
+        their parameters and the data passed to `fit`.
+    fit_cache_dir : str, default=None
+        The directory used by the fit cache when `fit_cache` is "disk". If it is
+        an empty string, the "predictably_fit_cache" directory in the current
+        user's cache directory (like "~/.cache") is used. Directories are created
+        if they don't exist, and aren't used if other users can write to them.
+        If None, the existing value won't change.
+    fit_cache_max_bytes : int, default=None
+        The maximum number of bytes of fitted state kept by the fit cache. The
+        least recently used entries are removed once it is exceeded. If None,
+        the existing value won't change.
     local_threadsafe : bool, default=False
         If False, set the backend as default for all threads.
 
@@ -201,9 +399,44 @@ def set_config(
         )
     if display is not None:
         local_config = _update_local_config(local_config, display, "display", msg)
+    if display_max_items is not None:
+        local_config = _update_local_config(
+            local_config, display_max_items, "display_max_items", msg
+        )
+    if display_max_depth is not None:
+        local_config = _update_local_config(
+            local_config, display_max_depth, "display_max_depth", msg
+        )
+    if display_memory_usage is not None:
+        local_config = _update_local_config(
+            local_config, display_memory_usage, "display_memory_usage", msg
+        )
+    if validation_strategy is not None:
+        local_config = _update_local_config(
+            local_config, validation_strategy, "validation_strategy", msg
+        )
+    if validation_sample_size is not None:
+        local_config = _update_local_config(
+            local_config, validation_sample_size, "validation_sample_size", msg
+        )
+    if validate_params is not None:
+        local_config = _update_local_config(
+            local_config, validate_params, "validate_params", msg
+        )
+    if fit_cache is not None:
+        local_config = _update_local_config(local_config, fit_cache, "fit_cache", msg)
+    if fit_cache_dir is not None:
+        local_config = _update_local_config(
+            local_config, fit_cache_dir, "fit_cache_dir", msg
+        )
+    if fit_cache_max_bytes is not None:
+        local_config = _update_local_config(
+            local_config, fit_cache_max_bytes, "fit_cache_max_bytes", msg
+        )
 
     if not local_threadsafe:
         global_config.update(local_config)
+    _VALIDATION_MODE.mode = _make_validation_mode(local_config)
 
     return None
 
@@ -254,6 +487,15 @@ def config_context(
     *,
     print_changed_only: Optional[bool] = None,
     display: Optional[Literal["text", "diagram"]] = None,
+    display_max_items: Optional[int] = None,
+    display_max_depth: Optional[int] = None,
+    display_memory_usage: Optional[bool] = None,
+    validation_strategy: Optional[Literal["full", "sample", "off"]] = None,
+    validation_sample_size: Optional[int] = None,
+    validate_params: Optional[bool] = None,
+    fit_cache: Optional[Literal["off", "memory", "disk"]] = None,
+    fit_cache_dir: Optional[str] = None,
+    fit_cache_max_bytes: Optional[int] = None,
     local_threadsafe: bool = False,
 ) -> Iterator[None]:
     """Context manager for global configuration.
@@ -274,6 +516,58 @@ def config_context(
         as a diagram in a Jupyter lab or notebook context. If 'text', instances
         inheriting from BaseObject will be displayed as text. If None, the
         existing value won't change.
+    display_max_items : int, default=None
+        The maximum number of components shown side-by-side at any level of the
+        diagram used to display a BaseObject. Any further components are summarized
+        in a single "... and N more" item that groups them by class. If None, the
+        existing value won't change.
+    display_max_depth : int, default=None
+        The maximum nesting depth of components shown in the diagram used to
+        display a BaseObject. Components nested more deeply are shown as a single
+        item instead of being expanded. If None, the existing value won't change.
+    display_memory_usage : bool, default=None
+        If True, the diagram used to display a BaseObject includes an item
+        showing the memory used by the object, with a breakdown by attribute
+        (see :meth:`BaseObject.memory_usage`). Estimating the memory usage walks
+        all of the object's attributes, so this is off by default. If None, the
+        existing value won't change.
+    validation_strategy : {"full", "sample", "off"}, default=None
+        How much validation is performed by the checkers in
+        :mod:`predictably_core.validate` when they are not passed a strategy.
+        If "full", every element of sequences and mappings is validated. If
+        "sample", only the first, last and `validation_sample_size` randomly
+        selected elements are validated. If "off", the checkers return their
+        input without validating it. If None, the existing value won't change.
+    validation_sample_size : int, default=None
+        The number of randomly selected elements validated (in addition to the
+        first and last elements) when `validation_strategy` is "sample". If None,
+        the existing value won't change.
+    validate_params : bool, default=None
+        If True, functions decorated with
+        :func:`~predictably_core.validate.validate_params` validate their
+        arguments. If False, the decorator returns functions unchanged, so that
+        they have no validation overhead. The value in effect when a function is
+        decorated (usually when its module is imported) is used. If None, the
+        existing value won't change.
+    fit_cache : {"off", "memory", "disk"}, default=None
+        Where the `fit` method of BaseEstimators caches the fitted state, so that
+        fitting an estimator with the same class, parameters and data again
+        restores the cached state instead. If "memory", the state is cached in
+        memory of the current process. If "disk", the state is cached in files
+        in `fit_cache_dir`, so it can be reused by other processes. If "off",
+        estimators are always fit. If None, the existing value won't change.
+        Only use the cache for estimators whose fitted state depends only on
+        their parameters and the data passed to `fit`.
+    fit_cache_dir : str, default=None
+        The directory used by the fit cache when `fit_cache` is "disk". If it is
+        an empty string, the "predictably_fit_cache" directory in the current
+        user's cache directory (like "~/.cache") is used. Directories are created
+        if they don't exist, and aren't used if other users can write to them.
+        If None, the existing value won't change.
+    fit_cache_max_bytes : int, default=None
+        The maximum number of bytes of fitted state kept by the fit cache. The
+        least recently used entries are removed once it is exceeded. If None,
+        the existing value won't change.
     local_threadsafe : bool, default=False
         If False, set the config as default for all threads.
 
@@ -306,6 +600,15 @@ def config_context(
     set_config(
         print_changed_only=print_changed_only,
         display=display,
+        display_max_items=display_max_items,
+        display_max_depth=display_max_depth,
+        display_memory_usage=display_memory_usage,
+        validation_strategy=validation_strategy,
+        validation_sample_size=validation_sample_size,
+        validate_params=validate_params,
+        fit_cache=fit_cache,
+        fit_cache_dir=fit_cache_dir,
+        fit_cache_max_bytes=fit_cache_max_bytes,
         local_threadsafe=local_threadsafe,
     )
 
@@ -118,6 +118,7 @@ def test_set_config_then_get_config_returns_expected_value(print_changed_only, d
     )
     retrieved_default = get_config()
     expected_config = {
+        **get_config(default=True),
         "print_changed_only": print_changed_only,
         "display": display,
     }
@@ -199,6 +200,7 @@ def test_config_context(print_changed_only, display):
     ):
         retrieved_context_config = get_config()
     expected_config = {
+        **get_config(default=True),
         "print_changed_only": print_changed_only,
         "display": display,
     }
@@ -7,8 +7,72 @@ These tools can be used to build other `predictably` compliant packages.
 
 from __future__ import annotations
 
-from predictably_core.core._base import BaseEstimator, BaseObject
-from predictably_core.core._clone import clone
+from typing import TYPE_CHECKING
+
+from predictably_core._lazy import _lazy_module_attributes
+
+if TYPE_CHECKING:
+    from predictably_core.core._base import (
+        BaseEstimator,
+        BaseObject,
+        SlottedBaseEstimator,
+        SlottedBaseObject,
+    )
+    from predictably_core.core._clone import clone
+    from predictably_core.core._fit_cache import clear_fit_cache, fit_cache_info
+    from predictably_core.core._params_pickle import pickle_by_params
+    from predictably_core.core._pprint._export import export_html, export_text
+    from predictably_core.core._shared_memory import (
+        SharedEstimatorHandle,
+        share_estimator,
+    )
+    from predictably_core.core._spec import (
+        from_spec,
+        from_specs,
+        register_spec_class,
+        to_spec,
+        to_specs,
+    )
 
 __author__: list[str] = ["RNKuhns"]
-__all__: list[str] = ["BaseEstimator", "BaseObject", "clone"]
+__all__: list[str] = [
+    "BaseEstimator",
+    "BaseObject",
+    "SharedEstimatorHandle",
+    "SlottedBaseEstimator",
+    "SlottedBaseObject",
+    "clear_fit_cache",
+    "clone",
+    "export_html",
+    "export_text",
+    "fit_cache_info",
+    "from_spec",
+    "from_specs",
+    "pickle_by_params",
+    "register_spec_class",
+    "share_estimator",
+    "to_spec",
+    "to_specs",
+]
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "BaseEstimator": "predictably_core.core._base",
+    "BaseObject": "predictably_core.core._base",
+    "SlottedBaseEstimator": "predictably_core.core._base",
+    "SlottedBaseObject": "predictably_core.core._base",
+    "clone": "predictably_core.core._clone",
+    "clear_fit_cache": "predictably_core.core._fit_cache",
+    "fit_cache_info": "predictably_core.core._fit_cache",
+    "export_html": "predictably_core.core._pprint._export",
+    "export_text": "predictably_core.core._pprint._export",
+    "pickle_by_params": "predictably_core.core._params_pickle",
+    "SharedEstimatorHandle": "predictably_core.core._shared_memory",
+    "share_estimator": "predictably_core.core._shared_memory",
+    "from_spec": "predictably_core.core._spec",
+    "from_specs": "predictably_core.core._spec",
+    "register_spec_class": "predictably_core.core._spec",
+    "to_spec": "predictably_core.core._spec",
+    "to_specs": "predictably_core.core._spec",
+}
+
+__getattr__, __dir__ = _lazy_module_attributes(__name__, _LAZY_IMPORTS)
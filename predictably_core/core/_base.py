@@ -6,16 +6,20 @@
 """The base class used throughout `predictably_core`.
 
 `predictably_core` classes typically inherit from ``BaseObject`` or ``BaseEstimator``.
+Classes storing all their attributes in ``__slots__`` can instead inherit from
+``SlottedBaseObject`` or ``SlottedBaseEstimator``.
 """
 
 from __future__ import annotations
 
 import collections
 import copy
+import functools
 import inspect
 import re
 import sys
-from typing import Any, Callable, ClassVar, Iterable, Sequence
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Iterable, Sequence
 
 if sys.version_info < (3, 11):
     from typing_extensions import Self
@@ -23,30 +27,172 @@ else:
     from typing import Self
 
 from predictably_core.config import get_config
-from predictably_core.config._config import _CONFIG_REGISTRY
+from predictably_core.config._config import _CONFIG_REGISTRY, _get_config_value
 from predictably_core.core._clone import _clone_parametrized
 from predictably_core.core._exceptions import NotFittedError
-from predictably_core.core._pprint._object_html_repr import _object_html_repr
 from predictably_core.utils._iter import format_sequence_to_str
+from predictably_core.utils._utils import _slot_names
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pathlib
 
 __author__: list[str] = ["RNKuhns"]
-__all__: list[str] = ["BaseEstimator", "BaseObject"]
+__all__: list[str] = [
+    "BaseEstimator",
+    "BaseObject",
+    "SlottedBaseEstimator",
+    "SlottedBaseObject",
+]
+
+# Parameters of each class's __init__, along with the __init__ they were read from
+_INIT_SIGNATURE_CACHE: weakref.WeakKeyDictionary[
+    type, tuple[Callable[..., None], list[inspect.Parameter]]
+] = weakref.WeakKeyDictionary()
+
+
+# Marks unset slots
+_MISSING = object()
+# Configuration of the fit cache used by BaseEstimator subclasses
+_FIT_CACHE_CONFIG = ("fit_cache", "fit_cache_dir", "fit_cache_max_bytes")
+
+
+def _instance_attributes(obj: Any) -> dict[str, Any]:
+    """Get the attributes stored on an object instance.
+
+    Includes the slots that are set and the attributes in the instance
+    ``__dict__`` that don't shadow a class attribute. Attributes whose name
+    contains "__" are excluded.
+
+    Parameters
+    ----------
+    obj : Any
+        The object.
+
+    Returns
+    -------
+    dict[str, Any]
+        Mapping of attribute names to values. Slots are listed first, followed
+        by the attributes in the instance ``__dict__`` in the order they were
+        assigned.
+    """
+    attrs = {}
+    for name in _slot_names(type(obj)):
+        value = getattr(obj, name, _MISSING)
+        if value is not _MISSING and "__" not in name:
+            attrs[name] = value
+    instance_dict = getattr(obj, "__dict__", None)
+    if instance_dict:
+        class_attrs = set().union(*(vars(klass) for klass in type(obj).__mro__))
+        for name, value in instance_dict.items():
+            if name not in class_attrs and "__" not in name:
+                attrs[name] = value
+    return attrs
+
+
+def _set_attribute_names(obj: Any) -> list[str]:
+    """Get the names of the slots that are set and the attributes in ``__dict__``.
+
+    Parameters
+    ----------
+    obj : Any
+        The object.
+
+    Returns
+    -------
+    list[str]
+        The names of the slots that are set, followed by the names in the
+        instance ``__dict__`` in the order they were assigned.
+    """
+    names = [name for name in _slot_names(type(obj)) if hasattr(obj, name)]
+    names.extend(getattr(obj, "__dict__", ()))
+    return names
 
 
-class BaseObject:
-    """Base class for `predictably` classes with tag and config management.
+def _record_fitted_attributes(estimator: BaseEstimator, names_before: set[str]) -> None:
+    """Record the fitted attributes that `fit` set on an estimator.
 
-    All classes in `predictably` that use the tag interface or allow users
-    to override the global configuration should inherit from ``BaseClass``.
+    Parameters
+    ----------
+    estimator : BaseEstimator
+        The estimator that was fit.
+    names_before : set[str]
+        The names of the estimator's attributes before `fit` was called.
+    """
+    declared = estimator._fitted_attribute_names
+    new_names = [
+        name
+        for name in _set_attribute_names(estimator)
+        if name not in names_before
+        and ((name[-1:] == "_" and "__" not in name) or name in declared)
+    ]
+    if not new_names:
+        return
+    registry = getattr(estimator, "_fitted_registry", None)
+    if registry is None:
+        registry = estimator._fitted_registry = {}
+    registry.update(dict.fromkeys(new_names))
+
+
+def _use_fit_cache(fit: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a `fit` method so it records fitted attributes and uses the fit cache.
+
+    Parameters
+    ----------
+    fit : Callable
+        The `fit` method of a BaseEstimator subclass.
+
+    Returns
+    -------
+    Callable
+        The wrapped method. When the estimator's ``fit_cache`` configuration is
+        "off", it calls `fit` directly. The fitted attributes set by the call
+        are recorded once it returns (or raises).
     """
 
+    def fit_maybe_cached(self: BaseEstimator, args: Any, kwargs: Any) -> Any:
+        # The full configuration is only collected if the cache could be on
+        if _get_config_value("fit_cache") == "off":
+            config_dynamic = getattr(self, "_config_dynamic", None)
+            if not (config_dynamic and "fit_cache" in config_dynamic) and not any(
+                "fit_cache" in klass.__dict__.get("_config", ())
+                for klass in type(self).__mro__
+            ):
+                return fit(self, *args, **kwargs)
+        config = self._get_config(_FIT_CACHE_CONFIG)
+        if config["fit_cache"] == "off":
+            return fit(self, *args, **kwargs)
+        from predictably_core.core._fit_cache import _fit_with_cache
+
+        return _fit_with_cache(self, fit, args, kwargs, config)
+
+    @functools.wraps(fit)
+    def fit_with_cache(self: BaseEstimator, *args: Any, **kwargs: Any) -> Any:
+        names_before = set(_set_attribute_names(self))
+        try:
+            return fit_maybe_cached(self, args, kwargs)
+        finally:
+            _record_fitted_attributes(self, names_before)
+
+    fit_with_cache._uses_fit_cache = True  # type: ignore[attr-defined]
+    return fit_with_cache
+
+
+class _BaseObject:
+    """Implementation of the BaseObject interface.
+
+    It is shared by BaseObject and SlottedBaseObject. It declares empty
+    ``__slots__``, so it doesn't give instances of SlottedBaseObject a ``__dict__``.
+    """
+
+    __slots__ = ()
+
     _tags: ClassVar[dict[str, Any]] = {}
     _config: ClassVar[dict[str, Any]] = {}
+    _tags_dynamic: dict[str, Any]
+    _config_dynamic: dict[str, Any]
 
     def __init__(self) -> None:
         """Initialize the object."""
-        self._tags_dynamic: dict[str, Any] = {}
-        self._config_dynamic: dict[str, Any] = {}
         super().__init__()
 
     def __eq__(self, other: Any):
@@ -65,7 +211,7 @@ class BaseObject:
         bool
             Whether `other` is equal to the BaseObject.
         """
-        if not isinstance(other, BaseObject):
+        if not isinstance(other, _BaseObject):
             return False
 
         self_params = self.get_params(deep=False)
@@ -87,8 +233,13 @@ class BaseObject:
         ------
         RuntimeError if cls has varargs in __init__.
         """
+        init = cls.__init__
+        cached = _INIT_SIGNATURE_CACHE.get(cls)
+        if cached is not None and cached[0] is init:
+            return list(cached[1])
+
         # introspect the constructor arguments to find the model parameters to represent
-        init_signature = inspect.signature(cls.__init__)
+        init_signature = inspect.signature(init)
 
         # Consider the constructor parameters excluding 'self'
         parameters = [
@@ -106,7 +257,8 @@ class BaseObject:
                     " follow this convention."
                 )
 
-        return parameters
+        _INIT_SIGNATURE_CACHE[cls] = (init, parameters)
+        return list(parameters)
 
     @classmethod
     def _get_param_names(cls, sort: bool = True) -> list[str]:
@@ -159,6 +311,22 @@ class BaseObject:
             default_params = {n: default_params[n] for n in sorted(default_params)}
         return default_params
 
+    @classmethod
+    def _get_param_validators(cls) -> dict[str, Callable[[Any], Any]]:
+        """Get the validators of the object's parameters.
+
+        Parameters are validated if the object's ``__init__`` method is
+        decorated with :func:`~predictably_core.validate.validate_params`.
+
+        Returns
+        -------
+        dict[str, Callable[[Any], Any]]
+            Mapping of parameter names to a validator that returns the parameter
+            value if it matches the parameter's annotation and raises a
+            TypeError otherwise. Parameters that aren't validated are excluded.
+        """
+        return getattr(cls.__init__, "_param_validators", {})
+
     def get_params(self, deep: bool = True) -> dict[str, Any]:
         """Get a dict of parameters values for this object.
 
@@ -225,6 +393,10 @@ class BaseObject:
         The latter have parameters of the form ``<component>__<parameter>`` so
         that it's possible to update each component of a nested object.
 
+        If the object's ``__init__`` method is decorated with
+        :func:`~predictably_core.validate.validate_params`, the parameter values
+        are validated against the annotations of ``__init__``.
+
         Parameters
         ----------
         **params : dict
@@ -234,12 +406,20 @@ class BaseObject:
         -------
         self
             Reference to self (after parameters have been set).
+
+        Raises
+        ------
+        ValueError
+            If a parameter isn't a parameter of the object.
+        TypeError
+            If a parameter value doesn't match its annotation in a validated
+            ``__init__``.
         """
         if not params:
             # Simple optimization to gain speed (inspect is slow)
             return self
         valid_params = self.get_params(deep=True)
-        param_name_str = format_sequence_to_str(list(valid_params), last_sep="or")
+        param_validators = self._get_param_validators()
 
         nested_params: collections.defaultdict[str, Any] = collections.defaultdict(
             dict
@@ -247,6 +427,10 @@ class BaseObject:
         for key, value in params.items():
             key, delim, sub_key = key.partition("__")
             if key not in valid_params:
+                # Only format the (possibly many) valid parameters when needed
+                param_name_str = format_sequence_to_str(
+                    list(valid_params), last_sep="or"
+                )
                 raise ValueError(
                     f"Invalid parameter {key!r} for object {self}. "
                     f"Valid parameters are: {param_name_str}."
@@ -255,6 +439,8 @@ class BaseObject:
             if delim:
                 nested_params[key][sub_key] = value
             else:
+                if key in param_validators:
+                    value = param_validators[key](value)
                 setattr(self, key, value)
                 valid_params[key] = value
 
@@ -815,22 +1001,100 @@ class BaseObject:
         -----
         Equivalent to sklearn.clone but overwrites self. After self.reset()
         call, self is equal in value to `type(self)(**self.get_params(deep=False))`
+
+        Only the attributes in the instance ``__dict__`` and slots are considered,
+        and the hyper-parameters are reassigned in place by ``__init__`` rather
+        than being deleted first.
         """
         # retrieve parameters to copy them later
         params = self.get_params(deep=False)
 
-        # delete all object attributes in self
-        attrs = [attr for attr in dir(self) if "__" not in attr]
-        cls_attrs = list(dir(type(self)))
-        self_attrs = set(attrs).difference(cls_attrs)
-        for attr in self_attrs:
-            delattr(self, attr)
+        # delete object attributes in self, except for the parameters, which are
+        # reassigned in place by __init__
+        for attr in _instance_attributes(self):
+            if attr not in params:
+                delattr(self, attr)
 
         # run init with a copy of parameters self had at the start
         self.__init__(**params)  # type: ignore
 
         return self
 
+    def to_spec(self) -> dict[str, Any]:
+        """Convert the object to a declarative, JSON-compatible spec.
+
+        The spec contains the object's qualified class name, its parameters
+        (with BaseObject-valued parameters converted to nested specs) and its
+        dynamic tag and config overrides.
+
+        Returns
+        -------
+        dict[str, Any]
+            The spec, as described in :func:`predictably_core.core.to_spec`.
+
+        Raises
+        ------
+        TypeError
+            If a parameter value can't be represented as JSON.
+
+        See Also
+        --------
+        from_spec :
+            Build an object from a spec.
+
+        Examples
+        --------
+        >>> from predictably_core.core import BaseEstimator
+        >>> spec = BaseEstimator()._set_tags(some_tag=[1, 2]).to_spec()
+        >>> spec  # doctest: +NORMALIZE_WHITESPACE
+        {'class': 'predictably_core.core._base:BaseEstimator', 'params': {},
+         'tags': {'some_tag': [1, 2]}}
+        >>> BaseEstimator.from_spec(spec)._get_tags()["some_tag"]
+        [1, 2]
+        """
+        from predictably_core.core._spec import to_spec
+
+        return to_spec(self)
+
+    @classmethod
+    def from_spec(cls, spec: dict[str, Any]) -> Self:
+        """Build an object from a spec.
+
+        Parameters
+        ----------
+        spec : dict[str, Any]
+            The spec, as returned by `to_spec`.
+
+        Returns
+        -------
+        BaseObject
+            The object, initialized with the spec's parameters and with its tag
+            and config overrides set.
+
+        Raises
+        ------
+        TypeError
+            If the spec describes an object that isn't an instance of the class
+            `from_spec` is called on.
+        ValueError
+            If a class in the spec can't be resolved, or the spec has invalid
+            parameters.
+
+        See Also
+        --------
+        to_spec :
+            Convert the object to a spec.
+        """
+        from predictably_core.core._spec import from_spec
+
+        obj = from_spec(spec)
+        if not isinstance(obj, cls):
+            raise TypeError(
+                f"Expected the spec to describe an instance of {cls.__name__}, "
+                f"but found {type(obj).__name__}."
+            )
+        return obj
+
     def is_composite(self) -> bool:
         """Check if the object is composed of other BaseObjects.
 
@@ -844,7 +1108,7 @@ class BaseObject:
         """
         params = self.get_params(deep=False)
         composite = any(
-            isinstance(x, BaseObject) or hasattr(x, "get_params")
+            isinstance(x, _BaseObject) or hasattr(x, "get_params")
             for x in params.values()
         )
 
@@ -877,25 +1141,119 @@ class BaseObject:
             If `base_class` is not None or a class that subclasses BaseObject.
         """
         if base_class is None:
-            base_class = BaseObject
-        if not (inspect.isclass(base_class) and issubclass(base_class, BaseObject)):
+            base_class = _BaseObject
+        if not (inspect.isclass(base_class) and issubclass(base_class, _BaseObject)):
             msg = "`base_class` must be None or a class that subclasses "
             msg += f"BaseObject, but found {type(base_class)}"
             raise TypeError(msg)
 
         # retrieve parameter names to exclude them later
-        param_names = self._get_param_names(sort=False)
+        param_names = set(self._get_param_names(sort=False))
 
         # retrieve all attributes that are BaseObject descendants
-        attrs = [attr for attr in dir(self) if "__" not in attr]
-        cls_attrs = list(dir(type(self)))
-        self_attrs = set(attrs).difference(cls_attrs).difference(param_names)
-
-        comp_dict = {x: getattr(self, x) for x in self_attrs}
-        comp_dict = {x: y for (x, y) in comp_dict.items() if isinstance(y, base_class)}
+        comp_dict = {
+            x: y
+            for (x, y) in _instance_attributes(self).items()
+            if x not in param_names and isinstance(y, base_class)
+        }
 
         return comp_dict
 
+    def memory_usage(self, deep: bool = True) -> dict[str, int]:
+        """Estimate the memory used by the object, broken down by attribute.
+
+        The parameters and fitted attributes of the object (including its
+        components) are measured, following the objects they reference.
+
+        Parameters
+        ----------
+        deep : bool, default=True
+            Whether to break down the memory used by attributes whose values are
+            BaseObjects.
+
+            - If True, then the attributes of BaseObject-valued attributes are
+              reported separately, using paths like
+              ``[attributename]__[componentattributename]``.
+            - If False, then each attribute is reported as a whole.
+
+        Returns
+        -------
+        dict[str, int]
+            Mapping of attribute paths to the estimated number of bytes they use.
+            The object itself (its header and instance ``__dict__``) is reported
+            using the path "", and BaseObject-valued attributes that are broken
+            down are reported in the same way using their path. Objects that are
+            referenced more than once are only counted at the first path they
+            are found at, so the total is ``sum(obj.memory_usage().values())``.
+
+        See Also
+        --------
+        predictably_core.utils.deep_sizeof :
+            Estimate the memory used by an object and the objects it references.
+
+        Notes
+        -----
+        Sizes are estimated with ``sys.getsizeof``, except that array-likes with
+        an `nbytes` attribute (like NumPy arrays) are measured by the size of
+        their data buffer, which is only counted once for all of its views.
+
+        Examples
+        --------
+        >>> from predictably_core.core import BaseEstimator
+        >>> class Estimator(BaseEstimator):
+        ...     def __init__(self, n=3, component=None):
+        ...         self.n = n
+        ...         self.component = component
+        ...         super().__init__()
+        ...     def fit(self):
+        ...         self.weights_ = [0.0] * 1000
+        ...         return self
+        >>> estimator = Estimator(component=Estimator()).fit()
+        >>> usage = estimator.memory_usage()
+        >>> list(usage)  # doctest: +NORMALIZE_WHITESPACE
+        ['', 'n', 'component', '_is_fitted', 'weights_', '_fitted_registry',
+         'component__n', 'component__component', 'component___is_fitted']
+        >>> max(usage, key=usage.get)
+        'weights_'
+        """
+        from predictably_core.utils._memory import deep_sizeof
+
+        usage: dict[str, int] = {}
+        seen: set[int] = set()
+        # Components are broken down using a stack of (path, object) pairs
+        stack: list[tuple[str, Any]] = [("", self)]
+        while stack:
+            path, obj = stack.pop()
+            seen.add(id(obj))
+            attrs = _instance_attributes(obj)
+            instance_dict = getattr(obj, "__dict__", None)
+            own_size = sys.getsizeof(obj)
+            if instance_dict is not None:
+                seen.add(id(instance_dict))
+                own_size += sys.getsizeof(instance_dict)
+                # The attribute names, and the attributes that aren't reported
+                # separately, belong to the object
+                own_size += sum(
+                    deep_sizeof(name, seen)
+                    + (0 if name in attrs else deep_sizeof(value, seen))
+                    for name, value in instance_dict.items()
+                )
+            usage[path] = own_size
+
+            components = []
+            for name, value in attrs.items():
+                attr_path = f"{path}__{name}" if path else name
+                if deep and isinstance(value, _BaseObject) and id(value) not in seen:
+                    # Reserve the position of the component in the breakdown, so
+                    # later references to it aren't counted again
+                    seen.add(id(value))
+                    usage[attr_path] = 0
+                    components.append((attr_path, value))
+                else:
+                    usage[attr_path] = deep_sizeof(value, seen)
+            stack.extend(reversed(components))
+        return usage
+
     def __repr__(self, n_char_max: int = 700) -> str:
         """Represent class as string.
 
@@ -994,6 +1352,8 @@ class BaseObject:
         str
             String representation of the object.
         """
+        from predictably_core.core._pprint._object_html_repr import _object_html_repr
+
         return _object_html_repr(self)
 
     def _repr_mimebundle_(self, **kwargs: Any) -> dict[str, Any]:
@@ -1015,21 +1375,38 @@ class BaseObject:
         """
         output = {"text/plain": repr(self)}
         if self._get_config()["display"] == "diagram":
+            from predictably_core.core._pprint._object_html_repr import (
+                _object_html_repr,
+            )
+
             output["text/html"] = _object_html_repr(self)
         return output
 
 
-class BaseEstimator(BaseObject):
-    """Base class for estimators with scikit-learn and sktime design patterns.
+class _BaseEstimator(_BaseObject):
+    """Implementation of the BaseEstimator interface.
 
-    Extends BaseObject to include basic functionality for fittable estimators.
+    It is shared by BaseEstimator and SlottedBaseEstimator.
     """
 
+    __slots__ = ()
+
+    _is_fitted: bool
+    # Names of fitted attributes that don't end with an underscore
+    _fitted_attribute_names: ClassVar[tuple[str, ...]] = ()
+
     def __init__(self) -> None:
         """Initialize the object."""
-        self._is_fitted: bool = False
+        self._is_fitted = False
         super().__init__()
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Wrap the `fit` method defined by a subclass to record fitted attributes."""
+        super().__init_subclass__(**kwargs)
+        fit = cls.__dict__.get("fit")
+        if inspect.isfunction(fit) and not getattr(fit, "_uses_fit_cache", False):
+            cls.fit = _use_fit_cache(fit)  # type: ignore[attr-defined]
+
     @property
     def is_fitted(self) -> bool:
         """Whether `fit` has been called.
@@ -1045,7 +1422,117 @@ class BaseEstimator(BaseObject):
         """
         return self._is_fitted
 
-    def check_is_fitted(self, raise_error: bool = True) -> bool:
+    @property
+    def fitted_attributes(self) -> tuple[str, ...]:
+        """Names of the fitted attributes that are set on the estimator.
+
+        Fitted attributes are recorded when `fit` returns, so this doesn't
+        require inspecting the estimator's other attributes.
+
+        Returns
+        -------
+        tuple[str, ...]
+            The names of the fitted attributes that are still set, in the order
+            they were first assigned.
+
+        Examples
+        --------
+        >>> from predictably_core.core import BaseEstimator
+        >>> class Estimator(BaseEstimator):
+        ...     _fitted_attribute_names = ("_n_seen",)
+        ...     def __init__(self, alpha=1.0):
+        ...         self.alpha = alpha
+        ...         super().__init__()
+        ...     def fit(self):
+        ...         self.coef_ = [self.alpha]
+        ...         self._n_seen = 10
+        ...         self._cache = {}
+        ...         self._is_fitted = True
+        ...         return self
+        >>> estimator = Estimator()
+        >>> estimator.fitted_attributes
+        ()
+        >>> estimator.fit().fitted_attributes
+        ('coef_', '_n_seen')
+        >>> estimator.reset().fitted_attributes
+        ()
+        """
+        registry = getattr(self, "_fitted_registry", None)
+        if not registry:
+            return ()
+        return tuple(name for name in registry if hasattr(self, name))
+
+    def reset(self) -> Self:
+        """Re-initialize the estimator to a post-init state.
+
+        The recorded fitted attributes are deleted directly, before the
+        remaining attributes other than the hyper-parameters are removed and
+        ``__init__`` is run as in :meth:`BaseObject.reset`.
+
+        Returns
+        -------
+        self
+            Instance of class reset to a clean post-init state but retaining
+            the current hyper-parameter values.
+        """
+        registry = getattr(self, "_fitted_registry", None)
+        if registry is not None:
+            for name in registry:
+                if hasattr(self, name):
+                    delattr(self, name)
+            del self._fitted_registry
+        return super().reset()
+
+    def memory_usage(
+        self, deep: bool = True, fitted_only: bool = False
+    ) -> dict[str, int]:
+        """Estimate the memory used by the estimator's attributes.
+
+        Parameters
+        ----------
+        deep : bool, default=True
+            Whether to break down the memory used by attributes whose values are
+            BaseObjects (see :meth:`BaseObject.memory_usage`). Ignored if
+            `fitted_only` is True.
+        fitted_only : bool, default=False
+            Whether only the recorded fitted attributes (see
+            `fitted_attributes`) are measured, each as a whole. This doesn't
+            inspect the estimator's other attributes.
+
+        Returns
+        -------
+        dict[str, int]
+            Mapping of attribute paths to the estimated number of bytes they use.
+            If `fitted_only` is True, maps the names of the fitted attributes
+            to their size, with objects they share only counted once.
+
+        Examples
+        --------
+        >>> from predictably_core.core import BaseEstimator
+        >>> class Estimator(BaseEstimator):
+        ...     def fit(self):
+        ...         self.weights_ = [0.0] * 1000
+        ...         self.n_weights_ = 1000
+        ...         return self
+        >>> usage = Estimator().fit().memory_usage(fitted_only=True)
+        >>> list(usage)
+        ['weights_', 'n_weights_']
+        """
+        if not fitted_only:
+            return super().memory_usage(deep=deep)
+        from predictably_core.utils._memory import deep_sizeof
+
+        seen: set[int] = set()
+        return {
+            name: deep_sizeof(getattr(self, name), seen)
+            for name in self.fitted_attributes
+        }
+
+    def check_is_fitted(
+        self,
+        raise_error: bool = True,
+        attributes: str | Sequence[str] | None = None,
+    ) -> bool:
         """Check if the estimator has been fitted.
 
         Inspects object's `_is_fitted` attribute that should initialize to False
@@ -1061,6 +1548,11 @@ class BaseEstimator(BaseObject):
               estimator is not fitted.
             - Otherwise, returns True or False indicating if the estimator has been fit.
 
+        attributes : str | Sequence[str] | None, default=None
+            The fitted attribute(s) that must also be set for the estimator to be
+            considered fitted. These are looked up in the recorded fitted
+            attributes (see `fitted_attributes`).
+
         Returns
         -------
         bool
@@ -1070,11 +1562,221 @@ class BaseEstimator(BaseObject):
         ------
         NotFittedError
             If the estimator has not been fitted yet.
+
+        Examples
+        --------
+        >>> from predictably_core.core import BaseEstimator
+        >>> class Estimator(BaseEstimator):
+        ...     def fit(self):
+        ...         self.coef_ = 1.0
+        ...         self._is_fitted = True
+        ...         return self
+        >>> estimator = Estimator().fit()
+        >>> estimator.check_is_fitted(attributes="coef_")
+        True
+        >>> estimator.check_is_fitted(raise_error=False, attributes="intercept_")
+        False
         """
-        if not self.is_fitted and raise_error:
-            raise NotFittedError(
-                f"This instance of {self.__class__.__name__} has not been fitted yet. "
-                f"Please call `fit` first."
-            )
+        is_fitted = self.is_fitted
+        missing: list[str] = []
+        if is_fitted and attributes is not None:
+            if isinstance(attributes, str):
+                attributes = [attributes]
+            registry = getattr(self, "_fitted_registry", {})
+            missing = [
+                name
+                for name in attributes
+                if name not in registry or not hasattr(self, name)
+            ]
+            is_fitted = not missing
+        if not is_fitted and raise_error:
+            msg = f"This instance of {self.__class__.__name__} has not been fitted yet."
+            if missing:
+                missing_str = format_sequence_to_str(missing, last_sep="and")
+                msg = (
+                    f"This instance of {self.__class__.__name__} is missing the "
+                    f"fitted attribute(s) {missing_str}."
+                )
+            raise NotFittedError(f"{msg} Please call `fit` first.")
         else:
-            return self.is_fitted
+            return is_fitted
+
+    def save(self, path: str | pathlib.Path) -> None:
+        """Save the estimator to a directory.
+
+        The estimator's parameters and small state are pickled into a manifest,
+        while large buffers (like the data of NumPy arrays) are written to
+        separate raw files, so they can be memory mapped by `load`.
+
+        Parameters
+        ----------
+        path : str | pathlib.Path
+            The directory to save the estimator to. It is created if it doesn't
+            exist, and files from an earlier save are replaced.
+
+        See Also
+        --------
+        load :
+            Load an estimator saved to a directory.
+
+        Examples
+        --------
+        >>> import tempfile
+        >>> from predictably_core.core import BaseEstimator
+        >>> estimator = BaseEstimator()._set_config(display="text")
+        >>> with tempfile.TemporaryDirectory() as path:
+        ...     estimator.save(path)
+        ...     loaded = BaseEstimator.load(path)
+        >>> loaded._get_config()["display"]
+        'text'
+        """
+        from predictably_core.core._persist import _save_estimator
+
+        _save_estimator(self, path)
+
+    @classmethod
+    def load(cls, path: str | pathlib.Path, mmap: bool = True) -> Self:
+        """Load an estimator saved to a directory by `save`.
+
+        Parameters
+        ----------
+        path : str | pathlib.Path
+            The directory the estimator was saved to.
+        mmap : bool, default=True
+            Whether the large buffers saved in separate files are memory mapped
+            instead of read into memory.
+
+            - If True, arrays backed by these buffers are read-only and share
+              their memory (through the operating system's page cache) with
+              other processes that load the same files. Loading takes time
+              independent of the size of these buffers, and their data is read
+              from disk as it is used.
+            - If False, the buffers are read into memory owned by the estimator.
+
+        Returns
+        -------
+        BaseEstimator
+            The loaded estimator.
+
+        Raises
+        ------
+        FileNotFoundError
+            If `path` doesn't contain a saved estimator.
+        TypeError
+            If the loaded estimator isn't an instance of the class `load` is
+            called on.
+
+        See Also
+        --------
+        save :
+            Save the estimator to a directory.
+
+        Notes
+        -----
+        The estimator is unpickled, so it should only be loaded from trusted
+        sources. Memory mapped files must not be modified or removed while the
+        estimator is used.
+        """
+        from predictably_core.core._persist import _load_estimator
+
+        estimator = _load_estimator(path, mmap_mode=mmap)
+        if not isinstance(estimator, cls):
+            raise TypeError(
+                f"Expected the estimator saved in {path} to be an instance of "
+                f"{cls.__name__}, but found {type(estimator).__name__}."
+            )
+        return estimator
+
+
+class BaseObject(_BaseObject):
+    """Base class for `predictably` classes with tag and config management.
+
+    All classes in `predictably` that use the tag interface or allow users
+    to override the global configuration should inherit from ``BaseClass``.
+    """
+
+
+class SlottedBaseObject(_BaseObject):
+    """BaseObject for subclasses storing all their attributes in ``__slots__``.
+
+    Instances of subclasses that declare all their attributes (parameters and
+    other attributes) in ``__slots__`` don't have an instance ``__dict__``,
+    which reduces the memory used by each instance. The dynamic tag and config
+    overrides are stored in slots, which are only set when they are first
+    overridden.
+
+    The interface is the same as BaseObject, but SlottedBaseObject isn't a
+    subclass of BaseObject, since the instance ``__dict__`` of BaseObject would
+    be inherited. Subclasses can't be combined with classes that have their
+    own instance layout (like ``Exception`` or classes declaring non-empty
+    ``__slots__``), so classes that need such multiple inheritance should use
+    BaseObject.
+
+    Examples
+    --------
+    >>> from predictably_core.core import SlottedBaseObject
+    >>> class Config(SlottedBaseObject):
+    ...     __slots__ = ("horizon",)
+    ...     def __init__(self, horizon=1):
+    ...         self.horizon = horizon
+    ...         super().__init__()
+    >>> config = Config(horizon=3)
+    >>> hasattr(config, "__dict__")
+    False
+    >>> config.set_params(horizon=5).get_params()
+    {'horizon': 5}
+    """
+
+    __slots__ = ("_config_dynamic", "_tags_dynamic")
+
+
+class BaseEstimator(_BaseEstimator, BaseObject):
+    """Base class for estimators with scikit-learn and sktime design patterns.
+
+    Extends BaseObject to include basic functionality for fittable estimators.
+
+    The fitted attributes set by the `fit` method of subclasses are recorded
+    when `fit` returns. By convention, these are attributes whose name ends
+    with an underscore (like ``coef_``) and doesn't contain "__". Attributes
+    that don't follow the convention can be declared as fitted attributes by
+    listing them in the class attribute `_fitted_attribute_names`.
+
+    The `fit` method of subclasses uses the fit cache when the ``fit_cache``
+    configuration is turned on (globally, or for the class or instance using
+    the ``_config`` class attribute or `_set_config`). Fitting an estimator
+    with the same class, parameters and `fit` arguments as an earlier fit then
+    restores the cached fitted state instead (see
+    :func:`~predictably_core.core.fit_cache_info`). This requires that the
+    fitted state only depends on the parameters and the arguments of `fit`.
+    """
+
+
+class SlottedBaseEstimator(_BaseEstimator, SlottedBaseObject):
+    """BaseEstimator for subclasses storing all their attributes in ``__slots__``.
+
+    Subclasses should declare their parameters and fitted attributes in
+    ``__slots__``, so that their instances don't have an instance ``__dict__``
+    (see :class:`SlottedBaseObject`). The interface is the same as
+    BaseEstimator, but SlottedBaseEstimator isn't a subclass of BaseEstimator
+    or BaseObject.
+
+    Examples
+    --------
+    >>> from predictably_core.core import SlottedBaseEstimator
+    >>> class Mean(SlottedBaseEstimator):
+    ...     __slots__ = ("shift", "mean_")
+    ...     def __init__(self, shift=0.0):
+    ...         self.shift = shift
+    ...         super().__init__()
+    ...     def fit(self, x):
+    ...         self.mean_ = sum(x) / len(x) + self.shift
+    ...         self._is_fitted = True
+    ...         return self
+    >>> estimator = Mean().fit([1.0, 2.0])
+    >>> estimator.fitted_attributes
+    ('mean_',)
+    >>> estimator.reset().is_fitted
+    False
+    """
+
+    __slots__ = ("_fitted_registry", "_is_fitted")
@@ -165,8 +165,12 @@ def _clone_parametrized(obj, *, safe: bool = True):
     if hasattr(obj, "_sklearn_output_config"):
         new_object._sklearn_output_config = copy.deepcopy(obj._sklearn_output_config)
 
-    # Handles cloning of predictably tags and configs
+    # Handles cloning of predictably tags and configs. Class level tags and
+    # configs are only copied if they were overridden on the instance
+    instance_dict = getattr(obj, "__dict__", {})
     for attr_ in ("_tags", "_tags_dynamic", "_config", "_config_dynamic"):
-        if hasattr(obj, attr_):
+        if attr_ in instance_dict or (
+            attr_.endswith("_dynamic") and hasattr(obj, attr_)
+        ):
             setattr(new_object, attr_, getattr(obj, attr_))
     return new_object
@@ -7,6 +7,8 @@ Custom exceptions used to raise useful error messages in `predictably`.
 
 from __future__ import annotations
 
+from typing import Any
+
 __author__: list[str] = ["RNKuhns"]
 
 
@@ -20,6 +22,26 @@ class ForwardRefError(TypeError):
     pass
 
 
+class ValidationReportError(TypeError, ValueError):
+    """Error summarizing all issues found when validating an input.
+
+    This class inherits from both TypeError and ValueError, so that it is caught
+    by handlers of the errors raised by the validation functions that fail on
+    the first issue.
+
+    Parameters
+    ----------
+    *args : Any
+        The arguments of the exception (e.g., the error message).
+    report : ValidationReport, default=None
+        The report of the issues that were found.
+    """
+
+    def __init__(self, *args: Any, report: Any = None) -> None:
+        super().__init__(*args)
+        self.report = report
+
+
 class NotFittedError(ValueError, AttributeError):
     """Exception class to raise if estimator is used before fitting.
 
@@ -0,0 +1,539 @@
+#!/usr/bin/env python3 -u
+# copyright: predict-ably, BSD-3-Clause License (see LICENSE file)
+"""Cache the fitted state of estimators, keyed by their parameters and data.
+
+When the ``fit_cache`` configuration is turned on, the `fit` method of
+BaseEstimators first computes a digest of the estimator's class (including the
+code of its methods and the version of the packages defining it), parameters
+and the arguments passed to `fit`. If fitted state was cached for the digest, it
+is restored instead of fitting the estimator. Otherwise, the estimator is fit
+and its fitted state is cached in memory or on disk, where the least recently
+used entries are removed once the cache exceeds ``fit_cache_max_bytes``.
+
+The cache is only correct for estimators whose fitted state depends only on
+their parameters and the arguments passed to `fit`. Estimators that are already
+fitted are always fit without the cache, since their `fit` may reuse their
+fitted state (like when warm starting). Changes to code that the class's
+methods call (like functions defined outside of the class) aren't detected,
+unless the version of the package defining the class changes, so the disk cache
+should be cleared after such changes (see `clear_fit_cache`).
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import hashlib
+import inspect
+import json
+import marshal
+import os
+import pathlib
+import pickle  # noqa: S403
+import stat
+import sys
+import threading
+import warnings
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
+
+from predictably_core.config import get_config
+from predictably_core.core._spec import _qualified_name, _SpecConverter
+
+if TYPE_CHECKING:  # pragma: no cover
+    from predictably_core.core._base import BaseEstimator
+
+__author__: list[str] = ["RNKuhns"]
+__all__: list[str] = ["FitCacheInfo", "clear_fit_cache", "fit_cache_info"]
+
+_ENTRY_SUFFIX = ".pkl"
+# Directory in the user's cache directory used when the ``fit_cache_dir``
+# configuration is an empty string
+_DEFAULT_DIR_NAME = "predictably_fit_cache"
+# Errors raised when pickling objects that don't support it
+_PICKLING_ERRORS = (pickle.PicklingError, TypeError, AttributeError)
+
+
+class FitCacheInfo(NamedTuple):
+    """Statistics of the fit cache in the current process.
+
+    Parameters
+    ----------
+    hits : int
+        The number of fits that restored cached state.
+    misses : int
+        The number of fits whose state wasn't found in the cache.
+    memory_entries : int
+        The number of fitted states cached in memory.
+    memory_bytes : int
+        The number of bytes of fitted state cached in memory.
+    """
+
+    hits: int
+    misses: int
+    memory_entries: int
+    memory_bytes: int
+
+
+class _FitCache:
+    """Thread-safe statistics and in-memory entries of the fit cache.
+
+    Entries are pickled fitted states, kept in least recently used order.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.entries: collections.OrderedDict[str, bytes] = collections.OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> bytes | None:
+        """Get the entry of a digest, marking it as the most recently used."""
+        with self.lock:
+            payload = self.entries.get(key)
+            if payload is not None:
+                self.entries.move_to_end(key)
+            return payload
+
+    def put(self, key: str, payload: bytes, max_bytes: int) -> None:
+        """Add an entry, removing the least recently used entries over the limit."""
+        with self.lock:
+            old_payload = self.entries.pop(key, None)
+            if old_payload is not None:
+                self.nbytes -= len(old_payload)
+            self.entries[key] = payload
+            self.nbytes += len(payload)
+            while self.nbytes > max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.nbytes -= len(evicted)
+
+    def discard(self, key: str) -> None:
+        """Remove the entry of a digest, if there is one."""
+        with self.lock:
+            payload = self.entries.pop(key, None)
+            if payload is not None:
+                self.nbytes -= len(payload)
+
+    def count(self, hit: bool) -> None:
+        """Count a cache hit or miss."""
+        with self.lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self.lock:
+            self.entries.clear()
+            self.nbytes = self.hits = self.misses = 0
+
+
+class _ThreadLocalFits(threading.local):
+    """The ids of the estimators whose `fit` is run by the cache in each thread.
+
+    Calls to `fit` made while an estimator is being fit (like calls to the
+    parent class's `fit` using ``super()``) aren't cached separately.
+    """
+
+    def __init__(self) -> None:
+        self.ids: set[int] = set()
+
+
+_FIT_CACHE = _FitCache()
+_FITS_IN_PROGRESS = _ThreadLocalFits()
+# Digest of the code of each class, computed the first time it is fit
+_CLASS_DIGESTS: weakref.WeakKeyDictionary[type, bytes] = weakref.WeakKeyDictionary()
+
+
+def _update_digest(hasher: Any, data: Any) -> None:
+    """Add data to a digest, prefixed by its size so boundaries are unambiguous."""
+    hasher.update(memoryview(data).nbytes.to_bytes(8, "little"))
+    hasher.update(data)
+
+
+def _update_digest_with_pickle(hasher: Any, obj: Any) -> None:
+    """Add an object to a digest by pickling it.
+
+    Out-of-band buffers (like the data of NumPy arrays) are added to the digest
+    directly, rather than being copied into the pickle.
+    """
+
+    def hash_buffer(buffer: pickle.PickleBuffer) -> bool:
+        try:
+            raw = buffer.raw()
+        except BufferError:  # Non-contiguous buffers are kept in the pickle
+            return True
+        _update_digest(hasher, raw)
+        return False
+
+    _update_digest(hasher, pickle.dumps(obj, protocol=5, buffer_callback=hash_buffer))
+
+
+def _class_digest(cls: type) -> bytes:
+    """Compute the digest of the code of a class and its parent classes.
+
+    The digest covers the qualified name of each class in the method resolution
+    order, the version of the package defining it, and the compiled code of the
+    functions defined in its body, so editing a class's methods (in a later
+    process) changes the digest.
+
+    Parameters
+    ----------
+    cls : type
+        The class.
+
+    Returns
+    -------
+    bytes
+        The digest.
+    """
+    digest = _CLASS_DIGESTS.get(cls)
+    if digest is not None:
+        return digest
+    hasher = hashlib.sha256()
+    for klass in cls.__mro__:
+        package = sys.modules.get(klass.__module__.partition(".")[0])
+        version = getattr(package, "__version__", "")
+        _update_digest(hasher, f"{_qualified_name(klass)}:{version}".encode())
+        for name, value in sorted(vars(klass).items()):
+            if isinstance(value, property):
+                value = value.fget
+            # Static and class methods, and the functions wrapped by the fit cache
+            function = inspect.unwrap(getattr(value, "__func__", value))
+            code = getattr(function, "__code__", None)
+            if code is not None:
+                _update_digest(hasher, name.encode())
+                _update_digest(hasher, marshal.dumps(code))
+    digest = _CLASS_DIGESTS[cls] = hasher.digest()
+    return digest
+
+
+def _fit_digest(
+    estimator: BaseEstimator, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> str | None:
+    """Compute the digest identifying a call to an estimator's `fit` method.
+
+    Parameters
+    ----------
+    estimator : BaseEstimator
+        The estimator being fit.
+    args : tuple[Any, ...]
+        The positional arguments passed to `fit`.
+    kwargs : dict[str, Any]
+        The keyword arguments passed to `fit`.
+
+    Returns
+    -------
+    str | None
+        The hexadecimal digest of the estimator's class (see `_class_digest`),
+        its spec (or its pickled parameters and overrides if it can't be
+        converted to a spec) and the pickled arguments, or None if the arguments
+        can't be pickled.
+    """
+    hasher = hashlib.sha256()
+    _update_digest(hasher, _class_digest(type(estimator)))
+    try:
+        spec = _SpecConverter().to_spec(estimator)
+        _update_digest(hasher, json.dumps(spec, sort_keys=True).encode())
+    except TypeError:
+        # Parameters that can't be converted to a spec (like arrays) are pickled
+        try:
+            _update_digest_with_pickle(
+                hasher,
+                (
+                    estimator.get_params(deep=False),
+                    getattr(estimator, "_tags_dynamic", None),
+                    getattr(estimator, "_config_dynamic", None),
+                ),
+            )
+        except _PICKLING_ERRORS:
+            return None
+    try:
+        _update_digest_with_pickle(hasher, (args, kwargs))
+    except _PICKLING_ERRORS:
+        return None
+    return hasher.hexdigest()
+
+
+def _cache_dir(directory: str) -> pathlib.Path:
+    """Get the directory of the disk cache from the ``fit_cache_dir`` config."""
+    if directory:
+        return pathlib.Path(directory)
+    # The default directory belongs to the current user, rather than being
+    # shared with other users (like a directory in the system's temporary
+    # directory would be)
+    if os.name == "nt" and os.environ.get("LOCALAPPDATA"):
+        cache_home = pathlib.Path(os.environ["LOCALAPPDATA"])
+    else:
+        cache_home = pathlib.Path(
+            os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache"
+        )
+    return cache_home / _DEFAULT_DIR_NAME
+
+
+def _is_private_dir(directory: pathlib.Path) -> bool:
+    """Check whether only the current user can write to the disk cache directory.
+
+    The directory is created (only accessible by the current user) if it doesn't
+    exist. Cached entries are unpickled, so entries in directories that other
+    users can write to must not be read.
+
+    Parameters
+    ----------
+    directory : pathlib.Path
+        The directory of the disk cache.
+
+    Returns
+    -------
+    bool
+        Whether the directory is owned by the current user and can't be written
+        to by other users. Always True for existing directories on platforms
+        without POSIX permissions.
+    """
+    try:
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        info = directory.stat()
+    except OSError:
+        return False
+    if not stat.S_ISDIR(info.st_mode):
+        return False
+    if os.name != "posix":
+        return True
+    return info.st_uid == os.getuid() and not info.st_mode & (
+        stat.S_IWGRP | stat.S_IWOTH
+    )
+
+
+def _read_disk_entry(directory: pathlib.Path, key: str) -> bytes | None:
+    """Read the entry of a digest, marking it as the most recently used."""
+    path = directory / f"{key}{_ENTRY_SUFFIX}"
+    try:
+        payload = path.read_bytes()
+    except OSError:
+        return None
+    # Entries are removed in order of their modification time
+    with contextlib.suppress(OSError):
+        os.utime(path)
+    return payload
+
+
+def _write_disk_entry(
+    directory: pathlib.Path, key: str, payload: bytes, max_bytes: int
+) -> None:
+    """Write an entry, removing the least recently used entries over the limit."""
+    # Entries are written to a temporary file and then moved into place, so other
+    # processes never read partially written entries
+    temp_path = directory / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        temp_path.write_bytes(payload)
+        temp_path.replace(directory / f"{key}{_ENTRY_SUFFIX}")
+    except OSError:
+        with contextlib.suppress(OSError):
+            temp_path.unlink(missing_ok=True)
+        raise
+
+    entries = []
+    total = 0
+    for path in directory.glob(f"*{_ENTRY_SUFFIX}"):
+        with contextlib.suppress(FileNotFoundError):
+            stat = path.stat()
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+            total += stat.st_size
+    entries.sort()
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def _fit_with_cache(
+    estimator: BaseEstimator,
+    fit: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    config: dict[str, Any],
+) -> Any:
+    """Fit an estimator, or restore its fitted state from the fit cache.
+
+    Parameters
+    ----------
+    estimator : BaseEstimator
+        The estimator being fit.
+    fit : Callable
+        The estimator's `fit` method (as a function of the estimator and the
+        arguments).
+    args : tuple[Any, ...]
+        The positional arguments passed to `fit`.
+    kwargs : dict[str, Any]
+        The keyword arguments passed to `fit`.
+    config : dict[str, Any]
+        The estimator's ``fit_cache``, ``fit_cache_dir`` and
+        ``fit_cache_max_bytes`` configuration.
+
+    Returns
+    -------
+    Any
+        The value returned by `fit`, or the estimator if its fitted state was
+        restored from the cache.
+    """
+    fits_in_progress = _FITS_IN_PROGRESS.ids
+    # Fitted estimators may reuse their fitted state in `fit`, which isn't part
+    # of the digest
+    if (
+        id(estimator) in fits_in_progress
+        or estimator.is_fitted
+        or estimator.fitted_attributes
+    ):
+        return fit(estimator, *args, **kwargs)
+    directory = None
+    if config["fit_cache"] == "disk":
+        directory = _cache_dir(config["fit_cache_dir"])
+        if not _is_private_dir(directory):
+            warnings.warn(
+                f"The fit cache directory {directory} isn't used, because it "
+                "isn't a directory owned by the current user that only they can "
+                "write to. Estimators are fit without the cache.",
+                UserWarning,
+                stacklevel=3,
+            )
+            return fit(estimator, *args, **kwargs)
+    key = _fit_digest(estimator, args, kwargs)
+    if key is None:
+        return fit(estimator, *args, **kwargs)
+
+    if directory is not None:
+        payload = _read_disk_entry(directory, key)
+    else:
+        payload = _FIT_CACHE.get(key)
+    if payload is not None:
+        try:
+            state = pickle.loads(payload)  # noqa: S301
+        except Exception:
+            # Corrupt entries, or entries referring to classes that were renamed
+            # or moved since they were written, are removed and treated as misses
+            state = None
+            if directory is not None:
+                with contextlib.suppress(OSError):
+                    (directory / f"{key}{_ENTRY_SUFFIX}").unlink(missing_ok=True)
+            else:
+                _FIT_CACHE.discard(key)
+        if state is not None:
+            _FIT_CACHE.count(hit=True)
+            for name, value in state.items():
+                setattr(estimator, name, value)
+            return estimator
+
+    _FIT_CACHE.count(hit=False)
+    fits_in_progress.add(id(estimator))
+    try:
+        result = fit(estimator, *args, **kwargs)
+    finally:
+        fits_in_progress.discard(id(estimator))
+
+    from predictably_core.core._base import _set_attribute_names
+
+    # The parameters are part of the digest, so only the other attributes are
+    # cached
+    param_names = set(estimator._get_param_names(sort=False))
+    state = {
+        name: getattr(estimator, name)
+        for name in _set_attribute_names(estimator)
+        if name not in param_names
+    }
+    try:
+        payload = pickle.dumps(state, protocol=5)
+    except _PICKLING_ERRORS:
+        return result
+    max_bytes = config["fit_cache_max_bytes"]
+    if len(payload) <= max_bytes:
+        if directory is not None:
+            try:
+                _write_disk_entry(directory, key, payload, max_bytes)
+            except OSError as exc:
+                # The estimator was fit, so failing to cache it isn't an error
+                warnings.warn(
+                    f"The fitted state of {type(estimator).__name__} couldn't be "
+                    f"written to the fit cache directory {directory}: {exc}",
+                    UserWarning,
+                    stacklevel=3,
+                )
+        else:
+            _FIT_CACHE.put(key, payload, max_bytes)
+    return result
+
+
+def fit_cache_info() -> FitCacheInfo:
+    """Get statistics of the fit cache in the current process.
+
+    Returns
+    -------
+    FitCacheInfo
+        Named tuple with the number of cache hits and misses (counted since the
+        cache was last cleared), along with the number of entries and bytes
+        cached in memory.
+
+    See Also
+    --------
+    clear_fit_cache :
+        Clear the fit cache and its statistics.
+
+    Examples
+    --------
+    >>> from predictably_core.config import config_context
+    >>> from predictably_core.core import (
+    ...     BaseEstimator, clear_fit_cache, fit_cache_info
+    ... )
+    >>> class Mean(BaseEstimator):
+    ...     def fit(self, x):
+    ...         self.mean_ = sum(x) / len(x)
+    ...         self._is_fitted = True
+    ...         return self
+    >>> clear_fit_cache()
+    >>> with config_context(fit_cache="memory"):
+    ...     first = Mean().fit([1.0, 2.0, 3.0])
+    ...     second = Mean().fit([1.0, 2.0, 3.0])
+    >>> second.mean_
+    2.0
+    >>> info = fit_cache_info()
+    >>> info.hits, info.misses
+    (1, 1)
+    """
+    store = _FIT_CACHE
+    with store.lock:
+        return FitCacheInfo(store.hits, store.misses, len(store.entries), store.nbytes)
+
+
+def clear_fit_cache(disk: bool = False) -> None:
+    """Clear the fit cache and reset its statistics.
+
+    Parameters
+    ----------
+    disk : bool, default=False
+        Whether the entries cached on disk in the directory of the
+        ``fit_cache_dir`` configuration are also removed. Otherwise, only the
+        entries cached in memory of the current process are removed.
+
+    See Also
+    --------
+    fit_cache_info :
+        Get statistics of the fit cache.
+
+    Examples
+    --------
+    >>> from predictably_core.core import clear_fit_cache, fit_cache_info
+    >>> clear_fit_cache()
+    >>> fit_cache_info()
+    FitCacheInfo(hits=0, misses=0, memory_entries=0, memory_bytes=0)
+    """
+    _FIT_CACHE.clear()
+    if not disk:
+        return
+    directory = _cache_dir(get_config()["fit_cache_dir"])
+    if not directory.is_dir():
+        return
+    for path in directory.iterdir():
+        if path.suffix in (_ENTRY_SUFFIX, ".tmp"):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3 -u
+# copyright: predict-ably, BSD-3-Clause License (see LICENSE file)
+"""Save fitted estimators to a directory and load them with memory mapping.
+
+Estimators are pickled (using protocol 5) into a small manifest, while large
+out-of-band buffers (like the data of NumPy arrays) are written to separate raw
+files. When loading, the raw files can be memory mapped instead of read, so
+processes loading the same estimator share one copy of its data through the
+operating system's page cache.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import mmap
+import pathlib
+import pickle  # noqa: S403
+import secrets
+from typing import TYPE_CHECKING, Any
+
+from predictably_core.validate._types import check_path
+
+if TYPE_CHECKING:  # pragma: no cover
+    from predictably_core.core._base import BaseEstimator
+
+__author__: list[str] = ["RNKuhns"]
+__all__: list[str] = ["_load_estimator", "_save_estimator"]
+
+_MANIFEST_NAME = "manifest.pkl"
+_FORMAT_VERSION = 1
+# Smaller buffers are kept in the manifest, since mapping them isn't worthwhile
+_MIN_EXTERNAL_BUFFER_BYTES = 1 << 16
+
+
+def _save_estimator(estimator: BaseEstimator, path: str | pathlib.Path) -> None:
+    """Save an estimator to a directory.
+
+    Parameters
+    ----------
+    estimator : BaseEstimator
+        The estimator to save.
+    path : str | pathlib.Path
+        The directory to save the estimator to. It is created if it doesn't
+        exist, and files from an earlier save are replaced.
+    """
+    path = check_path(path, path_error_name="path")
+    path.mkdir(parents=True, exist_ok=True)
+    # Buffers are written to new files, so the files of an earlier save (and
+    # memory maps of them) aren't modified until the new manifest replaces it
+    save_id = secrets.token_hex(8)
+    buffer_names: list[str] = []
+
+    def write_buffer(buffer: pickle.PickleBuffer) -> bool:
+        try:
+            raw = buffer.raw()
+        except BufferError:  # Non-contiguous buffers are kept in the manifest
+            return True
+        if raw.nbytes < _MIN_EXTERNAL_BUFFER_BYTES:
+            return True
+        name = f"buffer_{save_id}_{len(buffer_names)}.bin"
+        with (path / name).open("wb") as out:
+            out.write(raw)
+        buffer_names.append(name)
+        return False
+
+    payload = pickle.dumps(estimator, protocol=5, buffer_callback=write_buffer)
+    manifest = {
+        "version": _FORMAT_VERSION,
+        "buffers": buffer_names,
+        "payload": payload,
+    }
+    # The manifest is written to a temporary file and then moved into place,
+    # so the directory always contains a complete manifest and its buffers
+    temp_path = path / f"{_MANIFEST_NAME}.{save_id}.tmp"
+    temp_path.write_bytes(pickle.dumps(manifest, protocol=5))
+    temp_path.replace(path / _MANIFEST_NAME)
+
+    # Buffers of earlier (or failed) saves are only removed once the new
+    # manifest is in place
+    current = set(buffer_names)
+    stale_paths = [*path.glob("buffer_*.bin"), *path.glob(f"{_MANIFEST_NAME}.*.tmp")]
+    for stale_path in stale_paths:
+        if stale_path.name not in current:
+            # Files that are memory mapped can't be removed on some platforms
+            with contextlib.suppress(OSError):
+                stale_path.unlink()
+
+
+def _read_buffer(buffer_path: pathlib.Path, mmap_mode: bool) -> Any:
+    """Read a buffer written by `_save_estimator`.
+
+    Parameters
+    ----------
+    buffer_path : pathlib.Path
+        The path of the raw buffer file.
+    mmap_mode : bool
+        Whether the file is memory mapped (read-only) instead of read.
+
+    Returns
+    -------
+    mmap.mmap | bytearray
+        The buffer.
+    """
+    if not mmap_mode:
+        return bytearray(buffer_path.read_bytes())
+    with buffer_path.open("rb") as file:
+        if file.seek(0, 2) == 0:  # Empty files can't be memory mapped
+            return b""
+        # The map stays valid after the file is closed
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _load_estimator(path: str | pathlib.Path, mmap_mode: bool = True) -> Any:
+    """Load an estimator saved by `_save_estimator`.
+
+    Parameters
+    ----------
+    path : str | pathlib.Path
+        The directory the estimator was saved to.
+    mmap_mode : bool, default=True
+        Whether the buffers saved in separate files are memory mapped (and
+        read-only) instead of read into memory.
+
+    Returns
+    -------
+    Any
+        The loaded estimator.
+
+    Raises
+    ------
+    FileNotFoundError
+        If `path` doesn't contain a saved estimator.
+    ValueError
+        If the estimator was saved using an unsupported format.
+    """
+    path = check_path(path, path_error_name="path")
+    manifest_path = path / _MANIFEST_NAME
+    if not manifest_path.is_file():
+        raise FileNotFoundError(f"No saved estimator was found in {path}.")
+    manifest = pickle.loads(manifest_path.read_bytes())  # noqa: S301
+    if manifest.get("version") != _FORMAT_VERSION:
+        raise ValueError(
+            f"The estimator in {path} was saved using an unsupported format "
+            f"version {manifest.get('version')!r}."
+        )
+    buffers = [_read_buffer(path / name, mmap_mode) for name in manifest["buffers"]]
+    return pickle.loads(manifest["payload"], buffers=buffers)  # noqa: S301
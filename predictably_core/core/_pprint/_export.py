@@ -0,0 +1,149 @@
+#!/usr/bin/env python3 -u
+# copyright: predict-ably, BSD-3-Clause License (see LICENSE file)
+"""Functionality to export the representation of BaseObjects to files.
+
+The representations are streamed to the file as they are generated.
+"""
+
+from __future__ import annotations
+
+import pathlib
+from contextlib import contextmanager
+from typing import IO, TYPE_CHECKING, Any, Iterator
+
+from predictably_core.core._pprint._object_html_repr import _write_object_html
+from predictably_core.validate._types import check_path
+
+if TYPE_CHECKING:  # pragma: no cover
+    from predictably_core.core._base import BaseObject
+
+__author__: list[str] = ["RNKuhns"]
+__all__: list[str] = ["export_html", "export_text"]
+
+
+@contextmanager
+def _open_for_writing(file: str | pathlib.Path | IO[str]) -> Iterator[IO[str]]:
+    """Yield a writable text stream for a path or file-like object.
+
+    Paths are opened (and closed on exit), while file-like objects are yielded
+    unchanged and left open.
+
+    Parameters
+    ----------
+    file : str | pathlib.Path | file-like
+        The path or file-like object to write to.
+
+    Yields
+    ------
+    file-like
+        The stream to write to.
+
+    Raises
+    ------
+    TypeError
+        If `file` is not a path or an object with a `write` method.
+    """
+    if isinstance(file, (str, pathlib.Path)):
+        path = check_path(file, path_error_name="file")
+        with path.open("w", encoding="utf-8") as out:
+            yield out
+    elif callable(getattr(file, "write", None)):
+        yield file
+    else:
+        raise TypeError(
+            "`file` must be a str, pathlib.Path or file-like object with a `write` "
+            f"method, but found {type(file).__name__}."
+        )
+
+
+def export_html(base_object: BaseObject, file: str | pathlib.Path | IO[str]) -> None:
+    """Write the HTML diagram of a BaseObject to a file.
+
+    The diagram is the same one displayed in Jupyter notebooks when the
+    ``display`` configuration is set to "diagram". It is streamed to `file` as
+    it is generated, rather than built as a single string in memory. The text
+    representation included as a fallback is written in full, as by
+    `export_text`, while the details of each item of the diagram show at most
+    the first few thousand characters of its representation, so memory use
+    doesn't grow with the size of `base_object`.
+
+    Parameters
+    ----------
+    base_object : BaseObject
+        The BaseObject (or object following the BaseObject API) to export.
+    file : str | pathlib.Path | file-like
+        The path or text file-like object the diagram is written to. Paths are
+        overwritten if they exist.
+
+    Returns
+    -------
+    None
+        No output returned.
+
+    See Also
+    --------
+    export_text :
+        Write the pretty printed text representation of a BaseObject to a file.
+
+    Examples
+    --------
+    >>> import io
+    >>> from predictably_core.core import BaseObject, export_html
+    >>> out = io.StringIO()
+    >>> export_html(BaseObject(), out)
+    >>> out.getvalue()[:7]
+    '<style>'
+    """
+    with _open_for_writing(file) as out:
+        _write_object_html(out, base_object, stream_text=True)
+
+
+def export_text(
+    base_object: BaseObject,
+    file: str | pathlib.Path | IO[str],
+    **kwargs: Any,
+) -> None:
+    """Write the pretty printed text representation of a BaseObject to a file.
+
+    Unlike ``repr(base_object)``, the representation is not truncated, and it
+    is streamed to `file` as it is generated. Nested objects that don't fit on
+    a single line are written one item at a time, without first building their
+    complete representation, so memory use is bounded by the line width and
+    the size of the largest non-composite value (like a long string).
+
+    Parameters
+    ----------
+    base_object : BaseObject
+        The BaseObject (or object following the BaseObject API) to export.
+    file : str | pathlib.Path | file-like
+        The path or text file-like object the representation is written to. Paths
+        are overwritten if they exist.
+    **kwargs : Any
+        Keyword arguments used to override the defaults of the pretty printer
+        (e.g., ``width``, or ``n_max_elements_to_show`` to truncate lists, tuples,
+        dicts and parameters to a maximum number of items).
+
+    Returns
+    -------
+    None
+        No output returned.
+
+    See Also
+    --------
+    export_html :
+        Write the HTML diagram of a BaseObject to a file.
+
+    Examples
+    --------
+    >>> import io
+    >>> from predictably_core.core import BaseObject, export_text
+    >>> out = io.StringIO()
+    >>> export_text(BaseObject(), out)
+    >>> out.getvalue().strip()
+    'BaseObject()'
+    """
+    from predictably_core.core._pprint._pprint import _stream_pformat
+
+    with _open_for_writing(file) as out:
+        _stream_pformat(base_object, out, **kwargs)
+        out.write("\n")
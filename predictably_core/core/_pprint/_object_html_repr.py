@@ -10,6 +10,8 @@ Follows scikit-learn pretty printing conventions.
 # mypy: ignore-errors
 from __future__ import annotations
 
+import collections
+import functools
 import html
 import uuid
 from contextlib import closing
@@ -17,6 +19,7 @@ from io import StringIO
 from string import Template
 
 import predictably_core as prc
+from predictably_core.core._pprint._pprint import _bounded_pformat, _stream_pformat
 
 
 class _VisualBlock:
@@ -94,8 +97,11 @@ def _write_label_html(
     out.write("</div></div>")  # outer_class inner_class
 
 
-def _get_visual_block(base_object):
-    """Generate information about how to display a BaseObject."""
+def _get_visual_block(base_object, details=str):
+    """Generate information about how to display a BaseObject.
+
+    `details` is the callable used to build the details of a single BaseObject.
+    """
     if hasattr(base_object, "_sk_visual_block_"):
         return base_object._sk_visual_block_()
 
@@ -120,7 +126,24 @@ def _get_visual_block(base_object):
         "single",
         base_object,
         names=base_object.__class__.__name__,
-        name_details=str(base_object),
+        name_details=details(base_object),
+    )
+
+
+def _write_omitted_html(out, omitted):
+    """Write a single summary item in place of omitted BaseObjects.
+
+    The omitted objects are counted by class, so the written HTML has a size that
+    depends on the number of distinct classes rather than the number of objects.
+    """
+    counts = collections.Counter(type(obj).__name__ for obj in omitted)
+    class_str = ", ".join(f"{name}: {count}" for name, count in counts.items())
+    _write_label_html(
+        out,
+        f"... and {len(omitted)} more",
+        f"Omitted components (grouped by class): {class_str}",
+        outer_class="sk-item",
+        inner_class="sk-estimator",
     )
 
 
@@ -130,11 +153,39 @@ def _write_base_object_html(
     base_object_label,
     base_object_label_details,
     first_call=False,
+    *,
+    max_items=None,
+    max_depth=None,
+    depth=0,
+    details=str,
 ):
-    """Write BaseObject to html in serial, parallel, or by itself (single)."""
-    est_block = _get_visual_block(base_object)
+    """Write BaseObject to html in serial, parallel, or by itself (single).
 
-    if est_block.kind in ("serial", "parallel"):
+    If `max_items` is not None, then at most `max_items` components are written
+    for a serial or parallel block and the rest are summarized in a single item.
+    If `max_depth` is not None, then serial or parallel blocks nested deeper than
+    `max_depth` are written as a single item instead of being expanded.
+    The details of items written as a single item are built with `details`.
+    """
+    if details is str:
+        est_block = _get_visual_block(base_object)
+    else:
+        est_block = _get_visual_block(base_object, details=details)
+
+    if (
+        est_block.kind in ("serial", "parallel")
+        and max_depth is not None
+        and depth >= max_depth
+    ):
+        _write_label_html(
+            out,
+            base_object.__class__.__name__,
+            details(base_object),
+            outer_class="sk-item",
+            inner_class="sk-estimator",
+            checked=first_call,
+        )
+    elif est_block.kind in ("serial", "parallel"):
         dashed_wrapped = first_call or est_block.dash_wrapped
         dash_cls = " sk-dashed-wrapped" if dashed_wrapped else ""
         out.write(f'<div class="sk-item{dash_cls}">')
@@ -144,16 +195,31 @@ def _write_base_object_html(
 
         kind = est_block.kind
         out.write(f'<div class="sk-{kind}">')
-        est_infos = zip(est_block.objs, est_block.names, est_block.name_details)
+        objs = est_block.objs
+        n_shown = len(objs) if max_items is None else max(max_items, 0)
+        est_infos = zip(objs[:n_shown], est_block.names, est_block.name_details)
+        limits = {"max_items": max_items, "max_depth": max_depth, "details": details}
 
         for est, name, name_details in est_infos:
             if kind == "serial":
-                _write_base_object_html(out, est, name, name_details)
+                _write_base_object_html(
+                    out, est, name, name_details, depth=depth + 1, **limits
+                )
             else:  # parallel
                 out.write('<div class="sk-parallel-item">')
                 # wrap element in a serial visualblock
                 serial_block = _VisualBlock("serial", [est], dash_wrapped=False)
-                _write_base_object_html(out, serial_block, name, name_details)
+                # The wrapping block is not a level of nesting of its own
+                _write_base_object_html(
+                    out, serial_block, name, name_details, depth=depth, **limits
+                )
+                out.write("</div>")  # sk-parallel-item
+
+        if len(objs) > n_shown:
+            if kind == "parallel":
+                out.write('<div class="sk-parallel-item">')
+            _write_omitted_html(out, objs[n_shown:])
+            if kind == "parallel":
                 out.write("</div>")  # sk-parallel-item
 
         out.write("</div></div>")
@@ -168,6 +234,39 @@ def _write_base_object_html(
         )
 
 
+def _format_bytes(n_bytes):
+    """Format a number of bytes using binary units (e.g., "1.5 KiB")."""
+    size = float(n_bytes)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024 or unit == "GiB":
+            break
+        size /= 1024
+    return f"{n_bytes} B" if unit == "B" else f"{size:.1f} {unit}"
+
+
+def _write_memory_usage_html(out, base_object, max_items=None):
+    """Write an item showing the memory used by a BaseObject.
+
+    The item's label shows the total memory usage and its details list the
+    attributes using the most memory, largest first. If `max_items` is not None,
+    then at most `max_items` attributes are listed.
+    """
+    usage = base_object.memory_usage(deep=True)
+    largest = sorted(usage.items(), key=lambda item: item[1], reverse=True)
+    n_shown = len(largest) if max_items is None else max(max_items, 0)
+    lines = [f"{path or '(object)'}: {_format_bytes(size)}" for path, size in largest]
+    details = "\n".join(lines[:n_shown])
+    if len(lines) > n_shown:
+        details += f"\n... and {len(lines) - n_shown} more"
+    _write_label_html(
+        out,
+        f"Memory usage: {_format_bytes(sum(usage.values()))}",
+        details,
+        outer_class="sk-item",
+        inner_class="sk-estimator",
+    )
+
+
 _STYLE = """
 #$id {
   color: black;
@@ -349,6 +448,105 @@ _STYLE = """
 )
 
 
+class _HTMLEscapingWriter:
+    """File-like object escaping text before writing it to another one."""
+
+    def __init__(self, out):
+        self.out = out
+
+    def write(self, text):
+        return self.out.write(html.escape(text))
+
+
+# Maximum number of characters of the details of an item of a streamed diagram
+_MAX_DETAILS_CHARS = 4096
+
+
+def _write_object_html(out, base_object, stream_text=False):
+    """Write the HTML representation of a BaseObject to a file-like object.
+
+    The representation is written piece by piece as the diagram is traversed,
+    so it is never held in memory as a single string.
+
+    If `stream_text` is True, then the text representation used as a fallback is
+    also streamed (without truncation) and the details of each item are built
+    from at most the first ``_MAX_DETAILS_CHARS`` characters of its
+    representation, so that the memory used doesn't depend on the size of
+    `base_object`. Otherwise, the text representations are built with `str`.
+
+    Parameters
+    ----------
+    out : file-like
+        The object implementing `write` that the HTML is written to.
+    base_object : object
+        The BaseObject, inheriting class or class following the API that should be
+         visualized.
+    stream_text : bool, default=False
+        Whether to stream the text representations rather than build them with
+        `str`.
+
+    Notes
+    -----
+    The size of the diagram is bounded by the ``display_max_items`` and
+    ``display_max_depth`` configuration parameters of `base_object`. If its
+    ``display_memory_usage`` configuration parameter is True, then an item
+    showing the memory used by `base_object` is added to the diagram.
+    """
+    config = base_object._get_config() if hasattr(base_object, "_get_config") else {}
+    container_id = "sk-" + str(uuid.uuid4())
+    style_template = Template(_STYLE)
+    style_with_id = style_template.substitute(id=container_id)
+    if stream_text:
+        details = functools.partial(
+            _bounded_pformat,
+            max_chars=_MAX_DETAILS_CHARS,
+            n_max_elements_to_show=30,
+        )
+    else:
+        details = str
+
+    # The fallback message is shown by default and loading the CSS sets
+    # div.sk-text-repr-fallback to display: none to hide the fallback message.
+    #
+    # If the notebook is trusted, the CSS is loaded which hides the fallback
+    # message. If the notebook is not trusted, then the CSS is not loaded and the
+    # fallback message is shown by default.
+    #
+    # The reverse logic applies to HTML repr div.sk-container.
+    # div.sk-container is hidden by default and the loading the CSS displays it.
+    fallback_msg = "Please rerun this cell to show the HTML repr or trust the notebook."
+    out.write(
+        f"<style>{style_with_id}</style>"
+        f'<div id={container_id!r} class="sk-top-container">'
+        '<div class="sk-text-repr-fallback">'
+        "<pre>"
+    )
+    if stream_text:
+        _stream_pformat(base_object, _HTMLEscapingWriter(out))
+    else:
+        out.write(html.escape(str(base_object)))
+    out.write(
+        f"</pre><b>{fallback_msg}</b>"
+        "</div>"
+        '<div class="sk-container" hidden>'
+    )
+    _write_base_object_html(
+        out,
+        base_object,
+        base_object.__class__.__name__,
+        details(base_object),
+        first_call=True,
+        max_items=config.get("display_max_items"),
+        max_depth=config.get("display_max_depth"),
+        details=details,
+    )
+    if config.get("display_memory_usage") and hasattr(base_object, "memory_usage"):
+        _write_memory_usage_html(
+            out, base_object, max_items=config.get("display_max_items")
+        )
+    out.write("</div></div>")
+
+
 def _object_html_repr(base_object: prc._base.BaseOBject) -> str:
     """Build a HTML representation of a BaseObject.
 
@@ -364,39 +562,6 @@ def _object_html_repr(base_object: prc._base.BaseOBject) -> str:
         HTML representation of BaseObject.
     """
     with closing(StringIO()) as out:
-        container_id = "sk-" + str(uuid.uuid4())
-        style_template = Template(_STYLE)
-        style_with_id = style_template.substitute(id=container_id)
-        base_object_str = str(base_object)
-
-        # The fallback message is shown by default and loading the CSS sets
-        # div.sk-text-repr-fallback to display: none to hide the fallback message.
-        #
-        # If the notebook is trusted, the CSS is loaded which hides the fallback
-        # message. If the notebook is not trusted, then the CSS is not loaded and the
-        # fallback message is shown by default.
-        #
-        # The reverse logic applies to HTML repr div.sk-container.
-        # div.sk-container is hidden by default and the loading the CSS displays it.
-        fallback_msg = (
-            "Please rerun this cell to show the HTML repr or trust the notebook."
-        )
-        out.write(
-            f"<style>{style_with_id}</style>"
-            f'<div id={container_id!r} class="sk-top-container">'
-            '<div class="sk-text-repr-fallback">'
-            f"<pre>{html.escape(base_object_str)}</pre><b>{fallback_msg}</b>"
-            "</div>"
-            '<div class="sk-container" hidden>'
-        )
-        _write_base_object_html(
-            out,
-            base_object,
-            base_object.__class__.__name__,
-            base_object_str,
-            first_call=True,
-        )
-        out.write("</div></div>")
-
+        _write_object_html(out, base_object)
         html_output = out.getvalue()
         return html_output
@@ -11,10 +11,11 @@ The pretty printing approach very closely follows scikit-learn.
 from __future__ import annotations
 
 import inspect
+import itertools
 import pprint
 from collections import OrderedDict
 
-from predictably_core.core._base import BaseObject
+from predictably_core.core._base import _BaseObject
 from predictably_core.validate._types import _is_scalar_nan
 
 
@@ -48,7 +49,13 @@ def _changed_params(base_object):
         if init_params[k] == inspect._empty:  # k has no default value
             return True
         # try to avoid calling repr on nested BaseObjects
-        if isinstance(v, BaseObject) and v.__class__ != init_params[k].__class__:
+        if isinstance(v, _BaseObject) and v.__class__ != init_params[k].__class__:
+            return True
+        # the builtin repr of a container of n items has at least 2n characters,
+        # so large containers are changed without building their repr
+        if type(v).__repr__ in (list.__repr__, tuple.__repr__, dict.__repr__) and (
+            2 * len(v) > len(repr(init_params[k]))
+        ):
             return True
         # Use repr as a last resort. It may be expensive.
         return bool(
@@ -278,10 +285,14 @@ class _BaseObjectPrettyPrinter(pprint.PrettyPrinter):
             delim = delimnl
             self._format(ent, stream, indent, allowance if last else 1, context, level)
 
+    def _repr_key(self, key, context, level):
+        """Get the representation of a key written before its value."""
+        return self._repr(key, context, level)
+
     def _pprint_key_val_tuple(self, obj, stream, indent, allowance, context, level):
         """Pretty printing for key-value tuples from dict or parameters."""
         k, v = obj
-        rep = self._repr(k, context, level)
+        rep = self._repr_key(k, context, level)
         if isinstance(obj, KeyValTupleParam):
             rep = rep.strip("'")
             middle = "="
@@ -298,10 +309,151 @@ class _BaseObjectPrettyPrinter(pprint.PrettyPrinter):
     # _BaseObjectPrettyPrinter (see scikit-learn Github issue 12906)
     # mypy error: "Type[PrettyPrinter]" has no attribute "_dispatch"
     _dispatch = pprint.PrettyPrinter._dispatch.copy()  # type: ignore
-    _dispatch[BaseObject.__repr__] = _pprint_object
+    _dispatch[_BaseObject.__repr__] = _pprint_object
     _dispatch[KeyValTuple.__repr__] = _pprint_key_val_tuple
 
 
+class _StreamingBaseObjectPrettyPrinter(_BaseObjectPrettyPrinter):
+    """Pretty printer that writes large BaseObjects without building their repr.
+
+    The builtin _format() renders each object on a single line (using
+    _safe_repr) to check whether it fits in the remaining width, so every level
+    of a large composite object builds the repr of all the objects nested in
+    it. Here, the single line repr of BaseObjects, lists, tuples and dicts is
+    only built if a lower bound on its length fits in the width. Otherwise, a
+    placeholder that is too long to fit is returned, so the object is written
+    one item at a time by its _pprint_TYPE() method.
+    """
+
+    def _repr(self, obj, context, level):
+        if _is_composite_repr(type(obj)) and _repr_exceeds(
+            obj, self._width, self.changed_only
+        ):
+            return " " * (self._width + 1)
+        return super()._repr(obj, context, level)
+
+    def _repr_key(self, key, context, level):
+        # Keys are written in full, even if they are too long to fit
+        return pprint.PrettyPrinter._repr(self, key, context, level)
+
+
+def _is_composite_repr(typ):
+    """Whether _safe_repr builds the repr of a type from the repr of its items."""
+    r = typ.__repr__
+    return (
+        (issubclass(typ, dict) and r is dict.__repr__)
+        or (issubclass(typ, list) and r is list.__repr__)
+        or (issubclass(typ, tuple) and r in (tuple.__repr__, KeyValTuple.__repr__))
+        or issubclass(typ, _BaseObject)
+    )
+
+
+def _repr_exceeds(obj, budget, changed_only=False):
+    """Whether the repr built by _safe_repr is certainly longer than `budget`.
+
+    The length of the repr is bounded from below by the length of the reprs of
+    the non-composite objects nested in `obj`, along with the brackets and
+    parameter names of the composite objects. The nested objects are visited
+    lazily and the walk stops as soon as the bound exceeds `budget`, so large
+    composite objects are never fully visited.
+    """
+    total = 0
+    seen = set()
+    stack = [iter((obj,))]
+    while stack:
+        item = next(stack[-1], _DONE)
+        if item is _DONE:
+            stack.pop()
+            continue
+        typ = type(item)
+        if not _is_composite_repr(typ):
+            total += len(_safe_repr(item, {}, None, 0, changed_only=changed_only)[0])
+        elif id(item) in seen:
+            # Recursive references are rendered as a short marker
+            continue
+        else:
+            seen.add(id(item))
+            if issubclass(typ, _BaseObject):
+                params = (
+                    _changed_params(item)
+                    if changed_only
+                    else item.get_params(deep=False)
+                )
+                total += len(typ.__name__) + 2 + sum(len(k) + 1 for k in params)
+                stack.append(iter(params.values()))
+            elif issubclass(typ, dict):
+                total += 2
+                stack.append(itertools.chain.from_iterable(item.items()))
+            else:
+                total += 2
+                stack.append(iter(item))
+        if total > budget:
+            return True
+    return False
+
+
+# Marks the end of the items of a composite object
+_DONE = object()
+
+
+class _CharLimitError(Exception):
+    """Raised by _BoundedWriter once it received its maximum number of chars."""
+
+
+class _BoundedWriter:
+    """File-like object keeping the first `max_chars` characters written to it."""
+
+    def __init__(self, max_chars):
+        self.parts = []
+        self.remaining = max_chars
+
+    def write(self, text):
+        if len(text) > self.remaining:
+            self.parts.append(text[: self.remaining])
+            self.remaining = 0
+            raise _CharLimitError
+        self.parts.append(text)
+        self.remaining -= len(text)
+        return len(text)
+
+
+def _stream_pformat(obj, stream, **kwargs):
+    """Write the pretty printed repr of an object to a stream, piece by piece.
+
+    The layout is the one used by BaseObject.__repr__ (without truncating the
+    number of characters), written with _StreamingBaseObjectPrettyPrinter so the
+    complete repr is never built. Unlike `pprint`, no newline is written at the
+    end. Keyword arguments override the defaults of the pretty printer.
+    """
+    if hasattr(obj, "_get_config"):
+        changed_only = obj._get_config()["print_changed_only"]
+    else:
+        changed_only = True
+    printer_kwargs = {
+        "compact": True,
+        "indent": 1,
+        "indent_at_name": True,
+        "changed_only": changed_only,
+    }
+    printer_kwargs.update(kwargs)
+    printer = _StreamingBaseObjectPrettyPrinter(stream=stream, **printer_kwargs)
+    printer._format(obj, stream, 0, 0, {}, 0)
+
+
+def _bounded_pformat(obj, max_chars, **kwargs):
+    """Pretty print an object, stopping after `max_chars` characters.
+
+    Only the first `max_chars` characters of the repr are built, followed by
+    "..." if the repr is longer.
+    """
+    writer = _BoundedWriter(max_chars)
+    try:
+        _stream_pformat(obj, writer, **kwargs)
+    except _CharLimitError:
+        return "".join(writer.parts) + "..."
+    return "".join(writer.parts)
+
+
 def _safe_repr(obj, context, maxlevels, level, changed_only=False):
     """Safe string representation logic.
 
@@ -379,7 +531,7 @@ def _safe_repr(obj, context, maxlevels, level, changed_only=False):
         del context[objid]
         return format_ % ", ".join(components), rdable, recursive  # noqa: RUF100, UP031
 
-    if issubclass(typ, BaseObject):
+    if issubclass(typ, _BaseObject):
         objid = id(obj)
         if maxlevels and level >= maxlevels:
             return "{...}", False, objid in context
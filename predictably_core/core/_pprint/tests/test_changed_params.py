@@ -123,3 +123,31 @@ def test_changed_params_nan_values():
     result = _changed_params(obj)
     expected = {"param1": np.nan}
     assert all(k in result and _is_scalar_nan(result[k]) for k in expected)
+
+
+def test_changed_params_container_subclass():
+    """
+    Test _changed_params compares containers of other types by their repr.
+
+    This test verifies that a container whose type differs from the type of the
+    default value, but whose repr is the same, isn't reported as changed.
+
+    Asserts:
+        The function only returns the container whose repr differs.
+    """
+
+    class ListSubclass(list):
+        pass
+
+    class ContainerParamObject(BaseObject):
+        def __init__(self, param1=[1, 2], param2=[1, 2]):  # noqa: B006
+            self.param1 = param1
+            self.param2 = param2
+
+        def get_params(self, deep=False):
+            return {"param1": self.param1, "param2": self.param2}
+
+    obj = ContainerParamObject(
+        param1=ListSubclass([1, 2]), param2=ListSubclass(range(10))
+    )
+    assert _changed_params(obj) == {"param2": obj.param2}
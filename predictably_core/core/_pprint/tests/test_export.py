@@ -0,0 +1,130 @@
+#!/usr/bin/env python3 -u
+# copyright: predict-ably, BSD-3-Clause License (see LICENSE file)
+"""Tests of the functionality to export BaseObject representations to files."""
+
+from __future__ import annotations
+
+import io
+import re
+import tracemalloc
+
+import pytest
+
+from predictably_core.core import export_html, export_text
+from predictably_core.core._pprint._object_html_repr import _object_html_repr
+from predictably_core.core._pprint._pprint import _BaseObjectPrettyPrinter
+from predictably_core.tests.conftest import CompositionDummy
+
+__author__: list[str] = ["RNKuhns"]
+
+
+class _CountingWriter:
+    """File-like object recording the size of each write."""
+
+    def __init__(self):
+        self.sizes = []
+
+    def write(self, text):
+        self.sizes.append(len(text))
+        return len(text)
+
+
+def test_export_html_matches_html_repr():
+    """Test export_html writes the same diagram as _object_html_repr."""
+    obj = CompositionDummy(foo=CompositionDummy(foo=7))
+    out = io.StringIO()
+    export_html(obj, out)
+    # Container and checkbox ids are random, so they are removed before comparing
+    id_pattern = "sk-[0-9a-f-]{36}|'[0-9a-f-]{36}'"
+    expected = re.sub(id_pattern, "", _object_html_repr(obj))
+    assert re.sub(id_pattern, "", out.getvalue()) == expected
+
+
+def test_export_html_streams_output():
+    """Test export_html writes the diagram in pieces rather than a single string."""
+    obj = CompositionDummy(foo=CompositionDummy(foo=CompositionDummy(foo=7)))
+    writer = _CountingWriter()
+    export_html(obj, writer)
+    assert len(writer.sizes) > 1
+    assert max(writer.sizes) < sum(writer.sizes)
+
+
+def test_export_to_path(tmp_path):
+    """Test export_html and export_text write to paths given as str or Path."""
+    obj = CompositionDummy(foo=CompositionDummy(foo=7))
+    html_path = tmp_path / "diagram.html"
+    export_html(obj, html_path)
+    assert html_path.read_text(encoding="utf-8").startswith("<style>")
+
+    text_path = tmp_path / "diagram.txt"
+    export_text(obj, str(text_path))
+    assert text_path.read_text(encoding="utf-8") == repr(obj) + "\n"
+
+
+def test_export_text_is_not_truncated():
+    """Test export_text does not truncate long representations like repr does."""
+    obj = CompositionDummy(foo="a" * 1000)
+    out = io.StringIO()
+    export_text(obj, out)
+    assert "a" * 1000 in out.getvalue()
+    assert "a" * 1000 not in repr(obj)
+
+
+def test_export_text_matches_pretty_printer():
+    """Test export_text uses the same layout as the BaseObject pretty printer."""
+    obj = CompositionDummy(
+        foo=[CompositionDummy(foo=i, bar={"key": "v" * i}) for i in range(40)],
+        bar=CompositionDummy(foo=(1, 2, 3), bar="short"),
+    )
+    out = io.StringIO()
+    export_text(obj, out)
+    printer = _BaseObjectPrettyPrinter(compact=True, indent=1, indent_at_name=True)
+    assert out.getvalue() == printer.pformat(obj) + "\n"
+    # Lists are not truncated
+    assert "foo=39" in out.getvalue()
+
+
+def test_export_text_streams_output():
+    """Test export_text writes large composites without building their repr."""
+    obj = CompositionDummy(
+        foo=[CompositionDummy(foo=CompositionDummy(foo=i)) for i in range(2_000)]
+    )
+    writer = _CountingWriter()
+    tracemalloc.start()
+    try:
+        export_text(obj, writer)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert sum(writer.sizes) > 100_000
+    assert max(writer.sizes) < 100
+    assert peak < 64_000
+
+
+def test_export_html_streams_text():
+    """Test export_html writes large composites without building their repr."""
+    obj = CompositionDummy(
+        foo=[CompositionDummy(foo=CompositionDummy(foo=i)) for i in range(2_000)]
+    )
+    out = io.StringIO()
+    export_text(obj, out)
+    text = out.getvalue().strip()
+    writer = _CountingWriter()
+    tracemalloc.start()
+    try:
+        export_html(obj, writer)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    # The fallback text is complete, while the details of the diagram are not
+    assert sum(writer.sizes) > len(text)
+    assert sum(writer.sizes) < len(text) + 64_000
+    # Building the repr of obj would use more than 800 kB
+    assert peak < 128_000
+
+
+@pytest.mark.parametrize("export_func", (export_html, export_text))
+def test_export_raises_on_invalid_file(export_func):
+    """Test export functions raise an error if `file` is not a path or file-like."""
+    with pytest.raises(TypeError, match="`file` must be a str, pathlib.Path or"):
+        export_func(CompositionDummy(), 7)
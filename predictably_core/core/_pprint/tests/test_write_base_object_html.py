@@ -8,6 +8,7 @@ import pytest
 
 # Import the functions to be tested
 import predictably_core.core._pprint._object_html_repr as ohr
+from predictably_core.core._base import BaseObject
 from predictably_core.core._pprint.tests.conftest import (
     MockBaseObjectWithNestedParams,
 )
@@ -162,3 +163,93 @@ def test_write_base_object_html_first_call(mock_get_visual_block):
     assert 'type="checkbox" checked' in result, result
     assert "class='sk-item'" in result, result
     assert 'class="sk-estimator sk-toggleable"' in result, result
+
+
+class _WideEnsemble:
+    """Mock ensemble displayed as a parallel block of many components."""
+
+    def __init__(self, objs):
+        self.objs = objs
+
+    def _sk_visual_block_(self):
+        return ohr._VisualBlock("parallel", self.objs)
+
+
+def test_write_base_object_html_max_items():
+    """Test _write_base_object_html summarizes components beyond `max_items`."""
+    out = io.StringIO()
+    objs = ["a"] * 1000 + [None] * 500
+    ohr._write_base_object_html(
+        out, _WideEnsemble(objs), "Label", "Label Details", max_items=10
+    )
+    result = out.getvalue()
+    # 10 shown components plus a single summary item
+    assert result.count('class="sk-parallel-item"') == 11
+    assert "... and 1490 more" in result
+    assert "str: 990, NoneType: 500" in result
+
+    # Without a limit every component is written
+    out = io.StringIO()
+    ohr._write_base_object_html(out, _WideEnsemble(objs), "Label", "Label Details")
+    assert out.getvalue().count('class="sk-parallel-item"') == 1500
+
+
+def test_write_base_object_html_max_depth():
+    """Test _write_base_object_html collapses components nested beyond `max_depth`."""
+    nested = _WideEnsemble([_WideEnsemble([_WideEnsemble(["a", "b"])])])
+
+    out = io.StringIO()
+    ohr._write_base_object_html(out, nested, "Label", "Label Details", max_depth=1)
+    result = out.getvalue()
+    assert result.count('class="sk-parallel"') == 1
+    assert ">a</label>" not in result
+
+    out = io.StringIO()
+    ohr._write_base_object_html(out, nested, "Label", "Label Details")
+    result = out.getvalue()
+    assert result.count('class="sk-parallel"') == 3
+    assert ">a</label>" in result
+
+
+def test_object_html_repr_uses_display_config():
+    """Test _object_html_repr limits the diagram using the object's config."""
+
+    class WideBaseObject(BaseObject):
+        def _sk_visual_block_(self):
+            return ohr._VisualBlock("parallel", ["a"] * 100)
+
+    obj = WideBaseObject()
+    assert ohr._object_html_repr(obj).count('class="sk-parallel-item"') == 31
+
+    obj._set_config(display_max_items=5)
+    assert ohr._object_html_repr(obj).count('class="sk-parallel-item"') == 6
+
+
+def test_object_html_repr_shows_memory_usage():
+    """Test _object_html_repr shows the memory usage if configured."""
+
+    class FittedBaseObject(BaseObject):
+        def __init__(self):
+            self.weights_ = [0.0] * 1000
+            super().__init__()
+
+    obj = FittedBaseObject()
+    assert "Memory usage" not in ohr._object_html_repr(obj)
+
+    obj._set_config(display_memory_usage=True)
+    result = ohr._object_html_repr(obj)
+    total = ohr._format_bytes(sum(obj.memory_usage().values()))
+    assert f"Memory usage: {total}" in result
+    assert "weights_: 7.9 KiB" in result
+
+    obj._set_config(display_max_items=1)
+    result = ohr._object_html_repr(obj)
+    assert "weights_: 7.9 KiB" in result
+    assert "... and 2 more" in result
+
+
+def test_format_bytes():
+    """Test _format_bytes uses binary units."""
+    assert ohr._format_bytes(12) == "12 B"
+    assert ohr._format_bytes(1536) == "1.5 KiB"
+    assert ohr._format_bytes(3 * 1024**3) == "3.0 GiB"
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3 -u
+# copyright: predict-ably, BSD-3-Clause License (see LICENSE file)
+"""Share fitted estimators with other processes using shared memory.
+
+An estimator is pickled (using protocol 5) once, with its large out-of-band
+buffers (like the data of NumPy arrays) copied into a single shared memory
+segment. Only a lightweight handle needs to be sent to other processes, which
+rebuild the estimator on top of read-only views of the shared segment.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import pickle  # noqa: S403
+from multiprocessing import resource_tracker, shared_memory
+from typing import TYPE_CHECKING, Any
+
+from predictably_core.core._persist import _MIN_EXTERNAL_BUFFER_BYTES
+
+if TYPE_CHECKING:  # pragma: no cover
+    from predictably_core.core._base import BaseEstimator
+
+__author__: list[str] = ["RNKuhns"]
+__all__: list[str] = ["SharedEstimatorHandle", "share_estimator"]
+
+# Buffers are aligned in the segment, so arrays are aligned for any dtype
+_ALIGNMENT = 64
+# Estimators rebuilt in this process, along with the segment they are a view of
+_ATTACHED: dict[str, tuple[_SharedSegment, Any]] = {}
+# Whether segments attached by this process are tracked by its own resource
+# tracker (rather than the tracker of the process that created the segments)
+_TRACKER_IS_PRIVATE: bool | None = None
+# Segments that are closed once the arrays viewing them are released
+_PENDING_CLOSE: list[_SharedSegment] = []
+
+
+class _SharedSegment(shared_memory.SharedMemory):
+    """Shared memory segment whose views can outlive it."""
+
+    def __del__(self) -> None:
+        """Close the segment, unless arrays still view it at interpreter exit."""
+        with contextlib.suppress(BufferError):
+            super().__del__()
+
+
+def _close_segment(segment: _SharedSegment) -> None:
+    """Close a segment, or defer closing it while arrays still view it.
+
+    Segments that can't be closed yet are kept, and closing them is retried
+    whenever another segment is closed.
+
+    Parameters
+    ----------
+    segment : _SharedSegment
+        The segment to close.
+    """
+    _PENDING_CLOSE.append(segment)
+    still_viewed = []
+    for pending in _PENDING_CLOSE:
+        try:
+            pending.close()
+        except BufferError:
+            still_viewed.append(pending)
+    _PENDING_CLOSE[:] = still_viewed
+
+
+def _attach_segment(name: str) -> _SharedSegment:
+    """Attach to a shared memory segment created by another process.
+
+    Parameters
+    ----------
+    name : str
+        The name of the segment.
+
+    Returns
+    -------
+    _SharedSegment
+        The attached segment.
+    """
+    global _TRACKER_IS_PRIVATE
+    if _TRACKER_IS_PRIVATE is None:
+        # Processes started by multiprocessing share the resource tracker of the
+        # process that started them, unless they were started before it was
+        tracker = getattr(resource_tracker, "_resource_tracker", None)
+        _TRACKER_IS_PRIVATE = os.name == "posix" and (
+            tracker is not None and getattr(tracker, "_fd", None) is None
+        )
+    segment = _SharedSegment(name=name)
+    if _TRACKER_IS_PRIVATE:
+        # Otherwise, this process's tracker would remove the segment on exit
+        resource_tracker.unregister(segment._name, "shared_memory")
+    return segment
+
+
+class SharedEstimatorHandle:
+    """Picklable handle to an estimator published to shared memory.
+
+    Handles are created by :func:`share_estimator`. Pickling a handle only
+    includes the estimator's small state and the location of its large buffers
+    in the shared memory segment, so handles can be cheaply sent to worker
+    processes (for example, as arguments of tasks submitted to a
+    ``concurrent.futures.ProcessPoolExecutor``).
+
+    The process that created the handle owns the shared memory segment, which
+    exists until the handle is closed (or used as a context manager).
+
+    Parameters
+    ----------
+    segment_name : str | None
+        The name of the shared memory segment, or None if the estimator didn't
+        have any large buffers.
+    buffer_spans : list[tuple[int, int]]
+        The start and end of each out-of-band buffer in the segment.
+    payload : bytes
+        The estimator pickled without its out-of-band buffers.
+
+    See Also
+    --------
+    share_estimator :
+        Publish an estimator to shared memory.
+    """
+
+    __slots__ = ("_buffer_spans", "_owned_segment", "_payload", "_segment_name")
+
+    def __init__(
+        self,
+        segment_name: str | None,
+        buffer_spans: list[tuple[int, int]],
+        payload: bytes,
+    ) -> None:
+        self._segment_name = segment_name
+        self._buffer_spans = buffer_spans
+        self._payload = payload
+        # Only set in the process that created the segment
+        self._owned_segment: _SharedSegment | None = None
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Reduce the handle to the location of the estimator's state."""
+        return (
+            type(self),
+            (self._segment_name, self._buffer_spans, self._payload),
+        )
+
+    def __enter__(self) -> SharedEstimatorHandle:
+        """Use the handle as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the handle."""
+        self.close()
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes of the estimator's state in shared memory.
+
+        Returns
+        -------
+        int
+            The total size of the buffers in the shared memory segment.
+        """
+        return sum(end - start for start, end in self._buffer_spans)
+
+    def load(self) -> Any:
+        """Rebuild the estimator on top of the shared memory segment.
+
+        The estimator is only rebuilt the first time it is loaded in a process,
+        afterwards the same estimator is returned.
+
+        Returns
+        -------
+        BaseEstimator
+            The estimator. Arrays backed by the shared memory segment are
+            read-only views of it.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the shared memory segment was already closed by its owner.
+        """
+        name = self._segment_name
+        if name is None:
+            return pickle.loads(self._payload)  # noqa: S301
+        attached = _ATTACHED.get(name)
+        if attached is None:
+            segment = self._owned_segment or _attach_segment(name)
+            buffers = [
+                segment.buf[start:end].toreadonly() for start, end in self._buffer_spans
+            ]
+            estimator = pickle.loads(self._payload, buffers=buffers)  # noqa: S301
+            attached = _ATTACHED[name] = (segment, estimator)
+        return attached[1]
+
+    def close(self) -> None:
+        """Release the estimator, and remove the segment if this process owns it.
+
+        In worker processes, this drops the estimator rebuilt by `load`. In the
+        process that created the handle, this also removes the shared memory
+        segment, after which the handle can't be loaded by other processes.
+        Estimators that were already loaded keep working until they are
+        released, and the segment stays mapped in this process until then.
+        """
+        name = self._segment_name
+        segments = []
+        if name is not None and name in _ATTACHED:
+            # The estimator is released before closing its segment, which can
+            # only be closed once no arrays view the segment
+            segments.append(_ATTACHED.pop(name)[0])
+        owned_segment = self._owned_segment
+        if owned_segment is not None and owned_segment not in segments:
+            segments.append(owned_segment)
+        for segment in segments:
+            _close_segment(segment)
+        if owned_segment is not None:
+            self._owned_segment = None
+            with contextlib.suppress(FileNotFoundError):
+                owned_segment.unlink()
+
+
+def share_estimator(estimator: BaseEstimator) -> SharedEstimatorHandle:
+    """Publish an estimator to shared memory.
+
+    The estimator is pickled once, with its large buffers (like the data of
+    NumPy arrays) copied into a single shared memory segment. The returned
+    handle can be sent to other processes cheaply, where `load` rebuilds the
+    estimator using read-only views of the segment, without copying its data.
+
+    Parameters
+    ----------
+    estimator : BaseEstimator
+        The estimator to share.
+
+    Returns
+    -------
+    SharedEstimatorHandle
+        The handle to the shared estimator. The shared memory segment exists
+        until the handle is closed by the process that created it, so the handle
+        should be closed (or used as a context manager) once workers are done.
+
+    Raises
+    ------
+    TypeError
+        If `estimator` isn't a BaseEstimator.
+
+    Notes
+    -----
+    The shared estimator is a snapshot, later changes to `estimator` aren't
+    seen by processes loading it. Only the process that created the segment
+    removes it, when the handle is closed or (if it wasn't closed) when the
+    process exits.
+
+    Examples
+    --------
+    >>> from predictably_core.core import BaseEstimator, share_estimator
+    >>> estimator = BaseEstimator()
+    >>> with share_estimator(estimator) as handle:
+    ...     handle.load()
+    BaseEstimator()
+    """
+    from predictably_core.core._base import _BaseEstimator
+
+    if not isinstance(estimator, _BaseEstimator):
+        raise TypeError(
+            "`estimator` must be a BaseEstimator, but found "
+            f"{type(estimator).__name__}."
+        )
+    raw_buffers: list[memoryview] = []
+
+    def collect_buffer(buffer: pickle.PickleBuffer) -> bool:
+        try:
+            raw = buffer.raw()
+        except BufferError:  # Non-contiguous buffers are kept in the payload
+            return True
+        if raw.nbytes < _MIN_EXTERNAL_BUFFER_BYTES:
+            return True
+        raw_buffers.append(raw)
+        return False
+
+    payload = pickle.dumps(estimator, protocol=5, buffer_callback=collect_buffer)
+    if not raw_buffers:
+        return SharedEstimatorHandle(None, [], payload)
+
+    buffer_spans = []
+    size = 0
+    for raw in raw_buffers:
+        start = -(-size // _ALIGNMENT) * _ALIGNMENT
+        size = start + raw.nbytes
+        buffer_spans.append((start, size))
+    segment = _SharedSegment(create=True, size=size)
+    try:
+        for raw, (start, end) in zip(raw_buffers, buffer_spans):
+            segment.buf[start:end] = raw
+    except BaseException:
+        _close_segment(segment)
+        segment.unlink()
+        raise
+    handle = SharedEstimatorHandle(segment.name, buffer_spans, payload)
+    handle._owned_segment = segment
+    return handle
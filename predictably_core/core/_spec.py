@@ -0,0 +1,399 @@
+#!/usr/bin/env python3 -u
+# copyright: predict-ably, BSD-3-Clause License (see LICENSE file)
+"""Convert BaseObjects to and from declarative, JSON-compatible specs.
+
+A spec is a dictionary with the object's qualified class name, its parameters
+and its dynamic tag and config overrides. Parameter values that are
+BaseObjects are converted to nested specs, so the whole parameter tree can be
+stored as JSON and rebuilt without pickling.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, Iterable
+
+__author__: list[str] = ["RNKuhns"]
+__all__: list[str] = [
+    "from_spec",
+    "from_specs",
+    "register_spec_class",
+    "to_spec",
+    "to_specs",
+]
+
+# Keys marking encoded values that JSON can't represent directly
+_SPEC_KEY = "__spec__"
+_TUPLE_KEY = "__tuple__"
+_TYPE_KEY = "__type__"
+_MARKER_KEYS = frozenset((_SPEC_KEY, _TUPLE_KEY, _TYPE_KEY))
+_JSON_SCALAR_TYPES = (str, int, float, bool, type(None))
+# Classes registered by name, and the classes resolved from qualified names
+_SPEC_CLASS_REGISTRY: dict[str, type] = {}
+# The names classes were registered with
+_SPEC_CLASS_NAMES: dict[type, str] = {}
+
+
+def register_spec_class(cls: type, name: str | None = None) -> type:
+    """Register a class so specs can refer to it by name.
+
+    Registered classes are resolved without importing their module. This is
+    useful for classes that can't be imported by their qualified name (for
+    example, classes defined in ``__main__``), or to keep old names working
+    after a class is moved. Can be used as a class decorator.
+
+    Parameters
+    ----------
+    cls : type
+        The class to register. It must implement `get_params`.
+    name : str, default=None
+        The name specs refer to the class by. If None, its qualified name
+        (``"module:QualName"``) is used.
+
+    Returns
+    -------
+    type
+        The registered class.
+
+    Raises
+    ------
+    TypeError
+        If `cls` isn't a class implementing `get_params`.
+
+    Examples
+    --------
+    >>> from predictably_core.core import (
+    ...     BaseObject, from_spec, register_spec_class, to_spec
+    ... )
+    >>> class Model(BaseObject):
+    ...     def __init__(self, alpha=1.0):
+    ...         self.alpha = alpha
+    ...         super().__init__()
+    >>> _ = register_spec_class(Model, name="Model")
+    >>> spec = to_spec(Model(alpha=0.5))
+    >>> spec
+    {'class': 'Model', 'params': {'alpha': 0.5}}
+    >>> from_spec(spec)
+    Model(alpha=0.5)
+    """
+    if not isinstance(cls, type) or not hasattr(cls, "get_params"):
+        raise TypeError(
+            f"`cls` must be a class implementing `get_params`, but found {cls!r}."
+        )
+    if name is None:
+        name = _qualified_name(cls)
+    else:
+        _SPEC_CLASS_NAMES[cls] = name
+    _SPEC_CLASS_REGISTRY[name] = cls
+    return cls
+
+
+def _qualified_name(cls: type) -> str:
+    """Get the name specs use to refer to a class.
+
+    Parameters
+    ----------
+    cls : type
+        The class.
+
+    Returns
+    -------
+    str
+        The name the class was registered with, or its module and qualified
+        name separated by a colon.
+    """
+    name = _SPEC_CLASS_NAMES.get(cls)
+    if name is None:
+        name = f"{cls.__module__}:{cls.__qualname__}"
+    return name
+
+
+def _resolve_class(name: str, requires_get_params: bool = True) -> type:
+    """Find the class a spec refers to.
+
+    Only the module defining the class is imported (along with its parent
+    packages), and classes are cached after they are first resolved.
+
+    Parameters
+    ----------
+    name : str
+        The registered or qualified name of the class.
+    requires_get_params : bool, default=True
+        Whether the class must implement `get_params`.
+
+    Returns
+    -------
+    type
+        The class.
+
+    Raises
+    ------
+    ValueError
+        If `name` can't be resolved to a class (implementing `get_params` if
+        `requires_get_params` is True).
+    """
+    cls = _SPEC_CLASS_REGISTRY.get(name)
+    if cls is not None:
+        return cls
+    module_name, sep, qualname = name.partition(":")
+    try:
+        if not sep:
+            raise ImportError
+        obj: Any = importlib.import_module(module_name)
+        for attr in qualname.split("."):
+            obj = getattr(obj, attr)
+    except (ImportError, AttributeError):
+        raise ValueError(
+            f"Could not resolve the class {name!r}. Specs refer to classes using "
+            "'module:QualName' or a name registered with `register_spec_class`."
+        ) from None
+    has_get_params = hasattr(obj, "get_params")
+    if not isinstance(obj, type) or (requires_get_params and not has_get_params):
+        raise ValueError(
+            f"{name!r} must refer to a class"
+            f"{' implementing `get_params`' if requires_get_params else ''}, but "
+            f"found {obj!r}."
+        )
+    if has_get_params:
+        _SPEC_CLASS_REGISTRY[name] = obj
+    return obj
+
+
+class _SpecConverter:
+    """Convert objects to and from specs, sharing class lookups across objects."""
+
+    def __init__(self) -> None:
+        self._class_names: dict[type, str] = {}
+        self._classes: dict[str, type] = {}
+        self._param_names: dict[type, frozenset[str]] = {}
+
+    def to_spec(self, obj: Any) -> dict[str, Any]:
+        """Convert an object implementing `get_params` to a spec."""
+        cls = type(obj)
+        class_name = self._class_names.get(cls)
+        if class_name is None:
+            class_name = self._class_names[cls] = _qualified_name(cls)
+        spec: dict[str, Any] = {
+            "class": class_name,
+            "params": {
+                name: self._encode(value, name)
+                for name, value in obj.get_params(deep=False).items()
+            },
+        }
+        for key, attr in (("tags", "_tags_dynamic"), ("config", "_config_dynamic")):
+            flags = getattr(obj, attr, None)
+            if flags:
+                spec[key] = {name: self._encode(v, name) for name, v in flags.items()}
+        return spec
+
+    def _encode(self, value: Any, path: str) -> Any:
+        """Convert a parameter value to a JSON-compatible value."""
+        if isinstance(value, _JSON_SCALAR_TYPES):
+            return value
+        if isinstance(value, list):
+            return [self._encode(v, path) for v in value]
+        if isinstance(value, tuple):
+            return {_TUPLE_KEY: [self._encode(v, path) for v in value]}
+        if isinstance(value, dict):
+            if not all(isinstance(k, str) for k in value) or _MARKER_KEYS & set(value):
+                raise TypeError(
+                    f"The dict in {path!r} can't be converted to a spec, since "
+                    "its keys must be strings other than "
+                    f"{sorted(_MARKER_KEYS)}."
+                )
+            return {k: self._encode(v, f"{path}__{k}") for k, v in value.items()}
+        if isinstance(value, type):
+            return {_TYPE_KEY: _qualified_name(value)}
+        if hasattr(value, "get_params"):
+            return {_SPEC_KEY: self.to_spec(value)}
+        raise TypeError(
+            f"The value of {path!r} can't be converted to a spec, since values "
+            "must be JSON-compatible scalars, lists, tuples, dicts, classes or "
+            f"objects implementing `get_params`, but found {type(value).__name__}."
+        )
+
+    def from_spec(self, spec: dict[str, Any]) -> Any:
+        """Build the object described by a spec."""
+        try:
+            class_name = spec["class"]
+        except (KeyError, TypeError):
+            raise ValueError(
+                f"A spec must be a dict with a 'class' key, but found {spec!r}."
+            ) from None
+        cls = self._classes.get(class_name)
+        if cls is None:
+            cls = self._classes[class_name] = _resolve_class(class_name)
+        params = spec.get("params", {})
+        param_names = self._param_names.get(cls)
+        if param_names is None:
+            param_names = self._param_names[cls] = frozenset(
+                cls._get_param_names() if hasattr(cls, "_get_param_names") else params
+            )
+        unknown = set(params) - param_names
+        if unknown:
+            raise ValueError(
+                f"The spec of {class_name!r} has invalid parameters "
+                f"{sorted(unknown)}. Valid parameters are {sorted(param_names)}."
+            )
+        obj = cls(**{name: self._decode(value) for name, value in params.items()})
+        if "tags" in spec:
+            obj._set_tags(**self._decode(spec["tags"]))
+        if "config" in spec:
+            obj._set_config(**self._decode(spec["config"]))
+        return obj
+
+    def _decode(self, value: Any) -> Any:
+        """Convert a JSON-compatible value back to a parameter value."""
+        if isinstance(value, list):
+            return [self._decode(v) for v in value]
+        if not isinstance(value, dict):
+            return value
+        if len(value) == 1:
+            if _SPEC_KEY in value:
+                return self.from_spec(value[_SPEC_KEY])
+            if _TUPLE_KEY in value:
+                return tuple(self._decode(v) for v in value[_TUPLE_KEY])
+            if _TYPE_KEY in value:
+                return _resolve_class(value[_TYPE_KEY], requires_get_params=False)
+        return {k: self._decode(v) for k, v in value.items()}
+
+
+def to_spec(obj: Any) -> dict[str, Any]:
+    """Convert a BaseObject to a declarative, JSON-compatible spec.
+
+    Parameters
+    ----------
+    obj : BaseObject
+        The object to convert. Other objects implementing `get_params` (like
+        scikit-learn estimators) are also supported.
+
+    Returns
+    -------
+    dict[str, Any]
+        The spec, with keys:
+
+        - "class": the qualified name of the object's class (``"module:QualName"``)
+          or the name it was registered with using `register_spec_class`.
+        - "params": the object's parameters. BaseObject-valued parameters are
+          converted to nested specs (marked by a "__spec__" key), while tuples
+          and classes are marked by "__tuple__" and "__type__" keys.
+        - "tags" and "config": the object's dynamic tag and config overrides,
+          if it has any.
+
+    Raises
+    ------
+    TypeError
+        If a parameter value can't be represented as JSON.
+
+    See Also
+    --------
+    from_spec :
+        Build the object described by a spec.
+    to_specs :
+        Convert many objects to specs.
+
+    Examples
+    --------
+    >>> from predictably_core.core import BaseEstimator, to_spec
+    >>> to_spec(BaseEstimator()._set_config(display="text"))
+    ... # doctest: +NORMALIZE_WHITESPACE
+    {'class': 'predictably_core.core._base:BaseEstimator', 'params': {},
+     'config': {'display': 'text'}}
+    """
+    return _SpecConverter().to_spec(obj)
+
+
+def from_spec(spec: dict[str, Any]) -> Any:
+    """Build the object described by a spec.
+
+    Parameters
+    ----------
+    spec : dict[str, Any]
+        The spec, as returned by :func:`to_spec`.
+
+    Returns
+    -------
+    BaseObject
+        The object, initialized with the spec's parameters and with its tag and
+        config overrides set.
+
+    Raises
+    ------
+    ValueError
+        If a class in the spec can't be resolved to a class implementing
+        `get_params`, or the spec has invalid parameters.
+
+    See Also
+    --------
+    to_spec :
+        Convert a BaseObject to a spec.
+    from_specs :
+        Build the objects described by many specs.
+
+    Notes
+    -----
+    Unlike unpickling, building an object from a spec only imports the modules
+    defining the classes the spec refers to and initializes those classes with
+    JSON values. Only classes implementing `get_params` are initialized.
+
+    Examples
+    --------
+    >>> from predictably_core.core import from_spec
+    >>> spec = {
+    ...     "class": "predictably_core.core._base:BaseEstimator",
+    ...     "config": {"display": "text"},
+    ... }
+    >>> from_spec(spec)._get_config()["display"]
+    'text'
+    """
+    return _SpecConverter().from_spec(spec)
+
+
+def to_specs(objects: Iterable[Any]) -> list[dict[str, Any]]:
+    """Convert many objects to specs.
+
+    Equivalent to ``[to_spec(obj) for obj in objects]``, but the qualified name
+    of each class is only looked up once.
+
+    Parameters
+    ----------
+    objects : Iterable[BaseObject]
+        The objects to convert.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        The specs.
+
+    See Also
+    --------
+    to_spec :
+        Convert a BaseObject to a spec.
+    """
+    converter = _SpecConverter()
+    return [converter.to_spec(obj) for obj in objects]
+
+
+def from_specs(specs: Iterable[dict[str, Any]]) -> list[Any]:
+    """Build the objects described by many specs.
+
+    Equivalent to ``[from_spec(spec) for spec in specs]``, but each class and
+    its parameter names are only looked up once.
+
+    Parameters
+    ----------
+    specs : Iterable[dict[str, Any]]
+        The specs.
+
+    Returns
+    -------
+    list[BaseObject]
+        The objects.
+
+    See Also
+    --------
+    from_spec :
+        Build the object described by a spec.
+    """
+    converter = _SpecConverter()
+    return [converter.from_spec(spec) for spec in specs]
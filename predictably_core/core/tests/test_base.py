@@ -24,20 +24,27 @@ tests in this module:
 from __future__ import annotations
 
 import inspect
-from copy import deepcopy
+import pickle  # noqa: S403
+from copy import copy, deepcopy
 from typing import Any, ClassVar
 
 import numpy as np
 import pytest
 import scipy.sparse as sp
 
-from predictably_core.core._base import BaseEstimator, BaseObject
+from predictably_core.core._base import (
+    BaseEstimator,
+    BaseObject,
+    SlottedBaseEstimator,
+    SlottedBaseObject,
+)
 from predictably_core.core._clone import _clone_parametrized, clone
 from predictably_core.tests.conftest import Child, CompositionDummy, Parent
 
 __author__: list[str] = ["RNKuhns"]
 
 __all__: list[str] = [
+    "test_base_classes_support_multiple_inheritance",
     # "test_clone",
     # "test_clone_2",
     # "test_clone_raises_error_for_nonconforming_objects",
@@ -55,10 +62,12 @@ __all__: list[str] = [
     "test_components",
     "test_components_raises_error_base_class_is_not_baseobject_subclass",
     "test_components_raises_error_base_class_is_not_class",
+    "test_dynamic_flags_are_allocated_lazily",
     "test_eq_dunder",
     "test_get_class_tag",
     "test_get_class_tags",
     "test_get_init_signature",
+    "test_get_init_signature_is_cached",
     "test_get_init_signature_raises_error_for_invalid_signature",
     "test_get_param_names",
     "test_get_params",
@@ -68,16 +77,22 @@ __all__: list[str] = [
     "test_get_tag_raises",
     "test_get_tags",
     "test_is_composite",
+    "test_memory_usage",
+    "test_pickle_out_of_band_buffers",
+    "test_pickle_round_trip",
     "test_raises_on_get_params_for_param_arg_not_assigned_to_attribute",
     "test_repr_html_wraps",
     "test_reset",
     "test_reset_composite",
+    "test_reset_many_fitted_attributes",
     "test_set_params",
     "test_set_params_raises_error_non_existent_param",
     "test_set_params_raises_error_non_interface_composite",
     "test_set_params_with_no_param_to_set_returns_object",
     "test_set_tags",
     "test_set_tags_works_with_missing_tags_dynamic_attribute",
+    "test_slotted_object_interface",
+    "test_slotted_object_memory",
 ]
 
 
@@ -610,6 +625,46 @@ def test_reset_composite(fixture_reset_tester: type[ResetTester]):
     assert not hasattr(x.a, "d")
 
 
+def test_reset_many_fitted_attributes(fixture_reset_tester: type[ResetTester]):
+    """Test reset removes many fitted attributes and keeps parameters in place."""
+    param = [1, 2, 3]
+    x = fixture_reset_tester(a=param)
+    for i in range(300):
+        setattr(x, f"fitted_{i}_", i)
+    # Instance attributes shadowing class attributes are kept, as before
+    x.clsvar = 7
+    x.foo(fixture_reset_tester(1))
+    assert set(x._components()) == {"d", "_d", "d_"}
+
+    assert x.reset() is x
+    assert not any(hasattr(x, f"fitted_{i}_") for i in range(300))
+    assert x.a is param
+    assert x.clsvar == 7
+    assert x.f__o__o == 252
+    assert x._components() == {}
+    assert x.get_params() == fixture_reset_tester(a=param).get_params()
+
+
+def test_get_init_signature_is_cached(fixture_reset_tester: type[ResetTester]):
+    """Test the init signature is cached per class until __init__ changes."""
+
+    class Subclass(fixture_reset_tester):
+        pass
+
+    init_sig = Subclass._get_init_signature()
+    # Modifying the output doesn't modify the cached signature
+    init_sig.pop()
+    assert [p.name for p in Subclass._get_init_signature()] == ["a", "b", "c"]
+
+    def new_init(self, e: int = 1):
+        self.e = e
+        BaseObject.__init__(self)
+
+    Subclass.__init__ = new_init
+    assert Subclass._get_param_names() == ["e"]
+    assert fixture_reset_tester._get_param_names() == ["a", "b", "c"]
+
+
 def test_get_init_signature(fixture_class_parent: type[Parent]):
     """Test error is raised when invalid init signature is used."""
     init_sig = fixture_class_parent._get_init_signature()
@@ -1181,6 +1236,16 @@ class FittableCompositionDummy(BaseEstimator):
         self._is_fitted = True
 
 
+class CountingEstimator(FittableCompositionDummy):
+    """Composite estimator counting how many times it was initialized."""
+
+    n_inits: ClassVar[int] = 0
+
+    def __init__(self, foo: Any, bar: int | None = None):
+        CountingEstimator.n_inits += 1
+        super().__init__(foo, bar=bar)
+
+
 def test_eq_dunder():
     """Tests equality dunder for BaseObject descendants.
 
@@ -1234,3 +1299,211 @@ def test_eq_dunder():
 
     assert composite != 8
     assert composite != "something"
+
+
+class SlottedEstimator(SlottedBaseEstimator):
+    """Estimator declaring __slots__ for its parameters and fitted attributes."""
+
+    __slots__ = ("a", "b", "coef_", "component_")
+
+    def __init__(self, a: int = 1, b: Any = None):
+        self.a = a
+        self.b = b
+        super().__init__()
+
+    def fit(self):
+        self.coef_ = 3
+        self.component_ = SlottedEstimator(a=7)
+        self._is_fitted = True
+        return self
+
+
+class UnslottedEstimator(BaseEstimator):
+    """Estimator with the same parameters as SlottedEstimator without __slots__."""
+
+    def __init__(self, a: int = 1, b: Any = None):
+        self.a = a
+        self.b = b
+        super().__init__()
+
+
+def test_slotted_object_interface():
+    """Test the BaseObject interface works for objects without a __dict__."""
+    estimator = SlottedEstimator(a=2, b=SlottedEstimator(a=5))
+    assert not hasattr(estimator, "__dict__")
+    assert repr(estimator) == "SlottedEstimator(a=2, b=SlottedEstimator(a=5))"
+    assert estimator.get_params() == {
+        "a": 2,
+        "b": estimator.b,
+        "b__a": 5,
+        "b__b": None,
+    }
+    estimator.set_params(a=3, b__a=6)
+    assert estimator.a == 3 and estimator.b.a == 6
+
+    estimator.fit()._set_tags(some_tag="something")
+    estimator._set_config(display="text")
+    assert estimator._components() == {"component_": estimator.component_}
+    assert estimator._get_tags()["some_tag"] == "something"
+
+    cloned = clone(estimator)
+    assert cloned == estimator and not cloned.is_fitted
+    assert cloned._get_tags()["some_tag"] == "something"
+    assert cloned._get_config()["display"] == "text"
+    assert deepcopy(estimator).coef_ == 3
+    unpickled = pickle.loads(pickle.dumps(estimator))  # noqa: S301
+    assert unpickled == estimator and unpickled.fitted_attributes == (
+        "coef_",
+        "component_",
+    )
+
+    assert estimator.reset() is estimator
+    assert not hasattr(estimator, "coef_")
+    assert not estimator.is_fitted
+    assert estimator._components() == {}
+    assert estimator.get_params(deep=False) == {"a": 3, "b": estimator.b}
+
+
+def test_dynamic_flags_are_allocated_lazily():
+    """Test dynamic tag and config overrides are only allocated when set."""
+    estimator = UnslottedEstimator()
+    assert not hasattr(estimator, "_tags_dynamic")
+    assert not hasattr(estimator, "_config_dynamic")
+
+    estimator._set_tags(some_tag=1)
+    assert estimator._tags_dynamic == {"some_tag": 1}
+    assert not hasattr(estimator, "_config_dynamic")
+
+
+class _SlottedMixin:
+    """Mixin declaring non-empty __slots__."""
+
+    __slots__ = ("extra",)
+
+
+def test_base_classes_support_multiple_inheritance():
+    """Test the base classes can be combined with other classes' layouts."""
+
+    class EstimatorError(BaseEstimator, Exception):
+        def __init__(self, a: int = 1):
+            self.a = a
+            super().__init__()
+
+    class MixedEstimator(_SlottedMixin, UnslottedEstimator):
+        pass
+
+    error = EstimatorError(a=2)
+    assert isinstance(error, Exception) and error.get_params() == {"a": 2}
+    mixed = MixedEstimator(a=3)
+    mixed.extra = 1
+    assert mixed.get_params() == {"a": 3, "b": None}
+
+    assert vars(BaseObject()) == {}
+    assert vars(BaseEstimator()) == {"_is_fitted": False}
+
+
+def test_slotted_object_memory():
+    """Test objects declaring __slots__ use less memory than regular objects."""
+    import tracemalloc
+
+    class SlottedConfig(SlottedBaseObject):
+        __slots__ = ("a", "b")
+
+        def __init__(self, a: int = 1, b: Any = None):
+            self.a = a
+            self.b = b
+            super().__init__()
+
+    class UnslottedConfig(BaseObject):
+        def __init__(self, a: int = 1, b: Any = None):
+            self.a = a
+            self.b = b
+            super().__init__()
+
+    def per_instance_bytes(cls: type) -> float:
+        cls()
+        tracemalloc.start()
+        try:
+            objects = [cls() for _ in range(10_000)]
+            size, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert len(objects) == 10_000
+        return size / 10_000
+
+    for slotted, unslotted in (
+        (SlottedConfig, UnslottedConfig),
+        (SlottedEstimator, UnslottedEstimator),
+    ):
+        assert not hasattr(slotted(), "__dict__")
+        slotted_bytes = per_instance_bytes(slotted)
+        unslotted_bytes = per_instance_bytes(unslotted)
+        # Object header, slots and the list's pointer, without any dicts
+        assert slotted_bytes <= 112
+        assert slotted_bytes < unslotted_bytes
+
+
+def test_memory_usage():
+    """Test memory_usage reports a breakdown of the memory used by attributes."""
+    component = SlottedEstimator(a=7)
+    estimator = FittableCompositionDummy(foo=component)
+    estimator.weights_ = np.zeros(1000)
+    estimator.weights_view_ = estimator.weights_[:10]
+    estimator.fit()
+
+    usage = estimator.memory_usage()
+    assert list(usage)[:3] == ["", "foo", "bar"]
+    assert {"foo__a", "foo__b", "foo_", "foo___is_fitted"} <= set(usage)
+    assert usage["weights_"] >= estimator.weights_.nbytes
+    # The view's buffer belongs to weights_
+    assert usage["weights_view_"] < 1000
+    assert all(size >= 0 for size in usage.values())
+
+    usage_not_deep = estimator.memory_usage(deep=False)
+    assert "foo__a" not in usage_not_deep
+    assert list(usage_not_deep)[:3] == list(usage)[:3]
+    assert sum(usage_not_deep.values()) == sum(usage.values())
+
+    # Components referenced more than once are only counted once
+    estimator.same_foo_ = estimator.foo
+    usage = estimator.memory_usage()
+    assert usage["same_foo_"] == 0
+
+
+def test_pickle_round_trip():
+    """Test pickling and copying BaseObjects keeps all of their state."""
+    CountingEstimator.n_inits = 0
+    estimator = CountingEstimator(foo=SlottedEstimator(a=3), bar=2)
+    estimator._set_tags(some_tag="something")._set_config(display="text")
+    estimator.extra = 3
+    for copier in (copy, deepcopy, lambda obj: pickle.loads(pickle.dumps(obj))):  # noqa: S301
+        copied = copier(estimator)
+        assert copied == estimator and not copied.is_fitted
+        assert copied.extra == 3
+        assert copied._get_tags()["some_tag"] == "something"
+        assert copied._get_config()["display"] == "text"
+    # Objects aren't initialized again when they are copied or unpickled
+    assert CountingEstimator.n_inits == 1
+
+    slotted = SlottedEstimator(a=2, b=[1, 2]).fit()
+    unpickled = pickle.loads(pickle.dumps(slotted))  # noqa: S301
+    assert unpickled == slotted and unpickled.is_fitted
+    assert unpickled.coef_ == 3 and unpickled.component_ == slotted.component_
+    assert unpickled.fitted_attributes == slotted.fitted_attributes
+
+
+def test_pickle_out_of_band_buffers():
+    """Test array attributes are pickled out-of-band with pickle protocol 5."""
+    estimator = FittableCompositionDummy(foo=np.arange(10.0))
+    estimator.fit()
+    estimator.weights_ = np.ones(100_000)
+
+    buffers: list[pickle.PickleBuffer] = []
+    payload = pickle.dumps(estimator, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 3
+    assert len(payload) < 1000
+
+    unpickled = pickle.loads(payload, buffers=buffers)  # noqa: S301
+    np.testing.assert_array_equal(unpickled.weights_, estimator.weights_)
+    np.testing.assert_array_equal(unpickled.foo, estimator.foo)
+    assert unpickled.fitted_attributes == estimator.fitted_attributes
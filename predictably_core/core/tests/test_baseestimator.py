@@ -13,12 +13,24 @@ tests in this module:
     - test_is_fitted: Test that is_fitted property returns _is_fitted as expected.
     - test_check_is_fitted_raises_error_when_unfitted: Test check_is_fitted raises
       an error when an estimator is unfitted an ``raise_error is True``.
+    - test_fitted_attributes: Test the fitted attributes set by `fit` are recorded.
+    - test_fitted_attributes_recorded_when_fit_raises: Test fitted attributes are
+      recorded when `fit` raises an error.
+    - test_check_is_fitted_attributes: Test check_is_fitted verifies specific
+      fitted attributes.
+    - test_save_load: Test estimators are saved and loaded with memory mapping.
+    - test_save_replaces_earlier_save: Test saving over an earlier save removes
+      its buffers once it is replaced.
+    - test_load_raises_error: Test load raises errors for invalid directories.
 """
 
 from __future__ import annotations
 
 import inspect
+import mmap
+import pathlib
 
+import numpy as np
 import pytest
 
 from predictably_core.core._base import BaseEstimator, BaseObject
@@ -91,3 +103,152 @@ def test_check_is_fitted_raises_error_when_unfitted(fixture_estimator_instance):
 
     fixture_estimator_instance._is_fitted = True
     assert fixture_estimator_instance.check_is_fitted() is True
+
+
+class _RegistryEstimator(BaseEstimator):
+    """Estimator with conventional and declared fitted attributes, for testing."""
+
+    _fitted_attribute_names = ("_n_seen",)
+
+    def __init__(self, alpha: float = 1.0):
+        self.alpha = alpha
+        super().__init__()
+
+    def fit(self):
+        self.coef_ = [self.alpha]
+        self.intercept_ = 0.0
+        self._n_seen = 10
+        self._cache = {}
+        self.private__ = 1
+        self._is_fitted = True
+        return self
+
+
+def test_fitted_attributes():
+    """Test BaseEstimator records the fitted attributes set by `fit`."""
+    estimator = _RegistryEstimator()
+    assert estimator.fitted_attributes == ()
+    assert not hasattr(estimator, "_fitted_registry")
+
+    estimator.fit()
+    assert estimator.fitted_attributes == ("coef_", "intercept_", "_n_seen")
+    # Attributes set outside of `fit` aren't recorded
+    estimator.coef_ = [2.0]
+    estimator.other_ = 1
+    assert estimator.fitted_attributes == ("coef_", "intercept_", "_n_seen")
+
+    del estimator.intercept_
+    assert estimator.fitted_attributes == ("coef_", "_n_seen")
+    assert estimator.memory_usage(fitted_only=True).keys() == {"coef_", "_n_seen"}
+
+    estimator.reset()
+    assert estimator.fitted_attributes == ()
+    assert not hasattr(estimator, "coef_") and not hasattr(estimator, "other_")
+    assert estimator.fit().fitted_attributes == ("coef_", "intercept_", "_n_seen")
+
+
+def test_fitted_attributes_recorded_when_fit_raises():
+    """Test the fitted attributes set before `fit` raised an error are recorded."""
+
+    class FailingEstimator(BaseEstimator):
+        def fit(self):
+            self.partial_ = 1
+            raise ValueError("failed")
+
+    estimator = FailingEstimator()
+    with pytest.raises(ValueError, match="failed"):
+        estimator.fit()
+    assert estimator.fitted_attributes == ("partial_",)
+    assert not hasattr(estimator.reset(), "partial_")
+
+
+def test_check_is_fitted_attributes():
+    """Test BaseEstimator `check_is_fitted` verifies specific fitted attributes."""
+    estimator = _RegistryEstimator()
+    with pytest.raises(NotFittedError, match="has not been fitted yet"):
+        estimator.check_is_fitted(attributes="coef_")
+
+    estimator.fit()
+    assert estimator.check_is_fitted(attributes="coef_") is True
+    assert estimator.check_is_fitted(attributes=["coef_", "_n_seen"]) is True
+
+    del estimator.coef_
+    assert estimator.check_is_fitted(raise_error=False, attributes="coef_") is False
+    match = "is missing the fitted attribute\\(s\\) coef_ and foo_"
+    with pytest.raises(NotFittedError, match=match):
+        estimator.check_is_fitted(attributes=["coef_", "_n_seen", "foo_"])
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_save_load(tmp_path, use_mmap):
+    """Test BaseEstimator `save` and `load` round trip with large array state."""
+    estimator = _RegistryEstimator(alpha=2.0).fit()
+    estimator._set_config(display="text")
+    estimator.weights_ = np.arange(100_000.0)
+    estimator.small_ = np.arange(10)
+    estimator.strided_ = estimator.weights_[:1000:2]
+    estimator.save(tmp_path)
+    # Only the large contiguous array is saved to a separate file
+    assert len(list(tmp_path.glob("buffer_*.bin"))) == 1
+    assert len(list(tmp_path.iterdir())) == 2
+    assert (tmp_path / "manifest.pkl").stat().st_size < 10_000
+
+    loaded = _RegistryEstimator.load(tmp_path, mmap=use_mmap)
+    assert loaded == estimator and loaded.is_fitted
+    assert loaded.fitted_attributes == estimator.fitted_attributes
+    assert loaded._get_config()["display"] == "text"
+    np.testing.assert_array_equal(loaded.weights_, estimator.weights_)
+    np.testing.assert_array_equal(loaded.strided_, estimator.strided_)
+    if use_mmap:
+        base = loaded.weights_
+        while isinstance(base, np.ndarray):
+            base = base.base
+        assert isinstance(base.obj, mmap.mmap)
+        assert not loaded.weights_.flags.writeable
+    else:
+        assert loaded.weights_.flags.writeable
+
+    # Saving again replaces the files without changing the loaded estimator
+    estimator.weights_ = np.zeros(100_000)
+    estimator.save(tmp_path)
+    assert loaded.weights_[-1] == 99_999.0
+    assert BaseEstimator.load(tmp_path).weights_[-1] == 0.0
+
+
+def test_save_replaces_earlier_save(tmp_path, monkeypatch):
+    """Test saving over an earlier save removes its buffers once it is replaced."""
+    estimator = _RegistryEstimator().fit()
+    estimator.weights_ = np.arange(100_000.0)
+    estimator.other_ = np.ones(100_000)
+    estimator.save(tmp_path)
+    assert len(list(tmp_path.glob("buffer_*.bin"))) == 2
+
+    # A save that fails before its manifest is in place keeps the earlier save
+    def fail_replace(self, target):
+        raise OSError("failed")
+
+    del estimator.other_
+    monkeypatch.setattr(pathlib.Path, "replace", fail_replace)
+    with pytest.raises(OSError, match="failed"):
+        estimator.save(tmp_path)
+    monkeypatch.undo()
+    loaded = BaseEstimator.load(tmp_path, mmap=False)
+    np.testing.assert_array_equal(loaded.other_, np.ones(100_000))
+
+    estimator.save(tmp_path)
+    assert len(list(tmp_path.glob("buffer_*.bin"))) == 1
+    assert len(list(tmp_path.iterdir())) == 2
+    assert not hasattr(BaseEstimator.load(tmp_path), "other_")
+
+    BaseEstimator().save(tmp_path)
+    assert not list(tmp_path.glob("buffer_*.bin"))
+
+
+def test_load_raises_error(tmp_path):
+    """Test BaseEstimator `load` raises errors for invalid directories."""
+    with pytest.raises(FileNotFoundError, match="No saved estimator"):
+        BaseEstimator.load(tmp_path)
+
+    BaseEstimator().save(tmp_path)
+    with pytest.raises(TypeError, match="to be an instance of _RegistryEstimator"):
+        _RegistryEstimator.load(tmp_path)
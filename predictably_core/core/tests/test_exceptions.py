@@ -11,11 +11,15 @@ from __future__ import annotations
 
 import pytest
 
-from predictably_core.core._exceptions import ForwardRefError, NotFittedError
+from predictably_core.core._exceptions import (
+    ForwardRefError,
+    NotFittedError,
+    ValidationReportError,
+)
 
 __author__: list[str] = ["RNKuhns"]
 
-ALL_EXCEPTIONS = (ForwardRefError, NotFittedError)
+ALL_EXCEPTIONS = (ForwardRefError, NotFittedError, ValidationReportError)
 
 
 @pytest.mark.parametrize("predictably_exception", ALL_EXCEPTIONS)
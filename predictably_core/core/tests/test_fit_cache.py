@@ -0,0 +1,271 @@
+#!/usr/bin/env python3 -u
+# copyright: predict-ably, BSD-3-Clause License (see LICENSE file)
+"""Tests of the cache of estimators' fitted state."""
+
+from __future__ import annotations
+
+import errno
+import os
+import pathlib
+import stat
+from typing import ClassVar
+
+import numpy as np
+import pytest
+
+from predictably_core.config import config_context
+from predictably_core.core import BaseEstimator, clear_fit_cache, fit_cache_info
+
+__author__: list[str] = ["RNKuhns"]
+
+
+class _CountingEstimator(BaseEstimator):
+    """Estimator that counts how many times it was actually fit."""
+
+    n_fits: ClassVar[int] = 0
+
+    def __init__(self, alpha: float = 1.0) -> None:
+        self.alpha = alpha
+        super().__init__()
+
+    def fit(self, x, y=None):
+        """Fit the estimator."""
+        _CountingEstimator.n_fits += 1
+        self.weights_ = np.asarray(x) * self.alpha
+        self._is_fitted = True
+        return self
+
+
+class _ChildEstimator(_CountingEstimator):
+    """Estimator whose `fit` extends the parent class's `fit`."""
+
+    def fit(self, x, y=None):
+        """Fit the estimator."""
+        super().fit(x, y=y)
+        self.total_ = float(self.weights_.sum())
+        return self
+
+
+@pytest.fixture(autouse=True)
+def _reset_fit_cache():
+    """Start each test with an empty fit cache."""
+    clear_fit_cache()
+    _CountingEstimator.n_fits = 0
+    yield
+    clear_fit_cache()
+
+
+def test_fit_cache_off_by_default():
+    """Test estimators are always fit when the fit cache is off."""
+    x = np.arange(10.0)
+    _CountingEstimator().fit(x)
+    _CountingEstimator().fit(x)
+    assert _CountingEstimator.n_fits == 2
+    assert fit_cache_info() == (0, 0, 0, 0)
+
+
+def test_fit_cache_memory():
+    """Test fitted state is restored from memory for identical fits."""
+    x = np.arange(10.0)
+    with config_context(fit_cache="memory"):
+        first = _CountingEstimator(alpha=2.0).fit(x)
+        second = _CountingEstimator(alpha=2.0)
+        assert second.fit(x) is second
+        assert _CountingEstimator.n_fits == 1
+        assert second.is_fitted and second.fitted_attributes == ("weights_",)
+        np.testing.assert_array_equal(second.weights_, first.weights_)
+        # The restored state isn't shared with the fitted estimator
+        assert second.weights_ is not first.weights_
+
+        # Different parameters, data or arguments are fit
+        _CountingEstimator(alpha=3.0).fit(x)
+        _CountingEstimator(alpha=2.0).fit(x + 1)
+        _CountingEstimator(alpha=2.0).fit(x.astype(np.float32))
+        _CountingEstimator(alpha=2.0).fit(x, y=x)
+        assert _CountingEstimator.n_fits == 5
+
+    info = fit_cache_info()
+    assert (info.hits, info.misses, info.memory_entries) == (1, 5, 5)
+    assert info.memory_bytes > 0
+
+    clear_fit_cache()
+    assert fit_cache_info() == (0, 0, 0, 0)
+
+
+def test_fit_cache_config_overrides():
+    """Test the fit cache can be turned on and off for instances."""
+    x = np.arange(10.0)
+    for _ in range(2):
+        _CountingEstimator()._set_config(fit_cache="memory").fit(x)
+    assert _CountingEstimator.n_fits == 1
+
+    with config_context(fit_cache="memory"):
+        for _ in range(2):
+            _CountingEstimator(alpha=5.0)._set_config(fit_cache="off").fit(x)
+    assert _CountingEstimator.n_fits == 3
+
+
+def test_fit_cache_nested_fit():
+    """Test calls to a parent class's `fit` aren't cached separately."""
+    x = np.arange(10.0)
+    with config_context(fit_cache="memory"):
+        first = _ChildEstimator().fit(x)
+        second = _ChildEstimator().fit(x)
+    assert _CountingEstimator.n_fits == 1
+    assert second.total_ == first.total_
+    assert fit_cache_info()[:3] == (1, 1, 1)
+
+
+def test_fit_cache_unpicklable_data():
+    """Test estimators are fit without caching if the data can't be pickled."""
+    with config_context(fit_cache="memory"):
+        for _ in range(2):
+            _CountingEstimator().fit(np.arange(3.0), y=lambda: None)
+    assert _CountingEstimator.n_fits == 2
+    assert fit_cache_info() == (0, 0, 0, 0)
+
+
+def test_fit_cache_memory_eviction():
+    """Test the least recently used entries are evicted from memory."""
+    data = [np.full(1_000, i, dtype=np.float64) for i in range(3)]
+    with config_context(fit_cache="memory", fit_cache_max_bytes=20_000):
+        _CountingEstimator().fit(data[0])
+        _CountingEstimator().fit(data[1])
+        # Using the first entry makes the second the least recently used
+        _CountingEstimator().fit(data[0])
+        _CountingEstimator().fit(data[2])
+        assert fit_cache_info().memory_entries == 2
+        assert fit_cache_info().memory_bytes <= 20_000
+        assert _CountingEstimator.n_fits == 3
+
+        _CountingEstimator().fit(data[0])
+        assert _CountingEstimator.n_fits == 3
+        _CountingEstimator().fit(data[1])
+        assert _CountingEstimator.n_fits == 4
+
+    # Entries larger than the limit aren't cached
+    with config_context(fit_cache="memory", fit_cache_max_bytes=100):
+        _CountingEstimator().fit(data[2] + 1)
+    assert fit_cache_info().memory_entries == 2
+
+
+def test_fit_cache_disk(tmp_path):
+    """Test fitted state is restored from disk, with the oldest entries evicted."""
+    data = [np.full(1_000, i, dtype=np.float64) for i in range(3)]
+    with config_context(
+        fit_cache="disk", fit_cache_dir=str(tmp_path), fit_cache_max_bytes=20_000
+    ):
+        first = _CountingEstimator().fit(data[0])
+        second = _CountingEstimator().fit(data[0])
+        np.testing.assert_array_equal(second.weights_, first.weights_)
+        assert _CountingEstimator.n_fits == 1
+        assert len(list(tmp_path.glob("*.pkl"))) == 1
+        assert fit_cache_info()[:3] == (1, 1, 0)
+
+        _CountingEstimator().fit(data[1])
+        _CountingEstimator().fit(data[2])
+        entries = list(tmp_path.glob("*.pkl"))
+        assert len(entries) == 2
+        assert sum(path.stat().st_size for path in entries) <= 20_000
+        assert not list(tmp_path.glob("*.tmp"))
+        _CountingEstimator().fit(data[2])
+        assert _CountingEstimator.n_fits == 3
+
+        clear_fit_cache(disk=True)
+        assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize("payload", [b"", b"not a pickle", b"\x80\x05\x95"])
+def test_fit_cache_disk_corrupt_entry(tmp_path, payload):
+    """Test corrupt entries are removed and treated as cache misses."""
+    x = np.arange(3.0)
+    with config_context(fit_cache="disk", fit_cache_dir=str(tmp_path)):
+        _CountingEstimator().fit(x)
+        (entry,) = tmp_path.glob("*.pkl")
+        entry.write_bytes(payload)
+        estimator = _CountingEstimator().fit(x)
+        np.testing.assert_array_equal(estimator.weights_, x)
+        assert _CountingEstimator.n_fits == 2
+        # The corrupt entry was replaced by the state of the new fit
+        assert entry.read_bytes() != payload
+        _CountingEstimator().fit(x)
+    assert _CountingEstimator.n_fits == 2
+    assert fit_cache_info()[:2] == (1, 2)
+
+
+def test_fit_cache_disk_failed_write(tmp_path, monkeypatch):
+    """Test failing to write an entry warns instead of failing the fit."""
+
+    def full_disk(self, target):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(pathlib.Path, "replace", full_disk)
+    x = np.arange(3.0)
+    disk_cache = config_context(fit_cache="disk", fit_cache_dir=str(tmp_path))
+    with disk_cache, pytest.warns(UserWarning, match="couldn't be written"):
+        estimator = _CountingEstimator().fit(x)
+    np.testing.assert_array_equal(estimator.weights_, x)
+    assert estimator.is_fitted
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.skipif(os.name != "posix", reason="Requires POSIX permissions.")
+def test_fit_cache_disk_default_dir(tmp_path, monkeypatch):
+    """Test the default disk cache directory is private to the current user."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    with config_context(fit_cache="disk"):
+        _CountingEstimator().fit(np.arange(3.0))
+        _CountingEstimator().fit(np.arange(3.0))
+    assert _CountingEstimator.n_fits == 1
+    directory = tmp_path / "cache" / "predictably_fit_cache"
+    assert len(list(directory.glob("*.pkl"))) == 1
+    assert stat.S_IMODE(directory.stat().st_mode) & 0o077 == 0
+
+
+@pytest.mark.skipif(os.name != "posix", reason="Requires POSIX permissions.")
+def test_fit_cache_disk_refuses_shared_dir(tmp_path):
+    """Test directories other users can write to aren't used by the cache."""
+    tmp_path.chmod(0o777)
+    with config_context(fit_cache="disk", fit_cache_dir=str(tmp_path)):
+        for _ in range(2):
+            with pytest.warns(UserWarning, match="isn't used"):
+                _CountingEstimator().fit(np.arange(3.0))
+    assert _CountingEstimator.n_fits == 2
+    assert not list(tmp_path.iterdir())
+
+
+def test_fit_cache_fitted_estimators():
+    """Test estimators that are already fitted are fit without the cache."""
+    x = np.arange(10.0)
+    with config_context(fit_cache="memory"):
+        estimator = _CountingEstimator().fit(x)
+        estimator.fit(x)
+        _CountingEstimator().fit(x)
+    assert _CountingEstimator.n_fits == 2
+    assert fit_cache_info()[:3] == (1, 1, 1)
+
+
+def test_fit_cache_digest_includes_code():
+    """Test the cache isn't shared by classes whose methods have different code."""
+
+    def fit(self, x, y=None):
+        _CountingEstimator.n_fits += 1
+        self.weights_ = np.asarray(x)
+        return self
+
+    def edited_fit(self, x, y=None):
+        _CountingEstimator.n_fits += 1
+        self.weights_ = np.asarray(x) * 2.0
+        return self
+
+    def make_class(fit_method) -> type:
+        return type("Edited", (BaseEstimator,), {"fit": fit_method})
+
+    x = np.arange(3.0)
+    with config_context(fit_cache="memory"):
+        make_class(fit)().fit(x)
+        edited = make_class(edited_fit)().fit(x)
+        make_class(edited_fit)().fit(x)
+    # Classes with the same name but different code don't share entries
+    assert _CountingEstimator.n_fits == 2
+    np.testing.assert_array_equal(edited.weights_, x * 2.0)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3 -u
+# copyright: predict-ably, BSD-3-Clause License (see LICENSE file)
+"""Tests of pickling BaseObjects as their parameters."""
+
+from __future__ import annotations
+
+import copy
+import pickle  # noqa: S403
+
+import numpy as np
+import pytest
+
+from predictably_core.core import BaseEstimator, pickle_by_params
+from predictably_core.core.tests.test_base import SlottedEstimator
+from predictably_core.core.tests.test_baseestimator import _RegistryEstimator
+
+__author__: list[str] = ["RNKuhns"]
+
+
+class _CopyingEstimator(BaseEstimator):
+    """Estimator whose `__init__` stores a copy of a parameter."""
+
+    def __init__(self, data=None) -> None:
+        self.data = data
+        self.data_copy = list(data) if data is not None else None
+        super().__init__()
+
+    def fit(self):
+        """Fit the estimator."""
+        self.weights_ = np.ones(100_000)
+        self._is_fitted = True
+        return self
+
+
+def test_pickle_by_params_round_trip():
+    """Test objects pickled by their parameters keep their overrides."""
+    estimator = _RegistryEstimator(alpha=2.0)._set_config(display="text")
+    estimator._set_tags(some_tag="something").fit()
+    estimator.extra = 3
+    for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+        payload = pickle.dumps(pickle_by_params(estimator), protocol=protocol)
+        unpickled = pickle.loads(payload)  # noqa: S301
+        assert type(unpickled) is _RegistryEstimator
+        assert unpickled == estimator and not unpickled.is_fitted
+        assert not hasattr(unpickled, "extra")
+        assert unpickled.fitted_attributes == ()
+        assert unpickled._get_config()["display"] == "text"
+        assert unpickled._get_tags()["some_tag"] == "something"
+
+    copied = copy.deepcopy(pickle_by_params(estimator, fitted=True))
+    assert copied.is_fitted and copied.coef_ == [2.0]
+    assert copied.fitted_attributes == estimator.fitted_attributes
+    assert not hasattr(copied, "extra")
+
+    # Overrides and fitted attributes stored in slots are restored
+    slotted = SlottedEstimator(a=2)._set_config(display="text").fit()
+    unpickled = pickle.loads(pickle.dumps(pickle_by_params(slotted, fitted=True)))  # noqa: S301
+    assert unpickled.coef_ == 3 and unpickled.component_ == slotted.component_
+    assert unpickled.fitted_attributes == slotted.fitted_attributes
+    assert unpickled._get_config()["display"] == "text"
+
+    with pytest.raises(TypeError, match="must be a BaseObject"):
+        pickle_by_params([1, 2])
+
+
+def test_pickle_by_params_payload_is_compact():
+    """Test objects pickled by their parameters have smaller payloads."""
+    estimator = _CopyingEstimator(data=list(range(1000)))
+    default_size = len(pickle.dumps(estimator))
+    compact_size = len(pickle.dumps(pickle_by_params(estimator)))
+    assert compact_size < 0.6 * default_size
+
+    # Fitted attributes are pickled out-of-band with pickle protocol 5
+    estimator.fit()
+    buffers: list[pickle.PickleBuffer] = []
+    payload = pickle.dumps(
+        pickle_by_params(estimator, fitted=True),
+        protocol=5,
+        buffer_callback=buffers.append,
+    )
+    assert len(buffers) == 1 and len(payload) < default_size
+    unpickled = pickle.loads(payload, buffers=buffers)  # noqa: S301
+    np.testing.assert_array_equal(unpickled.weights_, estimator.weights_)
+    assert unpickled.data_copy == estimator.data_copy
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3 -u
+# copyright: predict-ably, BSD-3-Clause License (see LICENSE file)
+"""Tests of sharing estimators with other processes using shared memory."""
+
+from __future__ import annotations
+
+import pickle  # noqa: S403
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from predictably_core.core import (
+    BaseEstimator,
+    BaseObject,
+    SharedEstimatorHandle,
+    _shared_memory,
+    share_estimator,
+)
+from predictably_core.core.tests.test_baseestimator import _RegistryEstimator
+
+__author__: list[str] = ["RNKuhns"]
+
+
+def _summarize_shared_estimator(handle: SharedEstimatorHandle) -> tuple:
+    """Load a shared estimator in a worker process and summarize it."""
+    estimator = handle.load()
+    return (
+        float(estimator.weights_.sum()),
+        estimator.weights_.flags.writeable,
+        estimator.fitted_attributes,
+        handle.load() is estimator,
+    )
+
+
+def test_share_estimator():
+    """Test shared estimators are rebuilt on read-only views of shared memory."""
+    estimator = _RegistryEstimator(alpha=2.0).fit()
+    estimator.weights_ = np.arange(100_000.0)
+    estimator.small_ = np.arange(10)
+
+    with share_estimator(estimator) as handle:
+        # Only the large array is in shared memory
+        assert handle.nbytes == estimator.weights_.nbytes
+        assert len(pickle.dumps(handle)) < 2_000
+
+        unpickled = pickle.loads(pickle.dumps(handle))  # noqa: S301
+        loaded = unpickled.load()
+        assert loaded == estimator and loaded.is_fitted
+        np.testing.assert_array_equal(loaded.weights_, estimator.weights_)
+        np.testing.assert_array_equal(loaded.small_, estimator.small_)
+        assert not loaded.weights_.flags.writeable
+        assert unpickled.load() is loaded
+
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            results = list(executor.map(_summarize_shared_estimator, [handle] * 2))
+        assert (
+            results
+            == [(estimator.weights_.sum(), False, estimator.fitted_attributes, True)]
+            * 2
+        )
+
+    # Closing the handle removes the segment, but loaded estimators keep working
+    assert loaded.weights_[-1] == 99_999.0
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=handle._segment_name)
+    with pytest.raises(FileNotFoundError):
+        pickle.loads(pickle.dumps(handle)).load()  # noqa: S301
+    handle.close()
+
+
+def test_share_estimator_close_releases_segments():
+    """Test segments are closed once the estimators loaded from them are released."""
+    estimator = _RegistryEstimator().fit()
+    estimator.weights_ = np.arange(100_000.0)
+
+    handle = share_estimator(estimator)
+    handle.load()
+    handle.close()
+    assert not _shared_memory._PENDING_CLOSE
+
+    handle = share_estimator(estimator)
+    loaded = handle.load()
+    handle.close()
+    # The segment is closed once the loaded estimator is released
+    assert len(_shared_memory._PENDING_CLOSE) == 1
+    assert loaded.weights_[-1] == 99_999.0
+    del loaded
+    share_estimator(estimator).close()
+    assert not _shared_memory._PENDING_CLOSE
+
+
+def test_share_estimator_without_large_buffers():
+    """Test estimators without large buffers are shared without a segment."""
+    estimator = _RegistryEstimator().fit()
+    with share_estimator(estimator) as handle:
+        assert handle._segment_name is None and handle.nbytes == 0
+        assert pickle.loads(pickle.dumps(handle)).load() == estimator  # noqa: S301
+
+
+def test_share_estimator_raises_error():
+    """Test share_estimator raises an error for objects that aren't estimators."""
+    with pytest.raises(TypeError, match="must be a BaseEstimator"):
+        share_estimator(BaseObject())
+
+    assert isinstance(share_estimator(BaseEstimator()).load(), BaseEstimator)
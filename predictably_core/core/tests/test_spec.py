@@ -0,0 +1,105 @@
+#!/usr/bin/env python3 -u
+# copyright: predict-ably, BSD-3-Clause License (see LICENSE file)
+"""Tests of converting BaseObjects to and from declarative specs."""
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+
+from predictably_core.core import (
+    BaseEstimator,
+    BaseObject,
+    from_spec,
+    from_specs,
+    register_spec_class,
+    to_spec,
+    to_specs,
+)
+from predictably_core.core._spec import _SPEC_CLASS_NAMES, _SPEC_CLASS_REGISTRY
+from predictably_core.tests.conftest import Child, CompositionDummy, Parent
+
+__author__: list[str] = ["RNKuhns"]
+
+
+def test_spec_round_trip():
+    """Test specs are JSON-compatible and rebuild equal objects."""
+    obj = CompositionDummy(
+        foo=Child(a="x", b=3, c=None)._set_tags(A=1),
+        bar={"values": (1, 2.5, [True, None]), "type": Parent, "inner": Parent()},
+    )
+    obj._set_config(display="text")
+    spec = obj.to_spec()
+    assert spec["class"] == "predictably_core.tests.conftest:CompositionDummy"
+    assert spec["params"]["foo"] == {
+        "__spec__": {
+            "class": "predictably_core.tests.conftest:Child",
+            "params": {"a": "x", "b": 3, "c": None},
+            "tags": {"A": 1},
+        }
+    }
+    assert spec["params"]["bar"]["values"] == {"__tuple__": [1, 2.5, [True, None]]}
+    assert spec["config"] == {"display": "text"}
+
+    rebuilt = CompositionDummy.from_spec(json.loads(json.dumps(spec)))
+    assert rebuilt == obj
+    assert rebuilt.bar["values"] == (1, 2.5, [True, None])
+    assert rebuilt.bar["type"] is Parent
+    assert rebuilt.foo._get_tags()["A"] == 1
+    assert rebuilt._get_config()["display"] == "text"
+    assert to_spec(rebuilt) == spec
+
+
+def test_spec_bulk():
+    """Test to_specs and from_specs convert many objects."""
+    objects = [Parent(b=i) for i in range(100)] + [Child(a="y")]
+    specs = to_specs(objects)
+    assert specs == [to_spec(obj) for obj in objects]
+    rebuilt = from_specs(specs)
+    assert rebuilt == objects
+    assert [type(obj) for obj in rebuilt] == [type(obj) for obj in objects]
+
+
+def test_register_spec_class():
+    """Test registered classes are referred to by their registered name."""
+
+    class Local(BaseObject):
+        def __init__(self, a=1):
+            self.a = a
+            super().__init__()
+
+    with pytest.raises(ValueError, match="Could not resolve the class"):
+        from_spec(to_spec(Local()))
+
+    try:
+        assert register_spec_class(Local, name="my.Local") is Local
+        spec = to_spec(Local(a=2))
+        assert spec == {"class": "my.Local", "params": {"a": 2}}
+        assert from_spec(spec) == Local(a=2)
+    finally:
+        _SPEC_CLASS_NAMES.pop(Local)
+        _SPEC_CLASS_REGISTRY.pop("my.Local")
+
+    with pytest.raises(TypeError, match="implementing `get_params`"):
+        register_spec_class(dict)
+
+
+def test_spec_raises_error():
+    """Test errors are raised for objects and specs that can't be converted."""
+    with pytest.raises(TypeError, match="The value of 'a' can't be converted"):
+        to_spec(Parent(a=np.arange(3)))
+    with pytest.raises(TypeError, match="The dict in 'a' can't be converted"):
+        to_spec(Parent(a={1: 2}))
+
+    with pytest.raises(ValueError, match="must be a dict with a 'class' key"):
+        from_spec({"params": {}})
+    with pytest.raises(ValueError, match="implementing `get_params`"):
+        from_spec({"class": "builtins:dict"})
+    with pytest.raises(ValueError, match="invalid parameters \\['d'\\]"):
+        from_spec(
+            {"class": "predictably_core.tests.conftest:Parent", "params": {"d": 1}}
+        )
+    with pytest.raises(TypeError, match="to describe an instance of BaseEstimator"):
+        BaseEstimator.from_spec(to_spec(Parent()))
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3 -u
+# copyright: predict-ably, BSD-3-Clause License (see LICENSE file)
+"""Tests of the time and modules needed to import predictably_core.
+
+Imports are measured in a fresh interpreter using ``python -X importtime``.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess  # noqa: S404
+import sys
+
+import pytest
+
+import predictably_core
+import predictably_core.validate
+
+__author__: list[str] = ["RNKuhns"]
+
+# Budgets for the modules (including standard library modules) imported and the
+# cumulative import time. Wall-clock time depends on the machine, cold caches and
+# coverage instrumentation, so the time budget is only checked when the
+# PREDICTABLY_CHECK_IMPORT_TIME environment variable is set
+IMPORT_BUDGETS = {
+    "import predictably_core": (10, 0.05),
+    "from predictably_core.core import BaseObject": (70, 0.2),
+    "from predictably_core.validate import check_type": (90, 0.25),
+}
+# Machinery that should only be imported when it is used
+LAZY_MODULES = (
+    "predictably_core.core._pprint._object_html_repr",
+    "predictably_core.core._pprint._pprint",
+    "predictably_core.core._pprint._export",
+    "predictably_core.core._fit_cache",
+    "predictably_core.core._persist",
+    "predictably_core.core._params_pickle",
+    "predictably_core.core._shared_memory",
+    "predictably_core.core._spec",
+    "predictably_core.validate._arrays",
+    "predictably_core.validate._paths",
+    "predictably_core.validate._report",
+    "predictably_core.validate._validators",
+)
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)$")
+
+
+def _measure_import(statement: str) -> tuple[list[str], float]:
+    """Run an import statement in a fresh interpreter using -X importtime.
+
+    Parameters
+    ----------
+    statement : str
+        The Python statement to run.
+
+    Returns
+    -------
+    modules : list[str]
+        The modules imported by the statement.
+    seconds : float
+        The cumulative time spent importing the modules.
+    """
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    # Modules imported during interpreter startup are excluded
+    startup = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", "pass"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    startup_modules = {
+        m[3] for m in map(_IMPORTTIME_LINE.match, startup.stderr.splitlines()) if m
+    }
+    modules = []
+    microseconds = 0
+    for match in map(_IMPORTTIME_LINE.match, result.stderr.splitlines()):
+        if match is None or match[3] in startup_modules:
+            continue
+        modules.append(match[3])
+        # Only top level imports are counted, since their time is cumulative
+        if len(match[2]) == 1:
+            microseconds += int(match[1])
+    return modules, microseconds / 1e6
+
+
+@pytest.mark.parametrize("statement", list(IMPORT_BUDGETS))
+def test_import_budget(statement: str) -> None:
+    """Test importing predictably_core modules stays within the module budget."""
+    max_modules, _ = IMPORT_BUDGETS[statement]
+    modules, _ = _measure_import(statement)
+    assert len(modules) <= max_modules, (
+        f"`{statement}` imported {len(modules)} modules, more than the budget of "
+        f"{max_modules}: {modules}."
+    )
+    assert not set(LAZY_MODULES).intersection(modules)
+
+
+@pytest.mark.skipif(
+    not os.environ.get("PREDICTABLY_CHECK_IMPORT_TIME"),
+    reason="Import time is only checked if PREDICTABLY_CHECK_IMPORT_TIME is set.",
+)
+@pytest.mark.parametrize("statement", list(IMPORT_BUDGETS))
+def test_import_time_budget(statement: str) -> None:
+    """Test importing predictably_core modules stays within the time budget."""
+    _, max_seconds = IMPORT_BUDGETS[statement]
+    _, seconds = _measure_import(statement)
+    assert (
+        seconds <= max_seconds
+    ), f"`{statement}` took {seconds:.3f}s, more than the budget of {max_seconds}s."
+
+
+def test_import_package_is_lazy() -> None:
+    """Test importing predictably_core doesn't import its subpackages."""
+    modules, _ = _measure_import("import predictably_core")
+    assert [m for m in modules if m.startswith("predictably_core")] == [
+        "predictably_core._lazy",
+        "predictably_core",
+    ]
+
+    # Using an object only imports the module that defines it
+    modules, _ = _measure_import("from predictably_core.core import BaseObject")
+    assert "predictably_core.core._base" in modules
+    assert not set(LAZY_MODULES).intersection(modules)
+
+
+def test_lazy_attributes() -> None:
+    """Test lazily imported attributes are available from their package."""
+    from predictably_core.validate._types import check_type
+
+    assert predictably_core.validate.check_type is check_type
+    assert "check_type" in vars(predictably_core.validate)
+    assert predictably_core.core.BaseObject.__name__ == "BaseObject"
+
+    for package in (predictably_core, predictably_core.validate):
+        assert set(package.__all__) <= set(dir(package))
+        for name in package.__all__:
+            assert getattr(package, name) is not None
+
+    assert {"config", "core", "utils", "validate"} <= set(dir(predictably_core))
+
+    with pytest.raises(AttributeError, match="has no attribute 'not_an_attribute'"):
+        predictably_core.validate.not_an_attribute  # noqa: B018
@@ -10,25 +10,51 @@ This module includes general utilities.
 
 from __future__ import annotations
 
-from predictably_core.utils._iter import (
-    _convert_scalar_seq_type_input_to_tuple,
-    format_sequence_to_str,
-    scalar_to_sequence,
-    single_element_sequence_to_scalar,
-)
-from predictably_core.utils._utils import (
-    compare_mappings,
-    remove_type_text,
-    update_dict_at,
-)
+from typing import TYPE_CHECKING
+
+from predictably_core._lazy import _lazy_module_attributes
+
+if TYPE_CHECKING:
+    from predictably_core.utils._indexed_dict import IndexedDict
+    from predictably_core.utils._iter import (
+        _convert_scalar_seq_type_input_to_tuple,
+        format_sequence_to_str,
+        scalar_to_sequence,
+        single_element_sequence_to_scalar,
+    )
+    from predictably_core.utils._memory import deep_sizeof
+    from predictably_core.utils._utils import (
+        compare_mappings,
+        diff_mappings,
+        remove_type_text,
+        update_dict_at,
+    )
 
 __author__: list[str] = ["RNKuhns"]
 __all__: list[str] = [
+    "IndexedDict",
     "_convert_scalar_seq_type_input_to_tuple",
     "compare_mappings",
+    "deep_sizeof",
+    "diff_mappings",
     "format_sequence_to_str",
     "remove_type_text",
     "scalar_to_sequence",
     "single_element_sequence_to_scalar",
     "update_dict_at",
 ]
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "IndexedDict": "predictably_core.utils._indexed_dict",
+    "_convert_scalar_seq_type_input_to_tuple": "predictably_core.utils._iter",
+    "compare_mappings": "predictably_core.utils._utils",
+    "deep_sizeof": "predictably_core.utils._memory",
+    "diff_mappings": "predictably_core.utils._utils",
+    "format_sequence_to_str": "predictably_core.utils._iter",
+    "remove_type_text": "predictably_core.utils._utils",
+    "scalar_to_sequence": "predictably_core.utils._iter",
+    "single_element_sequence_to_scalar": "predictably_core.utils._iter",
+    "update_dict_at": "predictably_core.utils._utils",
+}
+
+__getattr__, __dir__ = _lazy_module_attributes(__name__, _LAZY_IMPORTS)
@@ -0,0 +1,436 @@
+#!/usr/bin/env python3 -u
+# copyright: predictably developers, BSD-3-Clause License (see LICENSE file)
+"""An ordered dictionary supporting efficient positional operations.
+
+Keys are stored in order in a list of bounded size blocks, alongside a Fenwick
+tree (binary indexed tree) of the block lengths. This allows keys to be
+inserted at, and looked up by, their position in O(log n) time (plus the cost
+of shifting keys within a single bounded size block), instead of the O(n)
+time needed to rebuild a regular dictionary.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import MutableMapping
+from typing import Any, Iterator, Mapping
+
+__author__: list[str] = ["RNKuhns"]
+__all__: list[str] = ["IndexedDict"]
+
+# Blocks are split in half once they have more than twice this many keys
+_BLOCK_LOAD = 256
+
+
+class IndexedDict(MutableMapping):
+    """Ordered dictionary with efficient insertion and lookup by position.
+
+    Behaves like a `dict` (keys are kept in insertion order and looked up in
+    O(1) time), but keys can also be inserted at any position, and the position
+    of a key or the key at a position can be found, in O(log n) time.
+
+    Parameters
+    ----------
+    *args : Mapping or Iterable[tuple[Any, Any]]
+        Optional mapping or iterable of key-value pairs used to initialize the
+        dictionary, as for `dict`.
+    **kwargs : Any
+        Additional items used to initialize the dictionary.
+
+    See Also
+    --------
+    update_dict_at :
+        Update a `dict` with another `dict` at a given position.
+
+    Notes
+    -----
+    Keys are stored in order in blocks of at most ``2 * 256`` keys, and a
+    Fenwick tree of the block lengths locates the block containing a position.
+    Inserting, deleting or finding the position of a key therefore takes
+    O(log n) time plus the (bounded) cost of shifting keys within a block.
+    When a block is split or emptied, the block index is rebuilt in time
+    proportional to the number of blocks, which is amortized over the many
+    inserts or deletes that caused it.
+
+    Examples
+    --------
+    >>> from predictably_core.utils import IndexedDict
+    >>> steps = IndexedDict({"impute": 1, "scale": 2, "model": 3})
+    >>> steps.insert(1, "encode", 4)
+    >>> steps
+    IndexedDict({'impute': 1, 'encode': 4, 'scale': 2, 'model': 3})
+    >>> steps.index("scale")
+    2
+    >>> steps.key_at(-1)
+    'model'
+    >>> steps.update_at({"select": 5, "model": 6}, at=2)
+    >>> list(steps.items())
+    [('impute', 1), ('encode', 4), ('select', 5), ('model', 6), ('scale', 2)]
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self._data: dict[Any, Any] = {}
+        # Keys in order, split into blocks of bounded size
+        self._blocks: list[list[Any]] = []
+        # The block containing each key
+        self._block_of: dict[Any, list[Any]] = {}
+        # The position of each block (by id) in self._blocks
+        self._block_index: dict[int, int] = {}
+        # Fenwick tree of the block lengths (1-based)
+        self._tree: list[int] = [0]
+        self.update(*args, **kwargs)
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the block positions and the Fenwick tree of block lengths."""
+        blocks = self._blocks
+        self._block_index = {id(block): i for i, block in enumerate(blocks)}
+        tree = [0, *(len(block) for block in blocks)]
+        n_blocks = len(blocks)
+        for i in range(1, n_blocks + 1):
+            parent = i + (i & -i)
+            if parent <= n_blocks:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _add_to_block_length(self, block_index: int, delta: int) -> None:
+        """Update the Fenwick tree after a block's length changed.
+
+        Parameters
+        ----------
+        block_index : int
+            The position of the block in the list of blocks.
+        delta : int
+            The change in the block's length.
+        """
+        tree = self._tree
+        n_blocks = len(self._blocks)
+        i = block_index + 1
+        while i <= n_blocks:
+            tree[i] += delta
+            i += i & -i
+
+    def _n_keys_before_block(self, block_index: int) -> int:
+        """Count the keys in the blocks before a block.
+
+        Parameters
+        ----------
+        block_index : int
+            The position of the block in the list of blocks.
+
+        Returns
+        -------
+        int
+            The number of keys in ``self._blocks[:block_index]``.
+        """
+        tree = self._tree
+        total = 0
+        i = block_index
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def _locate(self, position: int) -> tuple[int, int]:
+        """Find the block containing a position.
+
+        Parameters
+        ----------
+        position : int
+            A position in ``range(len(self))``.
+
+        Returns
+        -------
+        block_index : int
+            The position of the block containing `position`.
+        offset : int
+            The position within the block.
+        """
+        tree = self._tree
+        n_blocks = len(self._blocks)
+        block_index = 0
+        step = 1 << n_blocks.bit_length()
+        while step:
+            i = block_index + step
+            if i <= n_blocks and tree[i] <= position:
+                block_index = i
+                position -= tree[i]
+            step >>= 1
+        return block_index, position
+
+    def _normalize_position(self, position: int) -> int:
+        """Convert a (possibly negative) position into an index.
+
+        Parameters
+        ----------
+        position : int
+            The position, which can be negative to count from the end.
+
+        Returns
+        -------
+        int
+            The position in ``range(len(self))``.
+
+        Raises
+        ------
+        IndexError
+            If `position` is out of range.
+        """
+        n = len(self._data)
+        if position < 0:
+            position += n
+        if not 0 <= position < n:
+            raise IndexError(f"IndexedDict position out of range: {position}.")
+        return position
+
+    def __getitem__(self, key: Any) -> Any:
+        """Return the value of a key."""
+        return self._data[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """Set the value of a key, adding new keys at the end."""
+        if key in self._data:
+            self._data[key] = value
+        else:
+            self._insert_new(len(self._data), key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        """Remove a key."""
+        del self._data[key]
+        block = self._block_of.pop(key)
+        block_index = self._block_index[id(block)]
+        block.remove(key)
+        if block:
+            self._add_to_block_length(block_index, -1)
+        else:
+            del self._blocks[block_index]
+            self._rebuild_index()
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the keys in order."""
+        return itertools.chain.from_iterable(self._blocks)
+
+    def __reversed__(self) -> Iterator[Any]:
+        """Iterate over the keys in reverse order."""
+        for block in reversed(self._blocks):
+            yield from reversed(block)
+
+    def __len__(self) -> int:
+        """Return the number of keys."""
+        return len(self._data)
+
+    def __contains__(self, key: Any) -> bool:
+        """Indicate whether a key is in the dictionary."""
+        return key in self._data
+
+    def __repr__(self) -> str:
+        """Represent the dictionary like a `dict`."""
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    def _insert_new(self, position: int, key: Any, value: Any) -> None:
+        """Insert a key that isn't in the dictionary.
+
+        Parameters
+        ----------
+        position : int
+            The position in ``range(len(self) + 1)`` to insert the key at.
+        key : Any
+            The key.
+        value : Any
+            The value.
+        """
+        blocks = self._blocks
+        if not blocks:
+            block = [key]
+            blocks.append(block)
+            self._rebuild_index()
+        else:
+            if position == len(self._data):
+                block_index = len(blocks) - 1
+                offset = len(blocks[block_index])
+            else:
+                block_index, offset = self._locate(position)
+            block = blocks[block_index]
+            block.insert(offset, key)
+            if len(block) > 2 * _BLOCK_LOAD:
+                new_block = block[_BLOCK_LOAD:]
+                del block[_BLOCK_LOAD:]
+                blocks.insert(block_index + 1, new_block)
+                for moved_key in new_block:
+                    self._block_of[moved_key] = new_block
+                if offset >= _BLOCK_LOAD:
+                    block = new_block
+                self._rebuild_index()
+            else:
+                self._add_to_block_length(block_index, 1)
+        self._block_of[key] = block
+        self._data[key] = value
+
+    def insert(self, position: int, key: Any, value: Any) -> None:
+        """Insert a key and value at a position.
+
+        Parameters
+        ----------
+        position : int
+            The position to insert the key at, interpreted like the index
+            passed to `list.insert` (negative positions count from the end and
+            out of range positions insert at the start or end).
+        key : Any
+            The key. If the key is already in the dictionary, it is moved to
+            `position`.
+        value : Any
+            The value.
+        """
+        if key in self._data:
+            del self[key]
+        n = len(self._data)
+        if position < 0:
+            position = max(position + n, 0)
+        self._insert_new(min(position, n), key, value)
+
+    def index(self, key: Any) -> int:
+        """Find the position of a key.
+
+        Parameters
+        ----------
+        key : Any
+            The key.
+
+        Returns
+        -------
+        int
+            The position of `key`.
+
+        Raises
+        ------
+        KeyError
+            If `key` isn't in the dictionary.
+        """
+        block = self._block_of[key]
+        block_index = self._block_index[id(block)]
+        return self._n_keys_before_block(block_index) + block.index(key)
+
+    def key_at(self, position: int) -> Any:
+        """Find the key at a position.
+
+        Parameters
+        ----------
+        position : int
+            The position, which can be negative to count from the end.
+
+        Returns
+        -------
+        Any
+            The key at `position`.
+
+        Raises
+        ------
+        IndexError
+            If `position` is out of range.
+        """
+        block_index, offset = self._locate(self._normalize_position(position))
+        return self._blocks[block_index][offset]
+
+    def item_at(self, position: int) -> tuple[Any, Any]:
+        """Find the key and value at a position.
+
+        Parameters
+        ----------
+        position : int
+            The position, which can be negative to count from the end.
+
+        Returns
+        -------
+        tuple[Any, Any]
+            The key and value at `position`.
+
+        Raises
+        ------
+        IndexError
+            If `position` is out of range.
+        """
+        key = self.key_at(position)
+        return key, self._data[key]
+
+    def popitem(self, last: bool = True) -> tuple[Any, Any]:
+        """Remove and return the last (or first) key and value.
+
+        Parameters
+        ----------
+        last : bool, default=True
+            Whether the last item is removed. Otherwise, the first item is.
+
+        Returns
+        -------
+        tuple[Any, Any]
+            The removed key and value.
+
+        Raises
+        ------
+        KeyError
+            If the dictionary is empty.
+        """
+        if not self._data:
+            raise KeyError("popitem(): dictionary is empty")
+        key = self._blocks[-1][-1] if last else self._blocks[0][0]
+        value = self._data[key]
+        del self[key]
+        return key, value
+
+    def clear(self) -> None:
+        """Remove all keys."""
+        self._data.clear()
+        self._blocks.clear()
+        self._block_of.clear()
+        self._rebuild_index()
+
+    def copy(self) -> IndexedDict:
+        """Return a shallow copy.
+
+        Returns
+        -------
+        IndexedDict
+            A new IndexedDict with the same items.
+        """
+        return type(self)(self.items())
+
+    def update_at(
+        self,
+        new_dict: Mapping[Any, Any],
+        at: int | None = None,
+        keep_new: bool = True,
+    ) -> None:
+        """Update the dictionary in place with new items at a given position.
+
+        Equivalent to :func:`update_dict_at`, but updates the dictionary in
+        place in time proportional to the number of new items (times the
+        O(log n) cost of positional operations), instead of rebuilding it.
+
+        Parameters
+        ----------
+        new_dict : Mapping
+            The mapping used to update the dictionary.
+        at : int | None, default=None
+            The position the update should occur at. Interpreted like the `at`
+            parameter of :func:`update_dict_at`.
+        keep_new : bool, default=True
+            Whether to keep the values from `new_dict` when updating keys that
+            exist after the `at` position.
+        """
+        n = len(self._data)
+        if at is None:
+            at = n
+        # Number of keys before the "at" position (using slice semantics)
+        n_before = len(range(n)[:at])
+        position = n_before
+        for key, value in new_dict.items():
+            if key in self._data:
+                current = self.index(key)
+                if current < n_before:
+                    # Keys before the "at" position are updated in place
+                    self._data[key] = value
+                    continue
+                if not keep_new:
+                    value = self._data[key]
+                del self[key]
+            self._insert_new(position, key, value)
+            position += 1
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import collections
 import inspect
+import itertools
 from typing import Any, Sequence, TypeVar
 
 from predictably_core.utils._utils import remove_type_text
@@ -126,11 +127,113 @@ def scalar_to_sequence(
         raise ValueError(error_msg)
 
 
+def _format_truncated_elements(
+    seq: Any,
+    sep: str,
+    last_sep: str | None,
+    exclude_type_text: bool,
+    max_items: int | None,
+    max_chars: int | None,
+) -> str:
+    """Format the elements of an iterable, rendering only the ones that are shown.
+
+    Parameters
+    ----------
+    seq : Iterable[Any]
+        The elements to format.
+    sep : str
+        The separator to use when creating the str output.
+    last_sep : str | None
+        The separator to use prior to last element.
+    exclude_type_text : bool
+        Whether to remove the <class > text wrapping the class type name.
+    max_items : int | None
+        The maximum number of elements that are rendered.
+    max_chars : int | None
+        The approximate maximum length of the output.
+
+    Returns
+    -------
+    str
+        The formatted elements, with a "... (N more)" marker replacing elements
+        that aren't shown.
+    """
+    to_str = remove_type_text if exclude_type_text else str
+    # Elements can be read from the end of sequences, so the head and tail of a
+    # sequence are shown. Other iterables are only shown from the start
+    if isinstance(seq, collections.abc.Sequence):
+        n = len(seq)
+        indexable = True
+    elif isinstance(seq, collections.abc.Sized):
+        n = len(seq)
+        indexable = False
+    else:
+        seq = list(seq)
+        n = len(seq)
+        indexable = True
+
+    n_shown = n if max_items is None else min(n, max_items)
+    # Sequences that might be truncated are shown from both ends
+    truncated = n_shown < n or max_chars is not None
+    n_tail = n_shown // 2 if indexable and truncated else 0
+    n_head = n_shown - n_tail
+    head_strs = map(to_str, itertools.islice(seq, n_head))
+    # The tail is rendered from the last element backwards
+    tail_strs = (to_str(seq[i]) for i in range(n - 1, n - 1 - n_tail, -1))
+
+    head: list[str] = []
+    tail: list[str] = []
+    if max_chars is None:
+        head = list(head_strs)
+        tail = list(tail_strs)
+    else:
+        # Alternate between the head and the tail while elements fit the budget
+        n_chars = 0
+        # Separators are counted at the length of the longest one that is used
+        sep_len = len(sep) if last_sep is None else max(len(sep), len(last_sep) + 2)
+        sides = (
+            [(head, head_strs), (tail, tail_strs)] if n_tail else [(head, head_strs)]
+        )
+        while sides:
+            shown, strs = min(sides, key=lambda side: len(side[0]))
+            element_str = next(strs, None)
+            if element_str is None:
+                sides = [side for side in sides if side[0] is not shown]
+                continue
+            n_chars += len(element_str) + (sep_len if head or tail else 0)
+            if n_chars > max_chars:
+                break
+            shown.append(element_str)
+        if len(head) + len(tail) < n:
+            # Drop elements until the "... (N more)" marker fits
+            while head or tail:
+                marker = f"... ({n - len(head) - len(tail)} more)"
+                if n_chars <= max_chars - len(marker) - sep_len:
+                    break
+                shown = tail if len(tail) >= len(head) else head
+                n_chars -= len(shown.pop()) + sep_len
+    tail.reverse()
+
+    n_more = n - len(head) - len(tail)
+    if n_more:
+        parts = [*head, f"... ({n_more} more)", *tail]
+        if not tail:
+            # The separator before the last element is only used for an element
+            return sep.join(parts)
+    else:
+        parts = [*head, *tail]
+    if last_sep is None or len(parts) < 2:
+        return sep.join(parts)
+    return sep.join(parts[:-1]) + f" {last_sep} " + parts[-1]
+
+
 def format_sequence_to_str(
     seq: Any | Sequence[Any],
     sep: str = ", ",
     last_sep: str | None = None,
     exclude_type_text: bool = False,
+    max_items: int | None = None,
+    max_chars: int | None = None,
 ) -> str:
     """Format a sequence to a string of delimited elements.
 
@@ -159,12 +262,35 @@ def format_sequence_to_str(
         - If False, then input sequence [list, tuple] returns
           "<class 'list'>, <class 'tuple'>".
 
+    max_items : int | None, default=None
+        The maximum number of elements included in the output.
+
+        - If None, then all elements are included.
+        - Otherwise, only the first and last elements of a sequence (or the
+          first elements of other iterables) are converted to str, and the
+          remaining elements are replaced by a "... (N more)" marker.
+
+    max_chars : int | None, default=None
+        The maximum length of the output.
+
+        - If None, then the length of the output isn't limited.
+        - Otherwise, elements are added (alternating between the start and end
+          of a sequence) while the output fits in `max_chars` characters, and the
+          remaining elements are replaced by a "... (N more)" marker. The marker
+          is always included, so very small budgets can be exceeded.
+
     Returns
     -------
     str
         The sequence of inputs converted to a string. For example, if `seq`
         is (7, 9, "cart") and ``last_sep is None`` then the output is "7", "9", "cart".
 
+    Notes
+    -----
+    When `max_items` or `max_chars` is used, only the elements that are shown
+    are converted to str, so formatting a small part of a very large sequence
+    is cheap. Iterables that aren't sized are read into a list first.
+
     Examples
     --------
     >>> from predictably_core.utils._iter import format_sequence_to_str
@@ -175,25 +301,37 @@ def format_sequence_to_str(
     '1, 2, 3 and 4'
     >>> format_sequence_to_str(seq, last_sep="or")
     '1, 2, 3 or 4'
+
+    Large sequences can be truncated to their first and last elements.
+
+    >>> format_sequence_to_str(range(1_000_000), max_items=4, last_sep="or")
+    '0, 1, ... (999996 more), 999998 or 999999'
+    >>> format_sequence_to_str(range(1_000_000), max_chars=60)
+    '0, 1, 2, ... (999994 more), 999997, 999998, 999999'
     """
     from predictably_core.validate._types import is_iterable
 
     if isinstance(seq, str):
         output_str = seq
     elif isinstance(seq, type):
-        output_str = remove_type_text(str(seq)) if exclude_type_text else str(seq)
+        output_str = remove_type_text(seq) if exclude_type_text else str(seq)
     elif isinstance(seq, collections.abc.Sequence) or is_iterable(seq):
-        seq_str = [
-            remove_type_text(str(e)) if exclude_type_text else str(e) for e in seq
-        ]
-        if last_sep is None:
-            output_str = sep.join(seq_str)
+        if max_items is not None or max_chars is not None:
+            output_str = _format_truncated_elements(
+                seq, sep, last_sep, exclude_type_text, max_items, max_chars
+            )
         else:
-            if len(seq_str) == 1:
-                output_str = single_element_sequence_to_scalar(seq_str)
+            seq_str = [
+                remove_type_text(e) if exclude_type_text else str(e) for e in seq
+            ]
+            if last_sep is None:
+                output_str = sep.join(seq_str)
             else:
-                output_str = sep.join(seq_str[:-1])
-                output_str = output_str + f" {last_sep} " + seq_str[-1]
+                if len(seq_str) == 1:
+                    output_str = single_element_sequence_to_scalar(seq_str)
+                else:
+                    output_str = sep.join(seq_str[:-1])
+                    output_str = output_str + f" {last_sep} " + seq_str[-1]
     # Allow casting of scalars to strings
     else:
         try:
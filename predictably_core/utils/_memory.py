@@ -0,0 +1,113 @@
+#!/usr/bin/env python3 -u
+# copyright: predictably developers, BSD-3-Clause License (see LICENSE file)
+"""Estimate the memory used by objects and everything they reference."""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import sys
+import types
+from typing import Any
+
+from predictably_core.utils._utils import _slot_names
+
+__author__: list[str] = ["RNKuhns"]
+__all__: list[str] = ["deep_sizeof"]
+
+# Objects whose size doesn't depend on the objects they reference
+_ATOMIC_TYPES = (str, bytes, bytearray, int, float, complex, range, type(None))
+_CONTAINER_TYPES = (list, tuple, set, frozenset, collections.deque)
+# Program level objects that are shared rather than owned by the objects that
+# reference them
+_SHARED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+)
+
+
+def deep_sizeof(obj: Any, seen: set[int] | None = None) -> int:
+    """Estimate the memory used by an object and the objects it references.
+
+    Parameters
+    ----------
+    obj : Any
+        The object.
+    seen : set[int], default=None
+        The ids of objects that were already counted, and are skipped if they
+        are referenced again. The set is updated with the ids of the objects
+        counted by this call, so that it can be reused to measure several
+        objects without counting shared objects more than once.
+
+    Returns
+    -------
+    int
+        The estimated number of bytes.
+
+    Notes
+    -----
+    The objects referenced by builtin containers, instance ``__dict__`` and
+    slots are followed. The data buffer of array-likes with an `nbytes`
+    attribute (like NumPy arrays) is counted once, even if several views of it
+    are referenced. Objects that define their own ``__sizeof__`` in Python (like
+    pandas objects) are assumed to include the objects they reference. Classes,
+    modules and functions are shared by the whole program and aren't counted.
+
+    Examples
+    --------
+    >>> from predictably_core.utils import deep_sizeof
+    >>> data = [1.0] * 1000
+    >>> deep_sizeof(data) > deep_sizeof([])
+    True
+
+    Objects are only counted once, even if they are referenced more than once.
+
+    >>> deep_sizeof([data, data]) < deep_sizeof([data, list(data)])
+    True
+    """
+    if seen is None:
+        seen = set()
+    total = 0
+    # Objects are visited using a stack, so deeply nested objects are supported
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, _SHARED_TYPES):
+            continue
+        total += sys.getsizeof(obj)
+        if isinstance(obj, _ATOMIC_TYPES):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, _CONTAINER_TYPES):
+            stack.extend(obj)
+        elif isinstance(obj, memoryview):
+            # Released memoryviews raise a ValueError
+            with contextlib.suppress(ValueError):
+                stack.append(obj.obj)
+        elif isinstance(getattr(obj, "nbytes", None), int):
+            base = getattr(obj, "base", None)
+            if base is not None:
+                # Views only count their header, and the buffer of their base
+                stack.append(base)
+            else:
+                # sys.getsizeof includes the buffer of NumPy arrays that own
+                # their data, but not necessarily for other array-likes
+                total += max(obj.nbytes - sys.getsizeof(obj), 0)
+            if getattr(getattr(obj, "dtype", None), "kind", None) == "O":
+                stack.extend(obj.flat)
+        elif type(obj).__sizeof__ is object.__sizeof__:
+            instance_dict = getattr(obj, "__dict__", None)
+            if instance_dict is not None:
+                stack.append(instance_dict)
+            for name in _slot_names(type(obj)):
+                if hasattr(obj, name):
+                    stack.append(getattr(obj, name))
+    return total
@@ -6,11 +6,26 @@ For utility functions related to iterables see :mod:`predictable_core.utils._ite
 from __future__ import annotations
 
 import collections
+import functools
+import itertools
+import math
+import numbers
 import re
+import sys
+import weakref
 from typing import Any, Mapping
 
 __author__: list[str] = ["RNKuhns"]
-__all__: list[str] = ["compare_mappings", "remove_type_text", "update_dict_at"]
+__all__: list[str] = [
+    "compare_mappings",
+    "diff_mappings",
+    "remove_type_text",
+    "update_dict_at",
+]
+
+_CLASS_TEXT_PATTERN = re.compile(r"^<class '(.*)'>$")
+_FORWARD_REF_PATTERN = re.compile(r"^ForwardRef\('(.*)'\)")
+_MAX_CACHED_TYPE_NAMES = 1024
 
 
 def remove_type_text(input_: str | type) -> str:
@@ -41,20 +56,236 @@ def remove_type_text(input_: str | type) -> str:
     >>> remove_type_text("ForwardRef('pd.DataFrame')")
     'pd.DataFrame'
     """
+    if isinstance(input_, type):
+        try:
+            return _type_name(input_)
+        except TypeError:  # pragma: no cover
+            # Classes with an unhashable metaclass can't be cached
+            pass
     if not isinstance(input_, str):
         input_ = str(input_)
+    return _remove_type_text_from_str(input_)
+
 
-    m = re.match("^<class '(.*)'>$", input_)
+def _remove_type_text_from_str(input_: str) -> str:
+    """Remove <class > or ForwardRef() wrapper from a str.
+
+    Parameters
+    ----------
+    input_ : str
+        The printed type.
 
+    Returns
+    -------
+    str
+        The text without the <class > or ForwardRef() wrapper.
+    """
+    m = _CLASS_TEXT_PATTERN.match(input_)
     if m:
         return m[1]
+    m_forward_ref = _FORWARD_REF_PATTERN.match(input_)
+    if m_forward_ref:
+        return m_forward_ref[1]
+    return input_
 
-    else:
-        m_forward_ref = re.match(r"^ForwardRef\('(.*)'\)", input_)
-        if m_forward_ref:
-            return m_forward_ref[1]
-        else:
-            return input_
+
+@functools.lru_cache(maxsize=_MAX_CACHED_TYPE_NAMES)
+def _type_name(cls: type) -> str:
+    """Format a class without the <class > wrapper, caching the result per class.
+
+    Parameters
+    ----------
+    cls : type
+        The class.
+
+    Returns
+    -------
+    str
+        The text version of the class without the <class > wrapper.
+    """
+    return _remove_type_text_from_str(str(cls))
+
+
+# Names of the slots declared by each class and its parents
+_SLOT_NAMES_CACHE: weakref.WeakKeyDictionary[type, tuple[str, ...]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _slot_names(cls: type) -> tuple[str, ...]:
+    """Get the names of the slots declared by a class and its parents.
+
+    Parameters
+    ----------
+    cls : type
+        The class.
+
+    Returns
+    -------
+    tuple[str, ...]
+        The names of the slots (excluding "__dict__" and "__weakref__"), ordered
+        from the most basic parent class to `cls`.
+    """
+    names = _SLOT_NAMES_CACHE.get(cls)
+    if names is None:
+        slot_names: list[str] = []
+        for klass in reversed(cls.__mro__):
+            slots = vars(klass).get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            slot_names.extend(
+                name
+                for name in slots
+                if name not in ("__dict__", "__weakref__") and name not in slot_names
+            )
+        names = _SLOT_NAMES_CACHE[cls] = tuple(slot_names)
+    return names
+
+
+def _is_instance_of(value: Any, module_name: str, class_name: str) -> bool:
+    """Check if a value is an instance of a class in an optional dependency.
+
+    Parameters
+    ----------
+    value : Any
+        The value to check.
+    module_name : str
+        The name of the module defining the class. The module isn't imported, if
+        it hasn't already been imported then `value` can't be an instance.
+    class_name : str
+        The name of the class.
+
+    Returns
+    -------
+    bool
+        Whether `value` is an instance of the class.
+    """
+    module = sys.modules.get(module_name)
+    return module is not None and isinstance(value, getattr(module, class_name, ()))
+
+
+def _deep_equal(value: Any, other: Any) -> bool:
+    """Compare two values recursively.
+
+    Parameters
+    ----------
+    value : Any
+        The value to compare to.
+    other : Any
+        The value to compare to `value`.
+
+    Returns
+    -------
+    bool
+        Whether the values are equal. BaseObjects (or other objects with a
+        ``get_params`` method) are equal if they have the same class and equal
+        parameters. Mappings, lists and tuples are compared element by element.
+        NumPy arrays and SciPy sparse matrices are equal if they have the same
+        shape and elements. Other values whose ``==`` comparison doesn't produce
+        a single boolean are compared with their ``equals`` method (e.g.,
+        pandas DataFrames) if they have one. NaN values are considered equal.
+    """
+    if value is other:
+        return True
+    if type(value) is not type(other):
+        # Allow comparisons between numeric types (e.g., 1 == 1.0)
+        if isinstance(value, numbers.Number) and isinstance(other, numbers.Number):
+            return bool(value == other)
+        return False
+    if callable(getattr(value, "get_params", None)):
+        return _mapping_values_equal(
+            value.get_params(deep=False), other.get_params(deep=False), deep=True
+        )
+    if isinstance(value, collections.abc.Mapping):
+        return len(value) == len(other) and _mapping_values_equal(
+            value, other, deep=True
+        )
+    if isinstance(value, (list, tuple)):
+        return len(value) == len(other) and all(
+            _deep_equal(v1, v2) for v1, v2 in zip(value, other)
+        )
+    if _is_instance_of(value, "numpy", "ndarray"):
+        np = sys.modules["numpy"]
+        if value.shape != other.shape or value.dtype != other.dtype:
+            return False
+        try:
+            return bool(np.array_equal(value, other, equal_nan=True))
+        except TypeError:  # equal_nan isn't supported for non-numeric dtypes
+            return bool(np.array_equal(value, other))
+    if _is_instance_of(value, "scipy.sparse", "spmatrix") or _is_instance_of(
+        value, "scipy.sparse", "sparray"
+    ):
+        return value.shape == other.shape and (value != other).nnz == 0
+    if isinstance(value, float) and math.isnan(value) and math.isnan(other):
+        return True
+    try:
+        return bool(value == other)
+    except (TypeError, ValueError):
+        pass
+    # Element-wise comparisons (e.g., of pandas DataFrames) are ambiguous as a
+    # bool, so the values are compared as a whole
+    if callable(getattr(value, "equals", None)):
+        return bool(value.equals(other))
+    if "numpy" in sys.modules:
+        try:
+            return bool(sys.modules["numpy"].array_equal(value, other))
+        except (TypeError, ValueError):
+            pass
+    return False
+
+
+def _values_equal(value: Any, other: Any, deep: bool) -> bool:
+    """Compare two mapping values.
+
+    Parameters
+    ----------
+    value : Any
+        The value to compare to.
+    other : Any
+        The value to compare to `value`.
+    deep : bool
+        Whether to compare the values recursively using :func:`_deep_equal`.
+
+    Returns
+    -------
+    bool
+        Whether the values are equal. Values whose ``==`` comparison doesn't
+        produce a single boolean (e.g., NumPy arrays) are compared recursively,
+        even if `deep` is False.
+    """
+    if value is other:
+        return True
+    if deep:
+        return _deep_equal(value, other)
+    try:
+        return bool(value == other)
+    except (TypeError, ValueError):
+        # Element-wise comparisons (e.g., of arrays) are ambiguous as a bool
+        return _deep_equal(value, other)
+
+
+def _mapping_values_equal(
+    map_: Mapping[Any, Any], other_map: Mapping[Any, Any], deep: bool
+) -> bool:
+    """Compare the keys and the value of each key in two mappings.
+
+    Parameters
+    ----------
+    map_ : Mapping[Any, Any]
+        The mapping to compare to.
+    other_map : Mapping[Any, Any]
+        The mapping to compare to `map_`.
+    deep : bool
+        Whether to compare the values recursively.
+
+    Returns
+    -------
+    bool
+        Whether the mappings have the same keys, with equal values for each key.
+    """
+    return map_.keys() == other_map.keys() and all(
+        _values_equal(v, other_map[k], deep) for k, v in map_.items()
+    )
 
 
 def compare_mappings(
@@ -62,6 +293,7 @@ def compare_mappings(
     other_map: Mapping[Any, Any],
     values: bool = True,
     ordered: bool = True,
+    deep: bool = False,
 ) -> bool:
     """Compare if two mappings are equal.
 
@@ -75,15 +307,38 @@ def compare_mappings(
     other_map : Mapping[Any, Any]
         The mapping to compare to `map_`.
     values : bool, default=True
-        Whether to require the mappings to have the same values.
+        Whether to require the mappings to have the same values. Values are
+        compared key by key, so each key must have an equal value in both
+        mappings.
     ordered : bool, default=True
         Whether to require the mappings to have the same order.
+    deep : bool, default=False
+        Whether to compare values recursively.
+
+        - If False, then values are compared using ``==``. Values whose
+          comparison doesn't produce a single boolean (e.g., NumPy arrays) are
+          compared as if ``deep=True``.
+        - If True, then BaseObjects are equal if they have the same class and
+          equal parameters, nested mappings, lists and tuples are compared
+          element by element, arrays are equal if they have the same shape and
+          elements, and NaN values are considered equal.
 
     Returns
     -------
     bool
         Whether two mappings are "equal".
 
+    See Also
+    --------
+    diff_mappings :
+        Find the keys whose values differ between two mappings.
+
+    Notes
+    -----
+    The comparison takes time linear in the size of the mappings. Values are
+    matched by key rather than hashed, so unhashable values (e.g., lists,
+    dictionaries or arrays) are supported.
+
     Examples
     --------
     >>> from predictably_core.utils import compare_mappings
@@ -102,6 +357,11 @@ def compare_mappings(
     >>> compare_mappings(some_map, other_map, ordered=True)
     False
 
+    Each key must have the same value in both mappings.
+
+    >>> compare_mappings(some_map, {"a": 2, "b": 1}, ordered=False)
+    False
+
     It is also possible to just check the equality of the keys.
 
     >>> another_map = {"a": 3, "b": 4}
@@ -123,6 +383,15 @@ def compare_mappings(
     >>> still_another_map = some_map
     >>> compare_mappings(some_map, still_another_map)
     True
+
+    Unhashable values can be compared, and nested values are compared
+    recursively if ``deep=True``.
+
+    >>> compare_mappings({"a": [1, 2]}, {"a": [1, 2]}, ordered=False)
+    True
+    >>> nan = float("nan")
+    >>> compare_mappings({"a": {"b": [nan]}}, {"a": {"b": [nan]}}, deep=True)
+    True
     """
     if not (
         isinstance(map_, collections.abc.Mapping)
@@ -142,20 +411,71 @@ def compare_mappings(
     if values:
         if ordered:
             match_ = all(
-                kv1 == kv2 for kv1, kv2 in zip(map_.items(), other_map.items())
+                k1 == k2 and _values_equal(v1, v2, deep)
+                for (k1, v1), (k2, v2) in zip(map_.items(), other_map.items())
             )
         else:
-            match_ = set(map_) == set(other_map) and set(map_.values()) == set(
-                other_map.values()
-            )
+            match_ = _mapping_values_equal(map_, other_map, deep)
     else:
         if ordered:
             match_ = all(k1 == k2 for k1, k2 in zip(map_, other_map))
         else:
-            match_ = set(map_) == set(other_map)
+            match_ = map_.keys() == other_map.keys()
     return match_
 
 
+def diff_mappings(
+    map_: Mapping[Any, Any], other_map: Mapping[Any, Any], deep: bool = True
+) -> list[Any]:
+    """Find the keys whose presence or value differs between two mappings.
+
+    Parameters
+    ----------
+    map_ : Mapping[Any, Any]
+        The mapping to compare to.
+    other_map : Mapping[Any, Any]
+        The mapping to compare to `map_`.
+    deep : bool, default=True
+        Whether to compare values recursively. See :func:`compare_mappings`.
+
+    Returns
+    -------
+    list[Any]
+        The keys of `map_` that are missing from `other_map` or have a different
+        value, followed by the keys of `other_map` that are missing from `map_`.
+        Empty if the mappings are equal (ignoring order).
+
+    See Also
+    --------
+    compare_mappings :
+        Compare if two mappings are equal.
+
+    Examples
+    --------
+    >>> from predictably_core.utils import diff_mappings
+    >>> params = {"alpha": 0.5, "steps": [1, 2], "scale": True}
+    >>> new_params = {"alpha": 0.5, "steps": [1, 3], "normalize": False}
+    >>> diff_mappings(params, new_params)
+    ['steps', 'scale', 'normalize']
+    """
+    if not (
+        isinstance(map_, collections.abc.Mapping)
+        and isinstance(other_map, collections.abc.Mapping)
+    ):
+        raise ValueError(
+            "`map_` and `other_map` must both be dictionaries."
+            f"\n But `map_` has type {type(map_)} and `other_map` "
+            f"type {type(other_map)}."
+        )
+    differing = [
+        k
+        for k, v in map_.items()
+        if k not in other_map or not _values_equal(v, other_map[k], deep)
+    ]
+    differing.extend(k for k in other_map if k not in map_)
+    return differing
+
+
 def update_dict_at(
     input_dict: dict[Any, Any],
     new_dict: dict[Any, Any],
@@ -198,6 +518,16 @@ def update_dict_at(
     dict[Any, Any]
         The updated dictionary.
 
+    See Also
+    --------
+    IndexedDict.update_at :
+        Update an IndexedDict in place at a given position, without rebuilding it.
+
+    Notes
+    -----
+    The output is built in a single pass over `input_dict` and `new_dict`, so
+    the update takes O(n) time.
+
     Examples
     --------
     >>> from predictably_core.utils import update_dict_at
@@ -234,20 +564,21 @@ def update_dict_at(
             f"\n But `input_dict` has type {type(input_dict)} and `new_dict` "
             f"type {type(new_dict)}."
         )
-    keys = tuple(input_dict)
     if at is None:
         at = len(input_dict)
     if not isinstance(at, int):
         raise ValueError(f"`at` must be an int or None, but found {at}.")
-    # Step 1: Get keys up until "at" position
-    output_ = {k: v for k, v in input_dict.items() if k in keys[:at]}
+    # Number of items before the "at" position (using slice semantics)
+    n_before = len(range(len(input_dict))[:at])
+    items = iter(input_dict.items())
+    # Step 1: Get items up until "at" position
+    output_ = dict(itertools.islice(items, n_before))
     # Step 2: Add new keys
     output_.update(new_dict)
-    # Step 3: Add remaining values from original dict
-    remaining = {
-        k: v
-        for k, v in input_dict.items()
-        if k in keys[at:] and not (keep_new and k in new_dict)
-    }
-    output_.update(remaining)
+    # Step 3: Add remaining values from original dict. Keys already in the
+    # output keep their position, but take the original value if not keep_new
+    if keep_new:
+        output_.update((k, v) for k, v in items if k not in new_dict)
+    else:
+        output_.update(items)
     return output_
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3 -u
+# copyright: predictably developers, BSD-3-Clause License (see LICENSE file)
+"""Tests of the IndexedDict ordered dictionary.
+
+This tests the predictably_core.utils._indexed_dict module. Randomized tests
+use seeded random operations to check IndexedDict (and update_dict_at) against
+reference implementations using plain dictionaries and lists.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from predictably_core.utils import IndexedDict, _indexed_dict, update_dict_at
+
+__author__: list[str] = ["RNKuhns"]
+
+SEEDS = range(25)
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    """Use small blocks, so that block splits and removals are exercised."""
+    monkeypatch.setattr(_indexed_dict, "_BLOCK_LOAD", 2)
+
+
+def _reference_update_dict_at(input_dict, new_dict, at=None, keep_new=True):
+    """Update a dictionary at a position (the original quadratic version)."""
+    keys = tuple(input_dict)
+    if at is None:
+        at = len(input_dict)
+    output_ = {k: v for k, v in input_dict.items() if k in keys[:at]}
+    output_.update(new_dict)
+    remaining = {
+        k: v
+        for k, v in input_dict.items()
+        if k in keys[at:] and not (keep_new and k in new_dict)
+    }
+    output_.update(remaining)
+    return output_
+
+
+def _random_dicts(rng):
+    """Create random dictionaries with overlapping keys and a random position."""
+    n_keys = rng.randint(0, 30)
+    input_dict = {k: rng.random() for k in rng.sample(range(60), n_keys)}
+    new_dict = {k: rng.random() for k in rng.sample(range(60), rng.randint(0, 15))}
+    at = rng.choice([None, rng.randint(-n_keys - 3, n_keys + 3)])
+    return input_dict, new_dict, at
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("keep_new", [True, False])
+def test_update_dict_at_equivalence(seed, keep_new):
+    """Test update_dict_at matches the original implementation."""
+    rng = random.Random(seed)  # noqa: S311
+    for _ in range(20):
+        input_dict, new_dict, at = _random_dicts(rng)
+        expected = _reference_update_dict_at(input_dict, new_dict, at, keep_new)
+        output = update_dict_at(input_dict, new_dict, at, keep_new)
+        assert list(output.items()) == list(expected.items())
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("keep_new", [True, False])
+def test_update_at_equivalence(seed, keep_new, small_blocks):
+    """Test IndexedDict.update_at matches update_dict_at."""
+    rng = random.Random(seed)  # noqa: S311
+    for _ in range(20):
+        input_dict, new_dict, at = _random_dicts(rng)
+        expected = update_dict_at(input_dict, new_dict, at, keep_new)
+        indexed = IndexedDict(input_dict)
+        indexed.update_at(new_dict, at, keep_new)
+        assert list(indexed.items()) == list(expected.items())
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_indexed_dict_random_operations(seed, small_blocks):
+    """Test random operations on IndexedDict match a dict and a list of keys."""
+    rng = random.Random(seed)  # noqa: S311
+    indexed = IndexedDict()
+    data = {}
+    keys = []
+    for _ in range(300):
+        operation = rng.choice(["set", "insert", "insert", "delete", "pop"])
+        key = rng.randrange(40)
+        if operation == "set":
+            indexed[key] = data[key] = rng.random()
+            if key not in keys:
+                keys.append(key)
+        elif operation == "insert":
+            position = rng.randint(-len(keys) - 2, len(keys) + 2)
+            value = rng.random()
+            indexed.insert(position, key, value)
+            if key in keys:
+                keys.remove(key)
+            keys.insert(position, key)
+            data[key] = value
+        elif operation == "delete" and key in keys:
+            del indexed[key]
+            del data[key]
+            keys.remove(key)
+        elif operation == "pop" and keys:
+            last = rng.random() < 0.5
+            expected_key = keys.pop(-1 if last else 0)
+            assert indexed.popitem(last=last) == (expected_key, data.pop(expected_key))
+
+        assert list(indexed) == keys
+        assert len(indexed) == len(keys)
+        assert list(reversed(indexed)) == keys[::-1]
+        assert indexed == data
+        for position, k in enumerate(keys):
+            assert indexed.index(k) == position
+            assert indexed.key_at(position) == k
+            assert indexed.item_at(position - len(keys)) == (k, data[k])
+
+
+def test_indexed_dict_mapping_behavior():
+    """Test IndexedDict behaves like a dict."""
+    indexed = IndexedDict([("a", 1)], b=2)
+    assert indexed == {"a": 1, "b": 2}
+    assert "a" in indexed
+    assert "c" not in indexed
+    assert indexed.get("c") is None
+    assert repr(indexed) == "IndexedDict({'a': 1, 'b': 2})"
+    copied = indexed.copy()
+    copied["c"] = 3
+    assert list(indexed) == ["a", "b"]
+    assert list(copied.items()) == [("a", 1), ("b", 2), ("c", 3)]
+    indexed.clear()
+    assert len(indexed) == 0
+    indexed["z"] = 0
+    assert indexed.key_at(0) == "z"
+
+
+def test_indexed_dict_raises():
+    """Test IndexedDict raises errors for missing keys and positions."""
+    indexed = IndexedDict(a=1)
+    with pytest.raises(KeyError):
+        indexed.index("b")
+    with pytest.raises(KeyError):
+        del indexed["b"]
+    with pytest.raises(IndexError):
+        indexed.key_at(1)
+    with pytest.raises(IndexError):
+        indexed.item_at(-2)
+    indexed.clear()
+    with pytest.raises(KeyError):
+        indexed.popitem()
+
+
+def test_indexed_dict_large():
+    """Test positional operations on an IndexedDict with many blocks."""
+    n = 5000
+    indexed = IndexedDict((i, i) for i in range(n))
+    for i in range(0, n, 7):
+        indexed.insert(n // 2, ("new", i), i)
+    assert len(indexed) == n + len(range(0, n, 7))
+    assert indexed.key_at(n // 2) == ("new", range(0, n, 7)[-1])
+    assert indexed.index(n - 1) == len(indexed) - 1
+    assert indexed.index(n // 2 - 1) == n // 2 - 1
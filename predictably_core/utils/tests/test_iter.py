@@ -118,6 +118,63 @@ def test_format_seq_to_str() -> None:
     assert format_sequence_to_str(7, last_sep="or") == "7"
 
 
+def test_format_seq_to_str_truncates() -> None:
+    """Test format_sequence_to_str truncates output using max_items and max_chars."""
+    seq = list(range(10))
+    assert format_sequence_to_str(seq, max_items=4) == "0, 1, ... (6 more), 8, 9"
+    assert (
+        format_sequence_to_str(seq, max_items=3, last_sep="or")
+        == "0, 1, ... (7 more) or 9"
+    )
+    assert format_sequence_to_str(seq, max_items=0) == "... (10 more)"
+    # Budgets that aren't exceeded don't change the output
+    assert format_sequence_to_str(seq, max_items=10) == format_sequence_to_str(seq)
+    assert format_sequence_to_str(seq, max_chars=100, last_sep="and") == (
+        "0, 1, 2, 3, 4, 5, 6, 7, 8 and 9"
+    )
+
+    # Elements are added from both ends while they fit in the budget
+    output = format_sequence_to_str(range(1_000_000), max_chars=60)
+    assert output == "0, 1, 2, ... (999994 more), 999997, 999998, 999999"
+    for max_chars in range(18, 80):
+        output = format_sequence_to_str(range(1_000_000), max_chars=max_chars)
+        assert len(output) <= max_chars
+        assert "more)" in output
+
+    # Iterables that can't be indexed are truncated at the end
+    assert (
+        format_sequence_to_str({"a": 1, "b": 2, "c": 3}.keys(), max_items=2)
+        == "a, b, ... (1 more)"
+    )
+    assert (
+        format_sequence_to_str(iter(seq), max_items=2, last_sep="and")
+        == "0, ... (8 more) and 9"
+    )
+    assert (
+        format_sequence_to_str([int, str, float], max_items=2, exclude_type_text=True)
+        == "int, ... (1 more), float"
+    )
+
+
+def test_format_seq_to_str_only_formats_shown_elements() -> None:
+    """Test format_sequence_to_str only converts shown elements to str."""
+    n_formatted = 0
+
+    class Element:
+        def __str__(self) -> str:
+            nonlocal n_formatted
+            n_formatted += 1
+            return "e"
+
+    seq = [Element()] * 10_000
+    assert format_sequence_to_str(seq, max_items=5) == "e, e, e, ... (9995 more), e, e"
+    assert n_formatted == 5
+
+    n_formatted = 0
+    format_sequence_to_str(seq, max_chars=40)
+    assert n_formatted < 20
+
+
 def test_format_seq_to_str_raises() -> None:
     """Test format_sequence_to_str raises error when input is unexpected type."""
 
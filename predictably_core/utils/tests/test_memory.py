@@ -0,0 +1,84 @@
+#!/usr/bin/env python3 -u
+# copyright: predictably developers, BSD-3-Clause License (see LICENSE file)
+"""Tests of memory usage estimation.
+
+This tests the predictably_core.utils._memory module.
+"""
+
+from __future__ import annotations
+
+import sys
+
+import numpy as np
+
+from predictably_core.utils import deep_sizeof
+
+__author__: list[str] = ["RNKuhns"]
+
+
+class _Plain:
+    def __init__(self, value):
+        self.value = value
+
+
+class _Slotted:
+    __slots__ = ("missing", "value")
+
+    def __init__(self, value):
+        self.value = value
+
+
+def test_deep_sizeof_follows_references() -> None:
+    """Test deep_sizeof counts the objects referenced by containers and objects."""
+    data = list(range(1000, 2000))
+    data_size = sys.getsizeof(data) + sum(sys.getsizeof(x) for x in data)
+    assert deep_sizeof(data) == data_size
+
+    mapping = {"key": data}
+    assert deep_sizeof(mapping) == (
+        sys.getsizeof(mapping) + sys.getsizeof("key") + data_size
+    )
+    assert deep_sizeof(_Plain(data)) > data_size
+    slotted = _Slotted(data)
+    assert deep_sizeof(slotted) == sys.getsizeof(slotted) + data_size
+
+    # Classes, modules and functions are shared by the program
+    shared = [_Plain, np, deep_sizeof]
+    assert deep_sizeof(shared) == sys.getsizeof(shared)
+
+
+def test_deep_sizeof_counts_shared_objects_once() -> None:
+    """Test objects referenced several times (including cycles) are counted once."""
+    data = [float(i) for i in range(1000)]
+    assert deep_sizeof([data, data]) == sys.getsizeof([1, 2]) + deep_sizeof(data)
+
+    cycle: list = [data]
+    cycle.append(cycle)
+    assert deep_sizeof(cycle) == sys.getsizeof(cycle) + deep_sizeof(data)
+
+    # The seen objects can be shared between calls
+    seen: set[int] = set()
+    assert deep_sizeof(data, seen) == deep_sizeof(data)
+    assert deep_sizeof(data, seen) == 0
+
+    # Deeply nested objects are supported
+    nested: list = []
+    for _ in range(100_000):
+        nested = [nested]
+    assert deep_sizeof(nested) == sys.getsizeof([]) + 100_000 * sys.getsizeof(nested)
+
+
+def test_deep_sizeof_arrays() -> None:
+    """Test deep_sizeof counts array buffers once using their nbytes."""
+    array = np.zeros(10_000)
+    assert deep_sizeof(array) >= array.nbytes
+
+    view = array[::2]
+    assert deep_sizeof(view) == sys.getsizeof(view) + deep_sizeof(array)
+    assert deep_sizeof([array, view, array[:10]]) < 1.01 * deep_sizeof(array)
+
+    buffer = bytes(10_000)
+    assert deep_sizeof(memoryview(buffer)) > len(buffer)
+
+    objects = np.array([[1.5] * 1000, "a"], dtype=object)
+    assert deep_sizeof(objects) > deep_sizeof([1.5] * 1000)
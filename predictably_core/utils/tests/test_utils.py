@@ -15,8 +15,11 @@ from typing import ForwardRef
 
 import pytest
 
+from predictably_core.core import BaseObject
 from predictably_core.utils._utils import (
+    _type_name,
     compare_mappings,
+    diff_mappings,
     remove_type_text,
     update_dict_at,
 )
@@ -38,6 +41,12 @@ def test_remove_type_text() -> None:
     assert remove_type_text(ForwardRef("int")) == "int", msg
     assert remove_type_text("ForwardRef('pd.DataFrame')") == "pd.DataFrame", msg
 
+    # Type names are cached per type
+    _type_name.cache_clear()
+    assert remove_type_text(float) == "float"
+    assert remove_type_text(float) == "float"
+    assert _type_name.cache_info().hits == 1
+
 
 def test_compare_mappings() -> None:
     """Test compare_mappings output matches expectations."""
@@ -56,6 +65,86 @@ def test_compare_mappings() -> None:
     )
 
 
+def test_compare_mappings_pairs_values_with_keys() -> None:
+    """Test unordered compare_mappings compares the value of each key."""
+    assert not compare_mappings({"a": 1, "b": 2}, {"a": 2, "b": 1}, ordered=False)
+    assert not compare_mappings({"a": 1, "b": 1}, {"a": 1, "b": 2}, ordered=False)
+    assert not compare_mappings({"a": 1, "b": 2}, {"a": 1, "c": 2}, ordered=False)
+
+
+def test_compare_mappings_unhashable_values() -> None:
+    """Test compare_mappings supports unhashable values."""
+    map_ = {"a": [1, 2], "b": {"c": 3}}
+    assert compare_mappings(map_, {"b": {"c": 3}, "a": [1, 2]}, ordered=False)
+    assert not compare_mappings(map_, {"b": {"c": 3}, "a": [2, 1]}, ordered=False)
+    assert compare_mappings(map_, {"a": [1, 2], "b": {"c": 3}}, ordered=True)
+
+    np = pytest.importorskip("numpy")
+    arrays = {"a": np.arange(3), "b": np.ones((2, 2))}
+    same = {"b": np.ones((2, 2)), "a": np.arange(3)}
+    for ordered in (True, False):
+        assert compare_mappings(arrays, dict(arrays), ordered=ordered)
+    assert compare_mappings(arrays, same, ordered=False)
+    assert not compare_mappings(arrays, {"a": np.arange(3), "b": np.ones(4)})
+    assert not compare_mappings(arrays, {"a": np.arange(3), "b": np.zeros((2, 2))})
+
+
+def test_compare_mappings_dataframes() -> None:
+    """Test compare_mappings compares DataFrames as a whole."""
+    pd = pytest.importorskip("pandas")
+    map_ = {"a": pd.DataFrame({"x": [1.0, float("nan")]}), "b": 1}
+    same = {"a": pd.DataFrame({"x": [1.0, float("nan")]}), "b": 1}
+    different = {"a": pd.DataFrame({"x": [2.0, float("nan")]}), "b": 1}
+    for deep in (False, True):
+        for ordered in (True, False):
+            assert compare_mappings(map_, same, ordered=ordered, deep=deep)
+            assert not compare_mappings(map_, different, ordered=ordered, deep=deep)
+    assert not compare_mappings({"a": map_["a"]["x"]}, {"a": different["a"]["x"]})
+    assert compare_mappings({"a": map_["a"]["x"]}, {"a": same["a"]["x"]})
+
+
+class _Params(BaseObject):
+    def __init__(self, a=1, b=None):
+        self.a = a
+        self.b = b
+        super().__init__()
+
+
+def test_compare_mappings_deep() -> None:
+    """Test compare_mappings compares nested values if deep=True."""
+    nan, other_nan = float("nan"), float("nan")
+    map_ = {"obj": _Params(a=[1, nan], b=_Params()), "x": (1, {"y": nan})}
+    other = {"obj": _Params(a=[1, nan], b=_Params()), "x": (1, {"y": other_nan})}
+    assert compare_mappings(map_, other, deep=True)
+    assert not compare_mappings(map_, other, deep=False)
+    other["obj"] = _Params(a=[1, other_nan], b=_Params(a=2))
+    assert not compare_mappings(map_, other, deep=True)
+    assert not compare_mappings({"a": [1]}, {"a": (1,)}, deep=True)
+    assert compare_mappings({"a": 1}, {"a": 1.0}, deep=True)
+
+    np = pytest.importorskip("numpy")
+    arrays = {"a": np.array([1.0, np.nan]), "b": np.array(["x", "y"])}
+    same = {"a": np.array([1.0, np.nan]), "b": np.array(["x", "y"])}
+    assert compare_mappings(arrays, same, deep=True)
+    assert not compare_mappings(
+        arrays, {**same, "a": np.array([1, 2], dtype=int)}, deep=True
+    )
+
+
+def test_diff_mappings() -> None:
+    """Test diff_mappings finds keys that differ between mappings."""
+    map_ = {"a": 1, "b": [1, 2], "c": _Params(a=3)}
+    assert diff_mappings(map_, {"a": 1, "b": [1, 2], "c": _Params(a=3)}) == []
+    assert diff_mappings(map_, {"b": [2], "c": _Params(), "d": 1}) == [
+        "a",
+        "b",
+        "c",
+        "d",
+    ]
+    with pytest.raises(ValueError, match="`map_` and `other_map`.*"):
+        diff_mappings({}, 7)
+
+
 def test_compare_mappings_raises() -> None:
     """Test compare_mappings on invalid input."""
     # Verify function raises if input_dict and new_dict aren't both dicts
@@ -11,23 +11,95 @@ validation of inputs to `predictably` methods and functions.
 
 from __future__ import annotations
 
-from predictably_core.validate._types import (
-    check_mapping,
-    check_path,
-    check_sequence,
-    check_type,
-    is_iterable,
-    is_mapping,
-    is_sequence,
-)
+from typing import TYPE_CHECKING
+
+from predictably_core._lazy import _lazy_module_attributes
+
+if TYPE_CHECKING:
+    from predictably_core.validate._arrays import check_array_like, is_array_like
+    from predictably_core.validate._decorators import validate_params
+    from predictably_core.validate._paths import PathFailure, PathsReport, check_paths
+    from predictably_core.validate._report import (
+        ValidationIssue,
+        ValidationReport,
+        mapping_report,
+        sequence_report,
+        type_report,
+    )
+    from predictably_core.validate._types import (
+        check_async_iterable,
+        check_iterable,
+        check_mapping,
+        check_path,
+        check_sequence,
+        check_type,
+        is_iterable,
+        is_mapping,
+        is_sequence,
+        validation_context,
+    )
+    from predictably_core.validate._typing import is_type
+    from predictably_core.validate._validators import (
+        mapping_validator,
+        sequence_validator,
+        type_validator,
+    )
 
 __author__: list[str] = ["RNKuhns"]
 __all__: list[str] = [
+    "PathFailure",
+    "PathsReport",
+    "ValidationIssue",
+    "ValidationReport",
+    "check_array_like",
+    "check_async_iterable",
+    "check_iterable",
     "check_mapping",
     "check_path",
+    "check_paths",
     "check_sequence",
     "check_type",
+    "is_array_like",
     "is_iterable",
     "is_mapping",
     "is_sequence",
+    "is_type",
+    "mapping_report",
+    "mapping_validator",
+    "sequence_report",
+    "sequence_validator",
+    "type_report",
+    "type_validator",
+    "validate_params",
+    "validation_context",
 ]
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "PathFailure": "predictably_core.validate._paths",
+    "PathsReport": "predictably_core.validate._paths",
+    "ValidationIssue": "predictably_core.validate._report",
+    "ValidationReport": "predictably_core.validate._report",
+    "check_array_like": "predictably_core.validate._arrays",
+    "check_async_iterable": "predictably_core.validate._types",
+    "check_iterable": "predictably_core.validate._types",
+    "check_mapping": "predictably_core.validate._types",
+    "check_path": "predictably_core.validate._types",
+    "check_paths": "predictably_core.validate._paths",
+    "check_sequence": "predictably_core.validate._types",
+    "check_type": "predictably_core.validate._types",
+    "is_array_like": "predictably_core.validate._arrays",
+    "is_iterable": "predictably_core.validate._types",
+    "is_mapping": "predictably_core.validate._types",
+    "is_sequence": "predictably_core.validate._types",
+    "is_type": "predictably_core.validate._typing",
+    "mapping_report": "predictably_core.validate._report",
+    "mapping_validator": "predictably_core.validate._validators",
+    "sequence_report": "predictably_core.validate._report",
+    "sequence_validator": "predictably_core.validate._validators",
+    "type_report": "predictably_core.validate._report",
+    "type_validator": "predictably_core.validate._validators",
+    "validate_params": "predictably_core.validate._decorators",
+    "validation_context": "predictably_core.validate._types",
+}
+
+__getattr__, __dir__ = _lazy_module_attributes(__name__, _LAZY_IMPORTS)
@@ -0,0 +1,447 @@
+#!/usr/bin/env python3 -u
+# copyright: predictably developers, BSD-3-Clause License (see LICENSE file)
+"""Tools for validating array-like inputs without copying them.
+
+Array-likes are NumPy arrays and objects supporting the buffer protocol (e.g.,
+`array.array`, `bytes` or `memoryview`). Their shape, dimensions, element kind
+and memory layout are read from their metadata, while their values are checked
+using NumPy's vectorized reductions when NumPy is installed.
+"""
+
+from __future__ import annotations
+
+import cmath
+import itertools
+import math
+import sys
+from typing import Any, Iterable, NamedTuple, TypeVar
+
+from predictably_core.config._config import _VALIDATION_MODE
+from predictably_core.utils._iter import format_sequence_to_str
+from predictably_core.utils._utils import remove_type_text
+
+__author__: list[str] = ["RNKuhns"]
+__all__: list[str] = ["check_array_like", "is_array_like"]
+
+T = TypeVar("T")
+
+# Kind (using NumPy's codes) of the elements of each buffer protocol format
+_FORMAT_KINDS: dict[str, str] = {
+    **dict.fromkeys("bhilqn", "i"),
+    **dict.fromkeys("BHILQN", "u"),
+    **dict.fromkeys("efd", "f"),
+    "?": "b",
+    "Zf": "c",
+    "Zd": "c",
+}
+_CONTIGUOUS_VALUES = ("C", "F", "any")
+
+
+class _ArrayInfo(NamedTuple):
+    """The metadata of an array-like input.
+
+    Parameters
+    ----------
+    shape : tuple[int]
+        The shape of the array-like.
+    kind : str
+        The kind of the elements, using NumPy's single character codes (e.g.,
+        "f" for floating point numbers). "V" is used for buffer formats that
+        don't correspond to a NumPy kind.
+    c_contiguous : bool
+        Whether the array-like is C contiguous.
+    f_contiguous : bool
+        Whether the array-like is Fortran contiguous.
+    """
+
+    shape: tuple[int, ...]
+    kind: str
+    c_contiguous: bool
+    f_contiguous: bool
+
+
+def _get_numpy() -> Any:
+    """Import NumPy if it is installed.
+
+    Returns
+    -------
+    module or None
+        The NumPy module, or None if it isn't installed.
+    """
+    np = sys.modules.get("numpy")
+    if np is None:
+        try:
+            import numpy as np
+        except ImportError:  # pragma: no cover
+            return None
+    return np
+
+
+def _get_array_info(input_: Any) -> _ArrayInfo | None:
+    """Read the metadata of an array-like without copying it.
+
+    Parameters
+    ----------
+    input_ : Any
+        The input.
+
+    Returns
+    -------
+    _ArrayInfo or None
+        The metadata of `input_`, or None if it isn't array-like.
+    """
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(input_, np.ndarray):
+        flags = input_.flags
+        return _ArrayInfo(
+            input_.shape, input_.dtype.kind, flags.c_contiguous, flags.f_contiguous
+        )
+    try:
+        view = memoryview(input_)
+    except TypeError:
+        return None
+    with view:
+        return _ArrayInfo(
+            view.shape or (),
+            _FORMAT_KINDS.get(view.format.lstrip("@=<>!"), "V"),
+            view.c_contiguous,
+            view.f_contiguous,
+        )
+
+
+def is_array_like(input_: Any) -> bool:
+    """Indicate if the input is array-like.
+
+    Array-likes are NumPy arrays and objects that support the buffer protocol
+    (e.g., `array.array`, `bytes` and `memoryview`). Lists and other sequences
+    aren't array-like, since they can't be inspected without being copied.
+
+    Parameters
+    ----------
+    input_ : Any
+        The input to check.
+
+    Returns
+    -------
+    bool
+        Whether `input_` is array-like.
+
+    Examples
+    --------
+    >>> import array
+    >>> from predictably_core.validate import is_array_like
+    >>> is_array_like(array.array("d", [1.0, 2.0]))
+    True
+    >>> is_array_like([1.0, 2.0])
+    False
+    """
+    return _get_array_info(input_) is not None
+
+
+def _check_shape(
+    shape: tuple[int, ...],
+    expected_ndim: int | None,
+    expected_shape: tuple[int | None, ...] | None,
+    input_error_name: str,
+) -> None:
+    """Check the shape of an array-like.
+
+    Parameters
+    ----------
+    shape : tuple[int]
+        The shape of the array-like.
+    expected_ndim : int or None
+        The expected number of dimensions.
+    expected_shape : tuple[int or None] or None
+        The expected shape, where None matches any size.
+    input_error_name : str
+        The name to refer to the input as in any raised error messages.
+
+    Raises
+    ------
+    ValueError
+        If the shape isn't the expected shape.
+    """
+    if expected_ndim is not None and len(shape) != expected_ndim:
+        raise ValueError(
+            f"`{input_error_name}` should have {expected_ndim} dimension(s), but "
+            f"found {len(shape)}."
+        )
+    if expected_shape is not None and (
+        len(shape) != len(expected_shape)
+        or any(e is not None and e != s for s, e in zip(shape, expected_shape))
+    ):
+        expected_str = "(" + ", ".join(
+            "any" if e is None else str(e) for e in expected_shape
+        )
+        expected_str += ",)" if len(expected_shape) == 1 else ")"
+        raise ValueError(
+            f"`{input_error_name}` should have shape {expected_str}, but found "
+            f"{tuple(shape)}."
+        )
+
+
+def _value_extremes(input_: Any, kind: str) -> tuple[bool, Any, Any]:
+    """Find whether an array-like contains NaN and its smallest and largest values.
+
+    NumPy's vectorized reductions are used if NumPy is installed. The input is
+    never copied.
+
+    Parameters
+    ----------
+    input_ : Any
+        The non-empty array-like.
+    kind : str
+        The kind of the elements of `input_`.
+
+    Returns
+    -------
+    has_nan : bool
+        Whether `input_` contains NaN values.
+    min_value : Any
+        The smallest value, ignoring NaN (None if all values are NaN). For
+        complex values, the value with the smallest real part (similarly for
+        imaginary parts) isn't found, instead the smallest real and imaginary
+        parts are returned as a complex number.
+    max_value : Any
+        The largest value, ignoring NaN (None if all values are NaN).
+
+    Raises
+    ------
+    TypeError
+        If `input_` has complex elements and NumPy isn't installed.
+    """
+    np = _get_numpy()
+    if np is not None:
+        # Wraps buffers in an ndarray that shares their memory. NumPy treats
+        # bytes and bytearray as a single string, so they are wrapped through
+        # a memoryview to get an array of their elements
+        if isinstance(input_, (bytes, bytearray)):
+            input_ = memoryview(input_)
+        arr = np.asarray(input_)
+        if kind == "c":
+            parts = (arr.real, arr.imag)
+            extremes = [_value_extremes(part, "f") for part in parts]
+            has_nan = extremes[0][0] or extremes[1][0]
+            if any(e[1] is None for e in extremes):
+                return has_nan, None, None
+            return (
+                has_nan,
+                complex(extremes[0][1], extremes[1][1]),
+                complex(extremes[0][2], extremes[1][2]),
+            )
+        if kind == "f":
+            # np.minimum propagates NaN, while np.fmin ignores it
+            has_nan = bool(np.isnan(np.minimum.reduce(arr, axis=None)))
+            min_value = np.fmin.reduce(arr, axis=None)
+            max_value = np.fmax.reduce(arr, axis=None)
+            if np.isnan(min_value):
+                return has_nan, None, None
+            return has_nan, min_value.item(), max_value.item()
+        return False, arr.min().item(), arr.max().item()
+
+    # Without NumPy, buffers are iterated element by element
+    if kind == "c":
+        raise TypeError(
+            "NumPy is required to check the values of array-likes with complex "
+            "elements."
+        )
+    with memoryview(input_) as view:
+        values: Iterable[Any] = (
+            (view[index] for index in itertools.product(*map(range, view.shape)))
+            if view.ndim > 1
+            else view
+        )
+        has_nan = False
+        min_value = max_value = None
+        for value in values:
+            if value != value:
+                has_nan = True
+            elif min_value is None:
+                min_value = max_value = value
+            elif value < min_value:
+                min_value = value
+            elif value > max_value:
+                max_value = value
+    return has_nan, min_value, max_value
+
+
+def check_array_like(
+    input_: T,
+    ndim: int | None = None,
+    shape: tuple[int | None, ...] | None = None,
+    dtype_kind: str | None = None,
+    contiguous: str | None = None,
+    allow_nan: bool = True,
+    allow_inf: bool = True,
+    min_value: float | None = None,
+    max_value: float | None = None,
+    input_error_name: str = "input_",
+    validation_strategy: str | None = None,
+) -> T:
+    """Validate an array-like input without copying it.
+
+    The shape, number of dimensions, element kind and memory layout are read
+    from the metadata of the input (NumPy array attributes or a `memoryview` of
+    the buffer). Finiteness and value ranges are checked using NumPy's
+    vectorized reductions if NumPy is installed, otherwise by iterating over
+    the buffer. The input is never copied.
+
+    Parameters
+    ----------
+    input_ : array-like
+        The input to validate. Should be a NumPy array or an object that
+        supports the buffer protocol (e.g., `array.array` or `memoryview`).
+    ndim : int, default=None
+        The expected number of dimensions. If None, any number is allowed.
+    shape : tuple[int or None], default=None
+        The expected shape. Dimensions whose expected size is None can have
+        any size. If None, any shape is allowed.
+    dtype_kind : str, default=None
+        The allowed kinds of elements, using NumPy's single character codes
+        (e.g., "f" for floats, "iu" for signed or unsigned integers and "b"
+        for booleans). If None, any kind is allowed.
+    contiguous : {"C", "F", "any"}, default=None
+        The required memory layout.
+
+        - If None, then the layout isn't checked.
+        - If "C" or "F", then `input_` should be C or Fortran contiguous.
+        - If "any", then `input_` should be C or Fortran contiguous.
+
+    allow_nan : bool, default=True
+        Whether `input_` can contain NaN values.
+    allow_inf : bool, default=True
+        Whether `input_` can contain infinite values.
+    min_value : float, default=None
+        The smallest allowed value (ignoring NaN). If None, the values aren't
+        bounded from below.
+    max_value : float, default=None
+        The largest allowed value (ignoring NaN). If None, the values aren't
+        bounded from above.
+    input_error_name : str, default="input_"
+        The name to refer to `input_` as in any raised error messages.
+    validation_strategy : {"full", "sample", "sample(k)", "off"}, default=None
+        Whether `input_` is validated.
+
+        - If None, then the ``validation_strategy`` global configuration is used.
+        - If "off", then `input_` is returned without being validated.
+        - Otherwise, `input_` is fully validated (as values are checked using
+          vectorized reductions, they aren't sampled).
+
+    Returns
+    -------
+    array-like
+        The input (the same object, not a copy).
+
+    Raises
+    ------
+    TypeError
+        If `input_` isn't array-like, doesn't have an allowed element kind, or
+        a value range is requested for elements that can't be compared.
+    ValueError
+        If `input_` doesn't have the expected shape, number of dimensions,
+        memory layout or values.
+
+    See Also
+    --------
+    check_sequence :
+        Validate a sequence and the types of its elements.
+
+    Notes
+    -----
+    Value checks only apply to numeric and boolean elements. NaN and infinite
+    values are only possible for floating point and complex elements. Value
+    ranges aren't supported for complex elements.
+
+    Examples
+    --------
+    >>> import array
+    >>> from predictably_core.validate import check_array_like
+    >>> values = array.array("d", [0.5, 1.0, 2.5])
+    >>> check_array_like(values, ndim=1, dtype_kind="f", min_value=0) is values
+    True
+    >>> check_array_like(values, max_value=2)
+    Traceback (most recent call last):
+        ...
+    ValueError: `input_` should have values <= 2, but found maximum value 2.5.
+    >>> check_array_like([0.5, 1.0], input_error_name="values")
+    Traceback (most recent call last):
+        ...
+    TypeError: `values` should be array-like, but found list.
+    """
+    if (
+        _VALIDATION_MODE.mode.off
+        if validation_strategy is None
+        else validation_strategy == "off"
+    ):
+        return input_
+    if contiguous is not None and contiguous not in _CONTIGUOUS_VALUES:
+        raise ValueError(
+            '`contiguous` should be None, "C", "F" or "any", but found '
+            f"{contiguous!r}."
+        )
+
+    info = _get_array_info(input_)
+    if info is None:
+        raise TypeError(
+            f"`{input_error_name}` should be array-like, but found "
+            f"{remove_type_text(type(input_))}."
+        )
+    _check_shape(info.shape, ndim, shape, input_error_name)
+
+    if dtype_kind is not None and info.kind not in dtype_kind:
+        kinds_str = format_sequence_to_str(
+            [repr(kind) for kind in dtype_kind], last_sep="or"
+        )
+        raise TypeError(
+            f"`{input_error_name}` should have elements of kind {kinds_str}, but "
+            f"found {info.kind!r}."
+        )
+
+    if (
+        (contiguous == "C" and not info.c_contiguous)
+        or (contiguous == "F" and not info.f_contiguous)
+        or (contiguous == "any" and not (info.c_contiguous or info.f_contiguous))
+    ):
+        layout = "C or F" if contiguous == "any" else contiguous
+        raise ValueError(f"`{input_error_name}` should be {layout} contiguous.")
+
+    check_non_finite = info.kind in "fc" and not (allow_nan and allow_inf)
+    check_range = min_value is not None or max_value is not None
+    if not (check_non_finite or check_range) or math.prod(info.shape) == 0:
+        return input_
+    if info.kind not in "biufc":
+        raise TypeError(
+            f"`{input_error_name}` should have numeric elements to check its "
+            f"values, but found elements of kind {info.kind!r}."
+        )
+    if check_range and info.kind == "c":
+        raise TypeError(
+            f"`{input_error_name}` has complex elements, which don't support "
+            "`min_value` or `max_value`."
+        )
+
+    has_nan, found_min, found_max = _value_extremes(input_, info.kind)
+    if has_nan and not allow_nan:
+        raise ValueError(f"`{input_error_name}` should not contain NaN values.")
+    if not allow_inf and found_min is not None:
+        is_infinite = (
+            cmath.isinf(found_min) or cmath.isinf(found_max)
+            if info.kind == "c"
+            else math.isinf(found_min) or math.isinf(found_max)
+        )
+        if is_infinite:
+            raise ValueError(
+                f"`{input_error_name}` should not contain infinite values."
+            )
+    if min_value is not None and found_min is not None and found_min < min_value:
+        raise ValueError(
+            f"`{input_error_name}` should have values >= {min_value}, but found "
+            f"minimum value {found_min}."
+        )
+    if max_value is not None and found_max is not None and found_max > max_value:
+        raise ValueError(
+            f"`{input_error_name}` should have values <= {max_value}, but found "
+            f"maximum value {found_max}."
+        )
+    return input_
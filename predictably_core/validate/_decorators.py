@@ -0,0 +1,288 @@
+#!/usr/bin/env python3 -u
+# copyright: predictably developers, BSD-3-Clause License (see LICENSE file)
+"""Decorators that validate the arguments of functions and methods.
+
+The annotations of the decorated function are compiled into checkers once,
+when the function is decorated, so calls don't pay for ``inspect.signature``.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+from typing import Any, Callable, Iterable, NamedTuple, TypeVar, overload
+
+from predictably_core.config._config import _get_config_value
+from predictably_core.utils._utils import remove_type_text
+from predictably_core.validate._types import _resolve_validation_strategy
+from predictably_core.validate._typing import (
+    _annotation_to_str,
+    _Checker,
+    _CheckOptions,
+    _compile,
+    _compile_forward_ref,
+)
+
+__author__: list[str] = ["RNKuhns"]
+__all__: list[str] = ["validate_params"]
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class _ParamChecker(NamedTuple):
+    """The compiled check of a single parameter.
+
+    Parameters
+    ----------
+    checker : Callable
+        The checker of the parameter's annotation.
+    msg_prefix : str
+        The error message raised if an argument is invalid, up to the name of
+        the type that was found.
+    allow_none : bool
+        Whether None is allowed because it is the parameter's default value.
+    """
+
+    checker: _Checker
+    msg_prefix: str
+    allow_none: bool
+
+
+def _compile_param(
+    name: str, annotation: Any, default: Any, module_name: str
+) -> _ParamChecker:
+    """Compile the annotation of a parameter.
+
+    Parameters
+    ----------
+    name : str
+        The name of the parameter, used in error messages.
+    annotation : Any
+        The annotation of the parameter. String annotations (e.g., due to
+        ``from __future__ import annotations``) are resolved in `module_name`
+        when the first argument is checked.
+    default : Any
+        The default value of the parameter.
+    module_name : str
+        The name of the module the decorated function is defined in.
+
+    Returns
+    -------
+    _ParamChecker
+        The compiled check of the parameter.
+    """
+    if isinstance(annotation, str):
+        checker = _compile_forward_ref(annotation, module_name)
+    else:
+        checker = _compile(annotation)
+    allow_none = default is None
+    type_msg = _annotation_to_str(annotation)
+    if allow_none:
+        type_msg = f"{type_msg} or None"
+    return _ParamChecker(
+        checker, f"`{name}` should be type {type_msg}, but found ", allow_none
+    )
+
+
+def _check_param(
+    param_checker: _ParamChecker, value: Any, options: _CheckOptions
+) -> None:
+    """Check an argument using the compiled check of its parameter.
+
+    Parameters
+    ----------
+    param_checker : _ParamChecker
+        The compiled check of the parameter.
+    value : Any
+        The argument passed for the parameter.
+    options : _CheckOptions
+        The options of the check.
+
+    Raises
+    ------
+    TypeError
+        If `value` doesn't match the parameter's annotation.
+    """
+    if value is None and param_checker.allow_none:
+        return
+    if not param_checker.checker(value, options):
+        raise TypeError(param_checker.msg_prefix + f"{remove_type_text(type(value))}.")
+
+
+def _make_param_validator(param_checker: _ParamChecker) -> Callable[[Any], Any]:
+    """Create a validator of a single parameter.
+
+    Parameters
+    ----------
+    param_checker : _ParamChecker
+        The compiled check of the parameter.
+
+    Returns
+    -------
+    Callable[[Any], Any]
+        Validator returning its input unchanged if it matches the parameter's
+        annotation and raising a TypeError otherwise.
+    """
+
+    def validate_param(value: Any) -> Any:
+        """Validate `value` matches the parameter's annotation.
+
+        Parameters
+        ----------
+        value : Any
+            The value of the parameter.
+
+        Returns
+        -------
+        Any
+            The value.
+        """
+        strategy, sample_size = _resolve_validation_strategy(None)
+        if strategy != "off":
+            _check_param(
+                param_checker, value, _CheckOptions(strategy, sample_size, None)
+            )
+        return value
+
+    return validate_param
+
+
+@overload
+def validate_params(func: F, *, exclude: Iterable[str] | None = None) -> F: ...
+
+
+@overload
+def validate_params(
+    func: None = None, *, exclude: Iterable[str] | None = None
+) -> Callable[[F], F]: ...
+
+
+def validate_params(
+    func: F | None = None, *, exclude: Iterable[str] | None = None
+) -> F | Callable[[F], F]:
+    """Validate the arguments of a function or method using its annotations.
+
+    The annotation of each parameter is compiled into a checker when the
+    function is decorated. Each call then checks the arguments that were passed
+    against the compiled checkers, without inspecting the signature again.
+    Annotations are checked like the `expected_type` of :func:`check_type`,
+    so they can be classes or `typing` annotations, and a TypeError naming the
+    parameter is raised if an argument doesn't match its annotation.
+
+    When used to decorate the ``__init__`` method of a BaseObject, the
+    compiled checks are also used to validate values passed to the object's
+    ``set_params`` method.
+
+    Parameters
+    ----------
+    func : Callable, default=None
+        The function to decorate. If None, a decorator accepting the function
+        is returned (i.e., the decorator is used as ``@validate_params(...)``).
+    exclude : Iterable[str], default=None
+        The names of parameters that aren't validated.
+
+    Returns
+    -------
+    Callable
+        The decorated function, or a decorator if `func` is None. If the
+        ``validate_params`` global configuration is False when the function is
+        decorated, the function is returned unchanged.
+
+    See Also
+    --------
+    check_type :
+        Validate the input matches a type or annotation.
+
+    Notes
+    -----
+    Parameters without an annotation, or annotated with ``Any``, aren't
+    validated. Default values aren't validated, and None is allowed for
+    parameters whose default is None. Annotations of ``*args`` and
+    ``**kwargs`` are used to validate each of the extra arguments.
+
+    String annotations (e.g., due to ``from __future__ import annotations``)
+    are resolved in the module of the decorated function the first time an
+    argument is validated, so they can refer to classes defined after the
+    function (like the class a method belongs to).
+
+    Arguments are validated using the ``validation_strategy`` global
+    configuration in effect when the function is called. For production code,
+    set the ``validate_params`` global configuration to False before the
+    decorated functions are defined to remove all overhead.
+
+    Examples
+    --------
+    >>> from typing import List
+    >>> from predictably_core.validate import validate_params
+    >>> @validate_params
+    ... def total(values: List[float], scale: float = 1.0) -> float:
+    ...     return sum(values) * scale
+    >>> total([1.0, 2.0], scale=2.0)
+    6.0
+    >>> total([1.0, 2.0], scale="2")
+    Traceback (most recent call last):
+        ...
+    TypeError: `scale` should be type float, but found str.
+    """
+    if func is None:
+        return functools.partial(validate_params, exclude=exclude)  # type: ignore[return-value]
+    if not _get_config_value("validate_params"):
+        return func
+
+    excluded = set() if exclude is None else set(exclude)
+    module_name = getattr(func, "__module__", None) or "builtins"
+    param_checkers: dict[str, _ParamChecker] = {}
+    named_params: set[str] = set()
+    positional_names: list[str] = []
+    var_positional: _ParamChecker | None = None
+    var_keyword: _ParamChecker | None = None
+    for param in inspect.signature(func).parameters.values():
+        if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+            positional_names.append(param.name)
+        if param.kind not in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            named_params.add(param.name)
+        annotation = param.annotation
+        if (
+            param.name in excluded
+            or annotation is param.empty
+            or annotation is Any
+            or annotation in ("Any", "typing.Any")
+        ):
+            continue
+        param_checker = _compile_param(
+            param.name, annotation, param.default, module_name
+        )
+        if param.kind == param.VAR_POSITIONAL:
+            var_positional = param_checker
+        elif param.kind == param.VAR_KEYWORD:
+            var_keyword = param_checker
+        else:
+            param_checkers[param.name] = param_checker
+
+    positional_checkers = [param_checkers.get(name) for name in positional_names]
+    n_positional = len(positional_names)
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        strategy, sample_size = _resolve_validation_strategy(None)
+        if strategy != "off":
+            options = _CheckOptions(strategy, sample_size, None)
+            for param_checker, value in zip(positional_checkers, args):
+                if param_checker is not None:
+                    _check_param(param_checker, value, options)
+            if var_positional is not None:
+                for value in args[n_positional:]:
+                    _check_param(var_positional, value, options)
+            for name, value in kwargs.items():
+                param_checker = (
+                    param_checkers.get(name) if name in named_params else var_keyword
+                )
+                if param_checker is not None:
+                    _check_param(param_checker, value, options)
+        return func(*args, **kwargs)
+
+    wrapper._param_validators = {  # type: ignore[attr-defined]
+        name: _make_param_validator(param_checker)
+        for name, param_checker in param_checkers.items()
+    }
+    return wrapper  # type: ignore[return-value]
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3 -u
+# copyright: predictably developers, BSD-3-Clause License (see LICENSE file)
+"""Tools for validating many file system paths at once.
+
+Paths are grouped by their parent directory, so that each directory is scanned
+once with ``os.scandir`` instead of issuing a ``stat`` call for every path.
+Large batches of directories are scanned concurrently using a thread pool.
+"""
+
+from __future__ import annotations
+
+import collections
+import os
+import pathlib
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, NamedTuple
+
+from predictably_core.validate._types import _is_validation_off
+
+__author__: list[str] = ["RNKuhns"]
+__all__: list[str] = ["PathFailure", "PathsReport", "check_paths"]
+
+# Directories with fewer paths are checked using a stat call per path, which is
+# cheaper than listing the whole directory
+_SCANDIR_MIN_PATHS = 4
+# Number of directories above which they are checked concurrently by default
+_PARALLEL_MIN_DIRS = 8
+# Number of failures listed in the error raised by PathsReport.raise_if_failed
+_MAX_REPORTED_FAILURES = 10
+_KIND_VALUES = ("file", "dir")
+
+
+class PathFailure(NamedTuple):
+    """A path that failed validation.
+
+    Parameters
+    ----------
+    index : int
+        The position of the path in the validated paths.
+    path : pathlib.Path or Any
+        The path (or the invalid input if it isn't a str or pathlib.Path).
+    reason : str
+        Why the path is invalid. One of "invalid_type", "missing", "not_file",
+        "not_dir", "not_readable", "too_small" or "too_large".
+    """
+
+    index: int
+    path: Any
+    reason: str
+
+
+class PathsReport(NamedTuple):
+    """The result of validating many paths with :func:`check_paths`.
+
+    Parameters
+    ----------
+    valid_paths : list[pathlib.Path]
+        The paths that passed validation, in the order they were provided.
+    failures : list[PathFailure]
+        The paths that failed validation, in the order they were provided.
+    """
+
+    valid_paths: list[pathlib.Path]
+    failures: list[PathFailure]
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether all paths passed validation."""
+        return not self.failures
+
+    def raise_if_failed(self, paths_error_name: str = "paths") -> None:
+        """Raise a single error summarizing the failures, if there are any.
+
+        Parameters
+        ----------
+        paths_error_name : str, default="paths"
+            The name to refer to the validated paths as in the error message.
+
+        Raises
+        ------
+        ValueError
+            If any path failed validation.
+        """
+        if not self.failures:
+            return
+        listed = ", ".join(
+            f"{str(failure.path)!r} ({failure.reason})"
+            for failure in self.failures[:_MAX_REPORTED_FAILURES]
+        )
+        n_unlisted = len(self.failures) - _MAX_REPORTED_FAILURES
+        if n_unlisted > 0:
+            listed += f" and {n_unlisted} more"
+        raise ValueError(
+            f"`{paths_error_name}` has {len(self.failures)} invalid path(s): "
+            f"{listed}."
+        )
+
+
+class _PathStat(NamedTuple):
+    """The file system information needed to validate a path."""
+
+    is_file: bool
+    is_dir: bool
+    size: int
+
+
+def _stat_path(path: str) -> _PathStat | None:
+    """Stat a single path.
+
+    Parameters
+    ----------
+    path : str
+        The path.
+
+    Returns
+    -------
+    _PathStat or None
+        The information about `path`, or None if it doesn't exist.
+    """
+    try:
+        st = os.stat(path)  # noqa: PTH116
+    except (OSError, ValueError):
+        return None
+    return _PathStat(stat.S_ISREG(st.st_mode), stat.S_ISDIR(st.st_mode), st.st_size)
+
+
+def _stat_directory(
+    parent: str, names: set[str], need_size: bool
+) -> dict[str, _PathStat | None]:
+    """Stat the paths with the given names in a directory.
+
+    Parameters
+    ----------
+    parent : str
+        The directory ("" for the current directory).
+    names : set[str]
+        The names of the paths in `parent` to stat.
+    need_size : bool
+        Whether the size of files is needed. Otherwise, the file type is read
+        from the directory listing without an extra stat call where the
+        platform allows it.
+
+    Returns
+    -------
+    dict[str, _PathStat or None]
+        The information about each path, or None for paths that don't exist.
+    """
+    stats: dict[str, _PathStat | None] = {}
+    if len(names) >= _SCANDIR_MIN_PATHS:
+        try:
+            with os.scandir(parent or os.curdir) as entries:
+                for entry in entries:
+                    if entry.name not in names:
+                        continue
+                    try:
+                        is_file = entry.is_file()
+                        is_dir = entry.is_dir()
+                        # Other entries (e.g., dangling symlinks) are left to
+                        # the direct stat call below, so they are reported
+                        # the same way as when stat-ing each path
+                        if not (is_file or is_dir):
+                            continue
+                        stats[entry.name] = _PathStat(
+                            is_file,
+                            is_dir,
+                            entry.stat().st_size if need_size and is_file else 0,
+                        )
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+    # Paths missing from the listing (e.g., special names like "..", or case
+    # insensitive file systems) are confirmed with a direct stat call
+    for name in names:
+        if name not in stats:
+            stats[name] = _stat_path(os.path.join(parent, name))  # noqa: PTH118
+    return stats
+
+
+def check_paths(
+    paths: Iterable[str | pathlib.Path],
+    must_exist: bool = True,
+    kind: str | None = None,
+    readable: bool = False,
+    min_size: int | None = None,
+    max_size: int | None = None,
+    n_jobs: int | None = None,
+    validation_strategy: str | None = None,
+) -> PathsReport:
+    """Validate many file system paths, scanning each directory once.
+
+    Each path is validated like :func:`check_path` and, optionally, checked
+    against the file system. Rather than raising on the first invalid path,
+    all paths are checked and a report of the failures is returned.
+
+    Parameters
+    ----------
+    paths : Iterable[str | pathlib.Path]
+        The paths to validate.
+    must_exist : bool, default=True
+        Whether the paths must exist. If False, only the type of the paths is
+        validated and the other file system checks are skipped.
+    kind : {"file", "dir"}, default=None
+        The kind of path that is required. If None, any kind is allowed.
+    readable : bool, default=False
+        Whether the paths must be readable by the current user.
+    min_size : int, default=None
+        The minimum size of files in bytes. If None, files can be empty.
+    max_size : int, default=None
+        The maximum size of files in bytes. If None, files can have any size.
+    n_jobs : int, default=None
+        The number of threads used to scan directories concurrently.
+
+        - If None, then a thread pool with its default number of threads is
+          used when paths are in many directories, otherwise a single thread.
+        - If 1, then directories are scanned sequentially.
+        - Otherwise, a thread pool with `n_jobs` threads is used.
+
+    validation_strategy : {"full", "sample", "sample(k)", "off"}, default=None
+        Whether `paths` are validated.
+
+        - If None, then the ``validation_strategy`` global configuration is used.
+        - If "off", then the paths are converted to pathlib.Path without being
+          validated.
+        - Otherwise, all paths are validated (paths aren't sampled).
+
+    Returns
+    -------
+    PathsReport
+        The paths that passed validation and the failures. Use
+        ``report.raise_if_failed()`` to raise a ValueError summarizing the
+        failures.
+
+    Raises
+    ------
+    ValueError
+        If `kind` isn't None, "file" or "dir", or `n_jobs` is less than 1.
+
+    See Also
+    --------
+    check_path :
+        Validate a single path.
+
+    Notes
+    -----
+    Paths are grouped by their parent directory. Directories containing several
+    of the paths are listed once with ``os.scandir``, whose entries provide the
+    kind of each path without a ``stat`` call on most platforms. A ``stat`` call
+    per file is still needed when `min_size` or `max_size` is used on POSIX
+    systems, and an ``os.access`` call per path when ``readable=True``.
+
+    Examples
+    --------
+    >>> import pathlib, tempfile
+    >>> from predictably_core.validate import check_paths
+    >>> with tempfile.TemporaryDirectory() as folder:
+    ...     data = pathlib.Path(folder) / "data.csv"
+    ...     _ = data.write_text("a,b")
+    ...     report = check_paths([data, pathlib.Path(folder) / "missing.csv", 7])
+    >>> report.is_valid
+    False
+    >>> [(f.index, f.reason) for f in report.failures]
+    [(1, 'missing'), (2, 'invalid_type')]
+    """
+    if kind is not None and kind not in _KIND_VALUES:
+        raise ValueError(f'`kind` should be None, "file" or "dir", but found {kind!r}.')
+    if n_jobs is not None and n_jobs < 1:
+        raise ValueError(f"`n_jobs` should be None or at least 1, but found {n_jobs}.")
+
+    if _is_validation_off(validation_strategy):
+        return PathsReport([pathlib.Path(p) for p in paths], [])
+
+    valid_paths: list[pathlib.Path | None] = []
+    failures: list[PathFailure] = []
+    # Paths are grouped using strings, since hashing pathlib.Path is slow
+    locations: list[tuple[str, str]] = []
+    by_parent: dict[str, set[str]] = collections.defaultdict(set)
+    for index, path in enumerate(paths):
+        if isinstance(path, str):
+            path = pathlib.Path(path)
+        elif not isinstance(path, pathlib.Path):
+            failures.append(PathFailure(index, path, "invalid_type"))
+            valid_paths.append(None)
+            locations.append(("", ""))
+            continue
+        valid_paths.append(path)
+        if must_exist:
+            parent, name = os.path.split(str(path))
+            locations.append((parent, name))
+            by_parent[parent].add(name)
+
+    if must_exist and by_parent:
+        need_size = min_size is not None or max_size is not None
+        if n_jobs == 1 or (n_jobs is None and len(by_parent) < _PARALLEL_MIN_DIRS):
+            dir_stats = [
+                _stat_directory(parent, names, need_size)
+                for parent, names in by_parent.items()
+            ]
+        else:
+            with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+                dir_stats = list(
+                    executor.map(
+                        _stat_directory,
+                        by_parent.keys(),
+                        by_parent.values(),
+                        [need_size] * len(by_parent),
+                    )
+                )
+        stats = dict(zip(by_parent.keys(), dir_stats))
+
+        for index, (path, (parent, name)) in enumerate(zip(valid_paths, locations)):
+            if path is None:
+                continue
+            path_stat = stats[parent][name]
+            reason = None
+            if path_stat is None:
+                reason = "missing"
+            elif kind == "file" and not path_stat.is_file:
+                reason = "not_file"
+            elif kind == "dir" and not path_stat.is_dir:
+                reason = "not_dir"
+            elif readable and not os.access(path, os.R_OK):
+                reason = "not_readable"
+            elif (
+                path_stat.is_file and min_size is not None and path_stat.size < min_size
+            ):
+                reason = "too_small"
+            elif (
+                path_stat.is_file and max_size is not None and path_stat.size > max_size
+            ):
+                reason = "too_large"
+            if reason is not None:
+                failures.append(PathFailure(index, path, reason))
+                valid_paths[index] = None
+        failures.sort(key=lambda failure: failure.index)
+
+    return PathsReport([p for p in valid_paths if p is not None], failures)
@@ -0,0 +1,537 @@
+#!/usr/bin/env python3 -u
+# copyright: predictably developers, BSD-3-Clause License (see LICENSE file)
+"""Validation reports that collect every problem instead of failing fast.
+
+The report functions check every element of the input in a single pass and
+record the location and type of each invalid element (up to a maximum number).
+Error messages are only formatted when the report is rendered, so collecting
+the issues costs no more than checking the elements.
+"""
+
+from __future__ import annotations
+
+import collections
+import itertools
+import typing
+from collections.abc import Mapping
+from typing import Any, Iterable, NamedTuple, Sequence
+
+from predictably_core.core._exceptions import ValidationReportError
+from predictably_core.utils._iter import _convert_scalar_seq_type_input_to_tuple
+from predictably_core.utils._utils import remove_type_text
+from predictably_core.validate._types import _all_isinstance, _is_plain_type_input
+from predictably_core.validate._typing import (
+    _annotation_to_str,
+    _Checker,
+    _CheckOptions,
+    _compile,
+    _compile_expected_type,
+)
+
+__author__: list[str] = ["RNKuhns"]
+__all__: list[str] = [
+    "ValidationIssue",
+    "ValidationReport",
+    "mapping_report",
+    "sequence_report",
+    "type_report",
+]
+
+_MAX_REPORTED_ISSUES = 10
+# Elements are checked completely when building a report
+_FULL_CHECK = _CheckOptions("full", 0, None)
+
+
+class ValidationIssue(NamedTuple):
+    """An invalid part of a validated input.
+
+    Parameters
+    ----------
+    part : {"input", "element", "key", "value"}
+        The invalid part of the input. "input" means the input itself has the
+        wrong type, so its elements weren't checked.
+    location : Any
+        The index of an invalid element, or the key of an invalid mapping key or
+        value. None if `part` is "input".
+    found_type : type
+        The type of the invalid input, element, key or value.
+    """
+
+    part: str
+    location: Any
+    found_type: type
+
+
+class ValidationReport(NamedTuple):
+    """All issues found when validating an input.
+
+    Parameters
+    ----------
+    input_error_name : str or None
+        The name to refer to the input as in the rendered message. If None,
+        the input is referred to as "Input".
+    expected : dict[str, Any]
+        The expected type(s) or annotation of each part of the input (i.e.,
+        "input", "element", "key" or "value").
+    issues : list[ValidationIssue]
+        The reported issues, in the order they were found. At most
+        `max_reported` issues are kept.
+    n_issues : int
+        The total number of issues found, including those that weren't kept.
+    """
+
+    input_error_name: str | None
+    expected: dict[str, Any]
+    issues: list[ValidationIssue]
+    n_issues: int
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether no issues were found."""
+        return self.n_issues == 0
+
+    def render(self) -> str:
+        """Format the issues as a single message.
+
+        Returns
+        -------
+        str
+            The message describing the reported issues. Empty if the input is
+            valid.
+        """
+        if self.is_valid:
+            return ""
+        name_str = (
+            "Input" if self.input_error_name is None else f"`{self.input_error_name}`"
+        )
+        described = []
+        for issue in self.issues:
+            found = remove_type_text(issue.found_type)
+            expected = _annotation_to_str(self.expected[issue.part])
+            if issue.part == "input":
+                location = "the input"
+            elif issue.part == "value":
+                location = f"value of key {issue.location!r}"
+            else:
+                location = f"{issue.part} {issue.location!r}"
+            described.append(f"{location} is {found} (expected {expected})")
+        msg = f"{name_str} has {self.n_issues} invalid item(s): " + ", ".join(described)
+        n_unlisted = self.n_issues - len(self.issues)
+        if n_unlisted > 0:
+            msg += f" and {n_unlisted} more"
+        return msg + "."
+
+    def raise_if_failed(self) -> None:
+        """Raise a single error summarizing all issues, if there are any.
+
+        Raises
+        ------
+        ValidationReportError
+            If any issues were found. The report is available as the error's
+            `report` attribute.
+        """
+        if not self.is_valid:
+            raise ValidationReportError(self.render(), report=self)
+
+
+def _collect_issues(
+    elements: Iterable[tuple[Any, Any]],
+    types: tuple[type, ...] | None,
+    checker: _Checker | None,
+    part: str,
+    issues: list[ValidationIssue],
+    max_reported: int,
+) -> int:
+    """Check elements in a single pass, recording the invalid ones.
+
+    Parameters
+    ----------
+    elements : Iterable[tuple[Any, Any]]
+        Pairs of the location of each element and the element.
+    types : tuple[type] or None
+        The allowed types of the elements, if checked with isinstance.
+    checker : Callable or None
+        The compiled annotation the elements should match, if `types` is None.
+    part : str
+        The part of the input the elements are.
+    issues : list[ValidationIssue]
+        The issues found so far. Updated in place.
+    max_reported : int
+        The maximum number of issues kept in `issues`.
+
+    Returns
+    -------
+    int
+        The number of invalid elements.
+    """
+    if checker is None:
+        invalid = (
+            (location, element)
+            for location, element in elements
+            if not isinstance(element, types)  # type: ignore[arg-type]
+        )
+    else:
+        invalid = (
+            (location, element)
+            for location, element in elements
+            if not checker(element, _FULL_CHECK)
+        )
+    # Only the first issues are recorded, the rest are just counted
+    n_issues = len(issues)
+    issues.extend(
+        ValidationIssue(part, location, type(element))
+        for location, element in itertools.islice(
+            invalid, max(max_reported - n_issues, 0)
+        )
+    )
+    return len(issues) - n_issues + sum(1 for _ in invalid)
+
+
+def _check_max_reported(max_reported: int) -> None:
+    """Validate the maximum number of reported issues.
+
+    Parameters
+    ----------
+    max_reported : int
+        The maximum number of reported issues.
+
+    Raises
+    ------
+    ValueError
+        If `max_reported` is not a positive integer.
+    """
+    if not isinstance(max_reported, int) or max_reported < 1:
+        raise ValueError(
+            f"`max_reported` should be a positive int, but found {max_reported!r}."
+        )
+
+
+def sequence_report(
+    input_seq: Any,
+    sequence_type: type | tuple[type, ...] | None = None,
+    element_type: type | tuple[type, ...] | None = None,
+    sequence_name: str | None = None,
+    max_reported: int = _MAX_REPORTED_ISSUES,
+) -> ValidationReport:
+    """Check a sequence and report the index and type of every invalid element.
+
+    Performs the checks of :func:`check_sequence`, but every element is checked
+    (without sampling) and all invalid elements are counted.
+
+    Parameters
+    ----------
+    input_seq : Any
+        The input sequence to be validated.
+    sequence_type : type or tuple[type], default=None
+        The allowed sequence type that `input_seq` can be an instance of.
+    element_type : type or tuple[type], default=None
+        The allowed type(s) for elements of `input_seq`.
+    sequence_name : str, default=None
+        Name of `input_seq` to use in the rendered message.
+    max_reported : int, default=10
+        The maximum number of issues kept in the report.
+
+    Returns
+    -------
+    ValidationReport
+        The report of the issues. Use ``report.raise_if_failed()`` to raise a
+        single error summarizing them.
+
+    Raises
+    ------
+    TypeError
+        If `sequence_type` or `element_type` is not a type or sequence of types.
+    ValueError
+        If `max_reported` is not a positive integer.
+
+    See Also
+    --------
+    check_sequence :
+        Validate a sequence, raising an error on the first problem by default.
+
+    Examples
+    --------
+    >>> from predictably_core.validate import sequence_report
+    >>> report = sequence_report([1, "a", 3, None], element_type=int)
+    >>> [(issue.location, issue.found_type) for issue in report.issues]
+    [(1, <class 'str'>), (3, <class 'NoneType'>)]
+    >>> report.render()
+    'Input has 2 invalid item(s): element 1 is str (expected int), element 3 is NoneType (expected int).'
+    """  # noqa: E501
+    _check_max_reported(max_reported)
+    sequence_type_ = _convert_scalar_seq_type_input_to_tuple(
+        sequence_type,
+        type_input_subclass=collections.abc.Sequence,
+        type_input_error_name="sequence_type",
+    )
+    element_type_ = (
+        None
+        if element_type is None
+        else _convert_scalar_seq_type_input_to_tuple(
+            element_type, type_input_error_name="element_type"
+        )
+    )
+    expected = {"input": sequence_type_, "element": element_type_}
+    if not isinstance(input_seq, sequence_type_):
+        issues = [ValidationIssue("input", None, type(input_seq))]
+        return ValidationReport(sequence_name, expected, issues, 1)
+
+    issues: list[ValidationIssue] = []
+    n_issues = 0
+    # Valid sequences (the common case) are checked with the fast path
+    if element_type_ is not None and not _all_isinstance(input_seq, element_type_):
+        n_issues = _collect_issues(
+            enumerate(input_seq), element_type_, None, "element", issues, max_reported
+        )
+    return ValidationReport(sequence_name, expected, issues, n_issues)
+
+
+def mapping_report(
+    input_: Any,
+    map_type: type[Mapping] = Mapping,
+    key_type: type | Sequence[type] | None = None,
+    value_type: type | Sequence[type] | None = None,
+    input_error_name: str = "input_",
+    max_reported: int = _MAX_REPORTED_ISSUES,
+) -> ValidationReport:
+    """Check a mapping and report every invalid key and value with its type.
+
+    Performs the checks of :func:`check_mapping`, but every key and value is
+    checked (without sampling) and all invalid keys and values are counted.
+
+    Parameters
+    ----------
+    input_ : Any
+        The input to check to see if it is a mapping that optionally has
+        the expected key and value types.
+    map_type : type, default=Mapping
+        The expected type of the mapping.
+    key_type : type or tuple[type], default=None
+        The allowed type(s) for keys of `input_`.
+    value_type : type or tuple[type], default=None
+        The allowed type(s) for values of `input_`.
+    input_error_name : str, default="input_"
+        The name to refer to `input_` as in the rendered message.
+    max_reported : int, default=10
+        The maximum number of issues kept in the report.
+
+    Returns
+    -------
+    ValidationReport
+        The report of the issues. Use ``report.raise_if_failed()`` to raise a
+        single error summarizing them.
+
+    Raises
+    ------
+    TypeError
+        If `key_type` or `value_type` is not a type or sequence of types.
+    ValueError
+        If `max_reported` is not a positive integer.
+
+    See Also
+    --------
+    check_mapping :
+        Validate a mapping, raising an error on the first problem by default.
+
+    Examples
+    --------
+    >>> from predictably_core.validate import mapping_report
+    >>> config = {"alpha": 0.5, "beta": "high", 3: 1.0}
+    >>> report = mapping_report(
+    ...     config, key_type=str, value_type=float, input_error_name="config"
+    ... )
+    >>> report.n_issues
+    2
+    >>> report.raise_if_failed()  # doctest: +NORMALIZE_WHITESPACE
+    Traceback (most recent call last):
+        ...
+    predictably_core.core._exceptions.ValidationReportError: `config` has 2 invalid
+    item(s): value of key 'beta' is str (expected float), key 3 is int (expected str).
+    """
+    _check_max_reported(max_reported)
+    key_type_ = (
+        None
+        if key_type is None
+        else _convert_scalar_seq_type_input_to_tuple(
+            key_type, type_input_error_name="key_type"
+        )
+    )
+    value_type_ = (
+        None
+        if value_type is None
+        else _convert_scalar_seq_type_input_to_tuple(
+            value_type, type_input_error_name="value_type"
+        )
+    )
+    expected = {"input": map_type, "key": key_type_, "value": value_type_}
+    if not isinstance(input_, map_type):
+        issues = [ValidationIssue("input", None, type(input_))]
+        return ValidationReport(input_error_name, expected, issues, 1)
+
+    issues: list[ValidationIssue] = []
+    n_issues = 0
+    keys_invalid = key_type_ is not None and not _all_isinstance(input_, key_type_)
+    values_invalid = value_type_ is not None and not _all_isinstance(
+        input_.values(), value_type_
+    )
+    if keys_invalid or values_invalid:
+        # Keys and values are checked in a single pass over the items, so the
+        # issues are reported in the order of the mapping
+        for key, value in input_.items():
+            if keys_invalid and not isinstance(key, key_type_):  # type: ignore[arg-type]
+                n_issues += 1
+                if len(issues) < max_reported:
+                    issues.append(ValidationIssue("key", key, type(key)))
+            if values_invalid and not isinstance(value, value_type_):  # type: ignore[arg-type]
+                n_issues += 1
+                if len(issues) < max_reported:
+                    issues.append(ValidationIssue("value", key, type(value)))
+    return ValidationReport(input_error_name, expected, issues, n_issues)
+
+
+def _container_annotation_args(annotation: Any) -> tuple[type, Any, Any] | None:
+    """Find the element annotations of a container annotation.
+
+    Parameters
+    ----------
+    annotation : Any
+        The annotation.
+
+    Returns
+    -------
+    tuple or None
+        The container class and the annotations of its elements (or keys) and
+        values (None unless the container is a mapping). None if `annotation`
+        isn't a homogeneous container annotation (e.g., ``list[int]``,
+        ``tuple[int, ...]`` or ``Mapping[str, int]``).
+    """
+    origin = typing.get_origin(annotation)
+    if not isinstance(origin, type):
+        return None
+    args = typing.get_args(annotation)
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            return origin, args[0], None
+        return None
+    if issubclass(origin, collections.abc.Mapping) and len(args) == 2:
+        return origin, args[0], args[1]
+    if issubclass(origin, collections.abc.Collection) and len(args) == 1:
+        return origin, args[0], None
+    return None
+
+
+def type_report(
+    input_: Any,
+    expected_type: Any,
+    allow_none: bool = False,
+    use_subclass: bool = False,
+    input_error_name: str = "input_",
+    max_reported: int = _MAX_REPORTED_ISSUES,
+) -> ValidationReport:
+    """Check the input's type and report every invalid element of containers.
+
+    Performs the checks of :func:`check_type`. If `expected_type` is a
+    container annotation (e.g., ``list[int]`` or ``Mapping[str, float]``) and
+    the input is the right kind of container, every element is checked
+    (without sampling) and each invalid element (or key and value) is reported.
+
+    Parameters
+    ----------
+    input_ : Any
+        The input to be type checked.
+    expected_type : type, tuple[type] or annotation
+        The type or annotation that `input_` is expected to match.
+    allow_none : bool, default=False
+        Whether `input_` can be None in addition to matching `expected_type`.
+    use_subclass : bool, default=False
+        Whether to check the type using issubclass instead of isinstance.
+    input_error_name : str, default="input_"
+        The name to refer to `input_` as in the rendered message.
+    max_reported : int, default=10
+        The maximum number of issues kept in the report.
+
+    Returns
+    -------
+    ValidationReport
+        The report of the issues. Use ``report.raise_if_failed()`` to raise a
+        single error summarizing them.
+
+    Raises
+    ------
+    TypeError
+        If `expected_type` can't be checked at runtime.
+    ValueError
+        If `max_reported` is not a positive integer.
+
+    See Also
+    --------
+    check_type :
+        Validate the type of an input, raising an error on the first problem.
+
+    Examples
+    --------
+    >>> from typing import List
+    >>> from predictably_core.validate import type_report
+    >>> report = type_report([1, "a", 2.5], List[int], input_error_name="counts")
+    >>> print(report.render())  # doctest: +NORMALIZE_WHITESPACE
+    `counts` has 2 invalid item(s): element 1 is str (expected int),
+    element 2 is float (expected int).
+    """
+    _check_max_reported(max_reported)
+    if _is_plain_type_input(expected_type):
+        checker = None
+    else:
+        checker, _ = _compile_expected_type(
+            expected_type, allow_none, use_subclass, input_error_name
+        )
+    expected_input = (expected_type, type(None)) if allow_none else expected_type
+    expected = {"input": expected_input}
+    if allow_none and input_ is None:
+        return ValidationReport(input_error_name, expected, [], 0)
+    if checker is None:
+        type_check = issubclass if use_subclass else isinstance
+        is_valid = input_ is not None and type_check(input_, expected_type)
+    else:
+        is_valid = checker(input_, _FULL_CHECK)
+    if is_valid:
+        return ValidationReport(input_error_name, expected, [], 0)
+
+    container_args = (
+        None if checker is None else _container_annotation_args(expected_type)
+    )
+    if container_args is None or not isinstance(input_, container_args[0]):
+        issues = [ValidationIssue("input", None, type(input_))]
+        return ValidationReport(input_error_name, expected, issues, 1)
+
+    _, element_annotation, value_annotation = container_args
+    issues: list[ValidationIssue] = []
+    if value_annotation is None:
+        expected["element"] = element_annotation
+        n_issues = _collect_issues(
+            enumerate(input_),
+            None,
+            _compile(element_annotation),
+            "element",
+            issues,
+            max_reported,
+        )
+    else:
+        expected["key"] = element_annotation
+        expected["value"] = value_annotation
+        n_issues = _collect_issues(
+            ((key, key) for key in input_),
+            None,
+            _compile(element_annotation),
+            "key",
+            issues,
+            max_reported,
+        )
+        n_issues += _collect_issues(
+            input_.items(),
+            None,
+            _compile(value_annotation),
+            "value",
+            issues,
+            max_reported,
+        )
+    return ValidationReport(input_error_name, expected, issues, n_issues)
@@ -11,14 +11,37 @@ For specific functionality to validate the `predictably` data types, see
 
 from __future__ import annotations
 
+import abc
+import array
 import collections
 import inspect
+import itertools
 import math
 import numbers
 import pathlib
+import random
+import re
+import sys
+import typing
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Sequence, TypeVar, overload
+from contextlib import contextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Sequence,
+    TypeVar,
+    overload,
+)
 
+from predictably_core.config._config import (
+    _VALIDATION_MODE,
+    _get_config_value,
+    config_context,
+)
 from predictably_core.utils._iter import (
     _convert_scalar_seq_type_input_to_tuple,
     format_sequence_to_str,
@@ -29,6 +52,8 @@ from predictably_core.utils._iter import (
 __author__: list[str] = ["RNKuhns"]
 __all__: list[str] = [
     "_is_scalar_nan",
+    "check_async_iterable",
+    "check_iterable",
     "check_mapping",
     "check_path",
     "check_sequence",
@@ -36,16 +61,328 @@ __all__: list[str] = [
     "is_iterable",
     "is_mapping",
     "is_sequence",
+    "validation_context",
 ]
 
 T = TypeVar("T")
 
+# Metaclass instance checks that only depend on the class of the instance
+_CLASS_ONLY_INSTANCECHECKS = (type.__instancecheck__, abc.ABCMeta.__instancecheck__)
+# Below this many elements, checking each element directly is faster
+_MIN_ELEMENTS_TO_MEMOIZE = 32
+
+
+def _homogeneous_element_type(elements: Iterable[Any]) -> type | None:
+    """Get the type shared by all elements of a homogeneous container.
+
+    Containers like `range`, `array.array` and non-object NumPy arrays store
+    elements that all have the same type, which can be determined in O(1).
+
+    Parameters
+    ----------
+    elements : Iterable[Any]
+        The container whose element type should be determined.
+
+    Returns
+    -------
+    type or None
+        The type shared by all elements. None is returned if `elements` is empty,
+        or is not a known homogeneous container.
+    """
+    element_type: type | None = None
+    if isinstance(elements, range):
+        element_type = int if len(elements) else None
+    elif isinstance(elements, array.array):
+        if len(elements):
+            element_type = type(elements[0])
+    else:
+        np = sys.modules.get("numpy")
+        if (
+            np is not None
+            and isinstance(elements, np.ndarray)
+            and elements.ndim > 0
+            and elements.dtype.kind != "O"
+            and elements.size > 0
+        ):
+            element_type = type(next(iter(elements)))
+    return element_type
+
+
+def _all_isinstance(elements: Iterable[Any], types: tuple[type, ...]) -> bool:
+    """Check whether all elements are instances of the given types.
+
+    The verdict is determined once per distinct element class, rather than
+    calling ``isinstance`` on every element. This is only done when the result
+    of the instance check depends solely on the element's class (e.g., for
+    regular classes and abstract base classes, including virtual subclasses).
+    Homogeneous containers (`range`, `array.array` and NumPy arrays with
+    non-object dtype) are validated in O(1).
+
+    Parameters
+    ----------
+    elements : Iterable[Any]
+        The elements to check.
+    types : tuple[type, ...]
+        The allowed types of the elements.
+
+    Returns
+    -------
+    bool
+        Whether all elements are instances of `types`.
+    """
+    if (
+        isinstance(elements, collections.abc.Sized)
+        and len(elements) < _MIN_ELEMENTS_TO_MEMOIZE
+    ) or not all(
+        type(t).__instancecheck__ in _CLASS_ONLY_INSTANCECHECKS for t in types
+    ):
+        return all(isinstance(e, types) for e in elements)
+
+    homogeneous_type = _homogeneous_element_type(elements)
+    if homogeneous_type is not None:
+        return issubclass(homogeneous_type, types)
+
+    element_classes = set(map(type, elements))
+    # Classes overriding __class__ can have instances that check differently
+    if any(
+        "__class__" in vars(klass)
+        for cls in element_classes
+        for klass in cls.__mro__[:-1]
+    ):
+        return all(isinstance(e, types) for e in elements)
+    return all(issubclass(cls, types) for cls in element_classes)
+
+
+def _resolve_validation_strategy(
+    validation_strategy: str | None,
+) -> tuple[str, int]:
+    """Resolve a validation strategy to its kind and sample size.
+
+    Parameters
+    ----------
+    validation_strategy : {"full", "sample", "sample(k)", "off"} or None
+        The validation strategy. If None, the ``validation_strategy`` global
+        configuration is used. If "sample", the ``validation_sample_size``
+        global configuration is used as the sample size.
+
+    Returns
+    -------
+    tuple[str, int]
+        The kind of strategy ("full", "sample" or "off") and the number of
+        randomly selected elements to validate (0 unless sampling).
+
+    Raises
+    ------
+    ValueError
+        If `validation_strategy` is not a valid strategy.
+    """
+    if validation_strategy is None:
+        mode = _VALIDATION_MODE.mode
+        return mode.strategy, mode.sample_size
+    if validation_strategy in ("full", "off"):
+        return validation_strategy, 0  # type: ignore[return-value]
+    if validation_strategy == "sample":
+        return "sample", _get_config_value("validation_sample_size")
+    m = re.match(r"^sample\((\d+)\)$", str(validation_strategy))
+    if m is None:
+        raise ValueError(
+            '`validation_strategy` should be "full", "sample", "sample(k)" with k a '
+            f'non-negative integer, "off" or None, but found {validation_strategy!r}.'
+        )
+    return "sample", int(m[1])
+
+
+def _is_validation_off(validation_strategy: str | None) -> bool:
+    """Indicate if a validation strategy turns validation off.
+
+    Parameters
+    ----------
+    validation_strategy : str or None
+        The validation strategy. If None, the ``validation_strategy`` global
+        configuration is used.
+
+    Returns
+    -------
+    bool
+        Whether validation is turned off.
+    """
+    if validation_strategy is None:
+        return _VALIDATION_MODE.mode.off
+    return validation_strategy == "off"
+
+
+@contextmanager
+def validation_context(
+    validation_strategy: str, local_threadsafe: bool = False
+) -> Iterator[None]:
+    """Context manager setting how much validation the checkers perform.
+
+    Sets the ``validation_strategy`` (and, for "sample(k)", the
+    ``validation_sample_size``) global configuration used by the checkers in
+    :mod:`predictably_core.validate` that aren't passed a strategy. The
+    previous configuration is restored on exit.
+
+    Parameters
+    ----------
+    validation_strategy : {"full", "sample", "sample(k)", "off"}
+        The validation strategy to use inside the context.
+
+        - If "full", then inputs are fully validated.
+        - If "sample" or "sample(k)", then only the first, last and `k` randomly
+          selected elements of sequences and mappings are validated (`k`
+          defaults to the ``validation_sample_size`` global configuration).
+        - If "off", then the checkers return their inputs without validating
+          them, using a fast path that doesn't look up the configuration.
+
+    local_threadsafe : bool, default=False
+        If False, set the strategy as default for all threads.
+
+    Yields
+    ------
+    None
+        No output returned.
+
+    Raises
+    ------
+    ValueError
+        If `validation_strategy` is not a valid validation strategy.
+
+    See Also
+    --------
+    config_context :
+        Context manager for the global configuration.
+
+    Notes
+    -----
+    Each thread stores the resolved strategy of its configuration as a single
+    immutable record, which is replaced in one assignment when the
+    configuration changes. The checkers read this record instead of looking up
+    the configuration, so they always see a consistent strategy and sample size.
+
+    Examples
+    --------
+    >>> from predictably_core.validate import check_type, validation_context
+    >>> with validation_context("off"):
+    ...     check_type("not an int", expected_type=int)
+    'not an int'
+    """
+    kind, sample_size = _resolve_validation_strategy(validation_strategy)
+    with config_context(
+        validation_strategy=kind,  # type: ignore[arg-type]
+        validation_sample_size=sample_size if validation_strategy != kind else None,
+        local_threadsafe=local_threadsafe,
+    ):
+        yield
+
+
+def _sample_elements(
+    elements: Iterable[Any], sample_size: int, random_state: int | None = None
+) -> Iterable[Any]:
+    """Select the elements validated by the "sample" validation strategy.
+
+    The first and last elements are always selected, along with `sample_size`
+    elements selected uniformly at random (without replacement) from the rest.
+
+    Parameters
+    ----------
+    elements : Iterable[Any]
+        The elements of a sequence or a mapping's keys or values.
+    sample_size : int
+        The number of randomly selected elements.
+    random_state : int, default=None
+        Seed of the random number generator used to select elements. If None,
+        the elements selected differ between calls.
+
+    Returns
+    -------
+    Iterable[Any]
+        The selected elements. If `elements` is a homogeneous container (whose
+        element types are validated in O(1)) or has no more than
+        ``sample_size + 2`` elements, then `elements` is returned unchanged.
+
+    Notes
+    -----
+    Sequences are indexed directly, so sampling takes O(sample_size) time.
+    Other collections (like sets and mapping views) can only be iterated, so
+    the sampled elements are picked out in a single pass over the collection
+    up to the last selected position. No more than O(sample_size) memory is
+    used, although the time spent iterating is O(n).
+    """
+    if _homogeneous_element_type(elements) is not None:
+        return elements
+    if not isinstance(elements, collections.abc.Sized):
+        # Iterators can only be sampled after they are consumed
+        elements = list(elements)
+    n = len(elements)
+    if n <= sample_size + 2:
+        return elements
+    rng = random if random_state is None else random.Random(random_state)  # noqa: S311
+    positions = rng.sample(range(1, n - 1), sample_size)
+    if isinstance(elements, collections.abc.Sequence):
+        return [elements[0], elements[-1], *(elements[i] for i in positions)]
+
+    iterator = iter(elements)
+    first = next(iterator)
+    try:
+        # Mapping views support reversed iteration, so the walk can stop early
+        last = next(reversed(elements))  # type: ignore[call-overload]
+        end: list[int] = []
+    except TypeError:
+        last = None
+        end = [n - 1]
+    selected = []
+    previous = 0
+    for position in sorted(positions) + end:
+        # islice skips the elements between the selected positions in C
+        selected.append(next(itertools.islice(iterator, position - previous - 1, None)))
+        previous = position
+    if end:
+        last = selected.pop()
+    return [first, last, *selected]
+
+
+def _validate_elements(
+    elements: Iterable[Any],
+    types: tuple[type, ...],
+    strategy: str,
+    sample_size: int,
+    random_state: int | None = None,
+) -> bool:
+    """Check elements are instances of the given types using a resolved strategy.
+
+    Parameters
+    ----------
+    elements : Iterable[Any]
+        The elements to check.
+    types : tuple[type, ...]
+        The allowed types of the elements.
+    strategy : {"full", "sample", "off"}
+        The kind of validation strategy.
+    sample_size : int
+        The number of randomly selected elements checked if sampling.
+    random_state : int, default=None
+        Seed of the random number generator used when sampling.
+
+    Returns
+    -------
+    bool
+        Whether the (selected) elements are instances of `types`. Always True
+        if ``strategy="off"``.
+    """
+    if strategy == "off":
+        return True
+    if strategy == "sample":
+        elements = _sample_elements(elements, sample_size, random_state)
+    return _all_isinstance(elements, types)
+
 
 def is_mapping(
     input_: T,
     map_type: type[Mapping] = Mapping,
     key_type: type | Sequence[type] | None = None,
     value_type: type | Sequence[type] | None = None,
+    validation_strategy: str | None = None,
+    random_state: int | None = None,
 ) -> bool:
     """Indicate if the input is a mapping with expected key and value types.
 
@@ -63,6 +400,19 @@ def is_mapping(
         The allowed type(s) for elements of `seq`.
     value_type : type or tuple[type], default=None
         The allowed type(s) for elements of `seq`.
+    validation_strategy : {"full", "sample", "sample(k)", "off"}, default=None
+        How many of the keys and values are checked.
+
+        - If None, then the ``validation_strategy`` global configuration is used.
+        - If "full", then all keys and values are checked.
+        - If "sample" or "sample(k)", then only the first, last and `k` randomly
+          selected keys and values are checked (`k` defaults to the
+          ``validation_sample_size`` global configuration).
+        - If "off", then only the type of mapping is checked.
+
+    random_state : int, default=None
+        Seed of the random number generator used to select keys and values when
+        sampling. If None, different keys and values are selected on each call.
 
     Returns
     -------
@@ -89,6 +439,7 @@ def is_mapping(
     >>> is_mapping(some_map, map_type=defaultdict)
     False
     """
+    strategy, sample_size = _resolve_validation_strategy(validation_strategy)
     is_valid_mapping: bool = True
     if not isinstance(input_, map_type):
         is_valid_mapping = False
@@ -98,14 +449,18 @@ def is_mapping(
         key_type_ = _convert_scalar_seq_type_input_to_tuple(
             key_type, type_input_error_name="key_type"
         )
-        if not all(isinstance(k, key_type_) for k in input_):
+        if is_valid_mapping and not _validate_elements(
+            input_, key_type_, strategy, sample_size, random_state
+        ):
             is_valid_mapping = False
 
     if value_type is not None:
         value_type_ = _convert_scalar_seq_type_input_to_tuple(
             value_type, type_input_error_name="key_type"
         )
-        if not all(isinstance(v, value_type_) for v in input_.values()):
+        if is_valid_mapping and not _validate_elements(
+            input_.values(), value_type_, strategy, sample_size, random_state
+        ):
             is_valid_mapping = False
     return is_valid_mapping
 
@@ -116,6 +471,9 @@ def check_mapping(
     key_type: type | Sequence[type] | None = None,
     value_type: type | Sequence[type] | None = None,
     input_error_name: str = "input_",
+    validation_strategy: str | None = None,
+    random_state: int | None = None,
+    collect_errors: bool = False,
 ) -> T:
     """Validate if the input is a mapping with expected key and value types.
 
@@ -137,6 +495,26 @@ def check_mapping(
         is useful if you are using this to check a variable's type inside other
         code and want to raise a message with the name of the variable being
         validated.
+    validation_strategy : {"full", "sample", "sample(k)", "off"}, default=None
+        How much of `input_` is validated.
+
+        - If None, then the ``validation_strategy`` global configuration is used.
+        - If "full", then all keys and values are validated.
+        - If "sample" or "sample(k)", then only the first, last and `k` randomly
+          selected keys and values are validated (`k` defaults to the
+          ``validation_sample_size`` global configuration).
+        - If "off", then `input_` is returned without being validated.
+
+    random_state : int, default=None
+        Seed of the random number generator used to select keys and values when
+        sampling. If None, different keys and values are selected on each call.
+    collect_errors : bool, default=False
+        Whether every key and value is checked and all problems are reported.
+
+        - If False, then a ValueError is raised on the first problem.
+        - If True, then all keys and values are checked (without sampling) and
+          a single ValidationReportError listing the invalid keys and values
+          and their types is raised. See :func:`mapping_report`.
 
     Returns
     -------
@@ -148,6 +526,9 @@ def check_mapping(
     ValueError
         If the the `input_` is not a mapping of the expected type or optionally,
         if it does not have keys and/or values of the expected types.
+    ValidationReportError
+        If ``collect_errors=True`` and `input_` is invalid. Inherits from
+        ValueError.
 
     Examples
     --------
@@ -174,12 +555,37 @@ def check_mapping(
     Traceback (most recent call last):
         ...
     ValueError: The mapping `input_` is invalid.
+
+    Large mappings can be validated by sampling their keys and values.
+
+    >>> big_map = {str(i): i for i in range(100_000)}
+    >>> output = check_mapping(big_map, value_type=int, validation_strategy="sample")
+    >>> output is big_map
+    True
+
+    See the notes of :func:`check_sequence` for the guarantees provided by sampling.
     """
+    # Inlined check of whether validation is off, to minimize its overhead
+    if (
+        _VALIDATION_MODE.mode.off
+        if validation_strategy is None
+        else validation_strategy == "off"
+    ):
+        return input_
+    if collect_errors:
+        from predictably_core.validate._report import mapping_report
+
+        mapping_report(
+            input_, map_type, key_type, value_type, input_error_name
+        ).raise_if_failed()
+        return input_
     is_valid_mapping = is_mapping(
         input_=input_,
         map_type=map_type,
         key_type=key_type,
         value_type=value_type,
+        validation_strategy=validation_strategy,
+        random_state=random_state,
     )
     if not is_valid_mapping:
         raise ValueError(f"The mapping `{input_error_name}` is invalid.")
@@ -235,22 +641,354 @@ def is_iterable(input_: T) -> bool:
     return is_iter
 
 
+def _check_iterable_element_error_message(
+    element_type: tuple[type, ...],
+    iterable_name: str | None,
+    index: int,
+    element: Any,
+) -> str:
+    """Build the error message raised when an element of an iterable is invalid.
+
+    Parameters
+    ----------
+    element_type : tuple[type]
+        The allowed type(s) for elements of the iterable.
+    iterable_name : str, default=None
+        Name of the iterable to use in the message.
+    index : int
+        The position of the invalid element in the iterable.
+    element : Any
+        The invalid element.
+
+    Returns
+    -------
+    str
+        The error message.
+    """
+    name_str = "Input iterable" if iterable_name is None else f"`{iterable_name}`"
+    element_str = format_sequence_to_str(
+        element_type, last_sep="or", exclude_type_text=True
+    )
+    return (
+        f"Invalid iterable: {name_str} expected to have elements of type "
+        f"{element_str}, but element {index} is type "
+        f"{remove_type_text(type(element))}."
+    )
+
+
+def _check_max_items(max_items: int | None) -> None:
+    """Validate the `max_items` argument of the iterable checks.
+
+    Parameters
+    ----------
+    max_items : int or None
+        The maximum number of elements to validate.
+
+    Raises
+    ------
+    ValueError
+        If `max_items` is not None or a non-negative integer.
+    """
+    if max_items is not None and (
+        not isinstance(max_items, int) or isinstance(max_items, bool) or max_items < 0
+    ):
+        raise ValueError(
+            "`max_items` should be None or a non-negative integer, but found "
+            f"{max_items!r}."
+        )
+
+
+def _validate_iterator(
+    iterator: Iterator[Any],
+    element_type: tuple[type, ...],
+    max_items: int | None,
+    iterable_name: str | None,
+) -> Iterator[Any]:
+    """Yield elements of an iterator after validating their type.
+
+    Parameters
+    ----------
+    iterator : Iterator
+        The iterator whose elements are validated.
+    element_type : tuple[type]
+        The allowed type(s) for elements of `iterator`.
+    max_items : int or None
+        The number of elements to validate. Later elements are yielded
+        without being validated.
+    iterable_name : str, default=None
+        Name of the iterable to use if error messages are raised.
+
+    Yields
+    ------
+    Any
+        The elements of `iterator`.
+
+    Raises
+    ------
+    TypeError
+        If an element isn't an instance of `element_type`.
+    """
+    validated = iterator if max_items is None else itertools.islice(iterator, max_items)
+    for index, element in enumerate(validated):
+        if not isinstance(element, element_type):
+            raise TypeError(
+                _check_iterable_element_error_message(
+                    element_type, iterable_name, index, element
+                )
+            )
+        yield element
+    if max_items is not None:
+        yield from iterator
+
+
+def check_iterable(
+    input_: Iterable[T],
+    element_type: type | tuple[type, ...] | None = None,
+    max_items: int | None = None,
+    iterable_name: str | None = None,
+    validation_strategy: str | None = None,
+) -> Iterator[T]:
+    """Validate an iterable lazily as its elements are consumed.
+
+    Unlike :func:`check_sequence`, the input can be a generator or other
+    iterator that can't (or shouldn't) be materialized. Whether the input is
+    iterable is checked immediately, while the type of each element is checked
+    when the element is consumed from the returned iterator. Elements are not
+    buffered, so the iterator is consumed only as fast as the caller consumes
+    the returned iterator.
+
+    Parameters
+    ----------
+    input_ : Iterable
+        The input iterable to be validated.
+    element_type : type or tuple[type], default=None
+        The allowed type(s) for elements of `input_`.
+
+        - If None, then the elements of `input_` are not checked and the
+          iterator of `input_` is returned.
+        - If `element_type` is a type or tuple of types, then the elements of
+          `input_` are checked to make sure they are instances of the supplied
+          `element_type` as they are consumed.
+
+    max_items : int, default=None
+        The number of elements to validate. If None, then all elements are
+        validated. Otherwise, only the first `max_items` elements are validated
+        and the remaining elements are passed through without any overhead.
+    iterable_name : str, default=None
+        Name of `input_` to use if error messages are raised.
+    validation_strategy : {"full", "sample", "sample(k)", "off"}, default=None
+        Whether the elements of `input_` are validated.
+
+        - If None, then the ``validation_strategy`` global configuration is used.
+        - If "off", then the iterator of `input_` is returned and elements are
+          not validated.
+        - Otherwise, each consumed element is validated (as elements are
+          validated one at a time, they aren't sampled).
+
+    Returns
+    -------
+    Iterator
+        An iterator over the elements of `input_` that raises a TypeError when
+        an element with an invalid type is consumed.
+
+    Raises
+    ------
+    TypeError
+        If `input_` is not iterable or, when it is consumed, if an element
+        isn't an instance of `element_type`.
+    ValueError
+        If `max_items` is not None or a non-negative integer.
+
+    See Also
+    --------
+    check_async_iterable :
+        Lazily validate an asynchronous iterable.
+    check_sequence :
+        Validate a sequence and all its elements at once.
+
+    Examples
+    --------
+    >>> from predictably_core.validate import check_iterable
+    >>> list(check_iterable((c for c in [1, 2, 3]), element_type=int))
+    [1, 2, 3]
+
+    Elements are validated as they are consumed.
+
+    >>> validated = check_iterable(iter([1, "a"]), element_type=int)
+    >>> next(validated)
+    1
+    >>> next(validated)  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+        ...
+    TypeError: Invalid iterable: ... but element 1 is type str.
+
+    Non-iterable input raises an error immediately.
+
+    >>> check_iterable(7)
+    Traceback (most recent call last):
+        ...
+    TypeError: Invalid iterable: Input iterable expected to be iterable, but found int.
+    """
+    _check_max_items(max_items)
+    if not is_iterable(input_):
+        name_str = "Input iterable" if iterable_name is None else f"`{iterable_name}`"
+        raise TypeError(
+            f"Invalid iterable: {name_str} expected to be iterable, but found "
+            f"{remove_type_text(type(input_))}."
+        )
+    iterator = iter(input_)
+    if element_type is None or _is_validation_off(validation_strategy):
+        return iterator
+    element_type_ = _convert_scalar_seq_type_input_to_tuple(
+        element_type, type_input_error_name="element_type"
+    )
+    return _validate_iterator(iterator, element_type_, max_items, iterable_name)
+
+
+async def _validate_async_iterator(
+    iterator: AsyncIterator[Any],
+    element_type: tuple[type, ...],
+    max_items: int | None,
+    iterable_name: str | None,
+) -> AsyncIterator[Any]:
+    """Yield elements of an asynchronous iterator after validating their type.
+
+    Parameters
+    ----------
+    iterator : AsyncIterator
+        The asynchronous iterator whose elements are validated.
+    element_type : tuple[type]
+        The allowed type(s) for elements of `iterator`.
+    max_items : int or None
+        The number of elements to validate. Later elements are yielded
+        without being validated.
+    iterable_name : str, default=None
+        Name of the iterable to use if error messages are raised.
+
+    Yields
+    ------
+    Any
+        The elements of `iterator`.
+
+    Raises
+    ------
+    TypeError
+        If an element isn't an instance of `element_type`.
+    """
+    index = 0
+    async for element in iterator:
+        if (max_items is None or index < max_items) and not isinstance(
+            element, element_type
+        ):
+            raise TypeError(
+                _check_iterable_element_error_message(
+                    element_type, iterable_name, index, element
+                )
+            )
+        index += 1
+        yield element
+
+
+def check_async_iterable(
+    input_: AsyncIterable[T],
+    element_type: type | tuple[type, ...] | None = None,
+    max_items: int | None = None,
+    iterable_name: str | None = None,
+    validation_strategy: str | None = None,
+) -> AsyncIterator[T]:
+    """Validate an asynchronous iterable lazily as its elements are consumed.
+
+    The asynchronous counterpart of :func:`check_iterable`. Whether the input
+    is an asynchronous iterable is checked immediately, while the type of each
+    element is checked when it is consumed from the returned asynchronous
+    iterator (e.g., using ``async for``).
+
+    Parameters
+    ----------
+    input_ : AsyncIterable
+        The input asynchronous iterable to be validated.
+    element_type : type or tuple[type], default=None
+        The allowed type(s) for elements of `input_`. If None, then the elements
+        of `input_` are not checked and the asynchronous iterator of `input_` is
+        returned.
+    max_items : int, default=None
+        The number of elements to validate. If None, then all elements are
+        validated. Otherwise, only the first `max_items` elements are validated.
+    iterable_name : str, default=None
+        Name of `input_` to use if error messages are raised.
+    validation_strategy : {"full", "sample", "sample(k)", "off"}, default=None
+        Whether the elements of `input_` are validated. If None, then the
+        ``validation_strategy`` global configuration is used. If "off", then
+        elements are not validated. Otherwise, each consumed element is
+        validated.
+
+    Returns
+    -------
+    AsyncIterator
+        An asynchronous iterator over the elements of `input_` that raises a
+        TypeError when an element with an invalid type is consumed.
+
+    Raises
+    ------
+    TypeError
+        If `input_` is not an asynchronous iterable or, when it is consumed, if
+        an element isn't an instance of `element_type`.
+    ValueError
+        If `max_items` is not None or a non-negative integer.
+
+    See Also
+    --------
+    check_iterable :
+        Lazily validate a (synchronous) iterable.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from predictably_core.validate import check_async_iterable
+    >>> async def numbers():
+    ...     for i in range(3):
+    ...         yield i
+    >>> async def collect():
+    ...     return [i async for i in check_async_iterable(numbers(), int)]
+    >>> asyncio.run(collect())
+    [0, 1, 2]
+    """
+    _check_max_items(max_items)
+    if not isinstance(input_, collections.abc.AsyncIterable):
+        name_str = "Input iterable" if iterable_name is None else f"`{iterable_name}`"
+        raise TypeError(
+            f"Invalid iterable: {name_str} expected to be an asynchronous iterable, "
+            f"but found {remove_type_text(type(input_))}."
+        )
+    iterator = input_.__aiter__()
+    if element_type is None or _is_validation_off(validation_strategy):
+        return iterator
+    element_type_ = _convert_scalar_seq_type_input_to_tuple(
+        element_type, type_input_error_name="element_type"
+    )
+    return _validate_async_iterator(iterator, element_type_, max_items, iterable_name)
+
+
 @overload
 def check_path(
-    path_: str, path_error_name: str = "path_"
+    path_: str, path_error_name: str = "path_", validation_strategy: str | None = None
 ) -> pathlib.Path:  # numpydoc ignore=GL08
     ...  # pragma: no cover
 
 
 @overload
 def check_path(
-    path_: pathlib.Path, path_error_name: str = "path_"
+    path_: pathlib.Path,
+    path_error_name: str = "path_",
+    validation_strategy: str | None = None,
 ) -> pathlib.Path:  # numpydoc ignore=GL08
     ...  # pragma: no cover
 
 
 def check_path(
-    path_: str | pathlib.Path, path_error_name: str = "path_"
+    path_: str | pathlib.Path,
+    path_error_name: str = "path_",
+    validation_strategy: str | None = None,
 ) -> pathlib.Path:
     """Validate `path` is `pathlib.Path` or `str`.
 
@@ -265,11 +1003,19 @@ def check_path(
         The name to refer to `path_` as in error messages that are raised. This
         is useful if you are using this to check a path inside other code and
         want to raise a message with the name of the variable being validated.
+    validation_strategy : {"full", "sample", "sample(k)", "off"}, default=None
+        Whether `path_` is validated.
+
+        - If None, then the ``validation_strategy`` global configuration is used.
+        - If "off", then a str is still converted to a pathlib.Path, but other
+          input is returned unchanged instead of raising an error.
+        - Otherwise, `path_` is validated (a single path can't be sampled).
 
     Returns
     -------
     pathlib.Path
-        The validated path.
+        The validated path. If validation is turned off, input that isn't a
+        pathlib.Path or str is returned unchanged.
 
     Raises
     ------
@@ -295,6 +1041,8 @@ def check_path(
         return path_
     elif isinstance(path_, str):
         return pathlib.Path(path_)
+    elif _is_validation_off(validation_strategy):
+        return path_  # type: ignore[return-value]
     else:
         raise ValueError(
             f"`{path_error_name}` must be a pathlib.Path object or a str, but "
@@ -308,6 +1056,9 @@ def check_type(
     allow_none: bool = False,
     use_subclass: bool = False,
     input_error_name: str = "input_",
+    validation_strategy: str | None = None,
+    random_state: int | None = None,
+    collect_errors: bool = False,
 ) -> T:
     """Check the input is the expected type.
 
@@ -315,12 +1066,16 @@ def check_type(
     allowing None values as well (if ``allow_none=True``). For flexibility,
     the check can use ``issubclass`` instead of ``isinstance`` if ``use_subclass=True``.
 
+    `expected_type` can also be a `typing` annotation or PEP 585 generic alias
+    (e.g., ``list[int]``, ``Mapping[str, float]`` or ``Optional[int]``). See
+    :func:`is_type` for the supported annotations.
+
     Parameters
     ----------
     input_ : Any
         The input to be type checked.
-    expected_type : type
-        The type that `input_` is expected to be.
+    expected_type : type, tuple[type] or annotation
+        The type or annotation that `input_` is expected to match.
     allow_none : bool, default=False
         Whether `input_` can be None in addition to being instance of `expected_type`.
     use_subclass : bool, default=False
@@ -334,6 +1089,27 @@ def check_type(
         is useful if you are using this to check a variable's type inside other
         code and want to raise a message with the name of the variable being
         validated.
+    validation_strategy : {"full", "sample", "sample(k)", "off"}, default=None
+        Whether `input_` is validated.
+
+        - If None, then the ``validation_strategy`` global configuration is used.
+        - If "off", then `input_` is returned without being validated.
+        - If "sample" or "sample(k)", then only the first, last and `k` randomly
+          selected elements of containers in an `expected_type` annotation are
+          validated.
+        - If "full", then `input_` is completely validated.
+
+    random_state : int, default=None
+        Seed of the random number generator used to select elements when
+        sampling. If None, different elements are selected on each call.
+    collect_errors : bool, default=False
+        Whether all problems with the elements of containers are reported.
+
+        - If False, then a TypeError is raised on the first problem.
+        - If True and `expected_type` is a container annotation (e.g.,
+          ``list[int]``), then all elements are checked (without sampling) and
+          a single ValidationReportError listing the invalid elements and their
+          types is raised. See :func:`type_report`.
 
     Returns
     -------
@@ -345,6 +1121,11 @@ def check_type(
     TypeError
         If input does match expected type using isinstance by default
         or using issubclass in check if ``use_subclass=True``.
+    ForwardRefError
+        If a forward reference in `expected_type` can't be resolved.
+    ValidationReportError
+        If ``collect_errors=True`` and `input_` doesn't match `expected_type`.
+        Inherits from TypeError.
 
     Examples
     --------
@@ -360,16 +1141,43 @@ def check_type(
     Traceback (most recent call last):
         ...
     TypeError: `input_` should be type str, but found int.
+
+    Annotations from the `typing` module can also be checked.
+
+    >>> from typing import Dict, List
+    >>> check_type({"a": [1, 2]}, expected_type=Dict[str, List[int]])
+    {'a': [1, 2]}
+    >>> check_type([1, "a"], expected_type=List[int])  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+        ...
+    TypeError: `input_` should be type List[int], but found list.
     """
-    # process expected_type parameter
-    if not isinstance(expected_type, (type, tuple)):
-        msg = " ".join(
-            [
-                "`expected_type` should be type or tuple of types,"
-                f"but found {remove_type_text(expected_type)}."
-            ]
+    # Inlined check of whether validation is off, to minimize its overhead
+    if (
+        _VALIDATION_MODE.mode.off
+        if validation_strategy is None
+        else validation_strategy == "off"
+    ):
+        return input_
+    if collect_errors:
+        from predictably_core.validate._report import type_report
+
+        type_report(
+            input_, expected_type, allow_none, use_subclass, input_error_name
+        ).raise_if_failed()
+        return input_
+    if not _is_plain_type_input(expected_type):
+        from predictably_core.validate._typing import _check_annotation
+
+        return _check_annotation(  # type: ignore[no-any-return]
+            input_,
+            expected_type,
+            allow_none,
+            use_subclass,
+            input_error_name,
+            validation_strategy,
+            random_state,
         )
-        raise TypeError(msg)
 
     # Check the type of input_
     type_check = issubclass if use_subclass else isinstance
@@ -381,29 +1189,83 @@ def check_type(
         is_expected_type = type_check(input_, expected_type)
 
     if not is_expected_type:
-        chk_msg = "subclass type" if use_subclass else "be type"
-        if isinstance(expected_type, tuple):
-            expected_type_str = format_sequence_to_str(
-                [remove_type_text(t) for t in expected_type], last_sep="or"
-            )
-        else:
-            expected_type_str = remove_type_text(expected_type)
-        input_type_str = remove_type_text(type(input_))
-        if allow_none:
-            type_msg = f"{expected_type_str} or None"
-        else:
-            type_msg = f"{expected_type_str}"
         raise TypeError(
-            f"`{input_error_name}` should {chk_msg} {type_msg}, but "
-            f"found {input_type_str}."
+            _check_type_error_prefix(
+                expected_type, allow_none, use_subclass, input_error_name
+            )
+            + f"{remove_type_text(type(input_))}."
         )
     return input_
 
 
+def _is_plain_type_input(expected_type: Any) -> bool:
+    """Indicate if the expected type is a class or tuple of classes.
+
+    Parameters
+    ----------
+    expected_type : Any
+        The expected type.
+
+    Returns
+    -------
+    bool
+        Whether `expected_type` can be checked using isinstance directly.
+    """
+    if type(expected_type) is type:
+        return True
+    if isinstance(expected_type, tuple):
+        return all(_is_plain_type_input(t) for t in expected_type)
+    # typing.Any is a class on Python 3.11+, but can't be used with isinstance
+    return (
+        isinstance(expected_type, type)
+        and typing.get_origin(expected_type) is None
+        and expected_type is not typing.Any
+    )
+
+
+def _check_type_error_prefix(
+    expected_type: type | tuple[type, ...],
+    allow_none: bool,
+    use_subclass: bool,
+    input_error_name: str,
+) -> str:
+    """Build the start of the error message raised by `check_type`.
+
+    The message is completed by appending the name of the type that was found.
+
+    Parameters
+    ----------
+    expected_type : type | tuple[type, ...]
+        The type(s) the input was expected to be.
+    allow_none : bool
+        Whether the input was allowed to be None.
+    use_subclass : bool
+        Whether the check used issubclass instead of isinstance.
+    input_error_name : str
+        The name used to refer to the input in the message.
+
+    Returns
+    -------
+    str
+        The error message up to the name of the type that was found.
+    """
+    chk_msg = "subclass type" if use_subclass else "be type"
+    if isinstance(expected_type, tuple):
+        expected_type_str = format_sequence_to_str(
+            [remove_type_text(t) for t in expected_type], last_sep="or"
+        )
+    else:
+        expected_type_str = remove_type_text(expected_type)
+    type_msg = f"{expected_type_str} or None" if allow_none else expected_type_str
+    return f"`{input_error_name}` should {chk_msg} {type_msg}, but found "
+
+
 def is_sequence(
     input_seq: Any,
     sequence_type: type | tuple[type, ...] | None = None,
     element_type: type | tuple[type, ...] | None = None,
+    validation_strategy: str | None = None,
+    random_state: int | None = None,
 ) -> bool:
     """Indicate if an object is a sequence with optional check of element types.
 
@@ -429,6 +1291,20 @@ def is_sequence(
           `input_seq` are checked to make sure they are all instances of
           the supplied `element_type`.
 
+    validation_strategy : {"full", "sample", "sample(k)", "off"}, default=None
+        How many of the elements of `input_seq` are checked.
+
+        - If None, then the ``validation_strategy`` global configuration is used.
+        - If "full", then all elements are checked.
+        - If "sample" or "sample(k)", then only the first, last and `k` randomly
+          selected elements are checked (`k` defaults to the
+          ``validation_sample_size`` global configuration).
+        - If "off", then only the type of sequence is checked.
+
+    random_state : int, default=None
+        Seed of the random number generator used to select elements when
+        sampling. If None, different elements are selected on each call.
+
     Returns
     -------
     bool
@@ -472,6 +1348,7 @@ def is_sequence(
         type_input_error_name="sequence_type",
     )
 
+    strategy, sample_size = _resolve_validation_strategy(validation_strategy)
     is_valid_sequence = isinstance(input_seq, sequence_type_)
 
     # Optionally verify elements have correct types
@@ -479,7 +1356,9 @@ def is_sequence(
         element_type_ = _convert_scalar_seq_type_input_to_tuple(
             element_type, type_input_error_name="element_type"
         )
-        if not all(isinstance(e, element_type_) for e in input_seq):
+        if is_valid_sequence and not _validate_elements(
+            input_seq, element_type_, strategy, sample_size, random_state
+        ):
             is_valid_sequence = False
 
     return is_valid_sequence
@@ -492,6 +1371,9 @@ def check_sequence(
     coerce_output_type_to: type | None = None,
     coerce_scalar_input: bool = False,
     sequence_name: str | None = None,
+    validation_strategy: str | None = None,
+    random_state: int | None = None,
+    collect_errors: bool = False,
 ) -> Sequence[Any]:
     """Check whether an object is a sequence with optional check of element types.
 
@@ -519,6 +1401,27 @@ def check_sequence(
         `coerce_output_type_to` keyword to the desired sequence type (e.g., list).
     sequence_name : str, default=None
         Name of `input_seq` to use if error messages are raised.
+    validation_strategy : {"full", "sample", "sample(k)", "off"}, default=None
+        How much of `input_seq` is validated.
+
+        - If None, then the ``validation_strategy`` global configuration is used.
+        - If "full", then all elements are validated.
+        - If "sample" or "sample(k)", then only the first, last and `k` randomly
+          selected elements are validated (`k` defaults to the
+          ``validation_sample_size`` global configuration).
+        - If "off", then `input_seq` is not validated (but is still coerced if
+          requested).
+
+    random_state : int, default=None
+        Seed of the random number generator used to select elements when
+        sampling. If None, different elements are selected on each call.
+    collect_errors : bool, default=False
+        Whether every element is checked and all problems are reported.
+
+        - If False, then a TypeError is raised on the first problem.
+        - If True, then all elements are checked (without sampling) and a single
+          ValidationReportError listing the invalid elements' indices and types
+          is raised. See :func:`sequence_report`.
 
     Returns
     -------
@@ -530,6 +1433,29 @@ def check_sequence(
     TypeError :
         If `seq` is not instance of `sequence_type` or ``element_type is not None`` and
         all elements are not instances of `element_type`.
+    ValueError :
+        If `validation_strategy` is not a valid validation strategy.
+    ValidationReportError :
+        If ``collect_errors=True`` and `input_seq` is invalid. Inherits from
+        TypeError.
+
+    Notes
+    -----
+    Validating every element of a large sequence is O(n). The "sample" strategy
+    instead checks the first and last elements plus `k` elements selected
+    uniformly at random, so its cost doesn't depend on the length of the
+    sequence. The type of the sequence itself is always fully checked.
+
+    Sampling trades completeness for speed. If a fraction `p` of the elements
+    have an invalid type, then the probability an invalid sequence passes the
+    check is at most ``(1 - p) ** k``. For example, with ``k=100`` an input where
+    5% of elements are invalid is missed less than 0.6% of the time, but a
+    single invalid element in a sequence of 1 million elements will usually be
+    missed. Use "full" validation where every element must be checked.
+
+    Sequences whose element type is known from the container (``range``,
+    ``array.array`` and numeric numpy arrays) are always checked completely, as
+    this takes constant time.
 
     Examples
     --------
@@ -563,7 +1489,23 @@ def check_sequence(
     [1, 2, 3]
     >>> check_sequence([1, 2, 3, 4], sequence_type=list, element_type=(int, float))
     [1, 2, 3, 4]
+
+    Large sequences can be validated by sampling their elements.
+
+    >>> big_seq = list(range(100_000))
+    >>> output = check_sequence(
+    ...     big_seq, element_type=int, validation_strategy="sample(50)"
+    ... )
+    >>> output is big_seq
+    True
     """
+    is_off = (
+        _VALIDATION_MODE.mode.off
+        if validation_strategy is None
+        else validation_strategy == "off"
+    )
+    if is_off and not coerce_scalar_input and coerce_output_type_to is None:
+        return input_seq
     if coerce_scalar_input:
         if sequence_type is None:
             input_seq = scalar_to_sequence(input_seq, sequence_type=tuple)
@@ -574,38 +1516,25 @@ def check_sequence(
         else:
             input_seq = scalar_to_sequence(input_seq, sequence_type=sequence_type)
 
-    is_valid_seqeunce = is_sequence(
+    if collect_errors and not is_off:
+        from predictably_core.validate._report import sequence_report
+
+        sequence_report(
+            input_seq, sequence_type, element_type, sequence_name
+        ).raise_if_failed()
+        is_off = True
+    is_valid_seqeunce = is_off or is_sequence(
         input_seq,
         sequence_type=sequence_type,
         element_type=element_type,
+        validation_strategy=validation_strategy,
+        random_state=random_state,
     )
     # Raise error is format is not expected.
     if not is_valid_seqeunce:
-        name_str = "Input sequence" if sequence_name is None else f"`{sequence_name}`"
-        if sequence_type is None:
-            seq_str = "sequence"
-        else:
-            sequence_type_ = _convert_scalar_seq_type_input_to_tuple(
-                sequence_type,
-                type_input_subclass=collections.abc.Sequence,
-                type_input_error_name="sequence_type",
-            )
-            seq_str = format_sequence_to_str(
-                sequence_type_, last_sep="or", exclude_type_text=True
-            )
-
-        msg = f"Invalid sequence: {name_str} expected to be a {seq_str}."
-
-        if element_type is not None:
-            element_type_ = _convert_scalar_seq_type_input_to_tuple(
-                element_type, type_input_error_name="element_type"
-            )
-            element_str = format_sequence_to_str(
-                element_type_, last_sep="or", exclude_type_text=True
-            )
-            msg = msg[:-1] + f" with elements of type {element_str}."
-
-        raise TypeError(msg)
+        raise TypeError(
+            _check_sequence_error_message(sequence_type, element_type, sequence_name)
+        )
 
     if coerce_output_type_to is not None:
         output_ = coerce_output_type_to(input_seq)
@@ -616,6 +1545,53 @@ def check_sequence(
     return input_seq
 
 
+def _check_sequence_error_message(
+    sequence_type: type | tuple[type, ...] | None,
+    element_type: type | tuple[type, ...] | None,
+    sequence_name: str | None,
+) -> str:
+    """Build the error message raised by `check_sequence`.
+
+    Parameters
+    ----------
+    sequence_type : type or tuple[type], default=None
+        The allowed sequence type(s).
+    element_type : type or tuple[type], default=None
+        The allowed type(s) for elements of the sequence.
+    sequence_name : str, default=None
+        Name of the sequence to use in the message.
+
+    Returns
+    -------
+    str
+        The error message.
+    """
+    name_str = "Input sequence" if sequence_name is None else f"`{sequence_name}`"
+    if sequence_type is None:
+        seq_str = "sequence"
+    else:
+        sequence_type_ = _convert_scalar_seq_type_input_to_tuple(
+            sequence_type,
+            type_input_subclass=collections.abc.Sequence,
+            type_input_error_name="sequence_type",
+        )
+        seq_str = format_sequence_to_str(
+            sequence_type_, last_sep="or", exclude_type_text=True
+        )
+
+    msg = f"Invalid sequence: {name_str} expected to be a {seq_str}."
+
+    if element_type is not None:
+        element_type_ = _convert_scalar_seq_type_input_to_tuple(
+            element_type, type_input_error_name="element_type"
+        )
+        element_str = format_sequence_to_str(
+            element_type_, last_sep="or", exclude_type_text=True
+        )
+        msg = msg[:-1] + f" with elements of type {element_str}."
+    return msg
+
+
 def _is_scalar_nan(x: Any) -> bool:
     """Test if x is NaN.
 
@@ -0,0 +1,630 @@
+#!/usr/bin/env python3 -u
+# copyright: predictably developers, BSD-3-Clause License (see LICENSE file)
+"""Runtime checks of values against `typing` annotations.
+
+Annotations (e.g., ``list[int]``, ``Mapping[str, float]`` or ``Optional[int]``)
+are compiled once into a checker function that is cached, so that repeatedly
+checking values against the same annotation doesn't re-inspect the annotation.
+"""
+
+from __future__ import annotations
+
+import builtins
+import collections
+import functools
+import re
+import sys
+import typing
+from typing import Any, Callable, NamedTuple
+
+from predictably_core.core._exceptions import ForwardRefError
+from predictably_core.utils._utils import remove_type_text
+from predictably_core.validate._types import (
+    _all_isinstance,
+    _is_plain_type_input,
+    _resolve_validation_strategy,
+    _sample_elements,
+)
+
+__author__: list[str] = ["RNKuhns"]
+__all__: list[str] = ["is_type"]
+
+# Types of the union created by the `X | Y` syntax (Python 3.10+)
+_UNION_TYPES: tuple[Any, ...] = (typing.Union,)
+if sys.version_info >= (3, 10):  # pragma: no cover
+    import types
+
+    _UNION_TYPES = (typing.Union, types.UnionType)
+_ANNOTATED = getattr(typing, "Annotated", None)
+_MAX_CACHED_ANNOTATIONS = 1024
+
+
+class _CheckOptions(NamedTuple):
+    """How much of the value is checked against the annotation.
+
+    Parameters
+    ----------
+    strategy : {"full", "sample", "off"}
+        The resolved validation strategy. If "off", container elements aren't
+        checked.
+    sample_size : int
+        The number of randomly selected elements checked when sampling.
+    random_state : int or None
+        Seed of the random number generator used when sampling.
+    """
+
+    strategy: str
+    sample_size: int
+    random_state: int | None
+
+
+_Checker = Callable[[Any, _CheckOptions], bool]
+
+
+def _annotation_to_str(annotation: Any) -> str:
+    """Format an annotation for use in error messages.
+
+    Parameters
+    ----------
+    annotation : Any
+        The annotation to format.
+
+    Returns
+    -------
+    str
+        The annotation without the <class > wrapper and `typing.` prefixes.
+    """
+    if isinstance(annotation, tuple):
+        return " or ".join(_annotation_to_str(a) for a in annotation)
+    return re.sub(r"\btyping\.", "", remove_type_text(annotation))
+
+
+def _select_elements(elements: Any, options: _CheckOptions) -> Any:
+    """Select the elements of a container that are checked.
+
+    Parameters
+    ----------
+    elements : Iterable
+        The elements of a container.
+    options : _CheckOptions
+        The options of the check.
+
+    Returns
+    -------
+    Iterable
+        All elements, or the sampled elements if the strategy is "sample".
+    """
+    if options.strategy == "sample":
+        return _sample_elements(elements, options.sample_size, options.random_state)
+    return elements
+
+
+def _make_elements_checker(
+    element_annotation: Any,
+) -> Callable[[Any, _CheckOptions], bool]:
+    """Create a function that checks all (selected) elements of a container.
+
+    Parameters
+    ----------
+    element_annotation : Any
+        The annotation the elements should match.
+
+    Returns
+    -------
+    Callable
+        Function accepting the elements and the check options, returning
+        whether the (selected) elements match `element_annotation`.
+    """
+    plain_types = _as_plain_types(element_annotation)
+    if plain_types is not None:
+        if object in plain_types:
+            return lambda elements, options: True
+
+        def check_plain_elements(elements: Any, options: _CheckOptions) -> bool:
+            return _all_isinstance(_select_elements(elements, options), plain_types)
+
+        return check_plain_elements
+
+    element_checker = _compile(element_annotation)
+
+    def check_elements(elements: Any, options: _CheckOptions) -> bool:
+        return all(
+            element_checker(element, options)
+            for element in _select_elements(elements, options)
+        )
+
+    return check_elements
+
+
+def _as_plain_types(annotation: Any) -> tuple[type, ...] | None:
+    """Return the classes equivalent to an annotation, if there are any.
+
+    Parameters
+    ----------
+    annotation : Any
+        The annotation.
+
+    Returns
+    -------
+    tuple[type] or None
+        If `annotation` is a class, Any, None or a Union of those, the classes
+        an instance must be an instance of. Otherwise, None.
+    """
+    if annotation is typing.Any:
+        return (object,)
+    if annotation is None or annotation is type(None):
+        return (type(None),)
+    if isinstance(annotation, type) and typing.get_origin(annotation) is None:
+        return (annotation,)
+    if typing.get_origin(annotation) in _UNION_TYPES:
+        plain_types: tuple[type, ...] = ()
+        for arg in typing.get_args(annotation):
+            arg_types = _as_plain_types(arg)
+            if arg_types is None:
+                return None
+            plain_types += arg_types
+        return plain_types
+    return None
+
+
+def _compile_forward_ref(ref: str, module_name: str | None) -> _Checker:
+    """Compile a forward reference that is resolved when it is first checked.
+
+    Parameters
+    ----------
+    ref : str
+        The forward reference (e.g., "pandas.DataFrame" or "list[MyClass]").
+    module_name : str or None
+        The name of the module the reference should be resolved in.
+
+    Returns
+    -------
+    Callable
+        The checker of the annotation the reference resolves to.
+    """
+    resolved: list[_Checker] = []
+
+    def check_forward_ref(value: Any, options: _CheckOptions) -> bool:
+        if not resolved:
+            namespace: dict[str, Any] = {
+                name: module
+                for name, module in list(sys.modules.items())
+                if "." not in name
+            }
+            namespace.update(vars(typing))
+            namespace.update(vars(builtins))
+            module = sys.modules.get(module_name) if module_name else None
+            if module is not None:
+                namespace.update(vars(module))
+            try:
+                # Same evaluation typing.get_type_hints uses for str annotations
+                annotation = eval(ref, namespace)  # noqa: S307
+            except Exception as exc:
+                raise ForwardRefError(
+                    f"Unable to resolve the forward reference {ref!r}. Use the "
+                    "fully qualified name (e.g., 'package.module.Class') of "
+                    "classes from modules other than builtins and typing."
+                ) from exc
+            resolved.append(_compile(annotation))
+        return resolved[0](value, options)
+
+    return check_forward_ref
+
+
+def _compile_tuple(args: tuple[Any, ...]) -> _Checker:
+    """Compile a tuple annotation.
+
+    Parameters
+    ----------
+    args : tuple
+        The arguments of the tuple annotation.
+
+    Returns
+    -------
+    Callable
+        The checker of the tuple annotation.
+    """
+    if len(args) == 2 and args[1] is Ellipsis:
+        check_elements = _make_elements_checker(args[0])
+
+        def check_variadic_tuple(value: Any, options: _CheckOptions) -> bool:
+            return isinstance(value, tuple) and (
+                options.strategy == "off" or check_elements(value, options)
+            )
+
+        return check_variadic_tuple
+
+    if not args:
+        # Unsubscripted Tuple
+        return lambda value, options: isinstance(value, tuple)
+    element_checkers = tuple(_compile(arg) for arg in args)
+    n_elements = len(args)
+
+    def check_fixed_tuple(value: Any, options: _CheckOptions) -> bool:
+        return (
+            isinstance(value, tuple)
+            and len(value) == n_elements
+            and (
+                options.strategy == "off"
+                or all(
+                    checker(element, options)
+                    for checker, element in zip(element_checkers, value)
+                )
+            )
+        )
+
+    return check_fixed_tuple
+
+
+def _compile_generic(origin: type, args: tuple[Any, ...]) -> _Checker:
+    """Compile a subscripted generic class (e.g., ``list[int]``).
+
+    Parameters
+    ----------
+    origin : type
+        The unsubscripted class.
+    args : tuple
+        The arguments the class is subscripted with.
+
+    Returns
+    -------
+    Callable
+        The checker of the generic annotation.
+    """
+    if origin is tuple:
+        return _compile_tuple(args)
+
+    if origin is type:
+        # type[X] is satisfied by X and its subclasses
+        subclass_types = _as_plain_types(args[0]) if args else (object,)
+        if subclass_types is None:
+            raise TypeError(
+                f"Unable to check the annotation type[{_annotation_to_str(args[0])}]."
+            )
+        return lambda value, options: isinstance(value, type) and issubclass(
+            value, subclass_types
+        )
+
+    if issubclass(origin, collections.abc.Mapping) and len(args) == 2:
+        check_keys = _make_elements_checker(args[0])
+        check_values = _make_elements_checker(args[1])
+
+        def check_mapping(value: Any, options: _CheckOptions) -> bool:
+            return isinstance(value, origin) and (
+                options.strategy == "off"
+                or (
+                    check_keys(value, options) and check_values(value.values(), options)
+                )
+            )
+
+        return check_mapping
+
+    # Iterators can only be checked by consuming them, so only Collections
+    # (which can be iterated repeatedly) have their elements checked
+    if issubclass(origin, collections.abc.Iterable) and len(args) == 1:
+        check_elements = _make_elements_checker(args[0])
+
+        def check_collection(value: Any, options: _CheckOptions) -> bool:
+            return isinstance(value, origin) and (
+                options.strategy == "off"
+                or not isinstance(value, collections.abc.Collection)
+                or check_elements(value, options)
+            )
+
+        return check_collection
+
+    # Other generics (e.g., Callable[..., int]) are checked against their origin
+    return lambda value, options: isinstance(value, origin)
+
+
+def _compile_uncached(annotation: Any) -> _Checker:
+    """Compile an annotation into a function that checks values against it.
+
+    Parameters
+    ----------
+    annotation : Any
+        The annotation.
+
+    Returns
+    -------
+    Callable
+        Function accepting a value and the check options, returning whether
+        the value matches `annotation`.
+
+    Raises
+    ------
+    TypeError
+        If the annotation can't be checked at runtime.
+    """
+    plain_types = _as_plain_types(annotation)
+    if plain_types is not None:
+        if object in plain_types:
+            return lambda value, options: True
+        return lambda value, options: isinstance(value, plain_types)
+
+    if isinstance(annotation, str):
+        return _compile_forward_ref(annotation, None)
+    if isinstance(annotation, typing.ForwardRef):
+        return _compile_forward_ref(
+            annotation.__forward_arg__, getattr(annotation, "__forward_module__", None)
+        )
+
+    if isinstance(annotation, typing.TypeVar):
+        if annotation.__constraints__:
+            return _compile(typing.Union[annotation.__constraints__])
+        if annotation.__bound__ is not None:
+            return _compile(annotation.__bound__)
+        return lambda value, options: True
+
+    # NewType is checked against the type it is based on
+    if callable(annotation) and hasattr(annotation, "__supertype__"):
+        return _compile(annotation.__supertype__)
+
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin in _UNION_TYPES:
+        checkers = tuple(_compile(arg) for arg in args)
+        return lambda value, options: any(
+            checker(value, options) for checker in checkers
+        )
+    if origin is typing.Literal:
+        literals = tuple((type(arg), arg) for arg in args)
+        # Literal[1] doesn't match True, so types are compared as well as values
+        return lambda value, options: (type(value), value) in literals
+    if _ANNOTATED is not None and origin is _ANNOTATED:
+        return _compile(args[0])
+    if origin is tuple and (args == ((),) or str(annotation).endswith("[()]")):
+        # tuple[()] is the empty tuple (its args differ between Python versions)
+        return lambda value, options: value == ()
+    if isinstance(origin, type):
+        return _compile_generic(origin, args)
+
+    raise TypeError(
+        "`expected_type` should be a type, tuple of types or an annotation that "
+        f"can be checked at runtime, but found {_annotation_to_str(annotation)}."
+    )
+
+
+@functools.lru_cache(maxsize=_MAX_CACHED_ANNOTATIONS)
+def _compile_cached(annotation: Any) -> _Checker:
+    """Compile an annotation and cache the result.
+
+    Parameters
+    ----------
+    annotation : Any
+        The (hashable) annotation.
+
+    Returns
+    -------
+    Callable
+        The checker of the annotation.
+    """
+    return _compile_uncached(annotation)
+
+
+def _compile(annotation: Any) -> _Checker:
+    """Compile an annotation, using the cached checker if there is one.
+
+    Parameters
+    ----------
+    annotation : Any
+        The annotation.
+
+    Returns
+    -------
+    Callable
+        The checker of the annotation.
+    """
+    try:
+        return _compile_cached(annotation)
+    except TypeError:
+        # Annotations with unhashable arguments (e.g., in Literal) aren't cached
+        try:
+            hash(annotation)
+        except TypeError:
+            return _compile_uncached(annotation)
+        raise
+
+
+def is_type(
+    input_: Any,
+    expected_type: Any,
+    validation_strategy: str | None = None,
+    random_state: int | None = None,
+) -> bool:
+    """Indicate if the input matches a type or `typing` annotation.
+
+    In addition to classes and tuples of classes, `expected_type` can be an
+    annotation from the `typing` module or a PEP 585 generic alias, including:
+
+    - Containers like ``list[int]``, ``Mapping[str, float]``,
+      ``tuple[int, ...]`` or ``tuple[int, str]``.
+    - ``Union``, ``Optional`` and ``X | Y`` unions.
+    - ``Literal``, ``Any``, ``Annotated``, ``type[X]``, ``NewType`` and
+      ``TypeVar`` annotations.
+    - Forward references (strings or ``typing.ForwardRef``), which are
+      resolved when first checked.
+
+    Each annotation is compiled into a checker the first time it is used and
+    the checker is cached, so later checks against the same annotation don't
+    re-inspect it.
+
+    Parameters
+    ----------
+    input_ : Any
+        The input to be checked.
+    expected_type : type, tuple[type] or annotation
+        The type or annotation `input_` is expected to match. A tuple is
+        treated as a union of its items.
+    validation_strategy : {"full", "sample", "sample(k)", "off"}, default=None
+        How many of the elements of containers are checked.
+
+        - If None, then the ``validation_strategy`` global configuration is used.
+        - If "full", then all elements of containers are checked.
+        - If "sample" or "sample(k)", then only the first, last and `k` randomly
+          selected elements of each container are checked (`k` defaults to the
+          ``validation_sample_size`` global configuration).
+        - If "off", then only the type of containers is checked.
+
+    random_state : int, default=None
+        Seed of the random number generator used to select elements when
+        sampling. If None, different elements are selected on each call.
+
+    Returns
+    -------
+    bool
+        Whether `input_` matches `expected_type`.
+
+    Raises
+    ------
+    TypeError
+        If `expected_type` can't be checked at runtime.
+    ForwardRefError
+        If a forward reference in `expected_type` can't be resolved.
+
+    See Also
+    --------
+    check_type :
+        Validate the input matches a type or annotation, raising an error if not.
+
+    Notes
+    -----
+    Iterators (e.g., ``Iterator[int]``) are only checked to be iterators, since
+    checking their elements would consume them. Generic classes other than
+    containers (e.g., ``Callable[[int], str]``) are checked against the
+    unsubscripted class.
+
+    Forward references are evaluated with builtins, the `typing` module and
+    imported top-level packages in scope, so classes from other modules should
+    be referenced by their fully qualified name (e.g., "pandas.DataFrame").
+
+    Examples
+    --------
+    >>> from typing import List, Mapping, Optional
+    >>> from predictably_core.validate import is_type
+    >>> is_type([1, 2, 3], List[int])
+    True
+    >>> is_type([1, 2.5], List[int])
+    False
+    >>> is_type({"a": 1.0}, Mapping[str, float])
+    True
+    >>> is_type(None, Optional[int])
+    True
+
+    Large containers can be checked by sampling their elements.
+
+    >>> is_type(list(range(100_000)), List[int], validation_strategy="sample")
+    True
+    """
+    strategy, sample_size = _resolve_validation_strategy(validation_strategy)
+    if _is_plain_type_input(expected_type):
+        return isinstance(input_, expected_type)
+    if isinstance(expected_type, tuple):
+        expected_type = typing.Union[expected_type]
+    checker = _compile(expected_type)
+    return checker(input_, _CheckOptions(strategy, sample_size, random_state))
+
+
+def _compile_expected_type(
+    expected_type: Any,
+    allow_none: bool,
+    use_subclass: bool,
+    input_error_name: str,
+) -> tuple[_Checker, str]:
+    """Compile the annotation passed to `check_type` and its error message.
+
+    Parameters
+    ----------
+    expected_type : Any
+        The annotation that the input is expected to match. A tuple is treated
+        as a union of its items.
+    allow_none : bool
+        Whether the input can be None in addition to matching `expected_type`.
+    use_subclass : bool
+        Whether the check should use issubclass instead of isinstance. Only
+        supported for types and tuples of types.
+    input_error_name : str
+        The name to refer to the input as in any raised error messages.
+
+    Returns
+    -------
+    checker : Callable
+        The checker of the annotation.
+    msg_prefix : str
+        The error message raised if the input is invalid, up to the name of the
+        type that was found.
+
+    Raises
+    ------
+    TypeError
+        If `expected_type` can't be checked at runtime or ``use_subclass=True``.
+    """
+    if use_subclass:
+        raise TypeError(
+            "`use_subclass=True` requires `expected_type` to be a type or tuple of "
+            f"types, but found {_annotation_to_str(expected_type)}."
+        )
+    if isinstance(expected_type, tuple):
+        expected_type = typing.Union[expected_type]
+    checker = _compile(expected_type)
+    type_msg = _annotation_to_str(expected_type)
+    if allow_none:
+        type_msg = f"{type_msg} or None"
+    return checker, f"`{input_error_name}` should be type {type_msg}, but found "
+
+
+def _check_annotation(
+    input_: Any,
+    expected_type: Any,
+    allow_none: bool,
+    use_subclass: bool,
+    input_error_name: str,
+    validation_strategy: str | None,
+    random_state: int | None,
+) -> Any:
+    """Check the input matches a `typing` annotation.
+
+    Implements :func:`check_type` when `expected_type` is an annotation rather
+    than a type or tuple of types.
+
+    Parameters
+    ----------
+    input_ : Any
+        The input to be type checked.
+    expected_type : Any
+        The annotation that `input_` is expected to match.
+    allow_none : bool
+        Whether `input_` can be None in addition to matching `expected_type`.
+    use_subclass : bool
+        Whether the check should use issubclass instead of isinstance. Only
+        supported for types and tuples of types.
+    input_error_name : str
+        The name to refer to `input_` as in any raised error messages.
+    validation_strategy : {"full", "sample", "sample(k)", "off"} or None
+        How many of the elements of containers are checked.
+    random_state : int or None
+        Seed of the random number generator used when sampling.
+
+    Returns
+    -------
+    Any
+        The input.
+
+    Raises
+    ------
+    TypeError
+        If `input_` doesn't match `expected_type`, `expected_type` can't be
+        checked at runtime or ``use_subclass=True``.
+    ForwardRefError
+        If a forward reference in `expected_type` can't be resolved.
+    """
+    # Compiling first means invalid annotations raise errors even if input_ is None
+    checker, msg_prefix = _compile_expected_type(
+        expected_type, allow_none, use_subclass, input_error_name
+    )
+    if allow_none and input_ is None:
+        return input_
+    strategy, sample_size = _resolve_validation_strategy(validation_strategy)
+    if not checker(input_, _CheckOptions(strategy, sample_size, random_state)):
+        raise TypeError(msg_prefix + f"{remove_type_text(type(input_))}.")
+    return input_
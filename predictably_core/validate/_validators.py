@@ -0,0 +1,395 @@
+#!/usr/bin/env python3 -u
+# copyright: predictably developers, BSD-3-Clause License (see LICENSE file)
+"""Reusable validators that are compiled once and called many times.
+
+The validators perform the same checks and raise the same errors as
+:func:`check_sequence`, :func:`check_mapping` and :func:`check_type`, but the
+type arguments and error messages are normalized once when the validator is
+created instead of on every call.
+
+If a validator is created with an explicit `validation_strategy`, it is also
+resolved once. Otherwise, the ``validation_strategy`` global configuration in
+effect when the validator is called is used.
+"""
+
+from __future__ import annotations
+
+import collections
+from collections.abc import Mapping
+from typing import Any, Callable, Sequence, TypeVar
+
+from predictably_core.utils._iter import (
+    _convert_scalar_seq_type_input_to_tuple,
+    scalar_to_sequence,
+)
+from predictably_core.utils._utils import remove_type_text
+from predictably_core.validate._types import (
+    _check_sequence_error_message,
+    _check_type_error_prefix,
+    _is_plain_type_input,
+    _resolve_validation_strategy,
+    _validate_elements,
+)
+from predictably_core.validate._typing import (
+    _Checker,
+    _CheckOptions,
+    _compile_expected_type,
+)
+
+__author__: list[str] = ["RNKuhns"]
+__all__: list[str] = ["mapping_validator", "sequence_validator", "type_validator"]
+
+T = TypeVar("T")
+
+
+def sequence_validator(
+    sequence_type: type | tuple[type, ...] | None = None,
+    element_type: type | tuple[type, ...] | None = None,
+    coerce_output_type_to: type | None = None,
+    coerce_scalar_input: bool = False,
+    sequence_name: str | None = None,
+    validation_strategy: str | None = None,
+    random_state: int | None = None,
+) -> Callable[[Any], Sequence[Any]]:
+    """Create a reusable validator equivalent to :func:`check_sequence`.
+
+    The returned callable accepts the input sequence as its only argument and
+    behaves like calling `check_sequence` with the arguments passed here.
+
+    Parameters
+    ----------
+    sequence_type : type or tuple[type], default=None
+        The allowed sequence type that the input can be an instance of.
+    element_type : type or tuple[type], default=None
+        The allowed type(s) for elements of the input.
+    coerce_output_type_to : sequence type, default=None
+        The sequence type that the output sequence should be coerced to.
+
+        - If None, then the output sequence is the same as input sequence.
+        - If a sequence type (e.g., list, tuple) is provided then the output sequence
+          is coerced to that type.
+
+    coerce_scalar_input : bool, default=False
+        Whether scalar input should be coerced to a sequence type prior to running
+        the check.
+    sequence_name : str, default=None
+        Name of the input to use if error messages are raised.
+    validation_strategy : {"full", "sample", "sample(k)", "off"}, default=None
+        How much of the input is validated. If None, then the
+        ``validation_strategy`` global configuration at the time the validator
+        is called is used. See :func:`check_sequence` for details.
+    random_state : int, default=None
+        Seed of the random number generator used to select elements when
+        sampling. If None, different elements are selected on each call.
+
+    Returns
+    -------
+    Callable[[Any], Sequence]
+        Validator returning its input (optionally coerced) if it has the expected
+        type and raising a TypeError otherwise.
+
+    Raises
+    ------
+    TypeError
+        If `sequence_type` or `element_type` is not a type or sequence of types.
+    ValueError
+        If `validation_strategy` is not a valid validation strategy.
+
+    See Also
+    --------
+    check_sequence :
+        Validate a sequence with a single function call.
+
+    Examples
+    --------
+    >>> from predictably_core.validate import sequence_validator
+    >>> validate_ints = sequence_validator(sequence_type=list, element_type=int)
+    >>> validate_ints([1, 2, 3])
+    [1, 2, 3]
+    >>> validate_ints([1, 2.5])  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+        ...
+    TypeError: Invalid sequence: Input sequence expected to be a list with ...
+    """
+    sequence_type_ = _convert_scalar_seq_type_input_to_tuple(
+        sequence_type,
+        type_input_subclass=collections.abc.Sequence,
+        type_input_error_name="sequence_type",
+    )
+    element_type_ = (
+        None
+        if element_type is None
+        else _convert_scalar_seq_type_input_to_tuple(
+            element_type, type_input_error_name="element_type"
+        )
+    )
+    msg = _check_sequence_error_message(sequence_type, element_type, sequence_name)
+    fixed_strategy = (
+        None
+        if validation_strategy is None
+        else _resolve_validation_strategy(validation_strategy)
+    )
+
+    # Sequence type used to coerce scalar input (mirrors check_sequence)
+    scalar_seq_type: type
+    if sequence_type is None:
+        scalar_seq_type = tuple
+    elif isinstance(sequence_type, tuple):
+        scalar_seq_type = sequence_type[0] if sequence_type[0] is not None else tuple
+    else:
+        scalar_seq_type = sequence_type
+
+    def validate_sequence(input_seq: Any) -> Sequence[Any]:
+        """Validate `input_seq` is a sequence with the expected types.
+
+        Parameters
+        ----------
+        input_seq : Any
+            The input sequence to be validated.
+
+        Returns
+        -------
+        Sequence
+            The input sequence if it has the expected type.
+        """
+        if coerce_scalar_input:
+            input_seq = scalar_to_sequence(input_seq, sequence_type=scalar_seq_type)
+        strategy, sample_size = fixed_strategy or _resolve_validation_strategy(None)
+        if strategy != "off" and (
+            not isinstance(input_seq, sequence_type_)
+            or (
+                element_type_ is not None
+                and not _validate_elements(
+                    input_seq, element_type_, strategy, sample_size, random_state
+                )
+            )
+        ):
+            raise TypeError(msg)
+        if coerce_output_type_to is not None:
+            return coerce_output_type_to(input_seq)  # type: ignore[no-any-return]
+        return input_seq  # type: ignore[no-any-return]
+
+    return validate_sequence
+
+
+def mapping_validator(
+    map_type: type[Mapping] = Mapping,
+    key_type: type | Sequence[type] | None = None,
+    value_type: type | Sequence[type] | None = None,
+    input_error_name: str = "input_",
+    validation_strategy: str | None = None,
+    random_state: int | None = None,
+) -> Callable[[T], T]:
+    """Create a reusable validator equivalent to :func:`check_mapping`.
+
+    The returned callable accepts the input mapping as its only argument and
+    behaves like calling `check_mapping` with the arguments passed here.
+
+    Parameters
+    ----------
+    map_type : type, default=Mapping
+        The expected type of the mapping.
+    key_type : type or tuple[type], default=None
+        The allowed type(s) for keys of the mapping.
+    value_type : type or tuple[type], default=None
+        The allowed type(s) for values of the mapping.
+    input_error_name : str, default="input_"
+        The name to refer to the input as in any raised error messages.
+    validation_strategy : {"full", "sample", "sample(k)", "off"}, default=None
+        How much of the input is validated. If None, then the
+        ``validation_strategy`` global configuration at the time the validator
+        is called is used. See :func:`check_mapping` for details.
+    random_state : int, default=None
+        Seed of the random number generator used to select keys and values when
+        sampling. If None, different keys and values are selected on each call.
+
+    Returns
+    -------
+    Callable[[Any], Mapping]
+        Validator returning its input unchanged if it has the expected type
+        and raising a ValueError otherwise.
+
+    Raises
+    ------
+    TypeError
+        If `key_type` or `value_type` is not a type or sequence of types.
+    ValueError
+        If `validation_strategy` is not a valid validation strategy.
+
+    See Also
+    --------
+    check_mapping :
+        Validate a mapping with a single function call.
+
+    Examples
+    --------
+    >>> from predictably_core.validate import mapping_validator
+    >>> validate_map = mapping_validator(key_type=str, value_type=int)
+    >>> validate_map({"a": 1})
+    {'a': 1}
+    >>> validate_map({"a": 1.5})
+    Traceback (most recent call last):
+        ...
+    ValueError: The mapping `input_` is invalid.
+    """
+    key_type_ = (
+        None
+        if key_type is None
+        else _convert_scalar_seq_type_input_to_tuple(
+            key_type, type_input_error_name="key_type"
+        )
+    )
+    value_type_ = (
+        None
+        if value_type is None
+        else _convert_scalar_seq_type_input_to_tuple(
+            value_type, type_input_error_name="value_type"
+        )
+    )
+    msg = f"The mapping `{input_error_name}` is invalid."
+    fixed_strategy = (
+        None
+        if validation_strategy is None
+        else _resolve_validation_strategy(validation_strategy)
+    )
+
+    def validate_mapping(input_: T) -> T:
+        """Validate `input_` is a mapping with the expected types.
+
+        Parameters
+        ----------
+        input_ : Any
+            The input mapping to be validated.
+
+        Returns
+        -------
+        Mapping
+            The input mapping unchanged.
+        """
+        strategy, sample_size = fixed_strategy or _resolve_validation_strategy(None)
+        if strategy == "off":
+            return input_
+        if (
+            not isinstance(input_, map_type)
+            or (
+                key_type_ is not None
+                and not _validate_elements(
+                    input_, key_type_, strategy, sample_size, random_state
+                )
+            )
+            or (
+                value_type_ is not None
+                and not _validate_elements(
+                    input_.values(), value_type_, strategy, sample_size, random_state
+                )
+            )
+        ):
+            raise ValueError(msg)
+        return input_
+
+    return validate_mapping
+
+
+def type_validator(
+    expected_type: type | tuple[type, ...],
+    allow_none: bool = False,
+    use_subclass: bool = False,
+    input_error_name: str = "input_",
+    validation_strategy: str | None = None,
+    random_state: int | None = None,
+) -> Callable[[T], T]:
+    """Create a reusable validator equivalent to :func:`check_type`.
+
+    The returned callable accepts the input as its only argument and behaves
+    like calling `check_type` with the arguments passed here.
+
+    Parameters
+    ----------
+    expected_type : type, tuple[type] or annotation
+        The type or `typing` annotation that the input is expected to match.
+        Annotations are compiled once, when the validator is created.
+    allow_none : bool, default=False
+        Whether the input can be None in addition to being instance of
+        `expected_type`.
+    use_subclass : bool, default=False
+        Whether to check the type using issubclass instead of isinstance.
+    input_error_name : str, default="input_"
+        The name to refer to the input as in any raised error messages.
+    validation_strategy : {"full", "sample", "sample(k)", "off"}, default=None
+        Whether the input is validated. If None, then the ``validation_strategy``
+        global configuration at the time the validator is called is used. See
+        :func:`check_type` for details.
+    random_state : int, default=None
+        Seed of the random number generator used to select elements of
+        containers in an `expected_type` annotation when sampling.
+
+    Returns
+    -------
+    Callable[[Any], Any]
+        Validator returning its input unchanged if it has the expected type
+        and raising a TypeError otherwise.
+
+    Raises
+    ------
+    TypeError
+        If `expected_type` is not a type, tuple of types or an annotation that
+        can be checked at runtime.
+    ValueError
+        If `validation_strategy` is not a valid validation strategy.
+
+    See Also
+    --------
+    check_type :
+        Validate the type of an input with a single function call.
+
+    Examples
+    --------
+    >>> from predictably_core.validate import type_validator
+    >>> validate_number = type_validator((int, float))
+    >>> validate_number(7)
+    7
+    >>> validate_number("7")
+    Traceback (most recent call last):
+        ...
+    TypeError: `input_` should be type int or float, but found str.
+    """
+    checker: _Checker | None = None
+    if _is_plain_type_input(expected_type):
+        msg_prefix = _check_type_error_prefix(
+            expected_type, allow_none, use_subclass, input_error_name
+        )
+    else:
+        checker, msg_prefix = _compile_expected_type(
+            expected_type, allow_none, use_subclass, input_error_name
+        )
+    type_check = issubclass if use_subclass else isinstance
+    fixed_strategy = (
+        None
+        if validation_strategy is None
+        else _resolve_validation_strategy(validation_strategy)
+    )
+
+    def validate_type(input_: T) -> T:
+        """Validate `input_` has the expected type.
+
+        Parameters
+        ----------
+        input_ : Any
+            The input to be type checked.
+
+        Returns
+        -------
+        Any
+            The input.
+        """
+        strategy, sample_size = fixed_strategy or _resolve_validation_strategy(None)
+        if strategy == "off" or (allow_none and input_ is None):
+            return input_
+        if checker is None:
+            if input_ is not None and type_check(input_, expected_type):  # type: ignore[arg-type]
+                return input_
+        elif checker(input_, _CheckOptions(strategy, sample_size, random_state)):
+            return input_
+        raise TypeError(msg_prefix + f"{remove_type_text(type(input_))}.")
+
+    return validate_type
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3 -u
+# copyright: predictably developers, BSD-3-Clause License (see LICENSE file)
+"""Tests of the validation of array-like inputs.
+
+tests in this module test the functionality of:
+
+- is_array_like
+- check_array_like
+"""
+
+from __future__ import annotations
+
+import array
+import math
+import tracemalloc
+
+import pytest
+
+from predictably_core.validate import (
+    _arrays,
+    check_array_like,
+    is_array_like,
+    validation_context,
+)
+
+__author__: list[str] = ["RNKuhns"]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def value_backend(request, monkeypatch):
+    """Check values with NumPy or by iterating over the buffer."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(_arrays, "_get_numpy", lambda: None)
+    return request.param
+
+
+def test_is_array_like():
+    """Test is_array_like identifies buffers and NumPy arrays."""
+    assert is_array_like(array.array("d", [1.0]))
+    assert is_array_like(b"abc")
+    assert is_array_like(memoryview(bytearray(3)))
+    for input_ in ([1.0], (1.0,), "abc", 7, None):
+        assert not is_array_like(input_)
+
+    np = pytest.importorskip("numpy")
+    assert is_array_like(np.zeros((2, 3)))
+    assert is_array_like(np.zeros((4, 3))[::2])
+
+
+def test_check_array_like_returns_input():
+    """Test check_array_like returns the input itself."""
+    values = array.array("d", [1.0, 2.0])
+    assert check_array_like(values, ndim=1, min_value=0.0) is values
+
+
+def test_check_array_like_not_array_like():
+    """Test check_array_like raises a TypeError if input isn't array-like."""
+    with pytest.raises(
+        TypeError, match="`values` should be array-like, but found list"
+    ):
+        check_array_like([1.0, 2.0], input_error_name="values")
+
+
+def test_check_array_like_shape():
+    """Test check_array_like checks the shape and number of dimensions."""
+    values = memoryview(bytearray(24)).cast("d", (3, 1))
+    assert check_array_like(values, ndim=2, shape=(3, None)) is values
+    assert check_array_like(values, shape=(3, 1)) is values
+    with pytest.raises(ValueError, match="should have 1 dimension"):
+        check_array_like(values, ndim=1)
+    with pytest.raises(ValueError, match=r"should have shape \(any, 2\)"):
+        check_array_like(values, shape=(None, 2))
+    with pytest.raises(ValueError, match=r"should have shape \(3,\)"):
+        check_array_like(values, shape=(3,))
+
+
+def test_check_array_like_dtype_kind():
+    """Test check_array_like checks the kind of the elements."""
+    assert check_array_like(array.array("i", [1]), dtype_kind="iu")
+    assert check_array_like(array.array("B", [1]), dtype_kind="iu")
+    assert check_array_like(array.array("f", [1.0]), dtype_kind="f")
+    assert check_array_like(memoryview(b"\x01").cast("?"), dtype_kind="b")
+    with pytest.raises(TypeError, match="elements of kind 'f', but found 'i'"):
+        check_array_like(array.array("i", [1]), dtype_kind="f")
+
+    np = pytest.importorskip("numpy")
+    assert check_array_like(np.zeros(2, dtype=complex), dtype_kind="c") is not None
+    with pytest.raises(TypeError, match="'i' or 'u', but found 'f'"):
+        check_array_like(np.zeros(2), dtype_kind="iu")
+
+
+def test_check_array_like_contiguous():
+    """Test check_array_like checks the memory layout."""
+    np = pytest.importorskip("numpy")
+    c_order = np.zeros((3, 2))
+    f_order = np.asfortranarray(c_order)
+    strided = np.zeros((6, 2))[::2]
+    check_array_like(c_order, contiguous="C")
+    check_array_like(f_order, contiguous="F")
+    check_array_like(f_order, contiguous="any")
+    check_array_like(memoryview(strided), contiguous=None)
+    with pytest.raises(ValueError, match="should be C contiguous"):
+        check_array_like(f_order, contiguous="C")
+    with pytest.raises(ValueError, match="should be C or F contiguous"):
+        check_array_like(memoryview(strided), contiguous="any")
+    with pytest.raises(ValueError, match="`contiguous` should be"):
+        check_array_like(c_order, contiguous="K")
+
+
+def test_check_array_like_values(value_backend):
+    """Test check_array_like checks NaN, infinite and range of values."""
+    values = array.array("d", [0.5, math.nan, 2.5])
+    check_array_like(values, min_value=0.5, max_value=2.5, allow_inf=False)
+    with pytest.raises(ValueError, match="should not contain NaN values"):
+        check_array_like(values, allow_nan=False)
+    with pytest.raises(ValueError, match="minimum value 0.5"):
+        check_array_like(values, min_value=1)
+    with pytest.raises(ValueError, match="maximum value 2.5"):
+        check_array_like(values, max_value=2)
+    with pytest.raises(ValueError, match="should not contain infinite values"):
+        check_array_like(array.array("d", [1.0, -math.inf]), allow_inf=False)
+
+    integers = memoryview(array.array("q", range(-3, 9))).cast("B").cast("q", (3, 4))
+    check_array_like(integers, min_value=-3, max_value=8, allow_nan=False)
+    with pytest.raises(ValueError, match="minimum value -3"):
+        check_array_like(integers, min_value=0)
+
+    for buffer in (b"\x01\x05", bytearray(b"\x01\x05")):
+        check_array_like(buffer, min_value=1, max_value=5)
+        with pytest.raises(ValueError, match="minimum value 1"):
+            check_array_like(buffer, min_value=2)
+        with pytest.raises(ValueError, match="maximum value 5"):
+            check_array_like(buffer, max_value=4)
+
+    # Empty and all NaN inputs have no values to compare
+    check_array_like(array.array("d"), min_value=0, allow_nan=False)
+    check_array_like(array.array("d", [math.nan]), min_value=0)
+
+
+def test_check_array_like_strided_values(value_backend):
+    """Test check_array_like checks the values of non-contiguous inputs."""
+    np = pytest.importorskip("numpy")
+    values = memoryview(np.arange(12.0).reshape(3, 4)[:, 1::2])
+    check_array_like(values, min_value=1, max_value=11)
+    with pytest.raises(ValueError, match="minimum value 1.0"):
+        check_array_like(values, min_value=2)
+    with pytest.raises(ValueError, match="maximum value 11.0"):
+        check_array_like(values, max_value=10)
+
+
+def test_check_array_like_non_numeric_values():
+    """Test check_array_like raises a TypeError for non-numeric value checks."""
+    with pytest.raises(TypeError, match="should have numeric elements"):
+        check_array_like(memoryview(b"ab").cast("c"), min_value=0)
+
+    np = pytest.importorskip("numpy")
+    values = np.array([1 + 1j, complex(math.inf, 0)])
+    check_array_like(values, allow_nan=False)
+    with pytest.raises(ValueError, match="should not contain infinite values"):
+        check_array_like(values, allow_inf=False)
+    with pytest.raises(TypeError, match="complex elements"):
+        check_array_like(values, min_value=0)
+
+
+def test_check_array_like_does_not_copy():
+    """Test check_array_like checks values without copying the input."""
+    np = pytest.importorskip("numpy")
+    values = np.arange(400_000.0).reshape(1000, 400)[:, ::2]
+    buffer = array.array("d", range(200_000))
+    for input_ in (values, buffer, memoryview(buffer)):
+        tracemalloc.start()
+        try:
+            check_array_like(input_, min_value=0, allow_nan=False, allow_inf=False)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        # A copy would allocate at least 1.6MB
+        assert peak < 100_000
+
+
+def test_check_array_like_off():
+    """Test check_array_like skips validation when validation is off."""
+    assert check_array_like([1.0], validation_strategy="off") == [1.0]
+    with validation_context("off"):
+        assert check_array_like("abc", ndim=2) == "abc"
+    with pytest.raises(TypeError):
+        check_array_like([1.0], validation_strategy="full")
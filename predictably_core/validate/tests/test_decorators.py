@@ -0,0 +1,155 @@
+#!/usr/bin/env python3 -u
+# copyright: predictably developers, BSD-3-Clause License (see LICENSE file)
+"""Tests of the decorators that validate function arguments.
+
+tests in this module test the functionality of:
+
+- validate_params
+"""
+
+from __future__ import annotations
+
+import inspect
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from predictably_core.config import config_context
+from predictably_core.core._base import BaseObject
+from predictably_core.validate import validate_params
+
+__author__: list[str] = ["RNKuhns"]
+
+# Annotations use typing aliases so they can be evaluated on Python 3.8
+
+
+class _ValidatedObject(BaseObject):
+    """BaseObject with a validated __init__."""
+
+    @validate_params
+    def __init__(
+        self,
+        alpha: float = 1.0,
+        names: Optional[List[str]] = None,  # noqa: UP006, UP007
+        component: Optional[_ValidatedObject] = None,  # noqa: UP007
+        anything=None,
+    ) -> None:
+        self.alpha = alpha
+        self.names = names
+        self.component = component
+        self.anything = anything
+        super().__init__()
+
+    @validate_params(exclude=["unchecked"])
+    def transform(self, values: List[float], unchecked: int = 0) -> list[float]:  # noqa: UP006
+        """Scale the values."""
+        return [v * self.alpha for v in values]
+
+
+@validate_params
+def _varargs(first: int, *args: str, flag: bool = False, **kwargs: float) -> int:
+    """Return the first argument after validating all arguments."""
+    return first
+
+
+def test_validate_params_validates_arguments() -> None:
+    """Test validate_params raises errors for invalid arguments."""
+    obj = _ValidatedObject(2.0, names=["a"], component=_ValidatedObject())
+    assert obj.transform([1.0, 2.0]) == [2.0, 4.0]
+    assert obj.transform([1.0], unchecked="not validated") == [2.0]
+    assert _ValidatedObject(anything=object()).names is None
+
+    with pytest.raises(TypeError, match="^`alpha` should be type float, but found str"):
+        _ValidatedObject("2")
+    with pytest.raises(TypeError, match="^`names` should be type"):
+        _ValidatedObject(names=["a", 1])
+    with pytest.raises(TypeError, match="^`component` should be type"):
+        _ValidatedObject(component=BaseObject())
+    with pytest.raises(TypeError, match="^`values` should be type List"):
+        obj.transform((1.0, 2.0))
+
+
+def test_validate_params_varargs() -> None:
+    """Test validate_params validates *args and **kwargs."""
+    assert _varargs(1, "a", "b", flag=True, x=1.0, y=2.0) == 1
+    with pytest.raises(TypeError, match="^`first` should be type int"):
+        _varargs("1")
+    with pytest.raises(TypeError, match="^`args` should be type str"):
+        _varargs(1, "a", 2)
+    with pytest.raises(TypeError, match="^`flag` should be type bool"):
+        _varargs(1, flag=1)
+    with pytest.raises(TypeError, match="^`kwargs` should be type float"):
+        _varargs(1, x="1.0")
+
+
+def test_validate_params_keeps_base_object_parameters() -> None:
+    """Test decorated __init__ keeps the BaseObject parameter interface."""
+    assert _ValidatedObject._get_param_names() == [
+        "alpha",
+        "anything",
+        "component",
+        "names",
+    ]
+    assert next(iter(inspect.signature(_ValidatedObject.__init__).parameters)) == "self"
+    obj = _ValidatedObject(3.0)
+    assert obj.clone().get_params() == obj.get_params()
+    assert repr(obj) == "_ValidatedObject(alpha=3.0)"
+
+
+def test_validate_params_validates_set_params() -> None:
+    """Test set_params uses the validators of a decorated __init__."""
+    validators = _ValidatedObject._get_param_validators()
+    assert sorted(validators) == ["alpha", "component", "names"]
+    assert BaseObject._get_param_validators() == {}
+
+    obj = _ValidatedObject(component=_ValidatedObject())
+    obj.set_params(alpha=0.5, component__names=["b"])
+    assert obj.alpha == 0.5
+    assert obj.component.names == ["b"]
+    with pytest.raises(TypeError, match="^`alpha` should be type float"):
+        obj.set_params(alpha="0.5")
+    with pytest.raises(TypeError, match="^`names` should be type"):
+        obj.set_params(component__names="b")
+    assert obj.alpha == 0.5
+
+
+def test_validate_params_config() -> None:
+    """Test validate_params respects the global configuration."""
+    with config_context(validation_strategy="off"):
+        assert _ValidatedObject("2").alpha == "2"
+
+    with config_context(validate_params=False):
+
+        def func(x: int) -> int:
+            return x
+
+        assert validate_params(func) is func
+
+    with config_context(validation_strategy="sample", validation_sample_size=1):
+        values = [1.0] * 1_000
+        values[500] = "a"
+        assert len(_ValidatedObject().transform(values[:500] + values[501:])) == 999
+
+
+def test_validate_params_unresolvable_annotation() -> None:
+    """Test annotations that can't be resolved raise a ForwardRefError."""
+    from predictably_core.core._exceptions import ForwardRefError
+
+    @validate_params
+    def func(x: NotDefinedAnywhere) -> None:  # noqa: F821
+        return None
+
+    with pytest.raises(ForwardRefError):
+        func(1)
+
+
+def test_validate_params_without_annotations() -> None:
+    """Test functions without annotations, or annotated Any, accept anything."""
+
+    @validate_params
+    def func(x, y: Any, z: Dict[str, Any] = None):  # noqa: RUF013, UP006
+        return x, y, z
+
+    assert func(1, "a") == (1, "a", None)
+    with pytest.raises(TypeError, match="^`z` should be type"):
+        func(1, "a", z=[1])
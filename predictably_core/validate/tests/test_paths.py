@@ -0,0 +1,142 @@
+#!/usr/bin/env python3 -u
+# copyright: predictably developers, BSD-3-Clause License (see LICENSE file)
+"""Tests of the batch validation of file system paths.
+
+tests in this module test the functionality of:
+
+- check_paths
+- PathsReport
+"""
+
+from __future__ import annotations
+
+import os
+import pathlib
+
+import pytest
+
+from predictably_core.validate import PathFailure, PathsReport, _paths, check_paths
+
+__author__: list[str] = ["RNKuhns"]
+
+
+@pytest.fixture
+def folder(tmp_path):
+    """Create a folder with files of different sizes and a sub-folder."""
+    for i in range(6):
+        (tmp_path / f"file_{i}.txt").write_text("x" * i)
+    (tmp_path / "sub").mkdir()
+    return tmp_path
+
+
+def _reasons(report: PathsReport) -> list[tuple[int, str]]:
+    return [(failure.index, failure.reason) for failure in report.failures]
+
+
+@pytest.mark.parametrize("n_jobs", [None, 1, 3])
+def test_check_paths(folder, n_jobs):
+    """Test check_paths reports missing paths and paths of the wrong kind."""
+    paths = [folder / f"file_{i}.txt" for i in range(6)]
+    paths += [str(folder / "sub"), folder / "missing.txt", 7]
+    report = check_paths(paths, n_jobs=n_jobs)
+    assert not report.is_valid
+    assert _reasons(report) == [(7, "missing"), (8, "invalid_type")]
+    assert report.valid_paths == [pathlib.Path(p) for p in paths[:7]]
+    assert report.failures[1] == PathFailure(8, 7, "invalid_type")
+
+    report = check_paths(paths[:7], kind="file", n_jobs=n_jobs)
+    assert _reasons(report) == [(6, "not_file")]
+    report = check_paths(paths[:7], kind="dir", n_jobs=n_jobs)
+    assert _reasons(report) == [(i, "not_dir") for i in range(6)]
+
+
+def test_check_paths_size(folder):
+    """Test check_paths checks the size of files."""
+    paths = [folder / f"file_{i}.txt" for i in range(6)] + [folder / "sub"]
+    report = check_paths(paths, min_size=2, max_size=4)
+    assert _reasons(report) == [
+        (0, "too_small"),
+        (1, "too_small"),
+        (5, "too_large"),
+    ]
+
+
+@pytest.mark.skipif(
+    os.name == "nt" or (hasattr(os, "geteuid") and os.geteuid() == 0),
+    reason="File permissions aren't enforced for this user.",
+)
+def test_check_paths_readable(folder):
+    """Test check_paths checks paths are readable."""
+    unreadable = folder / "file_3.txt"
+    unreadable.chmod(0)
+    try:
+        report = check_paths([folder / "file_2.txt", unreadable], readable=True)
+    finally:
+        unreadable.chmod(0o644)
+    assert _reasons(report) == [(1, "not_readable")]
+
+
+def test_check_paths_special_names(folder, monkeypatch):
+    """Test check_paths handles paths missing from directory listings."""
+    monkeypatch.chdir(folder / "sub")
+    paths = ["..", ".", "../file_1.txt", pathlib.Path(folder.anchor), "nope"]
+    report = check_paths(paths)
+    assert _reasons(report) == [(4, "missing")]
+
+
+def test_check_paths_dangling_symlink(folder):
+    """Test check_paths reports dangling symlinks alone and in a directory scan."""
+    dangling = folder / "dangling"
+    try:
+        dangling.symlink_to(folder / "missing.txt")
+    except (OSError, NotImplementedError):
+        pytest.skip("Symlinks can't be created on this platform.")
+    others = [folder / f"file_{i}.txt" for i in range(_paths._SCANDIR_MIN_PATHS)]
+    assert _reasons(check_paths([dangling])) == [(0, "missing")]
+    assert _reasons(check_paths([dangling, *others])) == [(0, "missing")]
+
+
+def test_check_paths_scans_each_directory_once(folder, monkeypatch):
+    """Test check_paths lists each directory once instead of stat-ing paths."""
+    scanned = []
+    scandir = os.scandir
+
+    def counting_scandir(path):
+        scanned.append(path)
+        return scandir(path)
+
+    monkeypatch.setattr(_paths.os, "scandir", counting_scandir)
+    monkeypatch.setattr(_paths, "_stat_path", pytest.fail)
+    paths = [folder / f"file_{i}.txt" for i in range(6)]
+    assert check_paths(paths * 2, kind="file").is_valid
+    assert scanned == [str(folder)]
+
+
+def test_check_paths_must_exist_false(folder):
+    """Test check_paths only validates types if paths don't need to exist."""
+    report = check_paths([folder / "missing.txt", None], must_exist=False)
+    assert _reasons(report) == [(1, "invalid_type")]
+
+
+def test_check_paths_raise_if_failed(folder):
+    """Test PathsReport.raise_if_failed summarizes all failures."""
+    check_paths([folder / "file_1.txt"]).raise_if_failed()
+    report = check_paths([folder / f"missing_{i}" for i in range(12)])
+    with pytest.raises(ValueError, match=r"`inputs` has 12 invalid path\(s\)") as e:
+        report.raise_if_failed(paths_error_name="inputs")
+    assert "(missing)" in str(e.value)
+    assert str(e.value).endswith("and 2 more.")
+
+
+def test_check_paths_invalid_arguments():
+    """Test check_paths raises an error for invalid arguments."""
+    with pytest.raises(ValueError, match="`kind` should be"):
+        check_paths([], kind="link")
+    with pytest.raises(ValueError, match="`n_jobs` should be"):
+        check_paths([], n_jobs=0)
+
+
+def test_check_paths_off():
+    """Test check_paths converts paths without validation when off."""
+    report = check_paths(["a", "b"], validation_strategy="off")
+    assert report == PathsReport([pathlib.Path("a"), pathlib.Path("b")], [])
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3 -u
+# copyright: predictably developers, BSD-3-Clause License (see LICENSE file)
+"""Tests of the validation reports that collect every problem.
+
+tests in this module test the functionality of:
+
+- sequence_report
+- mapping_report
+- type_report
+- check_sequence, check_mapping and check_type with ``collect_errors=True``
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Set, Tuple
+
+import pytest
+
+from predictably_core.core._exceptions import ValidationReportError
+from predictably_core.validate import (
+    ValidationIssue,
+    ValidationReport,
+    check_mapping,
+    check_sequence,
+    check_type,
+    mapping_report,
+    sequence_report,
+    type_report,
+)
+
+__author__: list[str] = ["RNKuhns"]
+
+
+def test_sequence_report():
+    """Test sequence_report records the index and type of invalid elements."""
+    report = sequence_report([1, "a", 2, None, 3.0], element_type=int)
+    assert isinstance(report, ValidationReport)
+    assert not report.is_valid
+    assert report.n_issues == 3
+    assert report.issues == [
+        ValidationIssue("element", 1, str),
+        ValidationIssue("element", 3, type(None)),
+        ValidationIssue("element", 4, float),
+    ]
+
+    report = sequence_report([1, 2], sequence_type=list, element_type=int)
+    assert report.is_valid
+    assert report.issues == []
+    assert report.render() == ""
+    report.raise_if_failed()
+
+
+def test_sequence_report_wrong_container():
+    """Test sequence_report reports the input itself if it has the wrong type."""
+    report = sequence_report((1, "a"), sequence_type=list, element_type=int)
+    assert report.issues == [ValidationIssue("input", None, tuple)]
+    assert report.render() == (
+        "Input has 1 invalid item(s): the input is tuple (expected list)."
+    )
+
+
+def test_report_max_reported():
+    """Test reports keep at most `max_reported` issues but count all of them."""
+    report = sequence_report(["a"] * 1000, element_type=int, max_reported=3)
+    assert report.n_issues == 1000
+    assert [issue.location for issue in report.issues] == [0, 1, 2]
+    assert report.render().endswith("and 997 more.")
+    with pytest.raises(ValueError, match="`max_reported` should be"):
+        sequence_report([], max_reported=0)
+
+
+def test_report_renders_lazily(monkeypatch):
+    """Test issues are collected without formatting messages."""
+    from predictably_core.validate import _report
+
+    def fail(*args, **kwargs):
+        raise AssertionError("A message was formatted.")
+
+    monkeypatch.setattr(_report, "remove_type_text", fail)
+    monkeypatch.setattr(_report, "_annotation_to_str", fail)
+    sequence_report(list(range(10)) + ["a"] * 10, element_type=int)
+    mapping_report({1: "a"}, key_type=str, value_type=int)
+    type_report({"a": [1]}, Dict[str, int])
+
+
+def test_mapping_report():
+    """Test mapping_report records invalid keys and values in mapping order."""
+    config = {"a": 1, 2: 2, "c": "x", 4: None}
+    report = mapping_report(
+        config, key_type=str, value_type=int, input_error_name="cfg"
+    )
+    assert report.n_issues == 4
+    assert report.issues == [
+        ValidationIssue("key", 2, int),
+        ValidationIssue("value", "c", str),
+        ValidationIssue("key", 4, int),
+        ValidationIssue("value", 4, type(None)),
+    ]
+    assert report.render() == (
+        "`cfg` has 4 invalid item(s): key 2 is int (expected str), value of key 'c' "
+        "is str (expected int), key 4 is int (expected str), value of key 4 is "
+        "NoneType (expected int)."
+    )
+    assert mapping_report(config, value_type=(int, str, type(None))).is_valid
+    assert mapping_report([1], input_error_name="cfg").issues == [
+        ValidationIssue("input", None, list)
+    ]
+
+
+def test_type_report():
+    """Test type_report reports invalid elements of container annotations."""
+    report = type_report([1, "a", [2]], List[int])
+    assert [(i.location, i.found_type) for i in report.issues] == [(1, str), (2, list)]
+    assert report.expected["element"] is int
+
+    report = type_report((1, "a"), Tuple[int, ...])
+    assert report.issues == [ValidationIssue("element", 1, str)]
+
+    report = type_report({"a": [1], 2: "b"}, Dict[str, List[int]])
+    assert report.issues == [
+        ValidationIssue("key", 2, int),
+        ValidationIssue("value", 2, str),
+    ]
+    assert "value of key 2 is str (expected List[int])" in report.render()
+
+    report = type_report({1, "a"}, Set[int])
+    assert [issue.found_type for issue in report.issues] == [str]
+
+
+def test_type_report_whole_input():
+    """Test type_report reports the input when elements can't be reported."""
+    assert type_report(None, int, allow_none=True).is_valid
+    assert type_report(3, (int, float)).is_valid
+    assert type_report(None, Optional[int]).is_valid
+    for input_, expected_type in [
+        ("a", int),
+        ((1, "a"), List[int]),
+        ((1, "a"), Tuple[int, int]),
+        (None, int),
+    ]:
+        report = type_report(input_, expected_type)
+        assert report.issues == [ValidationIssue("input", None, type(input_))]
+    report = type_report("a", int, allow_none=True)
+    assert "the input is str (expected int or NoneType)" in report.render()
+    assert not type_report(int, str, use_subclass=True).is_valid
+
+
+def test_check_functions_collect_errors():
+    """Test the check functions raise a single error summarizing all issues."""
+    with pytest.raises(ValidationReportError, match="element 1 is str") as e:
+        check_sequence([1, "a", None], element_type=int, collect_errors=True)
+    assert e.value.report.n_issues == 2
+    assert isinstance(e.value, TypeError)
+
+    with pytest.raises(ValueError, match="`cfg` has 1 invalid"):
+        check_mapping(
+            {"a": "b", 1: 2}, key_type=str, input_error_name="cfg", collect_errors=True
+        )
+    with pytest.raises(TypeError, match="element 0 is str"):
+        check_type(["a"], List[int], collect_errors=True)
+
+    seq = [1, 2]
+    assert check_sequence(seq, element_type=int, collect_errors=True) is seq
+    assert check_sequence(
+        1, element_type=int, coerce_scalar_input=True, collect_errors=True
+    ) == (1,)
+    assert check_mapping({"a": 1}, key_type=str, collect_errors=True) == {"a": 1}
+    assert check_type([1], List[int], collect_errors=True) == [1]
+    assert check_type(["a"], List[int], collect_errors=True, validation_strategy="off")
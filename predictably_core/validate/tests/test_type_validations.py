@@ -7,6 +7,8 @@
 
 tests in this module test the functionality of:
 
+- check_async_iterable
+- check_iterable
 - check_path
 - check_type
 - check_sequence
@@ -17,6 +19,7 @@ tests in this module test the functionality of:
 from __future__ import annotations
 
 import pathlib
+import tracemalloc
 from collections import defaultdict
 
 import numpy as np
@@ -24,6 +27,8 @@ import pytest
 
 from predictably_core.core._base import BaseEstimator, BaseObject
 from predictably_core.validate import (
+    check_async_iterable,
+    check_iterable,
     check_mapping,
     check_path,
     check_sequence,
@@ -465,3 +470,325 @@ def test_is_scalar_nan() -> None:
     assert _is_scalar_nan(None) is False
     assert _is_scalar_nan("") is False
     assert _is_scalar_nan([np.nan]) is False
+
+
+class _VirtualSequence:
+    """Class registered as a virtual subclass of an ABC in tests."""
+
+
+class _SpoofedClass:
+    """Class whose instances claim to be another class."""
+
+    @property
+    def __class__(self):
+        return int
+
+
+@pytest.mark.parametrize("n", (3, 1000))
+def test_is_sequence_element_type_with_abc_and_virtual_subclass(n) -> None:
+    """Test element type checks of short and long inputs with ABCs."""
+    import abc
+    import numbers
+
+    class SomeABC(abc.ABC):
+        @abc.abstractmethod
+        def some_method(self):
+            """Abstract method."""
+
+    assert is_sequence([1, 2.5] * n, element_type=numbers.Number) is True
+    assert is_sequence([1, "a"] * n, element_type=numbers.Number) is False
+
+    assert is_sequence([_VirtualSequence()] * n, element_type=SomeABC) is False
+    SomeABC.register(_VirtualSequence)
+    assert is_sequence([_VirtualSequence()] * n, element_type=SomeABC) is True
+
+    # Instances overriding __class__ are checked individually
+    assert is_sequence([1, _SpoofedClass()] * n, element_type=int) is True
+    assert is_mapping({i: _SpoofedClass() for i in range(n)}, value_type=int) is True
+
+
+def test_is_sequence_element_type_with_instance_dependent_check() -> None:
+    """Test element type checks when isinstance depends on the instance."""
+    from typing import Protocol, runtime_checkable
+
+    @runtime_checkable
+    class HasFoo(Protocol):
+        foo: int
+
+    class Foo:
+        pass
+
+    with_foo = Foo()
+    with_foo.foo = 1
+    assert is_sequence([with_foo] * 100, element_type=HasFoo) is True
+    assert is_sequence([with_foo] * 100 + [Foo()], element_type=HasFoo) is False
+
+
+def test_is_sequence_element_type_of_homogeneous_containers() -> None:
+    """Test element type checks of containers with a single element type."""
+    import array
+
+    assert is_sequence(range(10**12), element_type=int) is True
+    assert is_sequence(range(10**12), element_type=float) is False
+    assert is_sequence(range(0), element_type=float) is True
+
+    assert is_sequence(array.array("d", [1.0] * 100), element_type=float) is True
+    assert is_sequence(array.array("l", [1] * 100), element_type=float) is False
+    assert is_sequence(array.array("l", [1] * 100), element_type=int) is True
+
+    # NumPy arrays are validated based on the element type produced by iteration
+    from predictably_core.validate._types import _all_isinstance
+
+    assert _all_isinstance(np.ones(100), (np.float64,)) is True
+    assert _all_isinstance(np.ones(100), (int,)) is False
+    assert _all_isinstance(np.ones((100, 2)), (np.ndarray,)) is True
+    assert _all_isinstance(np.array([1, "a"] * 50, dtype=object), (int,)) is False
+    assert _all_isinstance(np.array([1] * 100, dtype=object), (int,)) is True
+
+
+def test_validation_strategy_off_skips_element_checks() -> None:
+    """Test "off" validation strategy only checks container types or nothing."""
+    invalid_seq = [1, "a"]
+    assert is_sequence(invalid_seq, element_type=int) is False
+    assert is_sequence(invalid_seq, element_type=int, validation_strategy="off")
+    assert not is_sequence(7, element_type=int, validation_strategy="off")
+    assert check_sequence(invalid_seq, element_type=int, validation_strategy="off") == [
+        1,
+        "a",
+    ]
+    output = check_sequence(
+        7,
+        coerce_scalar_input=True,
+        coerce_output_type_to=list,
+        validation_strategy="off",
+    )
+    assert output == [7]
+
+    invalid_map = {"a": "b"}
+    assert is_mapping(invalid_map, value_type=int, validation_strategy="off")
+    assert check_mapping(invalid_map, value_type=int, validation_strategy="off") is (
+        invalid_map
+    )
+    assert check_type("a", expected_type=int, validation_strategy="off") == "a"
+    # str are still converted to paths, so the output can be used as a path
+    assert check_path("a", validation_strategy="off") == pathlib.Path("a")
+    assert check_path(1234, validation_strategy="off") == 1234
+
+
+def test_validation_strategy_sample() -> None:
+    """Test "sample" validation strategy checks first, last and sampled elements."""
+    n = 10_000
+    for position in (0, n - 1):
+        seq = [1] * n
+        seq[position] = "a"
+        assert is_sequence(seq, element_type=int, validation_strategy="sample(0)") is (
+            False
+        )
+
+    # A single invalid element in the middle is not found without a full check
+    seq = [1] * n
+    seq[n // 2] = "a"
+    assert is_sequence(seq, element_type=int, validation_strategy="full") is False
+    assert is_sequence(seq, element_type=int, validation_strategy="sample(0)") is True
+
+    # Inputs no longer than the sample are fully validated
+    assert not is_sequence(
+        [1, "a", 1], element_type=int, validation_strategy="sample(1)"
+    )
+    assert not is_sequence(
+        [1, 1, "a", 1], element_type=int, validation_strategy="sample(2)"
+    )
+
+    # Mostly invalid inputs are found by sampling
+    seq = ["a"] * n
+    seq[0] = seq[-1] = 1
+    assert is_sequence(seq, element_type=int, validation_strategy="sample") is False
+    big_map = {i: str(i) for i in range(n)}
+    big_map[n // 2] = 1
+    assert not is_mapping(big_map, value_type=int, validation_strategy="sample(5)")
+    with pytest.raises(TypeError, match="Invalid sequence"):
+        check_sequence(seq, element_type=int, validation_strategy="sample(5)")
+
+
+def test_validation_strategy_sample_random_state() -> None:
+    """Test sampled elements are reproducible with `random_state`."""
+    from predictably_core.validate._types import _sample_elements
+
+    seq = list(range(1_000))
+    sample = _sample_elements(seq, 10, random_state=42)
+    assert sample == _sample_elements(seq, 10, random_state=42)
+    assert len(sample) == 12
+    assert sample[:2] == [0, 999]
+    assert len(set(sample)) == 12
+
+    # Invalid elements are found or missed consistently for a given seed
+    seq = [1] * 1_000
+    seq[1::2] = ["a"] * 500
+    results = {
+        is_sequence(
+            seq, element_type=int, validation_strategy="sample(3)", random_state=0
+        )
+        for _ in range(5)
+    }
+    assert len(results) == 1
+
+
+def test_validation_strategy_sample_without_copying() -> None:
+    """Test mapping views and sets are sampled without copying their elements."""
+    from predictably_core.validate._types import _sample_elements
+
+    mapping = {i: str(i) for i in range(100_000)}
+    for elements in (mapping.keys(), mapping.values(), set(mapping)):
+        tracemalloc.start()
+        try:
+            sample = _sample_elements(elements, 10, random_state=0)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        assert peak < 10_000
+        assert sample == _sample_elements(elements, 10, random_state=0)
+        assert len(sample) == 12 and len({str(e) for e in sample}) == 12
+        assert all(element in elements for element in sample)
+    sample = _sample_elements(mapping.values(), 10, random_state=0)
+    assert sample[:2] == ["0", "99999"]
+
+
+def test_validation_strategy_uses_global_config() -> None:
+    """Test the validation strategy defaults to the global configuration."""
+    from predictably_core.config import config_context
+
+    seq = [1] * 1_000
+    seq[500] = "a"
+    with config_context(validation_strategy="off"):
+        assert check_sequence(seq, element_type=int) is seq
+        assert check_type("a", expected_type=int) == "a"
+    with config_context(validation_strategy="sample", validation_sample_size=0):
+        assert is_sequence(seq, element_type=int) is True
+        # The strategy passed to the function takes precedence over the config
+        assert is_sequence(seq, element_type=int, validation_strategy="full") is False
+    assert is_sequence(seq, element_type=int) is False
+
+
+@pytest.mark.parametrize("strategy", ["none", "sample()", "sample(-1)", "sample(1.5)"])
+def test_validation_strategy_invalid_raises_error(strategy) -> None:
+    """Test invalid validation strategies raise an error."""
+    with pytest.raises(ValueError, match="`validation_strategy` should be"):
+        is_sequence([1, 2], element_type=int, validation_strategy=strategy)
+    with pytest.raises(ValueError, match="`validation_strategy` should be"):
+        check_mapping({1: 2}, key_type=int, validation_strategy=strategy)
+
+
+def test_check_iterable() -> None:
+    """Test check_iterable lazily validates the elements of iterables."""
+    consumed = []
+
+    def gen(values):
+        for value in values:
+            consumed.append(value)
+            yield value
+
+    validated = check_iterable(gen([1, 2, "a", 3]), element_type=int)
+    # Nothing is consumed until the returned iterator is
+    assert consumed == []
+    assert next(validated) == 1
+    assert consumed == [1]
+    assert next(validated) == 2
+    with pytest.raises(TypeError, match="element 2 is type str"):
+        next(validated)
+    assert consumed == [1, 2, "a"]
+
+    assert list(check_iterable(range(5), element_type=int)) == list(range(5))
+    assert list(check_iterable({"a": 1, "b": 2}, element_type=str)) == ["a", "b"]
+    assert list(check_iterable(gen(["a", 1]))) == ["a", 1]
+    with pytest.raises(TypeError, match="`feed` expected to have elements of type"):
+        list(check_iterable([1.5], element_type=(int, str), iterable_name="feed"))
+
+    # Only the first `max_items` elements are validated
+    assert list(check_iterable([1, 2, "a"], element_type=int, max_items=2)) == [
+        1,
+        2,
+        "a",
+    ]
+    with pytest.raises(TypeError):
+        list(check_iterable([1, 2, "a"], element_type=int, max_items=3))
+    assert list(check_iterable(["a"], element_type=int, validation_strategy="off")) == [
+        "a"
+    ]
+
+    with pytest.raises(TypeError, match="expected to be iterable, but found int"):
+        check_iterable(7, element_type=int)
+    with pytest.raises(ValueError, match="`max_items` should be"):
+        check_iterable([1], element_type=int, max_items=-1)
+
+
+def test_check_async_iterable() -> None:
+    """Test check_async_iterable lazily validates asynchronous iterables."""
+    import asyncio
+
+    async def agen(values):
+        for value in values:
+            await asyncio.sleep(0)
+            yield value
+
+    async def collect(aiterable):
+        return [value async for value in aiterable]
+
+    assert asyncio.run(collect(check_async_iterable(agen([1, 2]), int))) == [1, 2]
+    assert asyncio.run(
+        collect(check_async_iterable(agen([1, "a"]), int, max_items=1))
+    ) == [1, "a"]
+    with pytest.raises(TypeError, match="element 1 is type str"):
+        asyncio.run(collect(check_async_iterable(agen([1, "a"]), int)))
+    with pytest.raises(TypeError, match="expected to be an asynchronous iterable"):
+        check_async_iterable([1, 2], int)
+
+
+def test_validation_context() -> None:
+    """Test validation_context sets the strategy used by the checkers."""
+    from predictably_core.config import get_config
+    from predictably_core.validate import validation_context
+
+    seq = [1] * 1_000
+    seq[500] = "a"
+    original_config = get_config()
+    with validation_context("off"):
+        assert check_type("a", expected_type=int) == "a"
+        assert check_sequence(seq, element_type=int) is seq
+        assert check_mapping({"a": "b"}, value_type=int) == {"a": "b"}
+        # Coercion is still applied when validation is off
+        assert check_sequence(7, coerce_scalar_input=True) == (7,)
+        # Explicit strategies take precedence
+        with pytest.raises(TypeError):
+            check_type("a", expected_type=int, validation_strategy="full")
+    with validation_context("sample(0)"):
+        assert get_config()["validation_sample_size"] == 0
+        assert check_sequence(seq, element_type=int) is seq
+    with validation_context("sample"):
+        assert get_config()["validation_sample_size"] == 100
+    assert get_config() == original_config
+    with pytest.raises(TypeError):
+        check_sequence(seq, element_type=int)
+
+    with pytest.raises(ValueError, match="`validation_strategy` should be"):
+        validation_context("strict").__enter__()
+
+
+def test_validation_context_threadsafe() -> None:
+    """Test thread local validation strategies don't leak between threads."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from predictably_core.validate import validation_context
+
+    def check_in_context(strategy):
+        with validation_context(strategy, local_threadsafe=True):
+            try:
+                check_type("a", expected_type=int)
+            except TypeError:
+                return "raised"
+            return "passed"
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(check_in_context, ["off", "full"] * 5))
+    assert results == ["passed", "raised"] * 5
+    with pytest.raises(TypeError):
+        check_type("a", expected_type=int)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3 -u
+# copyright: predictably developers, BSD-3-Clause License (see LICENSE file)
+"""Tests of the runtime checks of values against `typing` annotations.
+
+tests in this module test the functionality of:
+
+- is_type
+- check_type (with annotations)
+- type_validator (with annotations)
+"""
+
+from __future__ import annotations
+
+import collections
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    ForwardRef,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    NewType,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+import pytest
+
+from predictably_core.core._base import BaseEstimator, BaseObject
+from predictably_core.core._exceptions import ForwardRefError
+from predictably_core.validate import check_type, is_type, type_validator
+from predictably_core.validate._typing import _compile
+
+__author__: list[str] = ["RNKuhns"]
+
+UserId = NewType("UserId", int)
+Number = TypeVar("Number", int, float)
+Bounded = TypeVar("Bounded", bound=BaseObject)
+
+_TYPE_CASES = [
+    ([1, 2], List[int], True),
+    ([1, "a"], List[int], False),
+    ((1, 2), List[int], False),
+    ([], List[int], True),
+    ([[1], [2, 3]], List[List[int]], True),
+    ([[1], ["a"]], List[List[int]], False),
+    ([1, None], List[Optional[int]], True),
+    ((1, "a"), Tuple[int, str], True),
+    ((1, "a", 2), Tuple[int, str], False),
+    (("a", 1), Tuple[int, str], False),
+    ((1, 2, 3), Tuple[int, ...], True),
+    ((1, 2.5), Tuple[int, ...], False),
+    ((), Tuple[()], True),
+    ((1,), Tuple[()], False),
+    ((1, "a"), Tuple, True),
+    ({"a": 1.0}, Dict[str, float], True),
+    ({"a": 1}, Dict[str, float], False),
+    ({1: 1.0}, Mapping[str, float], False),
+    (collections.OrderedDict(a=[1]), Mapping[str, List[int]], True),
+    ({"a": [1]}, Dict[str, Union[List[int], str]], True),
+    ({1, 2}, Set[int], True),
+    (frozenset({"a"}), FrozenSet[int], False),
+    ("abc", Sequence[str], True),
+    ([1, 2], Iterable[int], True),
+    ([1, 2], Iterable[str], False),
+    (iter(["a"]), Iterator[int], True),
+    ([1], Iterator[int], False),
+    (None, Optional[int], True),
+    (1, Optional[int], True),
+    ("a", Optional[int], False),
+    (1, Union[int, str], True),
+    (1.5, Union[int, str], False),
+    (1.5, (int, List[int]), False),
+    ([1], (int, List[int]), True),
+    ("x", Literal["x", "y"], True),
+    ("z", Literal["x", "y"], False),
+    (True, Literal[1], False),
+    (1, Literal[1], True),
+    (object(), Any, True),
+    (BaseEstimator, Type[BaseObject], True),
+    (BaseObject, Type[BaseEstimator], False),
+    (BaseObject(), Type[BaseObject], False),
+    (len, Callable[[Any], int], True),
+    (1, Callable[[Any], int], False),
+    (5, UserId, True),
+    ("5", UserId, False),
+    (1.5, Number, True),
+    ("a", Number, False),
+    (BaseEstimator(), Bounded, True),
+    (1, Bounded, False),
+    ([1, 2], "List[int]", True),
+    ([BaseObject()], "List[predictably_core.core._base.BaseObject]", True),
+    ([BaseObject()], "List[predictably_core.core._base.BaseEstimator]", False),
+]
+
+
+@pytest.mark.parametrize("value, annotation, expected", _TYPE_CASES)
+def test_is_type(value, annotation, expected) -> None:
+    """Test is_type checks values against annotations."""
+    assert is_type(value, annotation) is expected
+    if expected:
+        assert check_type(value, annotation) is value
+        assert type_validator(annotation)(value) is value
+    else:
+        with pytest.raises(TypeError, match="^`input_` should be type"):
+            check_type(value, annotation)
+        with pytest.raises(TypeError, match="^`input_` should be type"):
+            type_validator(annotation)(value)
+
+
+def test_is_type_with_pep_585_and_604_annotations() -> None:
+    """Test is_type with generic aliases of builtins and `X | Y` unions."""
+    import sys
+
+    if sys.version_info < (3, 9):  # pragma: no cover
+        pytest.skip("PEP 585 generic aliases require Python 3.9+")
+    assert is_type([1, 2], list[int]) is True
+    assert is_type({"a": (1, 2)}, dict[str, tuple[int, ...]]) is True
+    assert is_type({"a": (1, "b")}, dict[str, tuple[int, ...]]) is False
+    assert is_type(int, type[int]) is True
+    if sys.version_info >= (3, 10):
+        assert is_type(None, int | None) is True
+        assert is_type([1, "a"], list[int | str]) is True
+        assert is_type([1.5], list[int | str]) is False
+
+
+def test_is_type_compiles_annotations_once() -> None:
+    """Test annotations are compiled into a cached checker."""
+    assert _compile(Dict[str, List[int]]) is _compile(Dict[str, List[int]])
+    # Unhashable annotation arguments are compiled without caching
+    assert is_type({"a": 1}, Literal[{"a": 1}]) is True
+
+
+def test_is_type_validation_strategy() -> None:
+    """Test containers in annotations are checked using the validation strategy."""
+    values = [1] * 10_000
+    values[5_000] = "a"
+    assert is_type(values, List[int]) is False
+    assert is_type(values, List[int], validation_strategy="sample(10)") is True
+    assert is_type({"a": values}, Dict[str, List[int]], validation_strategy="off")
+    assert not is_type((values,), List[List[int]], validation_strategy="off")
+    # Outer and inner containers are both sampled
+    nested = [[1] * 1_000 for _ in range(1_000)]
+    nested[500][500] = "a"
+    assert is_type(nested, List[List[int]], validation_strategy="sample") is True
+    assert is_type(nested, List[List[int]], validation_strategy="full") is False
+    assert check_type(values, List[int], validation_strategy="off") is values
+
+
+def test_check_type_annotation_errors() -> None:
+    """Test check_type raises useful errors for annotations."""
+    with pytest.raises(
+        TypeError, match=r"^`x` should be type Dict\[str, int\] or None"
+    ):
+        check_type([1], Dict[str, int], allow_none=True, input_error_name="x")
+    assert check_type(None, Dict[str, int], allow_none=True) is None
+    assert check_type(None, Optional[int]) is None
+
+    with pytest.raises(TypeError, match="^`use_subclass=True` requires"):
+        check_type(BaseObject, List[int], use_subclass=True)
+    with pytest.raises(TypeError, match="^`expected_type` should be"):
+        check_type(1, List[7])
+    with pytest.raises(TypeError, match="^`expected_type` should be"):
+        is_type(1, 7)
+
+    with pytest.raises(
+        ForwardRefError, match="Unable to resolve the forward reference"
+    ):
+        is_type(1, "NotDefinedAnywhere")
+    with pytest.raises(ForwardRefError):
+        check_type([1], List[ForwardRef("NotDefinedAnywhere")])
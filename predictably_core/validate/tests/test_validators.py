@@ -0,0 +1,136 @@
+#!/usr/bin/env python3 -u
+# copyright: predictably developers, BSD-3-Clause License (see LICENSE file)
+"""Tests of the reusable validators.
+
+tests in this module test the functionality of:
+
+- mapping_validator
+- sequence_validator
+- type_validator
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+
+import pytest
+
+from predictably_core.core._base import BaseEstimator, BaseObject
+from predictably_core.validate import (
+    check_mapping,
+    check_sequence,
+    check_type,
+    mapping_validator,
+    sequence_validator,
+    type_validator,
+)
+
+__author__: list[str] = ["RNKuhns"]
+
+_SEQUENCE_INPUTS = ([1, 2, 3], (1, 2, 3), [1, "a", 2.5], "abc", 7, None, {"a": 1})
+_SEQUENCE_PARAMS = (
+    {},
+    {"sequence_type": list},
+    {"sequence_type": (list, tuple)},
+    {"element_type": int},
+    {"element_type": (int, str), "sequence_name": "some_seq"},
+    {"sequence_type": tuple, "element_type": int, "coerce_output_type_to": list},
+    {"element_type": int, "coerce_scalar_input": True},
+    {"sequence_type": list, "element_type": int, "coerce_scalar_input": True},
+)
+_MAPPING_INPUTS = (
+    {"a": 1, "b": 2},
+    {1: "a"},
+    defaultdict(int, {"a": 1.5}),
+    {},
+)
+_MAPPING_PARAMS = (
+    {},
+    {"key_type": str},
+    {"key_type": str, "value_type": int},
+    {"value_type": (int, float), "input_error_name": "some_map"},
+    {"map_type": defaultdict},
+)
+_TYPE_INPUTS = (7, 7.5, "a", None, BaseObject, BaseEstimator(), [1])
+_TYPE_PARAMS = (
+    {"expected_type": int},
+    {"expected_type": (int, float)},
+    {"expected_type": str, "allow_none": True},
+    {"expected_type": BaseObject, "input_error_name": "obj"},
+    {"expected_type": BaseObject, "use_subclass": True},
+)
+
+
+def _call(func, *args, **kwargs):
+    """Return the output of a call or the type and message of the raised error."""
+    try:
+        return "output", func(*args, **kwargs)
+    except (TypeError, ValueError) as e:
+        return type(e), str(e)
+
+
+@pytest.mark.parametrize("params", _SEQUENCE_PARAMS)
+@pytest.mark.parametrize("input_seq", _SEQUENCE_INPUTS)
+def test_sequence_validator_matches_check_sequence(input_seq, params) -> None:
+    """Test sequence_validator returns or raises the same as check_sequence."""
+    expected = _call(check_sequence, input_seq, **params)
+    if expected[0] is not TypeError or "Invalid sequence" in expected[1]:
+        assert _call(sequence_validator(**params), input_seq) == expected
+
+
+@pytest.mark.parametrize("params", _MAPPING_PARAMS)
+@pytest.mark.parametrize("input_map", _MAPPING_INPUTS)
+def test_mapping_validator_matches_check_mapping(input_map, params) -> None:
+    """Test mapping_validator returns or raises the same as check_mapping."""
+    expected = _call(check_mapping, input_map, **params)
+    assert _call(mapping_validator(**params), input_map) == expected
+
+
+@pytest.mark.parametrize("params", _TYPE_PARAMS)
+@pytest.mark.parametrize("input_", _TYPE_INPUTS)
+def test_type_validator_matches_check_type(input_, params) -> None:
+    """Test type_validator returns or raises the same as check_type."""
+    expected = _call(check_type, input_, **params)
+    assert _call(type_validator(**params), input_) == expected
+
+
+def test_validators_raise_on_invalid_type_arguments() -> None:
+    """Test invalid type arguments raise an error when the validator is created."""
+    with pytest.raises(TypeError, match="`sequence_type` should be a type"):
+        sequence_validator(sequence_type=int)
+    with pytest.raises(TypeError, match="`element_type` should be a type"):
+        sequence_validator(element_type=7)
+    with pytest.raises(TypeError, match="`key_type` should be a type"):
+        mapping_validator(key_type=7)
+    with pytest.raises(TypeError, match="`value_type` should be a type"):
+        mapping_validator(value_type=7)
+    with pytest.raises(TypeError, match="^`expected_type` should be"):
+        type_validator([int])
+
+
+def test_validators_validation_strategy() -> None:
+    """Test validators use the validation strategy they are created with."""
+    from predictably_core.config import config_context
+
+    seq = [1] * 1_000
+    seq[500] = "a"
+    validate_full = sequence_validator(element_type=int, validation_strategy="full")
+    validate_sample = sequence_validator(
+        element_type=int, validation_strategy="sample(0)"
+    )
+    validate_default = sequence_validator(element_type=int)
+    assert validate_sample(seq) is seq
+    with pytest.raises(TypeError):
+        validate_full(seq)
+    with pytest.raises(TypeError):
+        validate_default(seq)
+    # Validators created without a strategy use the config when they are called
+    with config_context(validation_strategy="off"):
+        assert validate_default(seq) is seq
+        assert mapping_validator(value_type=int)({"a": "b"}) == {"a": "b"}
+        assert type_validator(int)("a") == "a"
+        with pytest.raises(TypeError):
+            validate_full(seq)
+
+    with pytest.raises(ValueError, match="`validation_strategy` should be"):
+        mapping_validator(value_type=int, validation_strategy="partial")